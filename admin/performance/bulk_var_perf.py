@@ -0,0 +1,59 @@
+#
+# This script compares the time to fix, unfix, set the values and set
+# the bounds of the variables of an indexed Var one variable at a time
+# and with the bulk (masked) methods of IndexedVar
+#
+
+import argparse
+import timeit
+
+import numpy
+from pyomo.environ import ConcreteModel, Var
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of variables", action="store", type=int, default=1000000)
+parser.add_argument("--storage", help="The storage of the Var ('object' or 'array')", action="store", default='array')
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+model = ConcreteModel()
+model.x = Var(range(args.n), storage=args.storage, initialize=0)
+vardata = list(model.x.values())
+values = numpy.arange(args.n, dtype=float)
+mask = values % 2 == 0
+
+
+def loop_fix():
+    for v, val, m in zip(vardata, values, mask):
+        if m:
+            v.fix(val)
+
+
+def loop_set_values():
+    for v, val in zip(vardata, values):
+        v.set_value(val)
+
+
+def loop_set_bounds():
+    for v, val in zip(vardata, values):
+        v.setlb(-val)
+        v.setub(val)
+
+
+benchmarks = [
+    ("loop: fix(values[mask])", loop_fix),
+    ("bulk: fix(values, mask=mask)",
+     lambda: model.x.fix(values, mask=mask)),
+    ("loop: unfix()", lambda: [v.unfix() for v in vardata]),
+    ("bulk: unfix()", lambda: model.x.unfix()),
+    ("loop: set_value()", loop_set_values),
+    ("bulk: set_values(values, valid=True)",
+     lambda: model.x.set_values(values, valid=True)),
+    ("loop: setlb() / setub()", loop_set_bounds),
+    ("bulk: set_bounds(-values, values)",
+     lambda: model.x.set_bounds(-values, values)),
+]
+
+for name, func in benchmarks:
+    t = min(timeit.repeat(func, number=1, repeat=args.ntrials))
+    print("%-40s %8.2f ms" % (name, t*1000))
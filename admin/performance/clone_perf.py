@@ -0,0 +1,51 @@
+#
+# This script compares the time to clone a model with Block.clone() and
+# with the generic copy.deepcopy() (the previous Block.clone()
+# implementation)
+#
+
+import argparse
+import copy
+import os
+import runpy
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--model", help="The model script (defines 'model')", action="store",
+                    default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         '..', '..', 'examples', 'performance',
+                                         'jump', 'opf_6620bus.py'))
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+# The model scripts read their data files from the current directory
+cwd = os.getcwd()
+os.chdir(os.path.dirname(os.path.abspath(args.model)))
+try:
+    start = time.time()
+    model = runpy.run_path(os.path.basename(args.model))['model']
+    print("Model construction: %.2f s" % (time.time()-start,))
+finally:
+    os.chdir(cwd)
+
+
+def deepcopy_clone(block):
+    save_parent, block._parent = block._parent, None
+    try:
+        return copy.deepcopy(
+            block, {'__block_scope__': {id(block): True, id(None): False},
+                    '__paranoid__': False})
+    finally:
+        block._parent = save_parent
+
+
+for name, fcn in (('deepcopy', deepcopy_clone),
+                  ('Block.clone', lambda block: block.clone())):
+    times = []
+    for i in range(args.ntrials):
+        start = time.time()
+        new_model = fcn(model)
+        times.append(time.time()-start)
+        del new_model
+    print("%-12s min: %.2f s  avg: %.2f s"
+          % (name, min(times), sum(times)/len(times)))
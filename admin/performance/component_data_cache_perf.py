@@ -0,0 +1,37 @@
+#
+# This script times repeated calls to Block.component_data_objects() on
+# a hierarchical model, as performed by the problem writers
+#
+
+from pyomo.environ import *
+
+import argparse
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-b", "--nblocks", help="The number of blocks", action="store", type=int, default=1000)
+parser.add_argument("-n", "--nvars", help="The number of variables per block", action="store", type=int, default=100)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=10)
+args = parser.parse_args()
+
+
+def _block_rule(b, i):
+    b.x = Var(range(args.nvars))
+    b.c = Constraint(range(args.nvars), rule=lambda b, j: b.x[j] >= 0)
+
+start = time.time()
+model = ConcreteModel()
+model.b = Block(range(args.nblocks), rule=_block_rule)
+print("Model construction: %.2f s" % (time.time()-start,))
+
+for ctype in (Var, Constraint):
+    times = []
+    for i in range(args.ntrials):
+        start = time.time()
+        for x in model.component_data_objects(ctype, active=True,
+                                              sort=True):
+            pass
+        times.append(time.time()-start)
+    print("%-10s first: %.3f s  later (avg): %.3f s"
+          % (ctype.__name__, times[0], sum(times[1:])/(len(times)-1)))
+print(model.component_data_cache_info())
@@ -0,0 +1,92 @@
+#
+# This script runs micro-benchmarks of the ComponentMap, ComponentSet
+# and ComponentArrayMap containers (insertion, lookup, iteration, bulk
+# updates and pickling) on the variables of a model
+#
+
+import argparse
+import pickle
+import timeit
+
+from pyomo.environ import ConcreteModel, Var
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_set import ComponentSet
+try:
+    from pyomo.core.kernel.component_map import ComponentArrayMap
+except ImportError:
+    ComponentArrayMap = None
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of variables", action="store", type=int, default=100000)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=5)
+parser.add_argument("--filter", help="Only run the benchmarks whose name contains this string", action="store", default=None)
+args = parser.parse_args()
+
+model = ConcreteModel()
+model.x = Var(range(args.n))
+keys = list(model.x.values())
+vals = [float(i) for i in range(args.n)]
+pairs = list(zip(keys, vals))
+
+
+def _filled(cls):
+    m = cls()
+    for k, v in pairs:
+        m[k] = v
+    return m
+
+cmap = _filled(ComponentMap)
+cset = ComponentSet(keys)
+
+benchmarks = [
+    ("ComponentMap: __setitem__",
+     lambda: _filled(ComponentMap)),
+    ("ComponentMap: __getitem__",
+     lambda: [cmap[k] for k in keys]),
+    ("ComponentMap: __contains__",
+     lambda: [k in cmap for k in keys]),
+    ("ComponentMap: iterate keys",
+     lambda: list(cmap)),
+    ("ComponentMap: iterate values",
+     lambda: list(cmap.values())),
+    ("ComponentMap: iterate items",
+     lambda: list(cmap.items())),
+    ("ComponentMap: update (pairs)",
+     lambda: ComponentMap().update(pairs)),
+    ("ComponentMap: update (ComponentMap)",
+     lambda: ComponentMap().update(cmap)),
+    ("ComponentMap: pickle",
+     lambda: pickle.loads(pickle.dumps((model, cmap)))),
+    ("ComponentSet: add",
+     lambda: [cset.add(k) for k in keys]),
+    ("ComponentSet: update",
+     lambda: ComponentSet().update(keys)),
+    ("ComponentSet: __contains__",
+     lambda: [k in cset for k in keys]),
+    ("ComponentSet: discard/add",
+     lambda: [cset.discard(k) for k in keys] and cset.update(keys)),
+]
+if hasattr(ComponentMap, 'update_from_arrays'):
+    benchmarks.append(
+        ("ComponentMap: update_from_arrays",
+         lambda: ComponentMap().update_from_arrays(keys, vals)))
+if ComponentArrayMap is not None:
+    amap = _filled(ComponentArrayMap)
+    benchmarks.extend([
+        ("ComponentArrayMap: __setitem__",
+         lambda: _filled(ComponentArrayMap)),
+        ("ComponentArrayMap: __getitem__",
+         lambda: [amap[k] for k in keys]),
+        ("ComponentArrayMap: update_from_arrays",
+         lambda: ComponentArrayMap().update_from_arrays(keys, vals)),
+        ("ComponentArrayMap: update_from_arrays (existing)",
+         lambda: amap.update_from_arrays(keys, vals)),
+        ("ComponentArrayMap: sum of values",
+         lambda: amap.array.sum()),
+    ])
+
+for name, func in benchmarks:
+    if args.filter is not None and args.filter not in name:
+        continue
+    t = min(timeit.repeat(func, number=1, repeat=args.ntrials))
+    print("%-50s %8.2f ms" % (name, t*1000))
@@ -0,0 +1,47 @@
+#
+# This script measures the time to copy and update configuration
+# blocks (e.g., CONFIG(kwds) in the solvers and transformations that
+# are created inside decomposition loops) and to validate values with
+# the domain validators in pyomo.common.config
+#
+
+import argparse
+import timeit
+
+from pyomo.common.config import (ConfigBlock, ConfigValue, In,
+                                 NonNegativeFloat, PositiveInt)
+from pyomo.contrib.gdpopt.GDPopt import GDPoptSolver
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of calls per trial", action="store", type=int, default=1000)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=5)
+args = parser.parse_args()
+
+CONFIG = ConfigBlock()
+for i in range(50):
+    CONFIG.declare('option_%d' % i, ConfigValue(
+        default=i, domain=PositiveInt if i % 2 else NonNegativeFloat))
+CONFIG.declare('strategy', ConfigValue(
+    default='a', domain=In(['a', 'b', 'c', 'd'])))
+kwds = {'option_1': 5, 'option_2': 0.5, 'strategy': 'b'}
+defaults = CONFIG.value(False)
+
+GDPOPT_CONFIG = GDPoptSolver.CONFIG
+gdpopt_kwds = {'mip_solver': 'cbc', 'nlp_solver': 'ipopt', 'tee': True}
+
+strategy = In(['a', 'b', 'c', 'd'])
+
+benchmarks = [
+    ("dict(defaults).update(kwds)",
+     lambda: dict(defaults).update(kwds)),
+    ("CONFIG(kwds) (51 values)", lambda: CONFIG(kwds)),
+    ("CONFIG() (51 values)", lambda: CONFIG()),
+    ("GDPopt CONFIG(kwds)", lambda: GDPOPT_CONFIG(gdpopt_kwds)),
+    ("PositiveInt(5)", lambda: PositiveInt(5)),
+    ("NonNegativeFloat(0.5)", lambda: NonNegativeFloat(0.5)),
+    ("In([...])('d')", lambda: strategy('d')),
+]
+
+for name, func in benchmarks:
+    t = min(timeit.repeat(func, number=args.n, repeat=args.ntrials))
+    print("%-40s %8.2f us" % (name, t/args.n*1e6))
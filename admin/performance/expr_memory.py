@@ -0,0 +1,109 @@
+#
+# This script measures the memory used by the expression trees of the
+# models in examples/performance.  The size of each expression node
+# (and of the containers holding its arguments and linear terms) is
+# summed over the unique nodes in the active constraints and
+# objectives of each model.
+#
+# The sizes depend on the interpreter and its build, so the
+# --max-bytes-per-node budget is only meaningful for the interpreter it
+# was measured on (see .travis.yml).
+#
+
+import argparse
+import os
+import sys
+
+from pyutilib.misc import import_file
+from pyomo.environ import Constraint, Objective
+from pyomo.core.expr.numvalue import nonpyomo_leaf_types
+from pyomo.core.expr import current as EXPR
+
+exdir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                     '..', '..', 'examples', 'performance')
+
+models = {
+    'bilinear1': ('misc/bilinear1_100000.py', None),
+    'diag1': ('misc/diag1_100000.py', None),
+    'clnlbeam': ('jump/clnlbeam.py', 'jump/clnlbeam-5000.dat'),
+    'facility': ('jump/facility.py', None),
+    'pmedian': ('pmedian/pmedian1.py', 'pmedian/pmedian.test4.dat'),
+}
+
+parser = argparse.ArgumentParser()
+parser.add_argument("models", help="The models to measure (default: all)", nargs='*')
+parser.add_argument("--max-bytes-per-node", help="Fail if the average size of an expression node exceeds this value", action="store", type=float, default=None)
+args = parser.parse_args()
+for name in args.models:
+    if name not in models:
+        parser.error("unknown model '%s' (choose from %s)"
+                     % (name, ', '.join(sorted(models))))
+
+
+def create_instance(name):
+    model_file, data_file = models[name]
+    module = import_file(os.path.join(exdir, model_file))
+    if hasattr(module, 'pyomo_create_model'):
+        model = module.pyomo_create_model()
+    else:
+        model = module.model
+    if not model.is_constructed():
+        if data_file is not None:
+            data_file = os.path.join(exdir, data_file)
+        model = model.create_instance(data_file)
+    return model
+
+
+def node_size(node):
+    ans = sys.getsizeof(node) + sys.getsizeof(node._args_)
+    if node.__class__ is EXPR.LinearExpression:
+        ans += sys.getsizeof(node.linear_coefs) \
+               + sys.getsizeof(node.linear_vars)
+    return ans
+
+
+def expression_memory(model):
+    seen = set()
+    nbytes = 0
+    stack = [c.body for c in model.component_data_objects(
+        Constraint, active=True)]
+    stack.extend(o.expr for o in model.component_data_objects(
+        Objective, active=True))
+    while stack:
+        node = stack.pop()
+        if node.__class__ in nonpyomo_leaf_types \
+           or not node.is_expression_type() or id(node) in seen:
+            continue
+        if node.is_named_expression_type():
+            stack.append(node.expr)
+            continue
+        seen.add(id(node))
+        nbytes += node_size(node)
+        stack.extend(node.args)
+    return len(seen), nbytes
+
+
+try:
+    sys.getsizeof(EXPR.SumExpression([]))
+except TypeError:
+    # sys.getsizeof() is not supported by all interpreters (e.g., PyPy)
+    print("The expression memory cannot be measured: sys.getsizeof() "
+          "is not supported on this interpreter")
+    sys.exit(0)
+
+total_nodes = 0
+total_bytes = 0
+for name in args.models or sorted(models):
+    nnodes, nbytes = expression_memory(create_instance(name))
+    total_nodes += nnodes
+    total_bytes += nbytes
+    print("%-12s %10d nodes %12d bytes %8.1f bytes/node"
+          % (name, nnodes, nbytes, nbytes/float(max(nnodes, 1))))
+bytes_per_node = total_bytes/float(max(total_nodes, 1))
+print("%-12s %10d nodes %12d bytes %8.1f bytes/node"
+      % ('total', total_nodes, total_bytes, bytes_per_node))
+
+if args.max_bytes_per_node is not None \
+   and bytes_per_node > args.max_bytes_per_node:
+    sys.exit("The expression nodes use %.1f bytes/node (the limit is %.1f)"
+             % (bytes_per_node, args.max_bytes_per_node))
@@ -0,0 +1,49 @@
+#
+# This script measures the time to compute the fingerprint of a model,
+# both from scratch and after a few of the parameter values change
+# (when the cached fingerprints of the other components are reused)
+#
+
+import argparse
+import timeit
+
+from pyomo.environ import ConcreteModel, Var, Param, Constraint, Objective
+from pyomo.util.fingerprint import model_fingerprint
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of constraints", action="store", type=int, default=20000)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=5)
+args = parser.parse_args()
+
+
+def create_model():
+    model = ConcreteModel()
+    model.I = range(args.n)
+    model.x = Var(model.I, bounds=(0, None))
+    model.p = Param(model.I, initialize=1, mutable=True)
+    model.c = Constraint(model.I, rule=lambda m, i:
+                         m.p[i]*m.x[i] + m.x[(i+1) % args.n]**2 <= i)
+    model.o = Objective(expr=sum(model.x[i] for i in model.I))
+    return model
+
+
+def cached(model):
+    for i in range(0, args.n, 100):
+        model.p[i] = model.p[i].value + 1
+    model_fingerprint(model)
+
+
+model = create_model()
+model_fingerprint(model)
+benchmarks = [
+    ("fingerprint (new model)",
+     lambda: model_fingerprint(create_model()), create_model),
+    ("fingerprint (1% of params changed)",
+     lambda: cached(model), None),
+]
+
+for name, func, baseline in benchmarks:
+    t = min(timeit.repeat(func, number=1, repeat=args.ntrials))
+    if baseline is not None:
+        t -= min(timeit.repeat(baseline, number=1, repeat=args.ntrials))
+    print("%-40s %8.2f ms" % (name, t*1000))
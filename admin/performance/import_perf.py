@@ -0,0 +1,40 @@
+#
+# This script measures the time to import pyomo.environ in a new Python
+# process, with the plugins of the deferred packages imported on demand
+# (the default) and with all plugins imported up front (as the pyomo
+# command does)
+#
+
+import argparse
+import subprocess
+import sys
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=5)
+parser.add_argument("--max-time", help="Fail if the minimum time to import pyomo.environ exceeds this value (in seconds)", action="store", type=float, default=None)
+args = parser.parse_args()
+
+_import_script = """
+import time
+start = time.time()
+import pyomo.environ
+%s
+print(time.time()-start)
+"""
+
+def import_time(script):
+    times = []
+    for i in range(args.ntrials):
+        output = subprocess.check_output([sys.executable, '-c', script])
+        times.append(float(output.decode().split()[-1]))
+    return min(times)
+
+deferred = import_time(_import_script % ('',))
+full = import_time(
+    _import_script % ('pyomo.environ._import_packages(deferred=True)',))
+print("import pyomo.environ:                  min %.2f s" % (deferred,))
+print("import pyomo.environ (all plugins):    min %.2f s" % (full,))
+
+if args.max_time is not None and deferred > args.max_time:
+    sys.exit("import pyomo.environ took %.2f s (the limit is %.2f s)"
+             % (deferred, args.max_time))
@@ -0,0 +1,42 @@
+#
+# This script times the lookup of component data by index
+# (IndexedComponent.__getitem__ and IndexedComponent.get_many)
+#
+
+from pyomo.environ import *
+
+import argparse
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--size", help="The size of each indexing set", action="store", type=int, default=300)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+N = args.size
+model = ConcreteModel()
+model.I = Set(initialize=range(N))
+model.J = Set(initialize=range(N))
+model.x = Var(model.I, model.J)
+model.p = Param(model.I, model.J, default=0, initialize={(0, 0): 1})
+
+keys = [(i, j) for i in range(N) for j in range(N)]
+nested_keys = [((i,), j) for i in range(N) for j in range(N)]
+
+tests = [
+    ("x[i,j]", lambda: [model.x[k] for k in keys]),
+    ("x[(i,),j]", lambda: [model.x[k] for k in nested_keys]),
+    ("p[i,j] (default)", lambda: [model.p[k] for k in keys]),
+]
+if hasattr(model.x, 'get_many'):
+    tests.append(("x.get_many()", lambda: model.x.get_many(keys)))
+    tests.append(("p.get_many()", lambda: model.p.get_many(keys)))
+
+for name, fcn in tests:
+    times = []
+    for i in range(args.ntrials):
+        start = time.time()
+        fcn()
+        times.append(time.time()-start)
+    print("%-18s min: %.3f s  avg: %.3f s (%d lookups)"
+          % (name, min(times), sum(times)/len(times), len(keys)))
@@ -0,0 +1,37 @@
+#
+# This script compares the time to construct a large indexed Param
+# with the default (dict) storage and with the array storage
+#
+
+from pyomo.environ import *
+
+import argparse
+import time
+
+try:
+    import numpy
+    has_numpy = True
+except:
+    has_numpy = False
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--size", help="The number of parameter values", action="store", type=int, default=1000000)
+parser.add_argument("--mutable", help="Construct mutable parameters", action="store_true", default=False)
+args = parser.parse_args()
+
+N = args.size
+data = dict((i, 0.5*i) for i in range(1, N+1))
+
+sources = [('dict', data)]
+if has_numpy:
+    sources.append(('numpy', numpy.arange(1, N+1)*0.5))
+
+for source, init in sources:
+    for storage in ('dict', 'dense', 'sparse'):
+        model = ConcreteModel()
+        model.I = RangeSet(N)
+        start = time.time()
+        model.p = Param(model.I, initialize=init, mutable=args.mutable,
+                        storage=storage)
+        print("%-6s initialize, %-6s storage: %.2f s"
+              % (source, storage, time.time()-start))
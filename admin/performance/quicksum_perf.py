@@ -0,0 +1,49 @@
+#
+# This script compares the time to build a large linear expression
+# with the builtin sum() function, with quicksum() and with
+# linear_sum()
+#
+
+import argparse
+import timeit
+
+from pyomo.environ import ConcreteModel, Var, Param, quicksum, linear_sum
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of terms in the sum", action="store", type=int, default=100000)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=5)
+args = parser.parse_args()
+
+model = ConcreteModel()
+model.I = range(args.n)
+model.x = Var(model.I)
+model.p = Param(model.I, initialize=lambda m, i: i+1)
+coefs = [float(i+1) for i in model.I]
+xvars = [model.x[i] for i in model.I]
+
+benchmarks = [
+    ("sum(c[i]*x[i])",
+     lambda: sum(model.p[i]*model.x[i] for i in model.I)),
+    ("quicksum(c[i]*x[i])",
+     lambda: quicksum(model.p[i]*model.x[i] for i in model.I)),
+    ("sum(x[i])",
+     lambda: sum(model.x[i] for i in model.I)),
+    ("quicksum(x[i])",
+     lambda: quicksum(model.x[i] for i in model.I)),
+    ("linear_sum(list, list)",
+     lambda: linear_sum(coefs, xvars)),
+]
+if numpy is not None:
+    coef_array = numpy.array(coefs)
+    var_array = numpy.array(xvars, dtype=object)
+    benchmarks.append(
+        ("linear_sum(ndarray, ndarray)",
+         lambda: linear_sum(coef_array, var_array)))
+
+for name, func in benchmarks:
+    t = min(timeit.repeat(func, number=1, repeat=args.ntrials))
+    print("%-40s %8.2f ms" % (name, t*1000))
@@ -0,0 +1,62 @@
+#
+# This script measures the time to iterate over slices (x[:, t]) and
+# References of (i, t) indexed variables, as found in DAE models.  The
+# variables are either indexed by a product of sets (dense), only
+# defined for some of the (i, t) pairs (sparse), or indexed by a
+# two-dimensional set of (i, t) tuples.
+#
+
+import argparse
+import timeit
+
+from pyomo.environ import ConcreteModel, Set, Var, Reference
+from pyomo.dae import ContinuousSet
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of states (i)", action="store", type=int, default=1000)
+parser.add_argument("--nt", help="The number of time points (t)", action="store", type=int, default=100)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+model = ConcreteModel()
+model.I = Set(initialize=range(args.n))
+model.t = ContinuousSet(initialize=range(args.nt))
+model.IT = Set(dimen=2, initialize=[(i, t) for i in model.I for t in model.t])
+model.dense = Var(model.I, model.t)
+model.sparse = Var(model.I, model.t, dense=False)
+for i in model.I:
+    for t in model.t:
+        if (i + t) % 2:
+            model.sparse[i, t] = 0
+model.tuples = Var(model.IT)
+
+times = list(model.t)
+states = list(model.I)[::max(1, args.n // args.nt)]
+
+
+def _slices(var):
+    # All time slices, followed by all state slices
+    for t in times:
+        for v in var[:, t]:
+            pass
+    for i in states:
+        for v in var[i, :]:
+            pass
+
+
+def _references(var):
+    # Look up every element of the time slices through References
+    for t in times:
+        ref = Reference(var[:, t])
+        for i in states:
+            if i in ref:
+                ref[i]
+        len(ref)
+
+
+for name in ('dense', 'sparse', 'tuples'):
+    var = model.component(name)
+    for label, func in (('slices', _slices), ('references', _references)):
+        t = min(timeit.repeat(lambda: func(var), number=1,
+                              repeat=args.ntrials))
+        print("%-8s %-12s %8.3f s" % (name, label, t))
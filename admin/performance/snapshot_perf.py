@@ -0,0 +1,71 @@
+#
+# This script compares the time to save and restore a constructed model
+# with pickle and with model snapshots (Block.save_snapshot() and
+# load_snapshot())
+#
+
+from pyomo.environ import *
+
+import argparse
+import os
+import pickle
+import tempfile
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--size", help="The size of the index set", action="store", type=int, default=100000)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+
+# Note: rules must be module-level functions so that the model can be
+# pickled
+def p_rule(m, i):
+    return i/2.0
+def c_rule(m, i):
+    return m.x[i] + m.p[i]*m.y[i] <= 5
+def e_rule(m, i):
+    return 2*m.x[i]**2
+def o_rule(m):
+    return sum(m.x[i] for i in m.I)
+
+start = time.time()
+model = ConcreteModel()
+model.I = RangeSet(args.size)
+model.x = Var(model.I, bounds=(0, 10), initialize=1)
+model.y = Var(model.I, within=Binary)
+model.p = Param(model.I, initialize=p_rule, mutable=True)
+model.c = Constraint(model.I, rule=c_rule)
+model.e = Expression(model.I, rule=e_rule)
+model.o = Objective(rule=o_rule)
+print("Model construction: %.2f s" % (time.time()-start,))
+
+
+def pickle_save(fname):
+    with open(fname, 'wb') as OUTPUT:
+        pickle.dump(model, OUTPUT, pickle.HIGHEST_PROTOCOL)
+
+def pickle_load(fname):
+    with open(fname, 'rb') as INPUT:
+        return pickle.load(INPUT)
+
+fd, fname = tempfile.mkstemp(suffix='.snapshot')
+os.close(fd)
+try:
+    for name, save, load in (('pickle', pickle_save, pickle_load),
+                             ('snapshot', model.save_snapshot, load_snapshot)):
+        save_times = []
+        load_times = []
+        for i in range(args.ntrials):
+            start = time.time()
+            save(fname)
+            save_times.append(time.time()-start)
+            start = time.time()
+            new_model = load(fname)
+            load_times.append(time.time()-start)
+            del new_model
+        print("%-9s save min: %.2f s  load min: %.2f s  size: %.1f MB"
+              % (name, min(save_times), min(load_times),
+                 os.path.getsize(fname)/1e6))
+finally:
+    os.remove(fname)
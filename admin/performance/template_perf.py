@@ -0,0 +1,50 @@
+#
+# This script measures the time to construct indexed constraints by
+# calling the rule for every index and by instantiating the template
+# expression captured from a single call to the rule (template=True)
+#
+
+import argparse
+import timeit
+
+from pyomo.environ import ConcreteModel, Set, Param, Var, Constraint
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", help="The number of states (i)", action="store", type=int, default=1000)
+parser.add_argument("--nt", help="The number of time points (t)", action="store", type=int, default=100)
+parser.add_argument("--ntrials", help="The number of test trials", action="store", type=int, default=3)
+args = parser.parse_args()
+
+model = ConcreteModel()
+model.I = Set(initialize=range(args.n))
+model.T = Set(initialize=range(args.nt), ordered=True)
+model.T0 = Set(initialize=range(args.nt - 1), ordered=True)
+model.k = Param(model.I, initialize=lambda m, i: 1.0 + i % 7)
+model.dt = Param(initialize=0.1)
+model.x = Var(model.I, model.T)
+model.u = Var(model.I, model.T)
+
+rules = {
+    # Explicit Euler discretization of dx/dt = k*u - x**2
+    'dynamics': (
+        (model.I, model.T0),
+        lambda m, i, t: m.x[i, t+1] == m.x[i, t]
+            + m.dt*(m.k[i]*m.u[i, t] - m.x[i, t]**2)),
+    # A linear coupling constraint over all of the time points
+    'linear sum': (
+        (model.I,),
+        lambda m, i: sum(m.k[i]*m.u[i, t] for t in m.T) <= 10),
+    # Bounds
+    'bounds': (
+        (model.I, model.T),
+        lambda m, i, t: (-m.k[i], m.u[i, t] - m.x[i, t], m.k[i])),
+}
+
+for name, (sets, rule) in sorted(rules.items()):
+    for template in (False, True):
+        def construct():
+            model.del_component('c')
+            model.del_component('c_index')
+            model.c = Constraint(*sets, rule=rule, template=template)
+        t = min(timeit.repeat(construct, number=1, repeat=args.ntrials))
+        print("%-12s template=%-5s %8.3f s" % (name, template, t))
@@ -0,0 +1,46 @@
+#
+# This script times the creation of MIP start (warm-start) files for
+# models with a large number of discrete variables
+#
+
+from pyomo.environ import *
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.solvers.plugins.solvers.warmstart import (collect_mip_start,
+                                                     write_cplex_mst,
+                                                     write_gurobi_mst)
+
+import argparse
+import os
+import tempfile
+import time
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-n", "--nvars", help="The number of variables", action="store", type=int, default=1000000)
+args = parser.parse_args()
+
+N = args.nvars
+
+start = time.time()
+model = ConcreteModel()
+model.x = Var(RangeSet(N), domain=Binary, initialize=lambda m, i: i % 2)
+# Emulate the symbol map created by the LP writer
+smap = SymbolMap()
+smap.addSymbols((v, 'x%d' % (i,)) for i, v in enumerate(model.x.values()))
+print("Model construction (%d variables): %.2f s" % (N, time.time()-start))
+
+start = time.time()
+symbols, values = collect_mip_start(smap, model)
+print("Collect MIP start: %.2f s" % (time.time()-start,))
+
+fd, fname = tempfile.mkstemp(suffix='.mst')
+os.close(fd)
+try:
+    start = time.time()
+    write_cplex_mst(fname, symbols, values)
+    print("Write CPLEX MST file: %.2f s" % (time.time()-start,))
+
+    start = time.time()
+    write_gurobi_mst(fname, symbols, values)
+    print("Write GUROBI MST file: %.2f s" % (time.time()-start,))
+finally:
+    os.remove(fname)
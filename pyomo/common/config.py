@@ -11,13 +11,204 @@
 import os
 import six
 
-from pyutilib.misc.config import ConfigBlock, ConfigList, ConfigValue
+from pyutilib.misc.config import ConfigBase, ConfigList
+from pyutilib.misc.config import ConfigBlock as _ConfigBlock
+from pyutilib.misc.config import ConfigValue as _ConfigValue
 
 USER_OPTION = 0
 ADVANCED_OPTION = 1
 DEVELOPER_OPTION = 2
 
+_NoArgument = ConfigBase.NoArgument
+
+# Values of these types cannot be modified in place, so copies of a
+# ConfigValue can share them (instead of casting the value again)
+_immutable_types = set([type(None), bool, float, complex, frozenset])
+_immutable_types.update(six.integer_types)
+_immutable_types.update(six.string_types)
+_immutable_types.add(six.text_type)
+
+
+class ConfigValue(_ConfigValue):
+    """A single configuration value (see pyutilib.misc.config).
+
+    Copying a ConfigValue (e.g., calling ``CONFIG(kwds)`` on the
+    ConfigBlock that holds it) does not cast values of immutable types
+    through the domain again: the copy shares the (already validated)
+    value of the original.
+    """
+
+    def __call__(self, value=_NoArgument, default=_NoArgument, domain=_NoArgument,
+                 description=_NoArgument, doc=_NoArgument, visibility=_NoArgument,
+                 implicit=_NoArgument, implicit_domain=_NoArgument,
+                 preserve_implicit=False):
+        if self.__class__ is not ConfigValue or default is not _NoArgument \
+           or domain is not _NoArgument or description is not _NoArgument \
+           or doc is not _NoArgument or visibility is not _NoArgument \
+           or implicit is not _NoArgument \
+           or implicit_domain is not _NoArgument:
+            return super(ConfigValue, self).__call__(
+                value, default, domain, description, doc, visibility,
+                implicit, implicit_domain, preserve_implicit)
+        ans = self._copy()
+        if value is not _NoArgument:
+            ans.set_value(value)
+        return ans
+
+    def _copy(self):
+        # This is equivalent to ConfigValue(default=self.value(), ...),
+        # without casting immutable values through the domain again
+        default = self.value()
+        ans = ConfigValue.__new__(ConfigValue)
+        ans._parent = None
+        ans._name = None
+        ans._userSet = False
+        ans._userAccessed = False
+        ans._default = default
+        ans._domain = self._domain
+        ans._description = self._description
+        ans._doc = self._doc
+        ans._visibility = self._visibility
+        ans._argparse = None
+        if default.__class__ in _immutable_types:
+            ans._data = default
+        else:
+            ans.reset()
+        return ans
+
+
+class ConfigBlock(_ConfigBlock):
+    """A block of configuration values (see pyutilib.misc.config).
+
+    Copying a ConfigBlock (e.g., ``CONFIG(kwds)``) creates the copies
+    of the block and its entries directly, instead of calling the
+    constructors with the declaration of each entry.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, value=_NoArgument, default=_NoArgument, domain=_NoArgument,
+                 description=_NoArgument, doc=_NoArgument, visibility=_NoArgument,
+                 implicit=_NoArgument, implicit_domain=_NoArgument,
+                 preserve_implicit=False):
+        if self.__class__ is not ConfigBlock or default is not _NoArgument \
+           or domain is not _NoArgument or description is not _NoArgument \
+           or doc is not _NoArgument or visibility is not _NoArgument \
+           or implicit is not _NoArgument \
+           or implicit_domain is not _NoArgument:
+            return super(ConfigBlock, self).__call__(
+                value, default, domain, description, doc, visibility,
+                implicit, implicit_domain, preserve_implicit)
+        ans = self._copy(preserve_implicit)
+        if value is not _NoArgument:
+            ans.set_value(value)
+        return ans
+
+    def _copy(self, preserve_implicit):
+        _set = object.__setattr__
+        ans = ConfigBlock.__new__(ConfigBlock)
+        _set(ans, '_parent', None)
+        _set(ans, '_name', None)
+        _set(ans, '_userSet', False)
+        _set(ans, '_userAccessed', False)
+        _set(ans, '_default', None)
+        _set(ans, '_domain', {})
+        _set(ans, '_description', self._description)
+        _set(ans, '_doc', self._doc)
+        _set(ans, '_visibility', self._visibility)
+        _set(ans, '_argparse', None)
+        _set(ans, '_implicit_declaration', self._implicit_declaration)
+        _set(ans, '_implicit_domain', self._implicit_domain)
+        data = {}
+        decl_order = []
+        declared = self._declared
+        _data = self._data
+        for key in self._decl_order:
+            if not (preserve_implicit or key in declared):
+                continue
+            config = _data[key]
+            if config.__class__ is ConfigValue:
+                _tmp = config._copy()
+            else:
+                _tmp = config(preserve_implicit=preserve_implicit)
+            _set(_tmp, '_parent', ans)
+            _set(_tmp, '_name', config._name)
+            data[key] = _tmp
+            decl_order.append(key)
+        _set(ans, '_data', data)
+        _set(ans, '_decl_order', decl_order)
+        _set(ans, '_declared', set(declared))
+        return ans
+
+    def set_value(self, value):
+        if value is None:
+            return self
+        if (type(value) is not dict) and \
+           (not isinstance(value, _ConfigBlock)):
+            raise ValueError("Expected dict value for %s.set_value, found %s" %
+                             (self.name(True), type(value).__name__))
+        if not value:
+            return self
+        _data = self._data
+        _implicit = []
+        _decl_map = {}
+        for key in value:
+            _key = str(key)
+            if _key in _data:
+                _decl_map[_key] = key
+            else:
+                _key = _key.replace('_', ' ')
+                if _key in _data:
+                    _decl_map[_key] = key
+                elif self._implicit_declaration:
+                    _implicit.append(key)
+                else:
+                    raise ValueError(
+                        "key '%s' not defined for Config Block '%s' and "
+                        "implicit (undefined) keys are not allowed" %
+                        (key, self.name(True)))
+
+        # Either set_value() succeeds completely, or nothing changes.
+        # Only the entries that are set are saved (and restored if one
+        # of the values fails validation).
+        _userSet = self._userSet
+        _saved = []
+        _added = []
+        try:
+            # Set the values in declaration order (so that things are
+            # deterministic and in case a validation depends on the
+            # order)
+            for key in self._decl_order:
+                if key in _decl_map:
+                    config = _data[key]
+                    if isinstance(config, _ConfigValue):
+                        _saved.append((config, config._data, config._userSet))
+                    else:
+                        _saved.append((config, config.value(False), None))
+                    config.set_value(value[_decl_map[key]])
+            # implicit data is declared at the end (in sorted order)
+            for key in sorted(_implicit):
+                self.add(key, value[key])
+                _added.append(str(key))
+        except:
+            for key in _added:
+                del self[key]
+            for config, data, userSet in reversed(_saved):
+                if userSet is None:
+                    config.reset()
+                    config.set_value(data)
+                else:
+                    config._data = data
+                    config._userSet = userSet
+            self._userSet = _userSet
+            raise
+        self._userSet = True
+        return self
+
+
 def PositiveInt(val):
+    if val.__class__ is int and val > 0:
+        return val
     ans = int(val)
     # We want to give an error for floating point numbers...
     if ans != float(val) or ans <= 0:
@@ -26,6 +217,8 @@ def PositiveInt(val):
     return ans
 
 def NegativeInt(val):
+    if val.__class__ is int and val < 0:
+        return val
     ans = int(val)
     if ans != float(val) or ans >= 0:
         raise ValueError(
@@ -33,6 +226,8 @@ def NegativeInt(val):
     return ans
 
 def NonPositiveInt(val):
+    if val.__class__ is int and val <= 0:
+        return val
     ans = int(val)
     if ans != float(val) or ans > 0:
         raise ValueError(
@@ -40,6 +235,8 @@ def NonPositiveInt(val):
     return ans
 
 def NonNegativeInt(val):
+    if val.__class__ is int and val >= 0:
+        return val
     ans = int(val)
     if ans != float(val) or ans < 0:
         raise ValueError(
@@ -47,6 +244,8 @@ def NonNegativeInt(val):
     return ans
 
 def PositiveFloat(val):
+    if val.__class__ is float and val > 0:
+        return val
     ans = float(val)
     if ans <= 0:
         raise ValueError(
@@ -54,6 +253,8 @@ def PositiveFloat(val):
     return ans
 
 def NegativeFloat(val):
+    if val.__class__ is float and val < 0:
+        return val
     ans = float(val)
     if ans >= 0:
         raise ValueError(
@@ -61,6 +262,8 @@ def NegativeFloat(val):
     return ans
 
 def NonPositiveFloat(val):
+    if val.__class__ is float and val <= 0:
+        return val
     ans = float(val)
     if ans > 0:
         raise ValueError(
@@ -68,6 +271,8 @@ def NonPositiveFloat(val):
     return ans
 
 def NonNegativeFloat(val):
+    if val.__class__ is float and val >= 0:
+        return val
     ans = float(val)
     if ans < 0:
         raise ValueError(
@@ -79,13 +284,30 @@ class In(object):
     def __init__(self, domain, cast=None):
         self._domain = domain
         self._cast = cast
+        # Check membership in a set if the domain is an immutable
+        # collection of hashable values (mutable domains, e.g. lists,
+        # may be extended after the validator is created)
+        self._domain_set = None
+        if isinstance(domain, (tuple, frozenset)):
+            try:
+                self._domain_set = frozenset(domain)
+            except TypeError:
+                pass
 
     def __call__(self, value):
         if self._cast is not None:
             v = self._cast(value)
         else:
             v = value
-        if v in self._domain:
+        if self._domain_set is not None:
+            try:
+                if v in self._domain_set:
+                    return v
+            except TypeError:
+                # unhashable value: fall back on the domain
+                if v in self._domain:
+                    return v
+        elif v in self._domain:
             return v
         raise ValueError("value %s not in domain %s" % (value, self._domain))
 
@@ -107,7 +329,7 @@ class Path(object):
             base = self.basePath
         else:
             base = Path.BasePath
-        if type(base) is ConfigValue:
+        if isinstance(base, _ConfigValue):
             base = base.value()
         if base is None:
             base = ""
@@ -338,3 +338,105 @@ class TestConfig(unittest.TestCase):
         c.a = ()
         self.assertEqual(len(c.a), 0)
         self.assertIs(type(c.a), list)
+
+    def test_In_collections(self):
+        self.assertEqual(In((1, 3, 5))(3), 3)
+        self.assertEqual(In(set(['a', 'b']))('a'), 'a')
+        with self.assertRaises(ValueError):
+            In([1, 3, 5])({})
+        # Domains with unhashable members
+        self.assertEqual(In([[1], [2]])([2]), [2])
+        with self.assertRaises(ValueError):
+            In([[1], [2]])([3])
+        # Other domains are only required to support "in"
+        self.assertEqual(In('abc')('ab'), 'ab')
+        with self.assertRaises(ValueError):
+            In((1, 3, 5))({})
+        # Mutable domains may change after the validator is created
+        domain = [1, 3]
+        validator = In(domain)
+        domain.append(5)
+        self.assertEqual(validator(5), 5)
+        domain = set(['a'])
+        validator = In(domain)
+        domain.discard('a')
+        with self.assertRaises(ValueError):
+            validator('a')
+
+    def _block(self):
+        c = ConfigBlock(description="a block", implicit=True)
+        c.declare('a', ConfigValue(5, PositiveInt, "option a"))
+        c.declare('b', ConfigValue([1, 2], list))
+        c.declare('c', ConfigValue('x', In(['x', 'y'])))
+        c.declare('sub', ConfigBlock())
+        c.sub.declare('d', ConfigValue(1.5, NonNegativeFloat))
+        c.declare('e', ConfigList([1], int))
+        return c
+
+    def test_copy(self):
+        c = self._block()
+        c.a = 7
+        c.implicit_opt = 3
+        d = c()
+        self.assertIs(type(d), ConfigBlock)
+        self.assertIs(type(d.get('a')), ConfigValue)
+        self.assertEqual(d.value(), {'a': 7, 'b': [1, 2], 'c': 'x',
+                                     'sub': {'d': 1.5}, 'e': [1]})
+        self.assertEqual(d.get('a').name(True), 'a')
+        self.assertEqual(d.sub.get('d').name(True), 'sub.d')
+        self.assertIs(d.sub._parent, d)
+        self.assertEqual(d.get('a')._description, "option a")
+        self.assertEqual(d._description, "a block")
+        self.assertFalse(d.get('a')._userSet)
+        self.assertEqual(list(d.user_values()), [])
+        # The copy is independent of the original
+        self.assertIsNot(d.b, c.b)
+        d.b.append(3)
+        self.assertEqual(c.b, [1, 2])
+        d.a = 2
+        d.sub.d = 3
+        self.assertEqual(c.a, 7)
+        self.assertEqual(c.sub.d, 1.5)
+        with self.assertRaises(ValueError):
+            d.a = -1
+        # Implicit entries are only copied on request
+        d = c(preserve_implicit=True)
+        self.assertEqual(d.implicit_opt, 3)
+        d.implicit_opt = 4
+        self.assertEqual(c.implicit_opt, 3)
+
+    def test_copy_with_value(self):
+        c = self._block()
+        d = c({'a': 3, 'sub': {'d': 2}, 'new_opt': 1})
+        self.assertEqual(d.a, 3)
+        self.assertEqual(d.sub.d, 2)
+        self.assertEqual(d.new_opt, 1)
+        self.assertTrue(d.get('a')._userSet)
+        self.assertEqual(c.a, 5)
+        self.assertNotIn('new_opt', c)
+        # Copies of values with different declarations are still
+        # supported
+        v = c.get('a')(default=10)
+        self.assertEqual(v.value(), 10)
+        self.assertEqual(v._domain, PositiveInt)
+
+    def test_set_value_rollback(self):
+        c = self._block()
+        c.b = [4]
+        with self.assertRaises(ValueError):
+            c.set_value({'a': 2, 'b': [3], 'c': 'z', 'new_opt': 1})
+        self.assertEqual(c.value(), {'a': 5, 'b': [4], 'c': 'x',
+                                     'sub': {'d': 1.5}, 'e': [1]})
+        self.assertFalse(c.get('a')._userSet)
+        self.assertTrue(c.get('b')._userSet)
+        with self.assertRaises(ValueError):
+            c.set_value({'sub': {'d': 2}, 'a': -1})
+        self.assertEqual(c.sub.d, 1.5)
+        with self.assertRaises(ValueError):
+            c.set_value({'new_opt': 1, 'sub': {'d': -1}})
+        self.assertNotIn('new_opt', c)
+        with self.assertRaises(ValueError):
+            c.set_value(5)
+        c.set_value({'a': 2, 'new_opt': 1})
+        self.assertEqual(c.a, 2)
+        self.assertEqual(c.new_opt, 1)
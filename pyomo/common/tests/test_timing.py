@@ -0,0 +1,141 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import json
+
+import pyutilib.th as unittest
+
+from six import StringIO
+
+from pyomo.common.timing import ConstructionProfiler, tracemalloc
+from pyomo.environ import (ConcreteModel, Block, Var, Constraint,
+                           Objective, TransformationFactory)
+
+
+def _block_rule(b, i):
+    b.x = Var(range(3))
+    b.c = Constraint(expr=b.x[0] >= i)
+
+
+class TestConstructionProfiler(unittest.TestCase):
+
+    def _build(self):
+        m = ConcreteModel()
+        m.b = Block(range(4), rule=_block_rule)
+        m.o = Objective(expr=m.b[0].x[0])
+        TransformationFactory('core.relax_integrality').apply_to(m)
+        return m
+
+    def test_tree(self):
+        with ConstructionProfiler() as profile:
+            self._build()
+        tree = profile.to_dict()
+        self.assertEqual(tree['name'], 'profile')
+        self.assertEqual(tree['count'], 1)
+        self.assertNotIn('memory', tree)
+        self.assertIn('clones', tree)
+
+        children = dict((c['name'], c) for c in tree['children'])
+        self.assertIn('Block b', children)
+        self.assertIn('Objective o', children)
+        self.assertIn('Transformation RelaxIntegrality (in-place)', children)
+
+        b = children['Block b']
+        self.assertEqual(b['rule'], '_block_rule')
+        self.assertEqual(b['count'], 1)
+        # The components of each block are aggregated under the
+        # indexed Block
+        sub = dict((c['name'], c) for c in b['children'])
+        self.assertEqual(sub['Var x']['count'], 4)
+        self.assertEqual(sub['Constraint c']['count'], 4)
+        self.assertAlmostEqual(
+            b['time'], b['self_time'] + sum(
+                c['time'] for c in b['children']))
+        self.assertLessEqual(b['time'], tree['time'])
+
+    def test_not_active(self):
+        profile = ConstructionProfiler()
+        self._build()
+        with profile:
+            pass
+        self._build()
+        self.assertEqual(profile.to_dict()['children'], [])
+
+    def test_nested_profilers(self):
+        with ConstructionProfiler():
+            self.assertRaisesRegexp(
+                RuntimeError, "already active",
+                ConstructionProfiler().start)
+
+    def test_exception(self):
+        def rule(b):
+            b.x = Var()
+            raise RuntimeError("rule failed")
+        with ConstructionProfiler() as profile:
+            m = ConcreteModel()
+            try:
+                m.b = Block(rule=rule)
+            except RuntimeError:
+                pass
+        # The timer for 'b' never reported; it is stopped with the
+        # profiler
+        tree = profile.to_dict()
+        self.assertEqual([c['name'] for c in tree['children']],
+                         ['Block ConcreteModel', 'Block b'])
+        b = tree['children'][1]
+        self.assertEqual(b['count'], 1)
+        self.assertEqual([c['name'] for c in b['children']], ['Var x'])
+        self.assertLessEqual(b['time'], tree['time'])
+
+    def test_write_json(self):
+        with ConstructionProfiler() as profile:
+            self._build()
+        buf = StringIO()
+        profile.write(buf, 'json')
+        self.assertEqual(json.loads(buf.getvalue()),
+                         json.loads(json.dumps(profile.to_dict())))
+
+    def test_write_stacks(self):
+        with ConstructionProfiler() as profile:
+            self._build()
+        buf = StringIO()
+        profile.write(buf)
+        lines = buf.getvalue().splitlines()
+        stacks = dict(line.rsplit(' ', 1) for line in lines)
+        self.assertIn('profile;Block b;Var x', stacks)
+        self.assertIn('profile;Block b;Constraint c', stacks)
+        for val in stacks.values():
+            self.assertGreater(int(val), 0)
+
+        self.assertRaisesRegexp(
+            ValueError, "Unknown construction profile format 'xml'",
+            profile.write, buf, 'xml')
+        self.assertRaisesRegexp(
+            ValueError, "Unknown construction profile value 'calls'",
+            profile.write, buf, 'stacks', 'calls')
+
+    @unittest.skipIf(tracemalloc is None, "tracemalloc is not available")
+    def test_memory(self):
+        with ConstructionProfiler(memory=True) as profile:
+            m = ConcreteModel()
+            m.x = Var(range(1000))
+        self.assertFalse(tracemalloc.is_tracing())
+        tree = profile.to_dict()
+        x = tree['children'][-1]
+        self.assertEqual(x['name'], 'Var x')
+        self.assertGreater(x['memory'], 1000*100)
+
+        buf = StringIO()
+        profile.write(buf, 'stacks', 'memory')
+        self.assertIn('profile;Var x ', buf.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
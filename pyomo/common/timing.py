@@ -1,7 +1,18 @@
 import sys
+import json
 import logging
+from collections import OrderedDict
+from timeit import default_timer
+
+from six import itervalues
+
 from pyutilib.misc.timing import TicTocTimer
 
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
 _logger = logging.getLogger('pyomo.common.timing')
 _logger.propagate = False
 _logger.setLevel(logging.WARNING)
@@ -26,11 +37,23 @@ class ConstructionTimer(object):
     def __init__(self, obj):
         self.obj = obj
         self.timer = TicTocTimer()
+        # The number of indices whose construction was deferred, and
+        # the number of deferred indices that were constructed (for
+        # lazily constructed components)
+        self.deferred = None
+        self.realized = None
+        if _profiler is not None:
+            self._profile = _profiler._start_timer(
+                _construction_label(obj), getattr(obj, '_rule', None))
+        else:
+            self._profile = None
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the messge string
         self.timer = self.timer.toc(msg="")
+        if self._profile is not None:
+            _stop_timer(self._profile)
         _construction_logger.info(self)
 
     def __str__(self):
@@ -44,12 +67,16 @@ class ConstructionTimer(object):
             except RuntimeError:
                 name = '(unknown)'
         try:
-            return self.fmt % ( 2 if total_time>=0.005 else 0,
-                                self.obj.type().__name__,
-                                name,
-                                idx,
-                                'indicies' if idx > 1 else 'index',
-                            ) % total_time
+            ans = self.fmt % ( 2 if total_time>=0.005 else 0,
+                               self.obj.type().__name__,
+                               name,
+                               idx,
+                               'indicies' if idx > 1 else 'index',
+                           ) % total_time
+            if self.deferred is not None:
+                ans += " (%d deferred, %d realized)" % (
+                    self.deferred, self.realized)
+            return ans
         except TypeError:
             return "ConstructionTimer object for %s %s; %s elapsed seconds" % (
                 self.obj.type().__name__,
@@ -67,11 +94,18 @@ class TransformationTimer(object):
         else:
             self.mode = " (%s)" % (mode,)
         self.timer = TicTocTimer()
+        if _profiler is not None:
+            self._profile = _profiler._start_timer(
+                "Transformation %s%s" % (obj.__class__.__name__, self.mode))
+        else:
+            self._profile = None
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the message string
         self.timer = self.timer.toc(msg="")
+        if self._profile is not None:
+            _stop_timer(self._profile)
         _transform_logger.info(self)
 
     def __str__(self):
@@ -86,3 +120,209 @@ class TransformationTimer(object):
             return "TransformationTimer object for %s; %s elapsed seconds" % (
                 name,
                 self.timer.toc("") )
+
+
+def _construction_label(obj):
+    try:
+        name = obj.local_name
+    except RuntimeError:
+        name = '(unknown)'
+    return "%s %s" % (obj.type().__name__, name)
+
+def _stop_timer(profile):
+    profiler, depth = profile
+    if profiler is _profiler:
+        profiler._stop_timer(depth)
+
+# The active ConstructionProfiler
+_profiler = None
+
+class _ProfileNode(object):
+    __slots__ = ('name', 'rule', 'count', 'time', 'memory', 'counters',
+                 'children')
+
+    def __init__(self, name, rule=None):
+        self.name = name
+        self.rule = rule
+        self.count = 0
+        self.time = 0.
+        self.memory = 0
+        self.counters = OrderedDict()
+        self.children = OrderedDict()
+
+    def self_time(self):
+        return self.time - sum(c.time for c in itervalues(self.children))
+
+    def to_dict(self, memory=True):
+        ans = OrderedDict()
+        ans['name'] = self.name
+        if self.rule is not None:
+            ans['rule'] = self.rule
+        ans['count'] = self.count
+        ans['time'] = self.time
+        ans['self_time'] = self.self_time()
+        if memory:
+            ans['memory'] = self.memory
+        ans.update(self.counters)
+        ans['children'] = [ c.to_dict(memory)
+                            for c in itervalues(self.children) ]
+        return ans
+
+    def stacks(self, prefix, value):
+        name = prefix + self.name.replace(';', ':')
+        if value == 'time':
+            # integer microseconds
+            val = int(round(self.self_time()*1e6))
+        else:
+            val = self.memory - sum(
+                c.memory for c in itervalues(self.children))
+        if val > 0:
+            yield "%s %d" % (name, val)
+        for c in itervalues(self.children):
+            for line in c.stacks(name + ';', value):
+                yield line
+
+
+class ConstructionProfiler(object):
+    """Record the construction and transformation timers as a tree
+
+    While a profiler is active, each ConstructionTimer and
+    TransformationTimer is recorded as a node beneath the timer that
+    was running when it was created.  For example, the components
+    declared by a Block rule are nested under the Block.  Repeated
+    timers with the same name under the same parent are combined into
+    one node, which keeps a count.  This covers the components of each
+    block in an indexed Block, and components that are constructed
+    lazily.  A timer that never reports (because the construction
+    raised an exception) is stopped when the timer above it reports (or
+    when the profiler stops).  Each node records:
+
+        count       the number of times the timer ran
+        time        the total elapsed (wall clock) time
+        memory      the net change in memory allocated by Python, as
+                    reported by tracemalloc (if memory=True)
+        <counter>   the change in each of the ConstructionProfiler.counters
+                    (e.g., the number of expressions cloned)
+
+    Example:
+
+        with ConstructionProfiler(memory=True) as profile:
+            instance = model.create_instance(data)
+        profile.write('construction.json')
+    """
+
+    # Registered counters: name -> function returning the current count
+    counters = OrderedDict()
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.root = _ProfileNode('profile')
+        self._stack = []
+        self._stop_tracing = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, et, ev, tb):
+        self.stop()
+
+    def start(self):
+        global _profiler
+        if _profiler is not None:
+            raise RuntimeError("A ConstructionProfiler is already active")
+        if self.memory:
+            if tracemalloc is None:
+                raise RuntimeError(
+                    "Memory profiling requires the tracemalloc module "
+                    "(Python 3.4+)")
+            self._stop_tracing = not tracemalloc.is_tracing()
+            if self._stop_tracing:
+                tracemalloc.start()
+        _profiler = self
+        self._stack = [(self.root, self._sample())]
+
+    def stop(self):
+        global _profiler
+        if _profiler is not self:
+            return
+        # Timers that did not report (e.g., because of an exception)
+        # are stopped along with the profiler
+        self._stop_timer(0)
+        _profiler = None
+        if self._stop_tracing:
+            tracemalloc.stop()
+            self._stop_tracing = False
+
+    def _sample(self):
+        if self.memory:
+            memory = tracemalloc.get_traced_memory()[0]
+        else:
+            memory = 0
+        return ( default_timer(), memory,
+                 [f() for f in itervalues(self.counters)] )
+
+    def _start_timer(self, name, rule=None):
+        stack = self._stack
+        parent = stack[-1][0]
+        node = parent.children.get(name, None)
+        if node is None:
+            if rule is not None:
+                rule = getattr(rule, '__name__', str(rule))
+            node = parent.children[name] = _ProfileNode(name, rule)
+        stack.append((node, self._sample()))
+        return self, len(stack) - 1
+
+    def _stop_timer(self, depth):
+        stack = self._stack
+        if len(stack) <= depth:
+            return
+        end_time, end_memory, end_counts = self._sample()
+        while len(stack) > depth:
+            node, (start_time, start_memory, start_counts) = stack.pop()
+            node.count += 1
+            node.time += end_time - start_time
+            node.memory += end_memory - start_memory
+            for name, start, end in zip(self.counters, start_counts,
+                                        end_counts):
+                node.counters[name] = node.counters.get(name, 0) \
+                                      + end - start
+
+    def to_dict(self):
+        """Return the profile tree as nested (ordered) dicts"""
+        return self.root.to_dict(self.memory)
+
+    def write(self, ostream, format=None, value='time'):
+        """Write the profile to a file name or stream
+
+        Formats:
+            json        the profile tree (see to_dict())
+            stacks      "folded" stacks ("a;b;c <value>" lines) for
+                        flame graph tools.  The value is the time
+                        (in microseconds) or the memory (in bytes)
+                        spent in each node, excluding its children.
+
+        If the format is not specified, it is 'json' for file names
+        ending in '.json' and 'stacks' otherwise.
+        """
+        if format is None:
+            if getattr(ostream, 'endswith', None) is not None \
+               and ostream.endswith('.json'):
+                format = 'json'
+            else:
+                format = 'stacks'
+        if format not in ('json', 'stacks'):
+            raise ValueError(
+                "Unknown construction profile format '%s'" % (format,))
+        if value not in ('time', 'memory'):
+            raise ValueError(
+                "Unknown construction profile value '%s'" % (value,))
+        if not hasattr(ostream, 'write'):
+            with open(ostream, 'w') as OUTPUT:
+                return self.write(OUTPUT, format, value)
+        if format == 'json':
+            json.dump(self.to_dict(), ostream, indent=2)
+            ostream.write("\n")
+        else:
+            for line in self.root.stacks('', value):
+                ostream.write(line + "\n")
@@ -58,6 +58,7 @@ from pyomo.core.base.sets import Set
 from pyomo.core.base.component import Component, ComponentUID
 from pyomo.core.base.plugin import ModelComponentFactory, TransformationFactory
 from pyomo.core.base.label import CNameLabeler, CuidLabeler
+from pyomo.core.base.solution_pool import SolutionPool
 
 import pyomo.opt
 from pyomo.opt.results import SolverResults, Solution, SolutionStatus, UndefinedData
@@ -184,6 +185,9 @@ class ModelSolutions(object):
             self.symbol_map = {}
         self.solutions = []
         self.index = None
+        # pool: a columnar SolutionPool holding the variable values of
+        # all solutions returned by the solver (if requested)
+        self.pool = None
 
     def __getstate__(self):
         state = {}
@@ -191,6 +195,7 @@ class ModelSolutions(object):
         state['_instance'] = self._instance()
         state['solutions'] = self.solutions
         state['symbol_map'] = self.symbol_map
+        state['pool'] = self.pool
         return state
 
     def __setstate__(self, state):
@@ -222,9 +227,17 @@ class ModelSolutions(object):
                   clear=True,
                   default_variable_value=None,
                   select=0,
-                  ignore_fixed_vars=True):
+                  ignore_fixed_vars=True,
+                  solution_pool=False):
         """
         Load solver results
+
+        If the results carry a SolutionPool (created by a solver
+        interface), or if solution_pool is True, the variable values of
+        all solutions are stored in the columnar pool (self.pool) and
+        only the selected solution (or the solution with the given id)
+        is stored as a ModelSolution, with index 0.  Other pool
+        solutions can be loaded into the model with self.pool.load().
         """
         instance = self._instance()
         #
@@ -257,6 +270,9 @@ class ModelSolutions(object):
         #
         # Load all solutions
         #
+        pool = results.__dict__.get('_solution_pool', None)
+        if pool is not None:
+            self.pool = pool
         if len(results.solution) == 0:
             return
         smap = results.__dict__.get('_smap', None)
@@ -266,6 +282,15 @@ class ModelSolutions(object):
             results._smap = None
         else:
             smap_id = results.__dict__.get('_smap_id')
+        if solution_pool and pool is None:
+            self.pool = self._create_pool(results, smap_id)
+        if self.pool is not None and (solution_pool or pool is not None):
+            if id is None:
+                # SolutionSet indices passed to results.solution() are
+                # 1-based
+                id = 1 if select is None else select + 1
+            if not select is None:
+                select = 0
         cache = {}
         if not id is None:
             self.add_solution(results.solution(id),
@@ -296,6 +321,42 @@ class ModelSolutions(object):
                 ignore_invalid_labels=ignore_invalid_labels,
                 ignore_fixed_vars=ignore_fixed_vars)
 
+    def _create_pool(self, results, smap_id):
+        """Collect the variable values of all solutions in a results
+        object into a SolutionPool"""
+        instance = self._instance()
+        columns = {}
+        variables = []
+        if smap_id is None:
+            for var in instance.component_data_objects(Var):
+                columns[var.name] = len(variables)
+                variables.append(var)
+        else:
+            smap = self.symbol_map[smap_id]
+            for symb, obj in iteritems(smap.bySymbol):
+                obj = obj()
+                if isinstance(obj, _VarData):
+                    columns[symb] = len(variables)
+                    variables.append(obj)
+            for symb, obj in iteritems(smap.aliases):
+                obj = obj()
+                if isinstance(obj, _VarData) and id(obj) in smap.byObject:
+                    columns[symb] = columns[smap.byObject[id(obj)]]
+        pool = SolutionPool(variables)
+        nan = float('nan')
+        for solution in results.solution:
+            row = [nan]*len(variables)
+            for symb, entry in iteritems(solution.variable):
+                col = columns.get(symb)
+                if col is not None:
+                    row[col] = entry['Value']
+            objective = None
+            for entry in itervalues(solution.objective):
+                objective = entry.get('Value')
+                break
+            pool.add(row, objective=objective)
+        return pool
+
     def store_to(self, results, cuid=False):
         """
         Return a Solution() object that is populated with the values in the model.
@@ -504,14 +565,23 @@ class ModelSolutions(object):
         for suffix in itervalues(valid_import_suffixes):
             suffix.clear_all_values()
         #
+        # The suffix values are collected in parallel lists of
+        # components and values for each suffix, and stored in bulk
+        # (see Suffix.update_from_arrays)
+        #
+        suffix_data = dict((name, ([], []))
+                           for name in valid_import_suffixes)
+        #
         # Load problem (model) level suffixes. These would only come from ampl
         # interfaced solution suffixes at this point in time.
         #
         for id_, (pobj,entry) in iteritems(soln._entry['problem']):
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][pobj] = attr_value
+                if attr_key in suffix_data:
+                    objs, vals = suffix_data[attr_key]
+                    objs.append(pobj)
+                    vals.append(attr_value)
         #
         # Load objective data (suffixes)
         #
@@ -519,8 +589,10 @@ class ModelSolutions(object):
             odata = odata()
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][odata] = attr_value
+                if attr_key in suffix_data:
+                    objs, vals = suffix_data[attr_key]
+                    objs.append(odata)
+                    vals.append(attr_value)
         #
         # Load variable data (suffixes and values)
         #
@@ -552,8 +624,10 @@ class ModelSolutions(object):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
                 if attr_key == 'value':
                     continue
-                elif attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][vdata] = attr_value
+                elif attr_key in suffix_data:
+                    objs, vals = suffix_data[attr_key]
+                    objs.append(vdata)
+                    vals.append(attr_value)
         #
         # Load constraint data (suffixes)
         #
@@ -561,8 +635,16 @@ class ModelSolutions(object):
             cdata = cdata()
             for _attr_key, attr_value in iteritems(entry):
                 attr_key = _attr_key[0].lower() + _attr_key[1:]
-                if attr_key in valid_import_suffixes:
-                    valid_import_suffixes[attr_key][cdata] = attr_value
+                if attr_key in suffix_data:
+                    objs, vals = suffix_data[attr_key]
+                    objs.append(cdata)
+                    vals.append(attr_value)
+        #
+        # Store the suffix values
+        #
+        for name, (objs, vals) in iteritems(suffix_data):
+            if objs:
+                valid_import_suffixes[name].update_from_arrays(objs, vals)
 
 
 @ModelComponentFactory.register('Model objects can be used as a component of other models.')
@@ -48,6 +48,7 @@ import pyomo.core.base.util
 from pyomo.core.base.rangeset import *
 
 from pyomo.core.base.instance2dat import *
+from pyomo.core.base.snapshot import load_snapshot
 
 #
 # This is a hack to strip out modules, which shouldn't have been included in these imports
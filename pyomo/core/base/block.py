@@ -24,10 +24,12 @@ from six import iteritems, iterkeys, itervalues, StringIO, string_types, \
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import *  # ModelComponentFactory
 from pyomo.core.base.component import Component, ActiveComponentData, \
-    ComponentUID
+    ComponentUID, _structure_changed
 from pyomo.core.base.sets import Set,  _SetDataBase
-from pyomo.core.base.var import Var
+from pyomo.core.base.var import Var, _is_sequence, _none_if_nan
 from pyomo.core.base.misc import apply_indexed_rule
+from pyomo.core.base.clone import _BlockCloner
+from pyomo.core.base.snapshot import save_snapshot
 from pyomo.core.base.suffix import ComponentMap
 from pyomo.core.base.indexed_component import IndexedComponent, \
     ActiveIndexedComponent, UnindexedComponent_set
@@ -215,6 +217,89 @@ class TraversalStrategy(object):
     DFS = DepthFirstSearch
 
 
+ComponentDataCacheInfo = collections.namedtuple(
+    'ComponentDataCacheInfo', ['hits', 'misses', 'entries'])
+
+
+class _ComponentDataCache(object):
+    """Cache of the component data generated by
+    Block.component_data_objects()
+
+    Each entry maps the arguments of component_data_objects() to the
+    tuple of component data that it generated and to the number of
+    data in each of the components that were walked to generate them.
+    All entries are discarded when the structure beneath the block
+    changes (see pyomo.core.base.component._structure_changed()).  As
+    some components add data by writing to their _data dicts directly
+    (e.g., when lazily constructed indices are realized), an entry is
+    also discarded when any of its components gained or lost data.
+    Only the max_entries most recently stored entries are kept.
+    """
+
+    __slots__ = ('generation', 'entries', 'hits', 'misses')
+
+    max_entries = 8
+
+    def __init__(self):
+        # Incremented every time the entries are discarded, so that
+        # iterators over cached data can detect structure changes
+        self.generation = 0
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.generation += 1
+        if self.entries:
+            self.entries.clear()
+
+    def lookup(self, key):
+        entry = self.entries.get(key, None)
+        if entry is None:
+            return None
+        for comp, ndata in entry[1]:
+            if len(comp._data) != ndata:
+                del self.entries[key]
+                return None
+        return entry[0]
+
+    def store(self, key, data, components, generation):
+        if generation != self.generation:
+            # The model changed while the data were being generated
+            return
+        entries = self.entries
+        if key not in entries and len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+        entries[key] = (
+            tuple(data),
+            tuple((comp, len(comp._data))
+                  for comp in itervalues(components)
+                  if hasattr(comp, '_data')) )
+
+
+def _component_data_cache_key(ctype, active, sort, descend_into,
+                              descent_order):
+    """Return the _ComponentDataCache key for the arguments to
+    component_data_objects(), or None if the arguments are not
+    cacheable (e.g., SubclassOf ctypes)"""
+    if ctype is not None and not isclass(ctype):
+        if type(ctype) not in (tuple, list) \
+           or not all(isclass(x) for x in ctype):
+            return None
+        ctype = tuple(ctype)
+    if type(descend_into) is not bool and not isclass(descend_into):
+        if type(descend_into) not in (tuple, list) \
+           or not all(isclass(x) for x in descend_into):
+            return None
+        descend_into = tuple(descend_into)
+    if descent_order is not None and type(descent_order) is not tuple:
+        return None
+    return ( ctype, active,
+             SortComponents.sort_names(sort),
+             SortComponents.sort_indices(sort),
+             descend_into, descent_order )
+
+
 def _sortingLevelWalker(list_of_generators):
     """Utility function for iterating over all members of a list of
     generators that prefixes each item with the index of the original
@@ -529,6 +614,7 @@ class _BlockData(ActiveComponentData):
         # Note sure why we are deleting these...
         if '_repn' in ans:
             del ans['_repn']
+        ans.pop('_component_data_cache', None)
         return ans
 
     #
@@ -920,6 +1006,7 @@ component, use the block del_component() and add_component() methods.
         # is to delegate the work to the next class up the MRO.
         #
         super(_BlockData, self).__setattr__(name, val)
+        _structure_changed(self)
         #
         # Update the ctype linked lists
         #
@@ -1012,6 +1099,10 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                     str(val.name), str(data).strip(),
                     type(err).__name__, err)
                 raise
+            finally:
+                # The construction rules may have generated (and cached)
+                # component data
+                _structure_changed(self)
             if __debug__ and logger.isEnabledFor(logging.DEBUG):
                 if _blockName[-1] == "'":
                     _blockName = _blockName[:-1] + '.' + val.name + "'"
@@ -1050,6 +1141,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         # Clear the _parent attribute
         obj._parent = None
+        _structure_changed(self)
 
         # Now that this component is not in the _decl map, we can call
         # delattr as usual.
@@ -1075,6 +1167,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             return
 
         name = obj.local_name
+        _structure_changed(self)
         if not preserve_declaration_order:
             # if we don't have to preserve the decl order, then the
             # easiest (and fastest) thing to do is just delete it and
@@ -1150,24 +1243,46 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # NonNegativeReals, etc) that are not "owned" by any blocks and
         # should be preserved as singletons.
         #
+        # The _BlockCloner implements the same scoping rules with a
+        # structure-aware copy (sharing unchanged expression subtrees).
+        # If it fails to copy an object (e.g., an attribute that cannot
+        # be deepcopied), we fall back on deepcopy, and then on the
+        # "paranoid" deepcopy (see _ComponentBase.__deepcopy__), which
+        # skip the uncopyable fields.
+        #
         save_parent, self._parent = self._parent, None
         try:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': False,
-                    })
-        except:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': True,
-                    })
+            new_block = _BlockCloner(self).clone()
+        except (TypeError, AttributeError, RuntimeError, copy.Error):
+            err = sys.exc_info()[1]
+            logger.warning(
+                "Cloning block '%s' with the structure-aware copy failed "
+                "(%s: %s); falling back on deepcopy"
+                % (self.name, type(err).__name__, err))
+            try:
+                new_block = copy.deepcopy(
+                    self, {
+                        '__block_scope__': {id(self): True, id(None): False},
+                        '__paranoid__': False,
+                        })
+            except:
+                new_block = copy.deepcopy(
+                    self, {
+                        '__block_scope__': {id(self): True, id(None): False},
+                        '__paranoid__': True,
+                        })
         finally:
             self._parent = save_parent
 
         return new_block
 
+    def save_snapshot(self, filename):
+        """
+        Write this block (and all components beneath it) to a binary
+        snapshot file that can be restored with load_snapshot().
+        """
+        save_snapshot(self, filename)
+
     def contains_component(self, ctype):
         """
         Return True if the component type is in _ctypes and ... TODO.
@@ -1237,14 +1352,20 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         else:
             return _BlockData.PseudoMap(self, ctype, active, sort)
 
-    def _component_data_iter(self, ctype=None, active=None, sort=False):
+    def _component_data_iter(self, ctype=None, active=None, sort=False,
+                             _walked=None):
         """
         Generator that returns a 3-tuple of (component name, index value,
         and _ComponentData) for every component data in the block.
+
+        If _walked is a dict, it is updated with {id: component} for
+        every component that the generator walks.
         """
         _sort_indices = SortComponents.sort_indices(sort)
         _subcomp = _BlockData.PseudoMap(self, ctype, active, sort)
         for name, comp in _subcomp.iteritems():
+            if _walked is not None:
+                _walked[id(comp)] = comp
             # _NOTE_: Suffix has a dict interface (something other
             #         derived non-indexed Components may do as well),
             #         so we don't want to test the existence of
@@ -1325,7 +1446,56 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         component data objects for all components in a
         block.  By default, this generator recursively
         descends into sub-blocks.
+
+        The generated component data are cached on this block, and
+        later calls with the same arguments iterate over the cached
+        data until the structure of the model changes (see
+        component_data_cache_info()).
         """
+        key = _component_data_cache_key(
+            ctype, active, sort, descend_into, descent_order)
+        if key is None:
+            for x in self._component_data_objects(
+                    ctype, active, sort, descend_into, descent_order):
+                yield x
+            return
+
+        cache = self.__dict__.get('_component_data_cache', None)
+        if cache is None:
+            cache = _ComponentDataCache()
+            super(_BlockData, self).__setattr__(
+                '_component_data_cache', cache)
+        data = cache.lookup(key)
+        if data is None:
+            cache.misses += 1
+            generation = cache.generation
+            data = []
+            walked = {}
+            for x in self._component_data_objects(
+                    ctype, active, sort, descend_into, descent_order,
+                    walked):
+                data.append(x)
+                yield x
+            cache.store(key, data, walked, generation)
+            return
+
+        cache.hits += 1
+        generation = cache.generation
+        for i, x in enumerate(data):
+            if generation != cache.generation:
+                # The model was changed by the caller: generate the
+                # remaining data from the current model structure
+                done = set(id(y) for y in data[:i])
+                for y in self._component_data_objects(
+                        ctype, active, sort, descend_into, descent_order):
+                    if id(y) not in done:
+                        yield y
+                return
+            yield x
+
+    def _component_data_objects(self, ctype, active, sort,
+                                descend_into, descent_order, _walked=None):
+        """The (uncached) implementation of component_data_objects()"""
         if descend_into:
             block_generator = self.block_data_objects(
                 active=active,
@@ -1336,11 +1506,28 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             block_generator = (self,)
 
         for _block in block_generator:
+            if _walked is not None:
+                _comp = _block.parent_component()
+                _walked[id(_comp)] = _comp
             for x in _block._component_data_iter(ctype=ctype,
                                                  active=active,
-                                                 sort=sort):
+                                                 sort=sort,
+                                                 _walked=_walked):
                 yield x[1]
 
+    def component_data_cache_info(self):
+        """
+        Return a ComponentDataCacheInfo (hits, misses, entries) tuple
+        describing the component_data_objects() cache on this block.
+        The hits are the number of walks of the block tree that the
+        cache saved.
+        """
+        cache = self.__dict__.get('_component_data_cache', None)
+        if cache is None:
+            return ComponentDataCacheInfo(0, 0, 0)
+        return ComponentDataCacheInfo(
+            cache.hits, cache.misses, len(cache.entries))
+
     def component_data_iterindex(self,
                                  ctype=None,
                                  active=None,
@@ -1465,10 +1652,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 yield _block
                 if not PM:
                     continue
-                _stack.append(_block.component_data_objects(ctype=ctype,
-                                                            active=active,
-                                                            sort=sort,
-                                                            descend_into=False))
+                _stack.append(_block._component_data_objects(
+                    ctype, active, sort, False, None))
             except StopIteration:
                 _stack.pop()
 
@@ -1537,19 +1722,92 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                                                         sort=sort,
                                                         descend_into=False))
 
-    def fix_all_vars(self):
-        # TODO: Simplify based on recursive logic
-        for var in itervalues(self.component_map(Var)):
-            var.fix()
-        for block in itervalues(self.component_map(Block)):
-            block.fix_all_vars()
-
-    def unfix_all_vars(self):
-        # TODO: Simplify based on recursive logic
-        for var in itervalues(self.component_map(Var)):
-            var.unfix()
-        for block in itervalues(self.component_map(Block)):
-            block.unfix_all_vars()
+    #
+    # The following methods update all variables on this block (and
+    # its sub-blocks) one Var component at a time.  Values, bounds and
+    # masks may be given as sequences (e.g., lists or numpy arrays)
+    # with one entry for each variable, in the order of
+    # component_data_objects(Var).
+    #
+
+    def fix_all_vars(self, values=None, mask=None):
+        """
+        Fix the variables on this block and its sub-blocks at the given
+        values (or at their current values if values is None).  If a
+        mask is given, only the variables selected by the mask are
+        fixed.
+        """
+        for var, (val, _mask) in self._var_slices(values, mask):
+            if var.is_indexed():
+                var.fix(*(() if val is None else (val,)), mask=_mask)
+            elif _mask is None or _mask[0]:
+                if _is_sequence(val):
+                    # As in Var.set_values(), NaN or None values clear
+                    # the variable value
+                    if hasattr(val, 'tolist'):
+                        # Do not store numpy scalars
+                        val = val.tolist()
+                    var.fix(_none_if_nan(val[0]))
+                elif val is None:
+                    var.fix()
+                else:
+                    var.fix(val)
+
+    def unfix_all_vars(self, mask=None):
+        """
+        Unfix the variables on this block and its sub-blocks (or the
+        variables selected by the mask).
+        """
+        for var, (_mask,) in self._var_slices(mask):
+            if var.is_indexed():
+                var.unfix(mask=_mask)
+            elif _mask is None or _mask[0]:
+                var.unfix()
+
+    def set_var_values(self, values, mask=None, valid=False):
+        """
+        Set the values of the variables on this block and its
+        sub-blocks (or of the variables selected by the mask).  NaN or
+        None values clear the variable values.
+        """
+        if not _is_sequence(values):
+            raise ValueError(
+                "Cannot set the variable values of block '%s': expected "
+                "one value for each variable" % (self.name,))
+        for var, (val, _mask) in self._var_slices(values, mask):
+            var.set_values(val, valid=valid, mask=_mask)
+
+    def set_var_bounds(self, lb, ub, mask=None):
+        """
+        Set the bounds of the variables on this block and its sub-blocks
+        (or of the variables selected by the mask).  Each bound may be
+        a single value for all variables or a sequence with one value
+        for each variable; NaN or None values clear the bounds.
+        """
+        for var, (_lb, _ub, _mask) in self._var_slices(lb, ub, mask):
+            var.set_bounds(_lb, _ub, mask=_mask)
+
+    def _var_slices(self, *args):
+        """
+        Generate the Var components on this block and its sub-blocks,
+        together with the slices of the arguments (sequences with one
+        entry for each variable) that belong to each Var.  Arguments
+        that are not sequences are passed unchanged.
+        """
+        var_components = list(self.component_objects(Var, descend_into=True))
+        nvars = sum(len(var) for var in var_components)
+        for arg in args:
+            if _is_sequence(arg) and len(arg) != nvars:
+                raise ValueError(
+                    "Cannot update the variables of block '%s': %s values "
+                    "were given for %s variables"
+                    % (self.name, len(arg), nvars))
+        offset = 0
+        for var in var_components:
+            n = len(var)
+            yield var, [arg[offset:offset+n] if _is_sequence(arg) else arg
+                        for arg in args]
+            offset += n
 
     def is_constructed(self):
         """
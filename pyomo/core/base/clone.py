@@ -0,0 +1,278 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import types
+from copy import deepcopy
+from weakref import ref as weakref_ref
+
+from six import iteritems, PY3
+from six.moves import xrange
+
+from pyomo.core.base.component import _ComponentBase
+from pyomo.core.expr.expr_pyomo5 import (ExpressionBase, LinearExpression,
+                                         _MutableLinearExpression,
+                                         _MutableSumExpression,
+                                         GetItemExpression,
+                                         ExternalFunctionExpression)
+
+#
+# Types that are never copied
+#
+_atomic_types = set([type(None), int, float, bool, complex, str, bytes,
+                     type, range, types.FunctionType,
+                     types.BuiltinFunctionType, type(Ellipsis),
+                     type(NotImplemented)])
+if not PY3:
+    _atomic_types.update((long, unicode, types.ClassType))
+
+#
+# Expression nodes that are copied node-by-node, sharing the unchanged
+# subtrees.  Nodes that hold references to components outside of their
+# arguments (GetItemExpression, ExternalFunctionExpression) are copied
+# with deepcopy().
+#
+_mutable_expression_types = set([_MutableSumExpression,
+                                 _MutableLinearExpression])
+_deepcopy_expression_types = set([GetItemExpression,
+                                  ExternalFunctionExpression])
+
+_missing = object()
+
+
+class _BlockCloner(object):
+    """Clone a block and all of the components beneath it.
+
+    This duplicates the behavior of copy.deepcopy() with a
+    '__block_scope__' memo (see _ComponentBase.__deepcopy__):
+    components and component data beneath the block are copied, and
+    everything outside the block is preserved as a reference.  Unlike
+    deepcopy(), the cloner dispatches on the type of each object once,
+    copies the component data of indexed components in bulk without
+    rechecking their scope, remaps weakrefs to the cloned objects, and
+    shares (instead of reallocating) the expression subtrees that do
+    not reference any component beneath the block.
+
+    Objects that the cloner does not know about are copied with
+    deepcopy() using the same memo, so components encountered while
+    copying them are still routed through the cloner.
+    """
+
+    def __init__(self, block):
+        self.memo = {
+            '__block_scope__': {id(block): True, id(None): False},
+            '__paranoid__': False,
+            '__block_cloner__': self,
+        }
+        # Objects whose id is stored in the memo must not be garbage
+        # collected while cloning (see copy._keep_alive)
+        self._keep_alive = []
+        self.block = block
+
+    def clone(self):
+        return self.copy_component(self.block)
+
+    def copy(self, obj):
+        """Return the copy of an arbitrary object"""
+        cls = obj.__class__
+        if cls in _atomic_types:
+            return obj
+        ans = self.memo.get(id(obj), _missing)
+        if ans is not _missing:
+            return ans
+        handler = _dispatch.get(cls, None)
+        if handler is None:
+            if issubclass(cls, _ComponentBase):
+                handler = _dispatch[cls] = _BlockCloner.copy_component
+            elif issubclass(cls, ExpressionBase):
+                handler = _dispatch[cls] = _BlockCloner._copy_expression
+            else:
+                handler = _BlockCloner._deepcopy
+        return handler(self, obj)
+
+    def _remember(self, obj, ans):
+        self.memo[id(obj)] = ans
+        self._keep_alive.append(obj)
+
+    def _in_scope(self, obj):
+        """Return True if the component (or component data) is
+        beneath the block being cloned"""
+        _known = self.memo['__block_scope__']
+        ans = _known.get(id(obj), None)
+        if ans is not None:
+            return ans
+        _new = []
+        tmp = obj.parent_block()
+        tmpId = id(tmp)
+        # Note: tmp never ends up being None, as id(None) is in
+        # __block_scope__
+        while tmpId not in _known:
+            _new.append(tmpId)
+            tmp = tmp.parent_block()
+            tmpId = id(tmp)
+        ans = _known[tmpId]
+        for _id in _new:
+            _known[_id] = ans
+        return ans
+
+    def copy_component(self, obj):
+        """Return the copy of a component or component data"""
+        ans = self.memo.get(id(obj), _missing)
+        if ans is not _missing:
+            return ans
+        if not self._in_scope(obj):
+            # component is out-of-scope.  shallow copy only
+            self._remember(obj, obj)
+            return obj
+        return self._copy_component_state(obj)
+
+    def _copy_component_state(self, obj):
+        cls = obj.__class__
+        ans = cls.__new__(cls)
+        self._remember(obj, ans)
+        copy = self.copy
+        new_state = {}
+        for key, val in iteritems(obj.__getstate__()):
+            if key == '_data' and val.__class__ is dict:
+                val = self._copy_component_data(obj, val)
+            elif val.__class__ not in _atomic_types:
+                val = copy(val)
+            new_state[key] = val
+        ans.__setstate__(new_state)
+        return ans
+
+    def _copy_component_data(self, component, data):
+        ans = self.memo.get(id(data), _missing)
+        if ans is not _missing:
+            return ans
+        ans = {}
+        self._remember(data, ans)
+        memo = self.memo
+        copy = self.copy
+        copy_state = self._copy_component_state
+        for idx, val in iteritems(data):
+            if idx.__class__ not in _atomic_types:
+                idx = copy(idx)
+            if isinstance(val, _ComponentBase):
+                new_val = memo.get(id(val), _missing)
+                if new_val is _missing:
+                    if val.parent_component() is component:
+                        # The component data owned by an in-scope
+                        # component are in-scope as well
+                        new_val = copy_state(val)
+                    else:
+                        new_val = copy(val)
+                ans[idx] = new_val
+            elif val.__class__ in _atomic_types:
+                ans[idx] = val
+            else:
+                ans[idx] = copy(val)
+        return ans
+
+    def _copy_expression(self, node):
+        cls = node.__class__
+        if cls in _deepcopy_expression_types:
+            return self._deepcopy(node)
+        copy = self.copy
+        if isinstance(node, LinearExpression):
+            constant = copy(node.constant)
+            coefs = [copy(c) for c in node.linear_coefs]
+            linear_vars = [copy(v) for v in node.linear_vars]
+            if cls not in _mutable_expression_types \
+               and constant is node.constant \
+               and all(a is b for a, b in zip(coefs, node.linear_coefs)) \
+               and all(a is b for a, b in zip(linear_vars,
+                                              node.linear_vars)):
+                ans = node
+            else:
+                ans = cls.__new__(cls)
+                ans._args_ = ()
+                ans.constant = constant
+                ans.linear_coefs = coefs
+                ans.linear_vars = linear_vars
+            self._remember(node, ans)
+            return ans
+
+        args = node.args
+        new_args = [arg if arg.__class__ in _atomic_types else copy(arg)
+                    for arg in args]
+        if cls in _mutable_expression_types:
+            ans = node.create_node_with_local_data(tuple(new_args))
+        else:
+            for i in xrange(len(new_args)):
+                if new_args[i] is not args[i]:
+                    ans = node.create_node_with_local_data(
+                        tuple(new_args))
+                    break
+            else:
+                # No component beneath the block appears in this
+                # subtree: share it (expressions are immutable)
+                ans = node
+        self._remember(node, ans)
+        return ans
+
+    def _deepcopy(self, obj):
+        return deepcopy(obj, self.memo)
+
+    def _copy_tuple(self, obj):
+        copy = self.copy
+        new = tuple(x if x.__class__ in _atomic_types else copy(x)
+                    for x in obj)
+        # Like deepcopy, the tuple may already have been copied while
+        # copying its members
+        ans = self.memo.get(id(obj), _missing)
+        if ans is not _missing:
+            return ans
+        for a, b in zip(new, obj):
+            if a is not b:
+                break
+        else:
+            new = obj
+        self._remember(obj, new)
+        return new
+
+    def _copy_list(self, obj):
+        ans = []
+        self._remember(obj, ans)
+        copy = self.copy
+        ans.extend(x if x.__class__ in _atomic_types else copy(x)
+                   for x in obj)
+        return ans
+
+    def _copy_dict(self, obj):
+        ans = {}
+        self._remember(obj, ans)
+        copy = self.copy
+        for key, val in iteritems(obj):
+            if key.__class__ not in _atomic_types:
+                key = copy(key)
+            if val.__class__ not in _atomic_types:
+                val = copy(val)
+            ans[key] = val
+        return ans
+
+    def _copy_weakref(self, obj):
+        target = obj()
+        if target is None:
+            return obj
+        new_target = self.copy(target)
+        if new_target is target:
+            ans = obj
+        else:
+            ans = weakref_ref(new_target)
+        self._remember(obj, ans)
+        return ans
+
+
+_dispatch = {
+    tuple: _BlockCloner._copy_tuple,
+    list: _BlockCloner._copy_list,
+    dict: _BlockCloner._copy_dict,
+    weakref_ref: _BlockCloner._copy_weakref,
+}
@@ -66,6 +66,28 @@ def cname(*args, **kwds):
     return name(*args, **kwds)
 
 
+def _structure_changed(obj):
+    """Discard the caches of the model structure that may include obj
+
+    This is called when components are added to, deleted from, or
+    reclassified on a block, when component data are deleted, and when
+    components or component data are (de)activated.  Only the caches
+    (see Block.component_data_objects()) held by obj and by the blocks
+    that contain it are discarded: the caches of other blocks and
+    models are not affected.
+    """
+    while obj is not None:
+        cache = obj._component_data_cache
+        if cache is not None:
+            cache.clear()
+        try:
+            obj = obj.parent_block()
+        except AttributeError:
+            # obj is still being initialized (e.g., a Disjunct adding
+            # its indicator_var), so it cannot be in a model yet
+            return
+
+
 class _ComponentBase(object):
     """An abstract base class for Component and ComponentData
 
@@ -75,6 +97,10 @@ class _ComponentBase(object):
     """
     __slots__ = ()
 
+    # The cache of Block.component_data_objects() (only set on blocks;
+    # see _structure_changed())
+    _component_data_cache = None
+
     def __deepcopy__(self, memo):
         # The problem we are addressing is when we want to clone a
         # sub-block in a model.  In that case, the block can have
@@ -93,6 +119,12 @@ class _ComponentBase(object):
         # we need to override __deepcopy__ for both Component and
         # ComponentData.
 
+        # Block.clone() routes all components through the _BlockCloner
+        # stored in the memo
+        cloner = memo.get('__block_cloner__', None)
+        if cloner is not None:
+            return cloner.copy_component(self)
+
         #try:
         #    print("Component: %s" % (self.name,))
         #except:
@@ -550,10 +582,12 @@ class ActiveComponent(Component):
     def activate(self):
         """Set the active attribute to True"""
         self._active=True
+        _structure_changed(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active=False
+        _structure_changed(self)
 
 
 class ComponentData(_ComponentBase):
@@ -873,10 +907,12 @@ class ActiveComponentData(ComponentData):
     def activate(self):
         """Set the active attribute to True"""
         self._active = self.parent_component()._active = True
+        _structure_changed(self)
 
     def deactivate(self):
         """Set the active attribute to False"""
         self._active = False
+        _structure_changed(self)
 
 
 class ComponentUID(object):
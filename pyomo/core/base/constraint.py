@@ -34,6 +34,9 @@ from pyomo.core.base.indexed_component import \
 from pyomo.core.base.misc import (apply_indexed_rule,
                                   tabular_writer)
 from pyomo.core.base.sets import Set
+from pyomo.core.base.template_expr import (
+    templatize_rule, compile_template, same_template_result)
+from pyomo.core.expr.expr_errors import TemplateExpressionError
 
 from six import StringIO, iteritems
 
@@ -635,6 +638,15 @@ class Constraint(ActiveIndexedComponent):
         expr            A Pyomo expression for this constraint
         rule            A function that is used to construct constraint
                             expressions
+        lazy            If True, the rule is only called for an index
+                            when that index is accessed (or when the
+                            constraints are iterated over)
+        template        If True, the rule is called once with
+                            IndexTemplate placeholders for the indices,
+                            and the resulting template expression is
+                            instantiated for each index (falling back
+                            on calling the rule for each index if the
+                            rule evaluates its indices)
         doc             A text string describing this component
         name            A name for this component
 
@@ -665,6 +677,9 @@ class Constraint(ActiveIndexedComponent):
     Feasible        = (1002,)
     Satisfied       = (1002,)
 
+    _rule_template = None
+    _rule_template_checked = False
+
     def __new__(cls, *args, **kwds):
         if cls != Constraint:
             return super(Constraint, cls).__new__(cls)
@@ -676,6 +691,8 @@ class Constraint(ActiveIndexedComponent):
     def __init__(self, *args, **kwargs):
         self.rule = kwargs.pop('rule', None)
         self._init_expr = kwargs.pop('expr', None)
+        self._lazy = kwargs.pop('lazy', False)
+        self._template = kwargs.pop('template', False)
         #if self.rule is None and self._init_expr is None:
         #    raise ValueError("A simple Constraint component requires a 'rule' or 'expr' option")
         kwargs.setdefault('ctype', Constraint)
@@ -759,25 +776,88 @@ class Constraint(ActiveIndexedComponent):
                     "of a constraint with a single expression" %
                     (self.name,) )
 
-            for ndx in self._index:
-                try:
-                    tmp = apply_indexed_rule(self,
-                                             _init_rule,
-                                             _self_parent,
-                                             ndx)
-                except Exception:
-                    err = sys.exc_info()[1]
-                    logger.error(
-                        "Rule failed when generating expression for "
-                        "constraint %s with index %s:\n%s: %s"
-                        % (self.name,
-                           str(ndx),
-                           type(err).__name__,
-                           err))
-                    raise
-                self._setitem_when_not_present(ndx, tmp)
+            if self._template:
+                self._rule_template = self._compile_rule_template()
+            if self._lazy:
+                self._construct_lazily(timer)
+            else:
+                for ndx in self._index:
+                    self._construct_index(ndx)
+                self._rule_template = None
         timer.report()
 
+    def __getstate__(self):
+        state = super(Constraint, self).__getstate__()
+        # The compiled rule template cannot be pickled (lazily
+        # constructed constraints call the rule for the remaining indices)
+        state.pop('_rule_template', None)
+        return state
+
+    def _compile_rule_template(self):
+        """Return a function that instantiates the expression returned
+        by the rule for an index, or None if the rule cannot be
+        converted to a template expression"""
+        ans = templatize_rule(self._parent(), self.rule, self._index)
+        if ans is not None:
+            try:
+                return compile_template(*ans)
+            except TemplateExpressionError:
+                pass
+        logger.debug("Constraint %s: the rule could not be converted to "
+                     "a template expression; calling the rule for each "
+                     "index" % (self.name,))
+        return None
+
+    def _check_rule_template(self, ndx, expr):
+        """Compare the compiled rule template with the expression that
+        the rule returned for ndx, and stop using the template if they
+        differ.
+
+        Rules can inspect their indices in ways that do not raise
+        exceptions when they are called with IndexTemplates (e.g.,
+        ``isinstance(i, int)``); the template captured for such rules
+        does not reproduce the rule.
+        """
+        self._rule_template_checked = True
+        if ndx.__class__ is tuple:
+            tmp = self._rule_template(*ndx)
+        else:
+            tmp = self._rule_template(ndx)
+        if not same_template_result(tmp, expr):
+            logger.debug("Constraint %s: the rule template does not "
+                         "reproduce the rule for index %s; calling the "
+                         "rule for each index" % (self.name, ndx))
+            self._rule_template = None
+
+    def _construct_index(self, ndx):
+        """Apply the rule to construct the constraint for one index"""
+        try:
+            if self._rule_template is not None \
+               and self._rule_template_checked:
+                if ndx.__class__ is tuple:
+                    tmp = self._rule_template(*ndx)
+                else:
+                    tmp = self._rule_template(ndx)
+            else:
+                tmp = apply_indexed_rule(self,
+                                         self.rule,
+                                         self._parent(),
+                                         ndx)
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed when generating expression for "
+                "constraint %s with index %s:\n%s: %s"
+                % (self.name,
+                   str(ndx),
+                   type(err).__name__,
+                   err))
+            raise
+        if self._rule_template is not None \
+           and not self._rule_template_checked:
+            self._check_rule_template(ndx, tmp)
+        self._setitem_when_not_present(ndx, tmp)
+
     def _pprint(self):
         """
         Return data that will be printed for this component.
@@ -254,6 +254,9 @@ class Expression(IndexedComponent):
                         used to initialize this object.
         expr        A synonym for initialize.
         rule        A rule function used to initialize this object.
+        lazy        If True, the rule is only called for an index when
+                        that index is accessed (or when the expressions
+                        are iterated over).
     """
 
     _ComponentDataClass = _GeneralExpressionData
@@ -272,6 +275,7 @@ class Expression(IndexedComponent):
         self._init_rule = kwds.pop('rule', None)
         self._init_expr = kwds.pop('initialize', None)
         self._init_expr = kwds.pop('expr', self._init_expr)
+        self._lazy = kwds.pop('lazy', False)
         if is_functor(self._init_expr) and \
            (not isinstance(self._init_expr, NumericValue)):
             raise TypeError(
@@ -383,16 +387,13 @@ class Expression(IndexedComponent):
         #
         if _init_rule is not None:
             # construct and initialize with a rule
-            if self.is_indexed():
-                for key in self._index:
-                    self.add(key,
-                             apply_indexed_rule(
-                                 self,
-                                 _init_rule,
-                                 self._parent(),
-                                 key))
-            else:
+            if not self.is_indexed():
                 self.add(None, _init_rule(self._parent()))
+            elif self._lazy:
+                self._construct_lazily(timer)
+            else:
+                for key in self._index:
+                    self._construct_index(key)
         else:
             # construct and initialize with a value
             if _init_expr.__class__ is dict:
@@ -405,6 +406,13 @@ class Expression(IndexedComponent):
                     self.add(key, _init_expr)
         timer.report()
 
+    def _construct_index(self, key):
+        """Apply the rule to construct the expression for one index"""
+        self.add(key, apply_indexed_rule(self,
+                                         self._init_rule,
+                                         self._parent(),
+                                         key))
+
 class SimpleExpression(_GeneralExpressionData, Expression):
 
     def __init__(self, *args, **kwds):
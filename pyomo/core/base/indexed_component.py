@@ -13,12 +13,15 @@ __all__ = ['IndexedComponent', 'ActiveIndexedComponent']
 import pyutilib.misc
 
 from pyomo.core.expr.expr_errors import TemplateExpressionError
+from pyomo.core.expr.numvalue import native_numeric_types
 from pyomo.core.base.indexed_component_slice import _IndexedComponent_slice
-from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.component import Component, ActiveComponent, \
+    _structure_changed
 from pyomo.core.base.config import PyomoOptions
 from pyomo.common import DeveloperError
+from pyomo.common.timing import ConstructionTimer
 
-from six import PY3, itervalues, iteritems
+from six import PY3, itervalues, iteritems, string_types
 
 UnindexedComponent_set = set([None])
 
@@ -28,6 +31,26 @@ def normalize_index(index):
     return just the element.  If it has length > 1, then
     return a tuple.
     """
+    # Fast path for the common cases: scalar indices and (nested)
+    # tuples of scalars
+    _cls = index.__class__
+    if _cls in native_numeric_types or _cls in string_types:
+        return index
+    if _cls is tuple:
+        idx = index
+        for x in idx:
+            if x.__class__ is tuple:
+                idx = pyutilib.misc.flatten_tuple(idx)
+                break
+        for x in idx:
+            _cls = x.__class__
+            if _cls not in native_numeric_types \
+               and _cls not in string_types and x is not None:
+                break
+        else:
+            if len(idx) == 1:
+                return idx[0]
+            return idx
     idx = pyutilib.misc.flatten(index)
     if type(idx) is list:
         if len(idx) == 1:
@@ -126,6 +149,21 @@ class IndexedComponent(Component):
     #
     _DEFAULT_INDEX_CHECKING_ENABLED = True
 
+    #
+    # For lazily constructed components, the set of indices whose
+    # construction rule has been run (or that were explicitly set).
+    # None if the component is not (or is no longer) lazily
+    # constructed.
+    #
+    _lazy_done = None
+    #
+    # For lazily constructed components, the number of indices whose
+    # construction was deferred and the number of those indices that
+    # have been realized (i.e., constructed since).
+    #
+    _lazy_deferred = 0
+    _lazy_realized = 0
+
     def __init__(self, *args, **kwds):
         from pyomo.core.base.sets import process_setarg
         #
@@ -173,6 +211,9 @@ class IndexedComponent(Component):
         state = super(IndexedComponent, self).__getstate__()
         if not self.is_indexed():
             state['_index'] = None
+        # Do not copy the (transient) slice indexes and fingerprints
+        state.pop('_slice_index', None)
+        state.pop('_fingerprints', None)
         return state
 
     def __setstate__(self, state):
@@ -188,15 +229,82 @@ class IndexedComponent(Component):
             if idx not in self._data:
                 self._getitem_when_not_present(idx)
 
+    def _construct_lazily(self, timer):
+        """Defer running the construction rule for each index until
+        the index is accessed or the component data are iterated over.
+
+        Derived classes that support lazy construction call this from
+        construct() instead of running the rule for every index, and
+        implement _construct_index().
+        """
+        self._lazy_done = set()
+        self._lazy_deferred = timer.deferred = len(self._index)
+        self._lazy_realized = timer.realized = 0
+
+    def _construct_index(self, index):
+        """Run the construction rule for a single index"""
+        raise DeveloperError(
+            "Derived component %s failed to define _construct_index()."
+            % (self.__class__.__name__,))
+
+    def _realize_index(self, index):
+        """Construct a deferred index of a lazily constructed component"""
+        done = self._lazy_done
+        if index in done:
+            return
+        done.add(index)
+        self._construct_index(index)
+        self._lazy_realized += 1
+        if len(done) >= len(self._index):
+            self._lazy_done = None
+
+    def _realize_all(self):
+        """Construct all deferred indices of a lazily constructed
+        component"""
+        done = self._lazy_done
+        if done is None:
+            return
+        timer = ConstructionTimer(self)
+        _data = self._data
+        in_order = not _data
+        for index in self._index:
+            if index not in done:
+                done.add(index)
+                if index not in _data:
+                    self._construct_index(index)
+                    self._lazy_realized += 1
+        self._lazy_done = None
+        timer.deferred = self._lazy_deferred
+        timer.realized = self._lazy_realized
+        if not in_order:
+            # Store the data in the same order as if the component was
+            # constructed eagerly (unordered sets iterate over the _data
+            # in insertion order)
+            _ordered = [(index, _data[index]) for index in self._index
+                        if index in _data]
+            if len(_ordered) == len(_data):
+                _data.clear()
+                _data.update(_ordered)
+        timer.report()
+
     def clear(self):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            self._lazy_done = None
+            self._data_removed()
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
                 % (self.__class__.__name__,))
 
+    def _data_removed(self):
+        """Discard the caches that may include deleted component data
+        (the slice indexes of this component and the cached component
+        data of the blocks that contain it)"""
+        self.__dict__.pop('_slice_index', None)
+        _structure_changed(self)
+
     def index_set(self):
         """Return the index set"""
         return self._index
@@ -216,15 +324,22 @@ class IndexedComponent(Component):
         Return the number of component data objects stored by this
         component.
         """
+        if self._lazy_done is not None:
+            self._realize_all()
         return len(self._data)
 
     def __contains__(self, idx):
         """Return true if the index is in the dictionary"""
+        if self._lazy_done is not None and idx not in self._data \
+           and idx in self._index:
+            self._realize_index(idx)
         return idx in self._data
 
     def __iter__(self):
         """Iterate over the keys in the dictionary"""
 
+        if self._lazy_done is not None:
+            self._realize_all()
         if not getattr(self._index, 'concrete', True):
             #
             # If the index set is virtual (e.g., Any) then return the
@@ -324,13 +439,15 @@ You can silence this warning by one of three ways:
                 return index
 
         if obj is _NotFound:
-            # Not good: we have to defer this import to now
-            # due to circular imports (expr imports _VarData
-            # imports indexed_component, but we need expr
-            # here
-            from pyomo.core.expr import current as EXPR
-            if index.__class__ is EXPR.GetItemExpression:
-                return index
+            if index.__class__ is not tuple \
+               and index.__class__ not in native_numeric_types:
+                # Not good: we have to defer this import to now
+                # due to circular imports (expr imports _VarData
+                # imports indexed_component, but we need expr
+                # here
+                from pyomo.core.expr import current as EXPR
+                if index.__class__ is EXPR.GetItemExpression:
+                    return index
             validated_index = self._validate_index(index)
             if validated_index is not index:
                 index = validated_index
@@ -345,10 +462,39 @@ You can silence this warning by one of three ways:
             # the default value
             #
             if obj is _NotFound:
+                if self._lazy_done is not None:
+                    self._realize_index(index)
+                    obj = self._data.get(index, _NotFound)
+                    if obj is not _NotFound:
+                        return obj
                 return self._getitem_when_not_present(index)
 
         return obj
 
+    def get_many(self, keys):
+        """
+        Return a list of the component data for each index in keys.
+
+        This is equivalent to [self[k] for k in keys], but retrieves
+        all of the indices that are already present in the component in
+        a single pass.  The remaining indices are processed by
+        __getitem__ (which validates them, returns default values, etc.)
+        """
+        if keys.__class__ is not list and keys.__class__ is not tuple:
+            keys = list(keys)
+        if self._constructed is False:
+            return [self[k] for k in keys]
+        _get = self._data.get
+        try:
+            ans = [_get(k, _NotFound) for k in keys]
+        except TypeError:
+            # Unhashable indices (e.g., slices)
+            return [self[k] for k in keys]
+        for i, obj in enumerate(ans):
+            if obj is _NotFound:
+                ans[i] = self[keys[i]]
+        return ans
+
     def __setitem__(self, index, val):
         #
         # Set the value: This relies on _setitem_when_not_present() to
@@ -376,6 +522,9 @@ You can silence this warning by one of three ways:
             # _processUnhashableIndex didn't return a slicer)
             if index.__class__ is not _IndexedComponent_slice:
                 index = self._validate_index(index)
+                if self._lazy_done is not None:
+                    # The explicit value replaces the construction rule
+                    self._lazy_done.add(index)
         else:
             return self._setitem_impl(index, obj, val)
         #
@@ -418,6 +567,8 @@ You can silence this warning by one of three ways:
         if obj is _NotFound:
             if index.__class__ is not _IndexedComponent_slice:
                 index = self._validate_index(index)
+                if self._lazy_done is not None:
+                    self._realize_index(index)
 
         # this supports "del m.x[:,1]" through a simple recursive call
         if index.__class__ is _IndexedComponent_slice:
@@ -433,6 +584,7 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            self._data_removed()
 
     def _not_constructed_error(self, idx):
         # Generate an error because the component is not constructed
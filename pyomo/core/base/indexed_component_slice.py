@@ -9,6 +9,7 @@
 #  ___________________________________________________________________________
 
 from six import PY3, iteritems, advance_iterator
+from six.moves import xrange
 from pyomo.common import DeveloperError
 
 class _IndexedComponent_slice(object):
@@ -167,6 +168,11 @@ class _IndexedComponent_slice(object):
         return ((_iter.get_last_index_wildcards(), _) for _ in _iter)
 
     def expanded_keys(self):
+        if len(self._call_stack) == 1 \
+           and self._call_stack[0][0] == _IndexedComponent_slice.slice_info:
+            # A slice of a single component: generate the matching
+            # indices without retrieving the component data
+            return _slice_generator(*self._call_stack[0][1], keys_only=True)
         _iter = self.__iter__()
         return (_iter.get_last_index() for _ in _iter)
 
@@ -179,18 +185,42 @@ class _slice_generator(object):
     """Utility (iterator) for generating the elements of one slice
 
     Iterate through the component index and yield the component data
-    values that match the slice template.
+    values (or, if keys_only is True, the indices) that match the
+    slice template.
     """
-    def __init__(self, component, fixed, sliced, ellipsis):
+    def __init__(self, component, fixed, sliced, ellipsis, keys_only=False):
         self.component = component
+        self.keys_only = keys_only
         self.fixed = fixed
         self.sliced = sliced
         self.ellipsis = ellipsis
 
         self.explicit_index_count = len(fixed) + len(sliced)
-        self.component_iter = component.__iter__()
+        index_set = getattr(component, '_index', None)
+        if ellipsis is None and fixed \
+           and hasattr(index_set, 'iter_slice') \
+           and index_set.dimen == self.explicit_index_count \
+           and _is_dense(component):
+            # Dense components indexed by a product set: only iterate
+            # over the free (sliced) components of the index
+            _slice = slice(None)
+            self.component_iter = index_set.iter_slice(tuple(
+                fixed.get(i, _slice)
+                for i in xrange(self.explicit_index_count)))
+        else:
+            matches = None
+            if ellipsis is None and fixed:
+                matches = _slice_index_lookup(
+                    component, self.explicit_index_count, fixed)
+            if matches is None:
+                self.component_iter = component.__iter__()
+            else:
+                self.component_iter = iter(matches)
         self.last_index = None
 
+    def __iter__(self):
+        return self
+
     def next(self):
         """__next__() iterator for Py2 compatibility"""
         return self.__next__()
@@ -224,12 +254,111 @@ class _slice_generator(object):
                 # Remember the index tuple corresponding to the last
                 # component data returned by this iterator
                 self.last_index = _idx
+                if self.keys_only:
+                    return index
                 # Note: it is important to use __getitem__, as the
                 # derived class may implement a non-standard storage
                 # mechanism (e.g., Param)
                 return self.component[index]
 
 
+class _SliceIndex(object):
+    """Secondary indexes of the data of an indexed component
+
+    Each index is keyed by the number of indices and the positions of
+    the fixed (non-wildcard) indices in a slice, and maps the values of
+    the fixed indices to the list of matching indices (in the order in
+    which the component iterates over its indices).  All indexes are
+    discarded when component data are deleted (see
+    IndexedComponent._data_removed()) or the component gained or lost
+    data.  As building an index costs more than a single pass
+    over the component indices, the indexes are only built for
+    components that are sliced more than once without changes.
+    """
+
+    __slots__ = ('data', 'ndata', 'nindex', 'indexes', 'dense')
+
+    def __init__(self, component):
+        self.data = component._data
+        self.ndata = len(self.data)
+        self.nindex = _index_len(component)
+        self.indexes = {}
+        # True if the component has data for every member of its
+        # index set (None until checked by _is_dense())
+        self.dense = None
+
+    def is_valid(self, component):
+        return self.data is component._data \
+            and self.ndata == len(self.data) \
+            and self.nindex == _index_len(component)
+
+
+def _index_len(component):
+    index_set = component._index
+    if not getattr(index_set, 'concrete', True):
+        return None
+    return len(index_set)
+
+
+def _is_dense(component):
+    """Return True if the component has data for every member of its
+    (concrete) index set.  The result is cached on the _SliceIndex of
+    the component, so the indices are only checked once after each
+    change to the component data."""
+    if len(component._data) != _index_len(component):
+        return False
+    cache = component.__dict__.get('_slice_index', None)
+    if cache is None or not cache.is_valid(component):
+        cache = component.__dict__['_slice_index'] = _SliceIndex(component)
+    if cache.dense is None:
+        # Note: the counts are equal, so the data is dense exactly when
+        # every member of the index set has data
+        data = component._data
+        cache.dense = all(idx in data for idx in component._index)
+    return cache.dense
+
+
+def _slice_index_lookup(component, explicit_index_count, fixed):
+    """Return the indices of the component that match the fixed indices
+    of a slice (with no ellipsis), using (and building, if necessary)
+    the _SliceIndex of the component.  Returns None if the indices
+    cannot be looked up (e.g., the indices are not hashable), in which
+    case the caller should iterate over all the indices."""
+    if getattr(component, '_data', None) is None \
+       or not hasattr(component, '_index'):
+        return None
+    cache = component.__dict__.get('_slice_index', None)
+    if cache is None or not cache.is_valid(component):
+        # Note: this is the first slice since the component (or model)
+        # changed: the caller iterates over all the indices
+        component.__dict__['_slice_index'] = _SliceIndex(component)
+        return None
+    positions = tuple(sorted(fixed))
+    key = tuple(fixed[i] for i in positions)
+    index = cache.indexes.get((explicit_index_count, positions), None)
+    try:
+        if index is None:
+            index = {}
+            for idx in component:
+                _idx = idx if type(idx) is tuple else (idx,)
+                if len(_idx) != explicit_index_count:
+                    continue
+                _key = tuple(_idx[i] for i in positions)
+                matches = index.get(_key, None)
+                if matches is None:
+                    index[_key] = [idx]
+                else:
+                    matches.append(idx)
+            # Note: iterating over a lazily constructed component may
+            # have added data
+            if cache.is_valid(component):
+                cache.indexes[explicit_index_count, positions] = index
+        return index.get(key, ())
+    except TypeError:
+        # Unhashable indices
+        return None
+
+
 # Mock up a callable object with a "check_complete" method
 def _advance_iter(_iter):
     return advance_iterator(_iter)
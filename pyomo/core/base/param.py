@@ -13,18 +13,34 @@ __all__ = ['Param']
 import sys
 import types
 import logging
+from numbers import Number, Integral
 from weakref import ref as weakref_ref
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:     #pragma:nocover
+    from collections import MutableMapping
+
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ComponentData
 from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.numvalue import NumericValue, native_types, value
+from pyomo.core.base.numvalue import (NumericValue, native_types,
+                                      native_numeric_types, value)
 from pyomo.core.base.set_types import Any
+from pyomo.core.base.sets import _OrderedSetData, _SetProduct
+from pyomo.core.base.rangeset import RangeSet
 
 from six import iteritems, iterkeys, next, itervalues
+from six.moves import zip
+
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
 
 logger = logging.getLogger('pyomo.core')
 
@@ -177,6 +193,362 @@ class _ParamData(ComponentData, NumericValue):
     __bool__ = __nonzero__
 
 
+
+class _ArrayParamData(_ParamData):
+    """
+    This class defines the data for a mutable parameter whose value is
+    stored in the array storage of the owning Param (see
+    Param(storage=...)).
+
+    These objects are only created when the parameter is referenced
+    (e.g., in an expression).
+    """
+
+    __slots__ = ('_store', '_pos')
+
+    def __init__(self, component, store, pos):
+        self._component = weakref_ref(component)
+        self._store = store
+        self._pos = pos
+
+    def __getstate__(self):
+        # Note: the value is held by the store, so we skip the
+        # _ParamData slots
+        state = super(_ParamData, self).__getstate__()
+        for i in _ArrayParamData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    @property
+    def _value(self):
+        return self._store._get_value(self._pos)
+    @_value.setter
+    def _value(self, val):
+        self._store._set_value(self._pos, val)
+
+
+def _array_position_map(index_set):
+    """
+    Return a function that maps the members of an ordered index set to
+    their (0-based) position in the set.  Returns None if the positions
+    cannot be computed from the set.
+    """
+    if isinstance(index_set, RangeSet):
+        if index_set.filter is not None or index_set.validate is not None:
+            return None
+        start = index_set._start_val
+        step = index_set._step_val
+        if type(start) is not int or type(step) is not int:
+            return None
+        n = len(index_set)
+        def locate(idx):
+            pos, rem = divmod(idx - start, step)
+            if rem or pos < 0 or pos >= n:
+                raise KeyError(idx)
+            return int(pos)
+        return locate
+    elif isinstance(index_set, _OrderedSetData):
+        if index_set._is_sorted:
+            # Adding members to a sorted set will move the existing
+            # members: only allow lookups while the set is unchanged
+            if index_set._is_sorted == 2:
+                index_set._sort()
+            n = len(index_set)
+            def locate(idx):
+                if len(index_set.order_dict) != n:
+                    raise RuntimeError(
+                        "The members of the sorted Set '%s' changed after "
+                        "the dense storage of a Param indexed by it was "
+                        "created" % (index_set.name,))
+                return index_set.order_dict[idx]
+            return locate
+        # New members are appended to insertion-ordered sets
+        return lambda idx: index_set.order_dict[idx]
+    elif isinstance(index_set, _SetProduct):
+        factors = index_set.set_tuple
+        if any(s.dimen != 1 for s in factors):
+            return None
+        maps = [_array_position_map(s) for s in factors]
+        if any(m is None for m in maps):
+            return None
+        sizes = [len(s) for s in factors]
+        dimen = len(factors)
+        def locate(idx):
+            if idx.__class__ is not tuple or len(idx) != dimen:
+                raise KeyError(idx)
+            pos = 0
+            for loc, size, i in zip(maps, sizes, idx):
+                j = loc(i)
+                if j >= size:
+                    raise RuntimeError(
+                        "The members of Set '%s' changed after the dense "
+                        "storage of a Param indexed by it was created"
+                        % (index_set.name,))
+                pos = pos*size + j
+            return pos
+        return locate
+    return None
+
+
+class _ParamArray(MutableMapping):
+    """
+    The array storage for the values of an indexed Param (see
+    Param(storage=...)).
+
+    This is a mapping from indices to values (immutable Params) or
+    _ArrayParamData objects (mutable Params) that replaces the
+    Param._data dict.  The values are stored in a single array (a numpy
+    array if numpy is available, a list otherwise), along with a byte
+    per entry that records if the entry is defined.  The position of an
+    entry is computed from the (ordered) index set in dense storage, and
+    is assigned as entries are added in sparse storage.  The
+    _ArrayParamData objects of mutable Params are created (and cached)
+    the first time the entry is referenced.
+    """
+
+    # Entry states
+    _UNDEFINED = 0
+    _VALID = 1
+    _NOT_VALID = 2
+
+    def __init__(self, component, dense):
+        self._component = component
+        self._locate = None
+        if dense:
+            self._locate = _array_position_map(component._index)
+            if self._locate is None:
+                raise ValueError(
+                    "Dense storage for Param '%s' requires an ordered index "
+                    "set (a RangeSet, an ordered Set, or a product of "
+                    "ordered Sets); use storage='sparse' instead"
+                    % (component.name,))
+            self._positions = None
+            size = len(component._index)
+        else:
+            self._positions = {}
+            size = 0
+        self._state = bytearray(size)
+        if has_numpy:
+            self._values = numpy.zeros(size, dtype=numpy.int64)
+        else:
+            self._values = [None]*size
+        self._len = 0
+        self._views = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # The locate function is rebuilt from the index set on demand
+        state['_locate'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _resize(self, size):
+        n = len(self._state)
+        if size <= n:
+            return
+        self._state.extend(bytearray(size - n))
+        if has_numpy:
+            if size > len(self._values):
+                values = numpy.zeros(max(size, 2*len(self._values)),
+                                     dtype=self._values.dtype)
+                values[:n] = self._values[:n]
+                self._values = values
+        else:
+            self._values.extend([None]*(size - n))
+
+    def _position(self, index, add=False):
+        """Return the position of an index (or None)"""
+        if self._positions is not None:
+            pos = self._positions.get(index, None)
+            if pos is None and add:
+                pos = self._positions[index] = len(self._state)
+                self._resize(pos + 1)
+            return pos
+        locate = self._locate
+        if locate is None:
+            locate = self._locate = _array_position_map(
+                self._component._index)
+        try:
+            pos = locate(index)
+        except (KeyError, TypeError, ValueError):
+            # Match the dict behavior for unhashable indices
+            hash(index)
+            if add:
+                raise KeyError(
+                    "Index '%s' is not valid for the dense storage of "
+                    "Param '%s'" % (index, self._component.name))
+            return None
+        if pos >= len(self._state):
+            if not add:
+                return None
+            self._resize(pos + 1)
+        return pos
+
+    def _get_value(self, pos):
+        state = self._state[pos]
+        if state != _ParamArray._VALID:
+            return _NotValid
+        if has_numpy:
+            return self._values.item(pos)
+        return self._values[pos]
+
+    def _set_value(self, pos, val):
+        state = self._state
+        if val is _NotValid:
+            if not state[pos]:
+                self._len += 1
+            state[pos] = _ParamArray._NOT_VALID
+            return
+        if val.__class__ not in native_numeric_types \
+           and not isinstance(val, Number):
+            raise ValueError(
+                "Param '%s' uses array storage and can only hold numeric "
+                "values: '%s' (type %s) is not numeric"
+                % (self._component.name, val, type(val)))
+        if not state[pos]:
+            self._len += 1
+        if has_numpy:
+            if self._values.dtype.kind != 'f' and not isinstance(val, Integral):
+                self._values = self._values.astype(numpy.float64)
+            self._values[pos] = val
+        else:
+            self._values[pos] = val
+        state[pos] = _ParamArray._VALID
+
+    def _positions_of(self, keys):
+        """Return the positions of a list of indices, adding the
+        indices that are not stored yet.  If keys is None, return the
+        positions of all members of the index set (in order)."""
+        if self._positions is not None:
+            if keys is None:
+                keys = list(self._component._index)
+            return [self._position(key, True) for key in keys]
+        if keys is None:
+            n = len(self._component._index)
+            self._resize(n)
+            return numpy.arange(n) if has_numpy else range(n)
+        locate = self._locate
+        if locate is None:
+            locate = self._locate = _array_position_map(
+                self._component._index)
+        try:
+            positions = [locate(key) for key in keys]
+        except (KeyError, TypeError, ValueError):
+            # Generate the appropriate exception
+            positions = [self._position(key, True) for key in keys]
+        if positions:
+            self._resize(max(positions) + 1)
+        return positions
+
+    def set_many(self, keys, values):
+        """
+        Set the values for a list of indices (all members of the index
+        set, in order, if keys is None).  The values are a sequence
+        (e.g., a numpy array) of numbers, or a single number.
+        """
+        positions = self._positions_of(keys)
+        if not has_numpy:
+            if not hasattr(values, '__len__'):
+                values = [values]*len(positions)
+            for pos, val in zip(positions, values):
+                self._set_value(pos, val)
+            return
+        values = numpy.asarray(values)
+        if values.dtype.kind not in 'biuf':
+            raise ValueError(
+                "Param '%s' uses array storage and can only hold numeric "
+                "values (got an array of type %s)"
+                % (self._component.name, values.dtype))
+        if values.dtype.kind == 'f' and self._values.dtype.kind != 'f':
+            self._values = self._values.astype(numpy.float64)
+        positions = numpy.array(positions, dtype=numpy.intp)
+        self._values[positions] = values
+        state = numpy.frombuffer(self._state, dtype=numpy.uint8)
+        self._len += int(numpy.count_nonzero(state[positions] == 0))
+        state[positions] = _ParamArray._VALID
+
+    def add(self, index):
+        """Add an entry without a valid value and return its
+        _ArrayParamData"""
+        pos = self._position(index, True)
+        self._set_value(pos, _NotValid)
+        return self[index]
+
+    def iter_values(self):
+        """Iterate over the (index, value) pairs of the defined entries"""
+        state = self._state
+        get = self._get_value
+        if self._positions is not None:
+            for index, pos in iteritems(self._positions):
+                if state[pos]:
+                    yield index, get(pos)
+        else:
+            n = len(state)
+            for pos, index in enumerate(self._component._index):
+                if pos >= n:
+                    break
+                if state[pos]:
+                    yield index, get(pos)
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, index):
+        pos = self._position(index)
+        return pos is not None and self._state[pos] != 0
+
+    def __iter__(self):
+        return (index for index, val in self.iter_values())
+
+    def __getitem__(self, index):
+        pos = self._position(index)
+        if pos is None or not self._state[pos]:
+            raise KeyError(index)
+        if self._component._mutable:
+            ans = self._views.get(pos, None)
+            if ans is None:
+                ans = self._views[pos] = _ArrayParamData(
+                    self._component, self, pos)
+            return ans
+        return self._get_value(pos)
+
+    def __setitem__(self, index, val):
+        if isinstance(val, _ParamData):
+            val = val._value
+        self._set_value(self._position(index, True), val)
+
+    def __delitem__(self, index):
+        pos = self._position(index)
+        if pos is None or not self._state[pos]:
+            raise KeyError(index)
+        self._state[pos] = _ParamArray._UNDEFINED
+        self._len -= 1
+        self._views.pop(pos, None)
+
+    def clear(self):
+        self._state[:] = bytearray(len(self._state))
+        if self._positions is not None:
+            self._positions = {}
+            self._state = bytearray()
+            if has_numpy:
+                self._values = numpy.zeros(0, dtype=self._values.dtype)
+            else:
+                self._values = []
+        self._len = 0
+        self._views = {}
+
+
+def _is_slice(index):
+    if index.__class__ is tuple:
+        for i in index:
+            if i.__class__ is slice or i is Ellipsis:
+                return True
+        return False
+    return index.__class__ is slice or index is Ellipsis
+
+
 @ModelComponentFactory.register("Parameter data that is used to define a model instance.")
 class Param(IndexedComponent):
     """
@@ -196,10 +568,18 @@ class Param(IndexedComponent):
        default     A scalar, rule, or dictionary that defines default
                      values for this parameter
        initialize  A dictionary or rule for setting up this parameter
-                     with existing model data
+                     with existing model data.  Indexed parameters may
+                     also be initialized with a pandas Series, or a
+                     numpy array of values in the order of the index set
+       storage     The storage for the values of an indexed parameter:
+                     'dict' (the default), 'dense' (numeric values in
+                     an array that spans the ordered index set), or
+                     'sparse' (numeric values in an array that only
+                     holds the defined entries)
     """
 
     DefaultMutable = False
+    _storage = 'dict'
 
     def __new__(cls, *args, **kwds):
         if cls != Param:
@@ -218,6 +598,7 @@ class Param(IndexedComponent):
         self._mutable       = kwd.pop('mutable', Param.DefaultMutable )
         self._default_val   = kwd.pop('default', _NotValid )
         self._dense_initialize = kwd.pop('initialize_as_dense', False)
+        storage             = kwd.pop('storage', 'dict')
         #
         if 'repn' in kwd:
             logger.error(
@@ -228,6 +609,16 @@ class Param(IndexedComponent):
         #
         kwd.setdefault('ctype', Param)
         IndexedComponent.__init__(self, *args, **kwd)
+        #
+        if storage not in ('dict', 'dense', 'sparse'):
+            raise ValueError(
+                "Unknown Param storage '%s': expected 'dict', 'dense', "
+                "or 'sparse'" % (storage,))
+        if storage != 'dict':
+            if not self.is_indexed():
+                raise ValueError(
+                    "Array storage is only supported for indexed parameters")
+            self._storage = storage
 
     def __len__(self):
         """
@@ -299,6 +690,14 @@ class Param(IndexedComponent):
         repeated __getitem__ calls are too expensive to extract
         the contents of a parameter.
         """
+        if self._data.__class__ is _ParamArray:
+            ans = self.extract_values_sparse()
+            if self._default_val is not _NotValid and \
+               len(ans) != len(self._index):
+                for key in self._index:
+                    if key not in ans:
+                        ans[key] = value(self[key])
+            return ans
         if self._mutable:
             #
             # The parameter is mutable, parameter data are ParamData types.
@@ -331,6 +730,18 @@ class Param(IndexedComponent):
         repeated __getitem__ calls are too expensive to extract
         the contents of a parameter.
         """
+        if self._data.__class__ is _ParamArray:
+            #
+            # Read the values from the array storage (without creating
+            # the _ParamData objects)
+            #
+            ans = {}
+            for key, val in self._data.iter_values():
+                if val is _NotValid:
+                    # Raise the usual exception for undefined values
+                    val = self._data[key]()
+                ans[key] = val
+            return ans
         if self._mutable:
             #
             # The parameter is mutable, parameter data are ParamData types.
@@ -365,6 +776,12 @@ class Param(IndexedComponent):
         if not self._mutable:
             _raise_modifying_immutable_error(self, '*')
         #
+        if self.is_indexed():
+            items = self._array_items(new_values)
+            if items is not None:
+                self._store_many(items[0], items[1], check)
+                return
+        #
         _srcType = type(new_values)
         _isDict = _srcType is dict or ( \
             hasattr(_srcType, '__getitem__')
@@ -383,7 +800,17 @@ class Param(IndexedComponent):
         # Param logic for ensuring data integrity.
         #
         if self.is_indexed():
-            if _isDict:
+            if self._data.__class__ is _ParamArray:
+                if _isDict:
+                    # Note: the array storage cannot hold invalid
+                    # indices or values, so they are always validated
+                    self._store_many(
+                        list(new_values.keys()),
+                        [val if val.__class__ in native_types else value(val)
+                         for val in itervalues(new_values)])
+                else:
+                    self._data.set_many(list(self._index), new_values)
+            elif _isDict:
                 # It is possible that the Param is sparse and that the
                 # index is not already in the _data dict.  As these
                 # cases are rare, we will recover from the exception
@@ -463,6 +890,8 @@ class Param(IndexedComponent):
             # reasonable values produces an informative error.
             if self._mutable:
                 # Note: _ParamData defaults to _NotValid
+                if self._data.__class__ is not dict:
+                    return self._data.add(index)
                 ans = self._data[index] = _ParamData(self)
                 return ans
             if self.is_indexed():
@@ -500,7 +929,10 @@ class Param(IndexedComponent):
         # then call validate.
         #
         if self._mutable:
-            return self._setitem_when_not_present(index, val)
+            if self._data.__class__ is dict:
+                return self._setitem_when_not_present(index, val)
+            self._setitem_when_not_present(index, val)
+            return self._data[index]
         #
         # For immutable params, we never inject the default into the data
         # dictionary.  This will break validation, as the validation rule is
@@ -587,6 +1019,11 @@ class Param(IndexedComponent):
                 self.set_value(value, index)
                 return self
             elif self._mutable:
+                if self._data.__class__ is not dict:
+                    # Store the value without creating the _ParamData
+                    self._data[index] = value
+                    self._validate_value(index, value)
+                    return value
                 obj = self._data[index] = _ParamData(self)
                 obj.set_value(value, index)
                 return obj
@@ -597,8 +1034,76 @@ class Param(IndexedComponent):
                 self._validate_value(index, value, _check_domain)
                 return value
         except:
-            del self._data[index]
+            self._data.pop(index, None)
+
 
+    def __setitem__(self, index, val):
+        if self._data.__class__ is _ParamArray and _is_slice(index):
+            #
+            # Vectorized update of the entries that match a slice (e.g.,
+            # "m.p[:,1] = 5") that does not create the _ParamData
+            # objects
+            #
+            if self._constructed and not self._mutable:
+                _raise_modifying_immutable_error(self, index)
+            _slice = self._processUnhashableIndex(index)
+            keys = list(_slice.expanded_keys())
+            if val.__class__ not in native_types \
+               and isinstance(val, NumericValue):
+                val = val()
+            for key in keys:
+                self._validate_value(key, val)
+                if not self._validate:
+                    # The domain only needs to be checked once
+                    break
+            self._data.set_many(keys, val)
+            return
+        return super(Param, self).__setitem__(index, val)
+
+    def _array_items(self, values):
+        """
+        Return the (indices, values) of a pandas Series, or of a numpy
+        array of values in the order of the index set.  Returns None
+        for all other objects.
+        """
+        if values.__class__.__name__ == 'Series' \
+           and hasattr(values, 'index') and hasattr(values, 'values'):
+            return list(values.index), values.values
+        if has_numpy and isinstance(values, numpy.ndarray):
+            values = values.ravel()
+            if len(values) != len(self._index):
+                raise ValueError(
+                    "Cannot set the values of Param '%s': %s values were "
+                    "given for an index set with %s members"
+                    % (self.name, len(values), len(self._index)))
+            # Note: None stands for all indices, in order
+            return None, values
+        return None
+
+    def _store_many(self, keys, values, check=True):
+        """
+        Store the values for a list of indices (all members of the
+        index set, in order, if keys is None), using the vectorized
+        update of the array storage when it is available.
+        """
+        if hasattr(values, 'tolist'):
+            value_list = values.tolist()
+        else:
+            value_list = values
+        if self._data.__class__ is dict:
+            if keys is None:
+                keys = self._index
+            for key, val in zip(keys, value_list):
+                self[key] = val
+            return
+        if check:
+            # Validate the indices and values as __setitem__ does
+            if keys is not None:
+                keys = [self._validate_index(key) for key in keys]
+            for key, val in zip(self._index if keys is None else keys,
+                                value_list):
+                self._validate_value(key, val)
+        self._data.set_many(keys, values)
 
     def _validate_value(self, index, value, validate_domain=True):
         """
@@ -628,6 +1133,18 @@ class Param(IndexedComponent):
         _init_type = type(_init)
         _isDict = _init_type is dict
 
+        if self.is_indexed():
+            items = None
+            if not _isDict:
+                items = self._array_items(_init)
+            elif self._data.__class__ is _ParamArray:
+                items = (list(_init.keys()),
+                         [val if val.__class__ in native_types else value(val)
+                          for val in itervalues(_init)])
+            if items is not None:
+                self._store_many(items[0], items[1])
+                return
+
         if _isDict or _init_type in native_types:
             #
             # We skip the other tests if we have a dictionary or constant
@@ -856,6 +1373,11 @@ This has resulted in the conversion of the source to dense form.
         #
         self._constructed = None
         #
+        # Set up the array storage
+        #
+        if self._storage != 'dict' and self._data.__class__ is dict:
+            self._data = _ParamArray(self, self._storage == 'dense')
+        #
         # Step #1: initialize data from rule value
         #
         if self._rule is not _NotValid:
@@ -994,6 +1516,14 @@ class SimpleParam(_ParamData, Param):
 
 class IndexedParam(Param):
 
+    def clear(self):
+        """Clear the data in this component"""
+        if self._data.__class__ is _ParamArray:
+            self._data.clear()
+            self._data_removed()
+        else:
+            super(IndexedParam, self).clear()
+
     def __call__(self, exception=True):
         """Compute the value of the parameter"""
         if exception:
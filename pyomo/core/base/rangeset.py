@@ -178,13 +178,37 @@ class RangeSet(OrderedSimpleSet):
         if key >= 1:
             if key > self._len:
                 raise IndexError("Cannot index a RangeSet past the last element")
-            return self._start_val + (key-1)*self._step_val
         elif key < 0:
             if self._len+key < 0:
                 raise IndexError("Cannot index a RangeSet past the first element")
-            return self._start_val + (self._len+key)*self._step_val
+            key += self._len + 1
         else:
             raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        if self.filter is None and self.validate is None:
+            return self._start_val + (key-1)*self._step_val
+        #
+        # The members of filtered sets are not evenly spaced
+        #
+        for i, val in enumerate(self, 1):
+            if i == key:
+                return val
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if self.filter is None and self.validate is None:
+            if self._set_contains(match_element):
+                return int(round((match_element - self._start_val)
+                                 / float(self._step_val))) + 1
+        else:
+            for i, val in enumerate(self, 1):
+                if val == match_element:
+                    return i
+        raise IndexError(
+            "Unknown input element=%s provided as input to ord() method "
+            "for set=%s" % (match_element, self.name))
 
     def _set_contains(self, element):
         """
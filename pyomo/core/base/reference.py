@@ -256,7 +256,7 @@ def _get_base_sets(_set):
     else:
         yield _set
 
-def _identify_wildcard_sets(iter_stack, index):
+def _identify_wildcard_sets(iter_stack, index, cache=None):
     # if we have already decided that there isn't a comon index for the
     # slices, there is nothing more we can do.  Bail.
     if index is None:
@@ -267,6 +267,14 @@ def _identify_wildcard_sets(iter_stack, index):
     tmp = [None]*len(iter_stack)
     for i, level in enumerate(iter_stack):
         if level is not None:
+            # The wildcard sets only depend on the _slice_generator, so
+            # the caller may cache them for all the items generated by
+            # the same _slice_generator
+            if cache is not None:
+                wildcard_sets = cache.get(level, None)
+                if wildcard_sets is not None:
+                    tmp[i] = wildcard_sets
+                    continue
             offset = 0
             wildcard_sets = {}
             for j,s in enumerate(_get_base_sets(level.component.index_set())):
@@ -294,6 +302,8 @@ def _identify_wildcard_sets(iter_stack, index):
             #if offset != level.explicit_index_count:
             #    return None
             tmp[i] = wildcard_sets
+            if cache is not None:
+                cache[level] = wildcard_sets
     if not index:
         return tmp
 
@@ -435,6 +445,7 @@ def Reference(reference, ctype=_NotSpecified):
         # Reference
         ctypes = set((1,2))
     index = []
+    wildcard_cache = {}
     for obj in _iter:
         ctypes.add(obj.type())
         if not isinstance(obj, ComponentData):
@@ -447,7 +458,8 @@ def Reference(reference, ctype=_NotSpecified):
             # skipped if the User knows better and forced a ctype on us.
             ctypes.add(0)
         if index is not None:
-            index = _identify_wildcard_sets(_iter._iter_stack, index)
+            index = _identify_wildcard_sets(
+                _iter._iter_stack, index, wildcard_cache)
         # Note that we want to walk the entire slice, unless we can
         # prove that BOTH there aren't common indexing sets AND there is
         # more than one ctype.
@@ -32,7 +32,7 @@ from pyomo.core.base.indexed_component import IndexedComponent, \
     UnindexedComponent_set
 from pyomo.core.base.numvalue import native_numeric_types
 
-from six import itervalues, iteritems, string_types
+from six import itervalues, iteritems, string_types, get_unbound_function
 from six.moves import xrange
 
 logger = logging.getLogger('pyomo.core')
@@ -456,7 +456,7 @@ class _OrderedSetData(_SetDataBase):
         """
         try:
             element_position = self.ord(match_element)
-        except IndexError:
+        except (IndexError, KeyError):
             raise KeyError("Cannot obtain next() member of set="+self.name+"; input element="+str(match_element)+" is not a member of the set!")
         #
         try:
@@ -477,10 +477,10 @@ class _OrderedSetData(_SetDataBase):
         """
         try:
             element_position = self.ord(match_element)
-        except KeyError:
+        except (IndexError, KeyError):
             raise KeyError("Cannot obtain nextw() member of set="+self.name+"; input element="+str(match_element)+" is not a member of the set!")
         #
-        return self[(element_position+k-1) % len(self.value) + 1]
+        return self[(element_position+k-1) % len(self) + 1]
 
     def prev(self, match_element, k=1):
         """
@@ -1540,6 +1540,18 @@ class _SetProduct(_SetOperator):
         # Do we really need to check if element is a tuple???
         # if type(element) is not tuple:
         #    return False
+        set_tuple = self.set_tuple
+        if self.dimen == len(set_tuple) and element.__class__ is tuple:
+            # Fast path for products of one-dimensional sets
+            if len(element) != len(set_tuple):
+                return False
+            try:
+                for subset, x in zip(set_tuple, element):
+                    if not subset._set_contains(x):
+                        return False
+                return True
+            except:
+                return False
         try:
             ctr = 0
             for subset in self.set_tuple:
@@ -1573,6 +1585,120 @@ class _SetProduct(_SetOperator):
             ans *= len(_set)
         return ans
 
+    def __getitem__(self, key):
+        """
+        Return the specified member of the set.  Valid index values
+        are 1 .. len(set), or -1 .. -len(set).
+
+        The member is computed from the positions in each of the
+        underlying sets, so the product is never enumerated.
+        """
+        if not self.ordered:
+            return SimpleSet.__getitem__(self, key)
+        _len = len(self)
+        if key >= 1:
+            if key > _len:
+                raise IndexError("Cannot index a set past the last element")
+        elif key < 0:
+            if _len+key < 0:
+                raise IndexError("Cannot index a set past the first element")
+            key += _len + 1
+        else:
+            raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        key -= 1
+        ans = []
+        for _set in reversed(self.set_tuple):
+            key, i = divmod(key, len(_set))
+            ans.append(_ordered_set_member(_set, i+1))
+        ans.reverse()
+        if self.is_flat_product():
+            return tuple(ans)
+        return pyutilib_misc_flatten_tuple(tuple(ans))
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if not self.ordered:
+            raise ValueError("Cannot call ord() on the unordered set '%s'"
+                             % (self.name,))
+        if self.dimen is not None and type(match_element) is tuple \
+           and len(match_element) == self.dimen:
+            ans = 0
+            ctr = 0
+            for _set in self.set_tuple:
+                d = _set.dimen
+                if d == 1:
+                    val = match_element[ctr]
+                else:
+                    val = match_element[ctr:ctr+d]
+                i = _ordered_set_position(_set, val)
+                if i is None:
+                    break
+                ans = ans*len(_set) + i - 1
+                ctr += d
+            else:
+                return ans + 1
+        raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+
+    def first(self):
+        """
+        Return the first element of the set.
+        """
+        return self[1]
+
+    def last(self):
+        """
+        Return the last element of the set.
+        """
+        return self[len(self)]
+
+    next = get_unbound_function(_OrderedSetData.next)
+    nextw = get_unbound_function(_OrderedSetData.nextw)
+    prev = get_unbound_function(_OrderedSetData.prev)
+    prevw = get_unbound_function(_OrderedSetData.prevw)
+
+    def iter_slice(self, index):
+        """
+        Iterate over the members of the set that match a slice.
+
+        The index is a tuple with one entry for each dimension of the
+        set, where slice(None) is a wildcard and any other value fixes
+        that component.  Only the underlying sets with wildcard
+        components are iterated over.
+        """
+        if self.dimen is None or len(index) != self.dimen:
+            raise ValueError(
+                "Cannot slice set '%s' with an index of dimension %s "
+                "(expected dimension %s)"
+                % (self.name, len(index), self.dimen))
+        factors = []
+        ctr = 0
+        for _set in self.set_tuple:
+            d = _set.dimen
+            idx = index[ctr:ctr+d]
+            ctr += d
+            fixed = [(i, val) for i, val in enumerate(idx)
+                     if val.__class__ is not slice]
+            if not fixed:
+                factors.append(_set)
+            elif len(fixed) == d:
+                val = idx[0] if d == 1 else idx
+                if val not in _set:
+                    return
+                factors.append((val,))
+            else:
+                factors.append(
+                    [val for val in _set
+                     if all(val[i] == v for i, v in fixed)])
+        if self.is_flat_product():
+            for i in itertools.product(*factors):
+                yield i
+        else:
+            for i in itertools.product(*factors):
+                yield pyutilib_misc_flatten_tuple(i)
+
     def _compute_dimen(self):
         ans=0
         for _set in self.set_tuple:
@@ -1619,6 +1745,26 @@ class _SetProduct(_SetOperator):
             next_tuple_index += member_set.dimen
         return True
 
+
+
+def _ordered_set_position(_set, val):
+    """Return the (1-based) position of val in an ordered set, or None"""
+    if isinstance(_set, (_OrderedSetData, _SetProduct)):
+        try:
+            return _set.ord(val)
+        except (IndexError, KeyError):
+            return None
+    for i, x in enumerate(_set, 1):
+        if x == val:
+            return i
+    return None
+
+def _ordered_set_member(_set, i):
+    """Return the member of an ordered set at (1-based) position i"""
+    if isinstance(_set, (_OrderedSetData, _SetProduct)):
+        return _set[i]
+    return next(itertools.islice(_set, i-1, None))
+
 # REVIEW - END
 
 class IndexedSet(Set):
@@ -0,0 +1,262 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Binary snapshots of constructed Pyomo models.
+
+A snapshot file starts with a short header (_SNAPSHOT_MAGIC followed
+by a format byte) and is followed by a stream of pickles written by a
+single pickler, so that every object (index, variable, parameter,
+expression node) is stored once and then referenced by its memo id.
+
+Component data and expression nodes make up nearly all of the objects
+in a constructed model.  Pickling them one at a time spends most of its
+time building (and then unpacking) a state dict per object.  The
+snapshot format instead stores these "slot-only" objects as bare
+shells in the first pickle (the block hierarchy), and then stores their
+state in batches: for each class, the list of objects followed by one
+column per slot.  Float columns (e.g., variable values and bounds) are
+stored as packed double arrays.  Loading restores each column with a
+single C-level map() over the objects.
+
+Snapshots, like pickles, store rules and other functions by reference
+and must only be loaded from trusted sources.
+"""
+
+__all__ = ['save_snapshot', 'load_snapshot']
+
+import mmap
+import pickle
+from array import array
+from collections import deque
+from itertools import repeat
+from operator import attrgetter
+from weakref import ref as weakref_ref
+
+from six import PY3, iteritems
+from six.moves import copyreg
+
+from pyutilib.misc import PauseGC
+
+from pyomo.core.expr.numvalue import NumericValue
+from pyomo.core.expr.expr_pyomo5 import ExpressionBase
+from pyomo.core.base.component import ComponentData
+from pyomo.core.base.expression import _GeneralExpressionDataImpl
+
+_SNAPSHOT_MAGIC = b'PYOMO-SNAPSHOT\n'
+# Format byte: the block pickled as a single object (Python 2), or the
+# block hierarchy followed by batches of slot state (Python 3)
+_PICKLE_FORMAT = b'\x00'
+_COLUMN_FORMAT = b'\x01'
+
+#
+# __setstate__ implementations that only assign the state to the
+# object's slots (resolving the '_component' weakref)
+#
+_generic_setstate = set(
+    getattr(cls.__setstate__, '__func__', cls.__setstate__)
+    for cls in (NumericValue, ComponentData, _GeneralExpressionDataImpl))
+
+_newobj = copyreg.__newobj__
+_setattr = object.__setattr__
+_float_type = set([float])
+
+
+def _slot_layout(obj):
+    """Return the slot names for the class of obj if instances of the
+    class can be stored as a shell plus slot columns (or None)
+
+    This is the case when the class has no instance __dict__, its
+    __setstate__ only assigns the state, and its __getstate__ returns
+    exactly its slots (with '_component' dereferenced).
+    """
+    cls = obj.__class__
+    if not issubclass(cls, (ComponentData, ExpressionBase)) \
+       or hasattr(obj, '__dict__'):
+        return None
+    setstate = getattr(cls.__setstate__, '__func__', cls.__setstate__)
+    if setstate not in _generic_setstate:
+        return None
+    names = []
+    for base in reversed(cls.__mro__):
+        slots = base.__dict__.get('__slots__', ())
+        if slots.__class__ is str:
+            slots = (slots,)
+        for name in slots:
+            if name in ('__weakref__', '__dict__') or name in names:
+                continue
+            if name.startswith('__'):
+                # Name-mangled slot
+                return None
+            names.append(name)
+    try:
+        state = obj.__getstate__()
+        if len(state) != len(names):
+            return None
+        for name in names:
+            val = getattr(obj, name)
+            if name == '_component' and val is not None:
+                val = val()
+            if state[name] is not val:
+                return None
+    except (AttributeError, KeyError):
+        return None
+    return tuple(names)
+
+
+class _SnapshotDispatch(dict):
+    """The dispatch table for the _SnapshotPickler
+
+    The pickler looks up the reduction function for every object that it
+    does not handle natively by the object's class.  Reduction functions
+    are created the first time a class is seen.
+    """
+
+    def __init__(self, pickler):
+        super(_SnapshotDispatch, self).__init__()
+        self.pickler = pickler
+        self.unhandled = set()
+
+    def __missing__(self, cls):
+        if cls in self.unhandled or \
+           not issubclass(cls, (ComponentData, ExpressionBase)):
+            self.unhandled.add(cls)
+            raise KeyError(cls)
+        ans = self[cls] = self.pickler._shell_reducer(cls)
+        return ans
+
+
+class _SnapshotPickler(pickle.Pickler):
+
+    def __init__(self, stream):
+        super(_SnapshotPickler, self).__init__(
+            stream, protocol=pickle.HIGHEST_PROTOCOL)
+        self.dispatch_table = _SnapshotDispatch(self)
+        self.layouts = {}
+        self.pending = {}
+
+    def _shell_reducer(self, cls):
+        layouts = self.layouts
+        protocol = pickle.HIGHEST_PROTOCOL
+
+        def reduce_shell(obj):
+            names = layouts.get(cls, 0)
+            if names == 0:
+                names = layouts[cls] = _slot_layout(obj)
+            if names is None:
+                return obj.__reduce_ex__(protocol)
+            pending = self.pending.get(cls, None)
+            if pending is None:
+                pending = self.pending[cls] = []
+            pending.append(obj)
+            return _newobj, (cls,)
+        return reduce_shell
+
+    def dump_snapshot(self, obj):
+        self.dump(obj)
+        while self.pending:
+            pending, self.pending = self.pending, {}
+            batch = []
+            for cls, objs in iteritems(pending):
+                names = self.layouts[cls]
+                columns = []
+                for name in names:
+                    col = list(map(attrgetter(name), objs))
+                    if name == '_component':
+                        col = [None if c is None else c() for c in col]
+                    elif set(map(type, col)) == _float_type:
+                        col = array('d', col)
+                    columns.append(col)
+                batch.append((names, objs, columns))
+            # Pickling the columns may encounter new shells (which are
+            # collected into the next batch)
+            self.dump(batch)
+        self.dump(None)
+
+
+def _restore_batch(batch):
+    for names, objs, columns in batch:
+        n = len(objs)
+        for name, col in zip(names, columns):
+            if col.__class__ is array:
+                col = col.tolist()
+            elif name == '_component':
+                col = [None if c is None else weakref_ref(c) for c in col]
+            deque(map(_setattr, objs, repeat(name, n), col), maxlen=0)
+
+
+def save_snapshot(block, filename):
+    """Write a block (and everything beneath it) to a snapshot file
+
+    The block is restored with load_snapshot().  Components outside the
+    block that are referenced by the block (e.g., variables used in its
+    expressions, or the indexed block that owns block data) are stored
+    with the snapshot, as they would be by pickle.
+    """
+    # Like Block.clone(), do not store the blocks above this block.
+    # (The data of an indexed block have no _parent: the owning
+    # component is stored with them.)
+    detach = block.parent_component() is block
+    if detach:
+        save_parent, block._parent = block._parent, None
+    try:
+        with open(filename, 'wb') as OUTPUT, PauseGC():
+            OUTPUT.write(_SNAPSHOT_MAGIC)
+            if PY3:
+                OUTPUT.write(_COLUMN_FORMAT)
+                _SnapshotPickler(OUTPUT).dump_snapshot(block)
+            else:
+                OUTPUT.write(_PICKLE_FORMAT)
+                pickle.dump(block, OUTPUT, pickle.HIGHEST_PROTOCOL)
+    finally:
+        if detach:
+            block._parent = save_parent
+
+
+def load_snapshot(filename):
+    """Load a block from a snapshot file written by Block.save_snapshot()
+
+    The file is memory-mapped (when possible) so that the pickled data
+    is read directly from the operating system's page cache.  The
+    garbage collector is paused while loading (the unpickler creates
+    many container objects, none of which are garbage).
+    """
+    header_len = len(_SNAPSHOT_MAGIC) + 1
+    with open(filename, 'rb') as INPUT, PauseGC():
+        header = INPUT.read(header_len)
+        if len(header) != header_len \
+           or header[:-1] != _SNAPSHOT_MAGIC \
+           or header[-1:] not in (_PICKLE_FORMAT, _COLUMN_FORMAT):
+            raise ValueError(
+                "File '%s' is not a Pyomo model snapshot" % (filename,))
+        if header[-1:] == _COLUMN_FORMAT and not PY3:
+            raise ValueError(
+                "Snapshot '%s' was written by Python 3 and cannot be "
+                "loaded by Python 2" % (filename,))
+        try:
+            source = mmap.mmap(INPUT.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            source = None
+        if source is None:
+            source = INPUT
+        else:
+            source.seek(header_len)
+        try:
+            unpickler = pickle.Unpickler(source)
+            block = unpickler.load()
+            if header[-1:] == _COLUMN_FORMAT:
+                while True:
+                    batch = unpickler.load()
+                    if batch is None:
+                        break
+                    _restore_batch(batch)
+        finally:
+            if source is not INPUT:
+                source.close()
+    return block
@@ -0,0 +1,174 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolutionPool']
+
+import math
+from array import array
+
+from six.moves import zip
+
+from pyomo.core.kernel.component_map import ComponentMap
+
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
+_nan = float('nan')
+
+
+class SolutionPool(object):
+    """A columnar store for a pool of solutions.
+
+    Every solution holds a value for each variable in a fixed list of
+    variables (the columns of the pool), plus an objective value.
+    Missing values are stored as NaN.  When numpy is available, the
+    values are held in a single (solutions x variables) float matrix;
+    otherwise, each solution is held in an array of doubles.
+
+    Args:
+        variables: the variables (columns) stored in the pool
+    """
+
+    def __init__(self, variables):
+        self._variables = list(variables)
+        self._columns = None
+        self._objectives = []
+        if has_numpy:
+            self._values = numpy.empty((0, len(self._variables)))
+        else:
+            self._values = []
+
+    def __len__(self):
+        return len(self._objectives)
+
+    def __getstate__(self):
+        # Note: the column map is a cache (rebuilt on demand)
+        state = dict(self.__dict__)
+        state['_columns'] = None
+        return state
+
+    @property
+    def variables(self):
+        """The variables (columns) stored in the pool"""
+        return self._variables
+
+    @property
+    def objectives(self):
+        """The list of objective values (None if not known)"""
+        return self._objectives
+
+    def add(self, values=None, objective=None):
+        """Add a solution to the pool.
+
+        Args:
+            values: the variable values, in the order of the pool
+                variables (None or NaN for missing values)
+            objective: the objective value of the solution
+
+        Returns:
+            The index of the new solution
+        """
+        index = len(self._objectives)
+        nvars = len(self._variables)
+        if has_numpy:
+            if index == self._values.shape[0]:
+                # grow the matrix geometrically
+                new_values = numpy.empty((max(4, 2*index), nvars))
+                new_values[:index] = self._values[:index]
+                self._values = new_values
+            row = self._values[index]
+        else:
+            row = array('d', [_nan])*nvars
+            self._values.append(row)
+        if values is None:
+            row[:] = _nan
+        else:
+            self._set_row(row, values)
+        self._objectives.append(objective)
+        return index
+
+    def _set_row(self, row, values):
+        if len(values) != len(row):
+            raise ValueError(
+                "Solution has %s values, but the solution pool has %s "
+                "variables" % (len(values), len(row)))
+        if has_numpy:
+            try:
+                row[:] = numpy.array(values, dtype=float)
+            except TypeError:
+                # values include None
+                row[:] = numpy.array([_nan if val is None else val
+                                      for val in values], dtype=float)
+        else:
+            row[:] = array('d', (_nan if val is None else val
+                                 for val in values))
+
+    def values(self, index):
+        """Return the variable values of a solution (in the order of
+        the pool variables)"""
+        if index < 0:
+            index += len(self)
+        if not (0 <= index < len(self)):
+            raise IndexError("Solution pool index %s out of range" % (index,))
+        return self._values[index]
+
+    def value(self, index, var):
+        """Return the value of a variable in a solution (None if the
+        solution does not include the variable)"""
+        if self._columns is None:
+            self._columns = ComponentMap(
+                (v, i) for i, v in enumerate(self._variables))
+        val = float(self.values(index)[self._columns[var]])
+        if math.isnan(val):
+            return None
+        return val
+
+    def matrix(self):
+        """Return the (solutions x variables) matrix of values for all
+        solutions in the pool (requires numpy)"""
+        if not has_numpy:
+            raise RuntimeError("SolutionPool.matrix() requires numpy")
+        return self._values[:len(self)]
+
+    def best(self, minimize=True):
+        """Return the index of the solution with the best objective
+        value (None if no solution has an objective value)"""
+        best = None
+        for index, obj in enumerate(self._objectives):
+            if obj is None:
+                continue
+            if best is None or (obj < self._objectives[best]
+                                if minimize else
+                                obj > self._objectives[best]):
+                best = index
+        return best
+
+    def load(self, index, ignore_fixed_vars=True):
+        """Copy the values of a solution into the pool variables.
+
+        Variables that do not have a value in the solution are left
+        unchanged (and flagged as stale).  Fixed variables are skipped
+        unless ignore_fixed_vars is False.
+        """
+        row = self.values(index)
+        if has_numpy:
+            row = row.tolist()
+        for var, val in zip(self._variables, row):
+            if var.fixed and ignore_fixed_vars:
+                continue
+            if val != val:
+                # NaN: the solution does not include this variable
+                var.stale = True
+                continue
+            var.value = val
+            var.stale = False
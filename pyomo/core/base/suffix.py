@@ -21,8 +21,15 @@ from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ActiveComponent
 
 from six import iteritems, itervalues
+from six.moves import zip, map
 from pyomo.common.deprecation import deprecated
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
 logger = logging.getLogger('pyomo.core')
 
 # A list of convenient suffix generators, including:
@@ -129,6 +136,270 @@ def suffix_generator(a_block, datatype=False):
             if suffix.get_datatype() is datatype:
                 yield name, suffix
 
+
+class _SuffixArray(object):
+    """
+    The values of a Suffix with array storage.
+
+    This is a mapping from id(component) to the suffix value (used as
+    the ComponentMap._vals dict of the Suffix).  The values are stored
+    in a numpy array (a list if numpy is not available) at a dense
+    position that is assigned when the component is added to the
+    suffix.  Positions are assigned in insertion order; deleting an
+    entry leaves a hole that is removed the next time the array is
+    compacted.
+    """
+    __slots__ = ('_pos', '_ids', '_values', '_int')
+
+    def __init__(self, datatype):
+        # maps id(obj) -> position
+        self._pos = {}
+        # maps position -> id(obj) (None for deleted entries)
+        self._ids = []
+        self._int = datatype == Suffix.INT
+        if has_numpy:
+            self._values = numpy.zeros(
+                0, dtype=numpy.int64 if self._int else numpy.float64)
+        else:
+            self._values = []
+
+    def __getstate__(self):
+        self._compact()
+        return {'_ids': self._ids,
+                '_values': self.array(),
+                '_int': self._int}
+
+    def __setstate__(self, state):
+        self._int = state['_int']
+        self._ids = list(state['_ids'])
+        self._pos = dict(zip(self._ids, range(len(self._ids))))
+        if has_numpy:
+            self._values = numpy.array(
+                state['_values'],
+                dtype=numpy.int64 if self._int else numpy.float64)
+        else:
+            self._values = list(state['_values'])
+
+    def _compact(self):
+        """Remove the holes left by deleted entries"""
+        ids = self._ids
+        if len(self._pos) == len(ids):
+            return
+        live = [pos for pos, i in enumerate(ids) if i is not None]
+        self._ids = [ids[pos] for pos in live]
+        self._pos = dict(zip(self._ids, range(len(live))))
+        if has_numpy:
+            self._values[:len(live)] = self._values[live]
+        else:
+            self._values = [self._values[pos] for pos in live]
+
+    def _add(self, ids):
+        """Assign positions to the new ids in a list.  Returns the first
+        position if all ids were new (and distinct), in which case they
+        were assigned consecutive positions; otherwise, returns None."""
+        _pos = self._pos
+        if _pos:
+            new = [i for i in ids if i not in _pos]
+            if not new:
+                return None
+        else:
+            new = ids
+        n = len(self._ids)
+        nlive = len(_pos)
+        _pos.update(zip(new, range(n, n+len(new))))
+        if len(_pos) == nlive + len(new):
+            self._ids.extend(new)
+            start = n
+        else:
+            # Duplicate ids are only added once
+            for i in set(new):
+                del _pos[i]
+            for i in new:
+                if i not in _pos:
+                    _pos[i] = len(self._ids)
+                    self._ids.append(i)
+            start = None
+        n = len(self._ids)
+        values = self._values
+        if has_numpy:
+            if n > len(values):
+                # Grow the array geometrically
+                self._values = numpy.zeros(max(n, 2*len(values)),
+                                           dtype=values.dtype)
+                self._values[:len(values)] = values
+        else:
+            values.extend([0]*(n - len(values)))
+        if len(new) != len(ids):
+            return None
+        return start
+
+    def _convert(self, val):
+        try:
+            ans = int(val) if self._int else float(val)
+        except (TypeError, ValueError):
+            raise ValueError(
+                "A Suffix with array storage can only hold numeric "
+                "values: '%s' (type %s) is not numeric" % (val, type(val)))
+        if self._int and ans != val:
+            raise ValueError(
+                "A Suffix with datatype INT can only hold integer "
+                "values: '%s' is not an integer" % (val,))
+        return ans
+
+    def set_int(self, flag):
+        """Store integer (or floating point) values"""
+        if flag == self._int:
+            return
+        self._compact()
+        self._int = flag
+        try:
+            if has_numpy:
+                values = self._values.astype(
+                    numpy.int64 if flag else numpy.float64)
+                if flag:
+                    # Do not silently truncate non-integral values
+                    n = len(self._ids)
+                    bad = numpy.flatnonzero(values[:n] != self._values[:n])
+                    if len(bad):
+                        self._convert(self._values.item(bad[0]))
+                self._values = values
+            else:
+                self._values = [self._convert(val) for val in self._values]
+        except ValueError:
+            self._int = not flag
+            raise
+
+    def array(self):
+        """Return the values, in insertion order (a numpy array if numpy
+        is available)"""
+        self._compact()
+        return self._values[:len(self._ids)]
+
+    def ids(self):
+        """Return the ids of the components, in insertion order"""
+        self._compact()
+        return self._ids
+
+    def positions(self, ids):
+        """Return the positions of a list of ids"""
+        self._compact()
+        return list(map(self._pos.__getitem__, ids))
+
+    def set_many(self, ids, values):
+        """Set the values of a list of ids from a sequence of values (or
+        a single value) in one vectorized operation"""
+        if has_numpy:
+            try:
+                new_values = numpy.asarray(values, dtype=self._values.dtype)
+            except (TypeError, ValueError):
+                for val in values:
+                    self._convert(val)
+                raise
+            if self._int:
+                # Do not silently truncate non-integral values
+                values = numpy.asarray(values)
+                if values.dtype.kind not in 'biu':
+                    bad = numpy.flatnonzero(
+                        new_values != values.astype(numpy.float64))
+                    if len(bad):
+                        self._convert(values.ravel()[bad[0]])
+            values = new_values
+            nvals = len(values) if values.ndim else len(ids)
+        else:
+            if not hasattr(values, '__len__'):
+                values = [values]*len(ids)
+            values = list(map(self._convert, values))
+            nvals = len(values)
+        if nvals != len(ids):
+            raise ValueError(
+                "The components and values have different lengths "
+                "(%s != %s)" % (len(ids), nvals))
+        start = self._add(ids)
+        if start is not None:
+            # The ids were added at the end of the array
+            positions = slice(start, start+len(ids))
+        else:
+            positions = list(map(self._pos.__getitem__, ids))
+        if has_numpy:
+            self._values[positions] = values
+        else:
+            if start is not None:
+                positions = range(start, start+len(ids))
+            _values = self._values
+            for pos, val in zip(positions, values):
+                _values[pos] = val
+
+    def fill(self, value):
+        """Set the value of all entries"""
+        n = len(self._ids)
+        if has_numpy:
+            self._values[:n] = self._convert(value)
+        else:
+            self._values[:n] = [self._convert(value)]*n
+
+    #
+    # The dict interface used by ComponentMap
+    #
+
+    def __getitem__(self, i):
+        if has_numpy:
+            return self._values.item(self._pos[i])
+        return self._values[self._pos[i]]
+
+    def __setitem__(self, i, val):
+        # Note: convert the value first, so that an invalid value does
+        # not add the entry
+        val = self._convert(val)
+        pos = self._pos.get(i, None)
+        if pos is None:
+            self._add((i,))
+            pos = self._pos[i]
+        self._values[pos] = val
+
+    def __delitem__(self, i):
+        pos = self._pos.pop(i)
+        self._ids[pos] = None
+
+    def __contains__(self, i):
+        return i in self._pos
+
+    def __len__(self):
+        return len(self._pos)
+
+    def __iter__(self):
+        return iter(self.ids())
+
+    def keys(self):
+        return self.ids()
+
+    def get(self, i, default=None):
+        if i in self._pos:
+            return self[i]
+        return default
+
+    def pop(self, i, *default):
+        if i in self._pos or not default:
+            val = self[i]
+            del self[i]
+            return val
+        return default[0]
+
+    def clear(self):
+        # Note: the array is kept (to be refilled by the next import)
+        self._pos.clear()
+        del self._ids[:]
+
+    def update(self, other):
+        if hasattr(other, 'keys'):
+            ids = list(other.keys())
+            values = [other[i] for i in ids]
+        else:
+            other = list(other)
+            ids = [i for i, val in other]
+            values = [val for i, val in other]
+        self.set_many(ids, values)
+
+
 # Note: The order of inheritance here is important so that
 #       __setstate__ works correctly on the ActiveComponent base class.
 
@@ -144,6 +415,14 @@ class Suffix(ComponentMap, ActiveComponent):
                         suffix data is exported or imported.
         datatype    A variable type associated with all values of this
                         suffix.
+        storage     The storage of the suffix values: a dict ('map',
+                        the default) or a numeric array ('array').
+                        With array storage, each component is assigned
+                        a dense position in the array, and the values
+                        can be set with update_from_arrays() and read
+                        with get_values_array() in one vectorized
+                        operation.  Array storage requires a numeric
+                        datatype.
     """
 
     # Suffix Directions:
@@ -169,6 +448,9 @@ class Suffix(ComponentMap, ActiveComponent):
     SuffixDatatypeToStr = {FLOAT: 'Suffix.FLOAT',
                            INT: 'Suffix.INT',
                            None: str(None)}
+    # Suffix storage
+    SuffixStorages = ('map', 'array')
+    _storage = 'map'
 
     def __init__(self, **kwds):
 
@@ -183,6 +465,14 @@ class Suffix(ComponentMap, ActiveComponent):
         # The suffix datatype
         datatype = kwds.pop('datatype', Suffix.FLOAT)
 
+        # The storage of the suffix values
+        storage = kwds.pop('storage', 'map')
+        if storage not in self.SuffixStorages:
+            raise ValueError("Suffix storage must be one of: %s. \n"
+                             "Value given: %s"
+                             % (list(self.SuffixStorages), storage))
+        self._storage = storage
+
         # The suffix construction rule
         # TODO: deprecate the use of 'rule'
         self._rule = kwds.pop('rule', None)
@@ -197,6 +487,8 @@ class Suffix(ComponentMap, ActiveComponent):
         kwds.setdefault('ctype', Suffix)
         ActiveComponent.__init__(self, **kwds)
         ComponentMap.__init__(self)
+        if storage == 'array':
+            self._vals = _SuffixArray(self._datatype)
 
         if self._rule is None:
             self.construct()
@@ -208,6 +500,12 @@ class Suffix(ComponentMap, ActiveComponent):
         """
         ActiveComponent.__setstate__(self, state)
         ComponentMap.__setstate__(self, state)
+        if self._storage == 'array':
+            # ComponentMap rebuilds the values as a dict
+            vals = _SuffixArray(self._datatype)
+            vals.set_many(list(self._keys),
+                          list(map(self._vals.__getitem__, self._keys)))
+            self._vals = vals
 
     def construct(self, data=None):
         """
@@ -302,9 +600,57 @@ class Suffix(ComponentMap, ActiveComponent):
         """
         Sets the value of this suffix on all components.
         """
+        if self._storage == 'array':
+            self._vals.fill(value)
+            return
         for ndx in self:
             self[ndx] = value
 
+    def update_from_arrays(self, components, values):
+        """
+        Sets the value of this suffix on a sequence of components from
+        a parallel sequence of values (e.g., a list or numpy array of
+        duals returned by a solver).  With array storage, the values
+        are stored in one vectorized operation.
+        """
+        if self._storage != 'array':
+            return ComponentMap.update_from_arrays(self, components, values)
+        components = list(components)
+        ids = list(map(id, components))
+        self._vals.set_many(ids, values)
+        self._keys.update(zip(ids, components))
+
+    def get_values_array(self, components=None):
+        """
+        Returns the values of this suffix for a sequence of components
+        (or for all components, in the order of iteration over the
+        suffix) as a numpy array (a list if numpy is not available).
+        Only supported for suffixes with array storage.
+        """
+        if self._storage != 'array':
+            raise ValueError(
+                "Suffix '%s' does not use array storage; "
+                "get_values_array() requires Suffix(storage='array')"
+                % (self.name,))
+        values = self._vals.array()
+        if components is None:
+            return values.copy() if has_numpy else values
+        try:
+            positions = self._vals.positions(list(map(id, components)))
+        except KeyError:
+            for obj in components:
+                self[obj]
+            raise
+        if has_numpy:
+            return values[positions]
+        return [values[pos] for pos in positions]
+
+    def get_storage(self):
+        """
+        Return the suffix storage ('map' or 'array').
+        """
+        return self._storage
+
     @deprecated('Suffix.clearValue is replaced with Suffix.clear_value.')
     def clearValue(self, component, expand=True):
         return self.clear_value(component, expand)
@@ -349,6 +695,13 @@ class Suffix(ComponentMap, ActiveComponent):
                              "Value given: %s"
                              % (list(Suffix.SuffixDatatypeToStr.values()),
                                 datatype))
+        if self._storage == 'array':
+            if datatype is None:
+                raise ValueError(
+                    "Suffix with array storage requires a numeric "
+                    "datatype (Suffix.FLOAT or Suffix.INT)")
+            if isinstance(getattr(self, '_vals', None), _SuffixArray):
+                self._vals.set_int(datatype == Suffix.INT)
         self._datatype = datatype
 
     @deprecated('Suffix.getDatatype is replaced with Suffix.get_datatype.')
@@ -401,7 +754,7 @@ class Suffix(ComponentMap, ActiveComponent):
             [('Direction', self.SuffixDirectionToStr[self._direction]),
              ('Datatype', self.SuffixDatatypeToStr[self._datatype]),
              ],
-            ((str(k), v) for k, v in itervalues(self._dict)),
+            ((str(k), v) for k, v in self.items()),
             ("Value",),
             lambda k, v: [v]
         )
@@ -437,6 +790,27 @@ class Suffix(ComponentMap, ActiveComponent):
     def pprint(self, *args, **kwds):
         return ActiveComponent.pprint(self, *args, **kwds)
 
+    #
+    # With array storage, iterate over the components and values in
+    # the order of the array
+    #
+
+    def __iter__(self):
+        if self._storage == 'array':
+            return map(self._keys.__getitem__, self._vals.ids())
+        return ComponentMap.__iter__(self)
+
+    def _itervalues(self):
+        if self._storage == 'array':
+            values = self._vals.array()
+            return iter(values.tolist() if has_numpy else values)
+        return ComponentMap._itervalues(self)
+
+    def _iteritems(self):
+        if self._storage == 'array':
+            return zip(self.__iter__(), self._itervalues())
+        return ComponentMap._iteritems(self)
+
     def __str__(self):
         return ActiveComponent.__str__(self)
 
@@ -10,12 +10,18 @@
 
 import copy
 import logging
+import sys
 from pyomo.core.expr import current as EXPR
+from pyomo.core.expr import expr_pyomo5
 from pyomo.core.expr.numvalue import (
-    NumericValue, native_numeric_types, as_numeric, value )
+    NumericValue, native_numeric_types, nonpyomo_leaf_types, as_numeric,
+    value )
 import pyomo.core.base
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 
+logger = logging.getLogger('pyomo.core')
+
+
 class IndexTemplate(NumericValue):
     """A "placeholder" for an index value in template expressions.
 
@@ -231,3 +237,316 @@ def substitute_template_with_value(expr):
         return as_numeric(expr())
     else:
         return expr.resolve_template()
+
+
+class _CaptureIndexTemplate(IndexTemplate):
+    """An IndexTemplate passed to a rule by templatize_rule()
+
+    IndexTemplates already raise exceptions when the rule evaluates
+    them (e.g., "if t == 0:") or uses them as keys (e.g., "data[t]").
+    The capture templates also refuse to be converted to strings, so
+    rules that test their indices with "str(t) == '2'" cannot be
+    templatized.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        raise TemplateExpressionError(
+            self, "Cannot convert the index template %s to a string"
+            % (self.getname(),))
+
+
+def _index_templates(index_set):
+    """Return a list of IndexTemplates (one per dimension) for the
+    indices of a component indexed by index_set, or None if the
+    dimension of the index set is not known"""
+    subsets = getattr(index_set, 'set_tuple', None)
+    if subsets is None:
+        subsets = (index_set,)
+    templates = []
+    for _set in subsets:
+        if _set.dimen is None:
+            return None
+        templates.extend(_CaptureIndexTemplate(_set)
+                         for i in range(_set.dimen))
+    return templates
+
+
+def templatize_rule(block, rule, index_set):
+    """Call an indexed rule once with IndexTemplate placeholders
+
+    The rule is called with one IndexTemplate for each dimension of the
+    index set, which captures a template of the expression that the
+    rule returns for every index.  This only succeeds for rules that
+    use their indices exclusively to index other components (or in
+    arithmetic expressions that are used as indices).  Rules that
+    evaluate their indices (e.g., to test ``if t == 0:``), use them as
+    keys or convert them to strings raise an exception, in which case
+    this returns None.  Rules that inspect their indices in other ways
+    (e.g., ``isinstance(t, int)``) are captured as if they did not,
+    so callers should check the instantiated template against the
+    rule (see same_template_result()).
+
+    Returns:
+        a tuple (template, templates), where template is the expression
+        (or tuple) returned by the rule and templates is the list of
+        IndexTemplates passed to the rule, or None
+    """
+    templates = _index_templates(index_set)
+    if not templates:
+        return None
+    # Relational expressions (e.g., "if t <= 2:") must not be resolved
+    # as the first part of a chained inequality
+    _chained = expr_pyomo5._using_chained_inequality
+    expr_pyomo5._using_chained_inequality = False
+    try:
+        template = rule(block, *templates)
+    except Exception:
+        # Any exception means that the rule cannot be called with
+        # placeholders for its indices
+        logger.debug("Rule %s could not be templatized:\n%s: %s"
+                     % (getattr(rule, '__name__', rule),
+                        type(sys.exc_info()[1]).__name__,
+                        sys.exc_info()[1]))
+        return None
+    finally:
+        expr_pyomo5._using_chained_inequality = _chained
+    if template.__class__ is tuple:
+        if not all(x is None or x.__class__ in native_numeric_types
+                   or isinstance(x, NumericValue) for x in template):
+            return None
+    elif getattr(template, 'is_relational', None) is None \
+         or not template.is_relational():
+        # e.g., Constraint.Skip
+        return None
+    return template, templates
+
+
+class _TemplateCompiler(object):
+    """Generate the source of a function that instantiates a template
+    expression for the values of its IndexTemplates
+
+    Each node of the template is mapped to a Python expression and to
+    the kind of object that it evaluates to:
+
+        'num':  a native numeric value (e.g., an index value or the value
+                of an immutable Param)
+        'npv':  a Pyomo object that is not potentially variable (e.g.,
+                a mutable Param)
+        'var':  a variable
+        'expr': any other Pyomo object
+
+    except that MonomialTermExpressions are mapped to the tuple
+    (coefficient source, coefficient kind, variable source).
+
+    The kinds of the arguments of each node are used to generate the
+    same expression nodes that the operators generate (e.g., the
+    product of a 'num' and a 'var' is a MonomialTermExpression).
+    """
+
+    # Nodes whose arguments are all native values are evaluated with
+    # these Python operators
+    _num_operators = {
+        EXPR.NPV_SumExpression: ' + ',
+        EXPR.SumExpression: ' + ',
+        EXPR.NPV_ProductExpression: ' * ',
+        EXPR.ProductExpression: ' * ',
+        EXPR.MonomialTermExpression: ' * ',
+    }
+
+    def __init__(self, templates):
+        self.templates = dict(
+            (id(t), '_i%d' % i) for i, t in enumerate(templates))
+        self.namespace = {
+            '_value': value,
+            '_as_numeric': as_numeric,
+            '_Monomial': EXPR.MonomialTermExpression,
+            '_Sum': EXPR.SumExpression,
+            '_NPV_Product': EXPR.NPV_ProductExpression,
+            '_NPV_Negation': EXPR.NPV_NegationExpression,
+        }
+        self.constants = {}
+
+    def constant(self, obj):
+        name = self.constants.get(id(obj), None)
+        if name is None:
+            name = self.constants[id(obj)] = '_c%d' % len(self.constants)
+            self.namespace[name] = obj
+        return name
+
+    def leaf_kind(self, obj):
+        if obj.__class__ in native_numeric_types:
+            return 'num'
+        if obj.__class__ in nonpyomo_leaf_types:
+            return 'expr'
+        if obj.is_variable_type():
+            return 'var'
+        if not obj.is_potentially_variable():
+            return 'npv'
+        return 'expr'
+
+    def monomial(self, coef, var, coef_kind='npv'):
+        # Monomials are returned with the kind (coef, coef_kind, var),
+        # so that products and negations of the monomial only update
+        # the coefficient
+        return ( '_Monomial((%s, %s))' % (coef, var),
+                 (coef, coef_kind, var) )
+
+    def compile(self, node):
+        """Return the (source, kind) of a node, or (None, None) if the
+        node does not depend on the IndexTemplates"""
+        if isinstance(node, IndexTemplate):
+            name = self.templates.get(id(node), None)
+            if name is None:
+                raise TemplateExpressionError(
+                    node, "Unknown IndexTemplate %s" % (node,))
+            return name, 'num'
+        if node.__class__ in nonpyomo_leaf_types \
+           or not node.is_expression_type() \
+           or node.is_named_expression_type():
+            return None, None
+
+        args = [self.compile(arg) for arg in node.args]
+        if all(src is None for src, kind in args):
+            return None, None
+        for i, (src, kind) in enumerate(args):
+            if src is None:
+                arg = node.arg(i)
+                args[i] = (self.constant(arg), self.leaf_kind(arg))
+
+        if node.__class__ is EXPR.GetItemExpression:
+            index = []
+            for src, kind in args:
+                if kind != 'num':
+                    src = '_value(%s)' % (src,)
+                index.append(src)
+            src = '%s[%s]' % (self.constant(node._base), ', '.join(index))
+            ctype = node._base.type()
+            if ctype is pyomo.core.base.var.Var:
+                return src, 'var'
+            if ctype is pyomo.core.base.param.Param:
+                return src, 'npv' if node._base._mutable else 'num'
+            return src, 'expr'
+
+        kinds = set(kind for src, kind in args)
+        if kinds == set(('num',)):
+            # Evaluate the node (e.g., index arithmetic like "t-1")
+            op = self._num_operators.get(node.__class__, None)
+            if op is not None:
+                return '(%s)' % (op.join(src for src, kind in args),), 'num'
+            return '%s._apply_operation((%s,))' % (
+                self.constant(node),
+                ', '.join(src for src, kind in args)), 'num'
+        if node.__class__ is EXPR.LinearExpression:
+            raise TemplateExpressionError(
+                None, "Cannot instantiate LinearExpression templates")
+        if isinstance(node, EXPR.ProductExpression) \
+           and node.__class__ is not EXPR.NPV_ProductExpression:
+            (a, a_kind), (b, b_kind) = args
+            if a_kind == 'var' or a_kind.__class__ is tuple:
+                (a, a_kind), (b, b_kind) = (b, b_kind), (a, a_kind)
+            if b_kind == 'var' and a_kind in ('num', 'npv'):
+                return self.monomial(a, b, a_kind)
+            if b_kind.__class__ is tuple and a_kind == 'num':
+                if b_kind[1] == 'num':
+                    return self.monomial('(%s * %s)' % (a, b_kind[0]),
+                                         b_kind[2], 'num')
+                return self.monomial(
+                    '_NPV_Product((%s, %s))' % (a, b_kind[0]), b_kind[2])
+        elif node.__class__ is EXPR.NegationExpression:
+            (a, a_kind), = args
+            if a_kind == 'var':
+                return self.monomial('-1', a, 'num')
+            if a_kind.__class__ is tuple:
+                if a_kind[1] == 'num':
+                    return self.monomial(
+                        '(-%s)' % (a_kind[0],), a_kind[2], 'num')
+                return self.monomial(
+                    '_NPV_Negation((%s,))' % (a_kind[0],), a_kind[2])
+
+        if node.is_relational():
+            # The relational operators store numeric constants
+            args = [('_as_numeric(%s)' % (src,), kind) if kind == 'num'
+                    else (src, kind) for src, kind in args]
+
+        if isinstance(node, EXPR.SumExpression):
+            src = '_Sum([%s])' % (', '.join(src for src, kind in args),)
+        elif node.__class__.create_node_with_local_data is \
+             EXPR.ExpressionBase.create_node_with_local_data:
+            src = '%s((%s,))' % (
+                self.constant(node.__class__),
+                ', '.join(src for src, kind in args))
+        else:
+            src = '%s.create_node_with_local_data((%s,))' % (
+                self.constant(node), ', '.join(src for src, kind in args))
+        if kinds.issubset(('num', 'npv')):
+            return src, 'npv'
+        return src, 'expr'
+
+
+def compile_template(template, templates):
+    """Compile a template returned by templatize_rule()
+
+    Returns a function that takes the values of the IndexTemplates (as
+    positional arguments) and returns the expression (or tuple) that
+    the rule would have returned for those index values.  This raises
+    TemplateExpressionError if the template contains nodes that cannot
+    be instantiated.
+    """
+    compiler = _TemplateCompiler(templates)
+    if template.__class__ is tuple:
+        items = []
+        for x in template:
+            src, kind = (None, None) if x is None else compiler.compile(x)
+            items.append(compiler.constant(x) if src is None else src)
+        src = '(%s,)' % (', '.join(items),)
+    else:
+        src, kind = compiler.compile(template)
+        if src is None:
+            src = compiler.constant(template)
+    src = 'def _instantiate(%s):\n    return %s\n' % (
+        ', '.join('_i%d' % i for i in range(len(templates))), src)
+    exec(compile(src, '<template>', 'exec'), compiler.namespace)
+    return compiler.namespace['_instantiate']
+
+
+def _same_structure(a, b):
+    """Compare two expression trees node by node (constants are
+    compared by value)"""
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if a is b:
+            continue
+        a_native = a.__class__ in nonpyomo_leaf_types
+        b_native = b.__class__ in nonpyomo_leaf_types
+        if (a_native or a.is_constant()) and (b_native or b.is_constant()):
+            if value(a) != value(b):
+                return False
+        elif a_native or b_native or a.__class__ is not b.__class__ \
+             or not a.is_expression_type():
+            return False
+        elif a.nargs() != b.nargs() or (
+                a.is_named_expression_type() and a is not b):
+            return False
+        else:
+            stack.extend(zip(a.args, b.args))
+    return True
+
+
+def same_template_result(a, b):
+    """Return True if two values returned by a constraint rule (or an
+    instantiated template) describe the same constraint
+
+    Expressions are equal if their string representations (which
+    include the names of all components and the values of all
+    constants) are equal, or if they have the same structure.
+    """
+    if a.__class__ is tuple:
+        if b.__class__ is not tuple or len(a) != len(b):
+            return False
+        return all(same_template_result(x, y) for x, y in zip(a, b))
+    if a is None or b is None:
+        return a is b
+    return str(a) == str(b) or _same_structure(a, b)
@@ -8,13 +8,17 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar']
+__all__ = ['Var', '_VarData', '_GeneralVarData', '_ArrayVarData', 'VarList',
+           'SimpleVar']
 
 import logging
+from array import array
+from itertools import compress
 from weakref import ref as weakref_ref
 
 from pyomo.common.timing import ConstructionTimer
-from pyomo.core.base.numvalue import NumericValue, value, is_fixed
+from pyomo.core.base.numvalue import (NumericValue, value, is_fixed,
+                                      native_numeric_types)
 from pyomo.core.base.set_types import BooleanSet, IntegerSet, RealSet, Reals
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ComponentData
@@ -24,10 +28,41 @@ from pyomo.core.base.sets import Set
 from pyomo.core.base.util import is_functor
 
 from six import iteritems, itervalues
-from six.moves import xrange
+from six.moves import xrange, zip
+
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
 
 logger = logging.getLogger('pyomo.core')
 
+_nan = float('nan')
+
+
+def _is_sequence(val):
+    """Return True if val holds one value for each variable (e.g., a
+    list, dictionary or numpy array) rather than a single value"""
+    return val.__class__ not in native_numeric_types \
+        and val is not None \
+        and not isinstance(val, NumericValue) \
+        and hasattr(val, '__len__')
+
+
+def _compress(values, mask):
+    """Return the items of a sequence selected by a boolean mask"""
+    if has_numpy and hasattr(values, 'dtype'):
+        return values[numpy.asarray(mask, dtype=bool)]
+    return list(compress(values, mask))
+
+
+def _none_if_nan(val):
+    if val.__class__ in native_numeric_types and val != val:
+        return None
+    return val
+
+
 class _VarData(ComponentData, NumericValue):
     """
     This class defines the data for a single variable.
@@ -458,6 +493,212 @@ class _GeneralVarData(_VarData):
     free = unfix
 
 
+
+class _VarArrays(object):
+    """
+    The storage for the variables of an array-backed Var (see
+    Var(storage='array')).
+
+    The values and numeric bounds of the variables are stored in
+    contiguous arrays of doubles (NaN stands for None), and the fixed
+    and stale flags in arrays of chars.  Bounds that are not numeric
+    constants (e.g., mutable Params) are kept in the lb_exprs and
+    ub_exprs dictionaries, with NaN in the bound arrays.  The arrays
+    are array.array objects, so numpy can operate on them without
+    copying (see numpy.frombuffer).
+    """
+
+    def __init__(self):
+        self.value = array('d')
+        self.lb = array('d')
+        self.ub = array('d')
+        self.fixed = array('b')
+        self.stale = array('b')
+        self.lb_exprs = {}
+        self.ub_exprs = {}
+        # Cache for Var._array_positions()
+        self.order = None
+
+    def allocate(self):
+        """Allocate the storage for a new variable and return its
+        position"""
+        pos = len(self.value)
+        self.value.append(_nan)
+        self.lb.append(_nan)
+        self.ub.append(_nan)
+        self.fixed.append(0)
+        self.stale.append(1)
+        return pos
+
+
+class _ArrayVarData(_VarData):
+    """
+    This class defines the data for a single variable of an
+    array-backed Var.
+
+    The value, bounds, and fixed and stale flags of the variable are
+    views into the arrays of the owning Var; only the domain is stored
+    on this object.  Values (and numeric bounds) are stored as floats.
+    """
+
+    __slots__ = ('_arrays', '_pos', '_domain')
+
+    def __init__(self, domain=Reals, component=None):
+        self._component = weakref_ref(component)
+        self._arrays = component._arrays
+        self._pos = self._arrays.allocate()
+        self._domain = None
+        if hasattr(domain, 'bounds'):
+            self._domain = domain
+        elif domain is not None:
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of one of %s, or an object that declares a method "
+                "for bounds (like a Pyomo Set). Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain, (RealSet, IntegerSet, BooleanSet)))
+
+    def __getstate__(self):
+        state = super(_ArrayVarData, self).__getstate__()
+        for i in _ArrayVarData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    @property
+    def value(self):
+        """Return the value (a float, or None) for this variable."""
+        val = self._arrays.value[self._pos]
+        if val != val:
+            return None
+        return val
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable (stored as a float)."""
+        self._arrays.value[self._pos] = _nan if val is None else val
+
+    @property
+    def domain(self):
+        """Return the domain for this variable."""
+        return self._domain
+    @domain.setter
+    def domain(self, domain):
+        """Set the domain for this variable."""
+        if hasattr(domain, 'bounds'):
+            self._domain = domain
+        else:
+            raise ValueError(
+                "%s is not a valid domain. Variable domains must be an "
+                "instance of one of %s, or an object that declares a method "
+                "for bounds (like a Pyomo Set). Examples: NonNegativeReals, "
+                "Integers, Binary" % (domain, (RealSet, IntegerSet, BooleanSet)))
+
+    @property
+    def lb(self):
+        """Return the lower bound for this variable."""
+        dlb, _ = self.domain.bounds()
+        lb = self._arrays.lb[self._pos]
+        if lb != lb:
+            lb = self._arrays.lb_exprs.get(self._pos, None)
+            if lb is None:
+                return dlb
+            lb = value(lb)
+        if dlb is None:
+            return lb
+        return max(lb, dlb)
+    @lb.setter
+    def lb(self, val):
+        raise AttributeError("Assignment not allowed. Use the setlb method")
+
+    @property
+    def ub(self):
+        """Return the upper bound for this variable."""
+        _, dub = self.domain.bounds()
+        ub = self._arrays.ub[self._pos]
+        if ub != ub:
+            ub = self._arrays.ub_exprs.get(self._pos, None)
+            if ub is None:
+                return dub
+            ub = value(ub)
+        if dub is None:
+            return ub
+        return min(ub, dub)
+    @ub.setter
+    def ub(self, val):
+        raise AttributeError("Assignment not allowed. Use the setub method")
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return bool(self._arrays.fixed[self._pos])
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._arrays.fixed[self._pos] = 1 if val else 0
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return bool(self._arrays.stale[self._pos])
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._arrays.stale[self._pos] = 1 if val else 0
+
+    def _set_bound(self, bounds, exprs, val):
+        # Note: is_fixed(None) returns True
+        if not is_fixed(val):
+            return False
+        if val is None:
+            bounds[self._pos] = _nan
+            exprs.pop(self._pos, None)
+        elif val.__class__ in native_numeric_types:
+            bounds[self._pos] = val
+            exprs.pop(self._pos, None)
+        else:
+            bounds[self._pos] = _nan
+            exprs[self._pos] = val
+        return True
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        if not self._set_bound(self._arrays.lb, self._arrays.lb_exprs, val):
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable lower "
+                "bound - legal types must be fixed expressions or variables."
+                % (type(val),))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        if not self._set_bound(self._arrays.ub, self._arrays.ub_exprs, val):
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable upper "
+                "bound - legal types are fixed expressions or variables."
+                "parameters"
+                % (type(val),))
+
+    def fix(self, *val):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if len(val) == 1:
+            self.value = val[0]
+        elif len(val) > 1:
+            raise TypeError("fix expected at most 1 arguments, got %d" % (len(val)))
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
+
 @ModelComponentFactory.register("Decision variables.")
 class Var(IndexedComponent):
     """A numeric variable, which may be defined over an index.
@@ -476,9 +717,19 @@ class Var(IndexedComponent):
             `index_set()` when constructing the Var (True) or just the
             variables returned by `initialize`/`rule` (False).  Defaults
             to True.
+        storage (str, optional): The storage layout of an indexed Var:
+            one object per variable ('object') or contiguous arrays of
+            values, bounds, and flags shared by all variables
+            ('array').  Array storage supports vectorized access
+            through `get_values(as_array=True)` and `set_values()`.
+            Note that array-backed variables store their values as
+            floats (e.g., a value set to 3 is returned as 3.0).
+            Defaults to 'object'.
     """
 
     _ComponentDataClass = _GeneralVarData
+    # The arrays of an array-backed Var (see _VarArrays)
+    _arrays = None
 
     def __new__(cls, *args, **kwds):
         if cls != Var:
@@ -498,6 +749,7 @@ class Var(IndexedComponent):
         domain = kwd.pop('domain', domain)
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
+        storage = kwd.pop('storage', 'object')
 
         #
         # Initialize the base class
@@ -505,6 +757,19 @@ class Var(IndexedComponent):
         kwd.setdefault('ctype', Var)
         IndexedComponent.__init__(self, *args, **kwd)
         #
+        # Set up the storage for the variable data
+        #
+        if storage == 'array':
+            if not self.is_indexed():
+                raise ValueError(
+                    "Array storage is only supported for indexed variables")
+            self._arrays = _VarArrays()
+            self._ComponentDataClass = _ArrayVarData
+        elif storage != 'object':
+            raise ValueError(
+                "Unknown Var storage '%s': expected 'object' or 'array'"
+                % (storage,))
+        #
         # Determine if the domain argument is a functor or other object
         #
         self._domain_init_value = None
@@ -543,13 +808,23 @@ class Var(IndexedComponent):
         """
         Set the 'stale' attribute of every variable data object to True.
         """
+        if self._arrays is not None:
+            self._fill_array(self._arrays.stale, 1)
+            return
         for var_data in itervalues(self._data):
             var_data.stale = True
 
-    def get_values(self, include_fixed_values=True):
+    def get_values(self, include_fixed_values=True, as_array=False):
         """
         Return a dictionary of index-value pairs.
+
+        If as_array is True, return the values in the order of keys()
+        as a numpy array of floats (an array.array if numpy is not
+        available), with NaN for variables that have no value (and for
+        fixed variables if include_fixed_values is False).
         """
+        if as_array:
+            return self._get_value_array(include_fixed_values)
         if include_fixed_values:
             return dict((idx, vardata.value)
                             for idx, vardata in iteritems(self._data))
@@ -559,15 +834,210 @@ class Var(IndexedComponent):
 
     extract_values = get_values
 
-    def set_values(self, new_values, valid=False):
+    def set_values(self, new_values, valid=False, mask=None):
         """
         Set the values of a dictionary.
 
+        The new values may also be given as a sequence (e.g., a list
+        or numpy array) with one value for each variable, in the order
+        of keys().  NaN or None values clear the variable values.  If
+        a mask (a sequence of booleans in the order of keys()) is
+        given, only the variables selected by the mask are set.
+
         The default behavior is to validate the values in the
         dictionary.
         """
-        for index, new_value in iteritems(new_values):
-            self[index].set_value(new_value, valid)
+        if hasattr(new_values, 'items'):
+            if mask is not None:
+                raise ValueError(
+                    "Cannot set the values of Var '%s': a mask cannot be "
+                    "combined with a dictionary of values" % (self.name,))
+            for index, new_value in iteritems(new_values):
+                self[index].set_value(new_value, valid)
+            return
+
+        keys = list(self.keys())
+        self._check_bulk_length(new_values, len(keys), 'values')
+        if mask is not None:
+            self._check_bulk_length(mask, len(keys), 'mask entries')
+            keys = list(compress(keys, mask))
+            new_values = _compress(new_values, mask)
+        if self._arrays is None:
+            if hasattr(new_values, 'tolist'):
+                # Iterating over the items of a numpy array is slow
+                new_values = new_values.tolist()
+            _data = self._data
+            for key, new_value in zip(keys, new_values):
+                if new_value != new_value:
+                    new_value = None
+                _data[key].set_value(new_value, valid)
+            return
+
+        if not valid:
+            _data = self._data
+            for key, new_value in zip(keys, new_values):
+                if new_value == new_value:
+                    _data[key]._valid_value(new_value)
+        arrays = self._arrays
+        positions, np_positions = self._masked_positions(mask)
+        if has_numpy:
+            if not hasattr(new_values, 'dtype'):
+                new_values = [_nan if x is None else x for x in new_values]
+            numpy.frombuffer(arrays.value)[np_positions] = new_values
+        else:
+            _value = arrays.value
+            for pos, new_value in zip(positions, new_values):
+                _value[pos] = _nan if new_value is None else new_value
+        self._fill_array(arrays.stale, 0, mask)
+
+    def set_bounds(self, lb, ub, mask=None):
+        """
+        Set the lower and upper bounds of the variables.
+
+        Each bound may be a single value for all variables or a
+        sequence (e.g., a list or numpy array) with one value for each
+        variable, in the order of keys().  NaN or None values clear the
+        bounds.  If a mask (a sequence of booleans in the order of
+        keys()) is given, only the variables selected by the mask are
+        updated.
+        """
+        nvars = len(self)
+        if mask is not None:
+            self._check_bulk_length(mask, nvars, 'mask entries')
+        bounds = []
+        for bound in (lb, ub):
+            if _is_sequence(bound):
+                self._check_bulk_length(bound, nvars, 'bounds')
+                if mask is not None:
+                    bound = _compress(bound, mask)
+            else:
+                bound = _none_if_nan(bound)
+            bounds.append(bound)
+
+        done = [False, False]
+        arrays = self._arrays
+        if arrays is not None:
+            positions, np_positions = self._masked_positions(mask)
+            for i, (data, exprs) in enumerate(((arrays.lb, arrays.lb_exprs),
+                                               (arrays.ub, arrays.ub_exprs))):
+                bound = bounds[i]
+                if bound is None or bound.__class__ in native_numeric_types:
+                    self._fill_array(data, _nan if bound is None else bound,
+                                     mask)
+                elif has_numpy and getattr(bound, 'dtype', None) is not None \
+                        and bound.dtype.kind in 'biuf':
+                    numpy.frombuffer(data)[np_positions] = bound
+                else:
+                    continue
+                if exprs:
+                    for pos in positions:
+                        exprs.pop(pos, None)
+                done[i] = True
+
+        vardata = None
+        for bound, setter, _done in zip(bounds, ('setlb', 'setub'), done):
+            if _done:
+                continue
+            if vardata is None:
+                vardata = self._masked_data(mask)
+            if _is_sequence(bound):
+                if hasattr(bound, 'tolist'):
+                    bound = bound.tolist()
+                for v, val in zip(vardata, bound):
+                    getattr(v, setter)(_none_if_nan(val))
+            else:
+                for v in vardata:
+                    getattr(v, setter)(bound)
+
+    def _check_bulk_length(self, values, nvars, what):
+        if len(values) != nvars:
+            raise ValueError(
+                "Cannot set the values of Var '%s': %s %s were given "
+                "for %s variables" % (self.name, len(values), what, nvars))
+
+    def _masked_data(self, mask):
+        """
+        Return a list of the variables selected by mask (all variables
+        if mask is None), in the order of keys().
+        """
+        keys = self.keys()
+        if mask is not None:
+            self._check_bulk_length(mask, len(self), 'mask entries')
+            keys = compress(keys, mask)
+        _data = self._data
+        return [_data[key] for key in keys]
+
+    def _masked_positions(self, mask):
+        """
+        Return the positions in the storage arrays of the variables
+        selected by mask (all variables if mask is None), in the order
+        of keys().
+        """
+        positions, np_positions = self._array_positions()
+        if mask is None:
+            return positions, np_positions
+        if has_numpy:
+            np_positions = np_positions[numpy.asarray(mask, dtype=bool)]
+        return list(compress(positions, mask)), np_positions
+
+    def _array_positions(self):
+        """
+        Return the positions of the variables in the storage arrays,
+        in the order of keys(), as a list and (if numpy is available)
+        as a numpy array.
+        """
+        arrays = self._arrays
+        if getattr(self._index, 'concrete', True):
+            index_len = len(self._index)
+        else:
+            index_len = None
+        key = (len(self._data), index_len, len(arrays.value))
+        if arrays.order is None or arrays.order[0] != key:
+            _data = self._data
+            positions = [_data[idx]._pos for idx in self.keys()]
+            if has_numpy:
+                np_positions = numpy.array(positions, dtype=numpy.intp)
+            else:
+                np_positions = None
+            arrays.order = (key, positions, np_positions)
+        return arrays.order[1:]
+
+    def _fill_array(self, data, val, mask=None):
+        """Set one of the storage arrays to val for all variables (or
+        the variables selected by mask)"""
+        positions, np_positions = self._masked_positions(mask)
+        if has_numpy:
+            numpy.frombuffer(data, dtype=data.typecode)[np_positions] = val
+        else:
+            for pos in positions:
+                data[pos] = val
+
+    def _get_value_array(self, include_fixed_values):
+        if self._arrays is not None:
+            positions, np_positions = self._array_positions()
+            arrays = self._arrays
+            if has_numpy:
+                ans = numpy.frombuffer(arrays.value)[np_positions]
+                if not include_fixed_values:
+                    fixed = numpy.frombuffer(arrays.fixed, dtype='b')
+                    ans[fixed[np_positions] != 0] = _nan
+                return ans
+            _value = arrays.value
+            if include_fixed_values:
+                return array('d', [_value[pos] for pos in positions])
+            _fixed = arrays.fixed
+            return array('d', [_nan if _fixed[pos] else _value[pos]
+                               for pos in positions])
+        values = []
+        for vardata in self.values():
+            val = vardata.value
+            if val is None or not (include_fixed_values or
+                                   not vardata.fixed):
+                val = _nan
+            values.append(val)
+        if has_numpy:
+            return numpy.array(values, dtype=float)
+        return array('d', values)
 
     def construct(self, data=None):
         """Construct this component."""
@@ -594,6 +1064,11 @@ class Var(IndexedComponent):
         if not self.is_indexed():
             self._data[None] = self
             self._initialize_members((None,))
+        elif self._dense and self._arrays is not None:
+            for ndx in self._index:
+                self._data[ndx] = _ArrayVarData(
+                    domain=self._domain_init_value, component=self)
+            self._initialize_members(self._index)
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
@@ -918,17 +1393,46 @@ class SimpleVar(_GeneralVarData, Var):
 class IndexedVar(Var):
     """An array of variables."""
 
-    def fix(self, *val):
+    def fix(self, *val, **kwds):
         """
         Set the fixed indicator to True. Value argument is optional,
         indicating the variable should be fixed at its current value.
+
+        The value may also be a dictionary or a sequence (e.g., a list
+        or numpy array) with one value for each variable, in the order
+        of keys() (see set_values()).  If a mask (a sequence of
+        booleans in the order of keys()) is given, only the variables
+        selected by the mask are fixed.
         """
-        for vardata in itervalues(self):
+        mask = kwds.pop('mask', None)
+        if kwds:
+            raise ValueError(
+                "Unexpected keyword options found while fixing "
+                "IndexedVar '%s': %s" % (self.name, sorted(kwds)))
+        if len(val) == 1 and _is_sequence(val[0]):
+            # Like _VarData.fix(), this does not validate the values
+            self.set_values(val[0], valid=True, mask=mask)
+            if hasattr(val[0], 'items'):
+                for index in val[0]:
+                    self[index].fix()
+                return
+            val = ()
+        if self._arrays is not None and len(val) < 2:
+            if val:
+                self._fill_array(self._arrays.value,
+                                 _nan if val[0] is None else val[0], mask)
+            self._fill_array(self._arrays.fixed, 1, mask)
+            return
+        for vardata in self._masked_data(mask):
             vardata.fix(*val)
 
-    def unfix(self):
-        """Sets the fixed indicator to False."""
-        for vardata in itervalues(self):
+    def unfix(self, mask=None):
+        """Sets the fixed indicator to False (for the variables selected
+        by mask, if given)."""
+        if self._arrays is not None:
+            self._fill_array(self._arrays.fixed, 0, mask)
+            return
+        for vardata in self._masked_data(mask):
             vardata.unfix()
 
     @property
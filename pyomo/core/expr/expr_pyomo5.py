@@ -15,7 +15,8 @@ _using_chained_inequality = True
 #
 # These symbols are part of pyomo.core.expr
 #
-_public = ['linear_expression', 'nonlinear_expression', 'inequality']
+_public = ['linear_expression', 'nonlinear_expression', 'inequality',
+           'linear_sum']
 #
 # These symbols are part of pyomo.core.expr.current
 #
@@ -23,6 +24,7 @@ __all__ = (
 'linear_expression',
 'nonlinear_expression',
 'inequality',
+'linear_sum',
 'decompose_term',
 'clone_counter',
 'clone_expression',
@@ -93,6 +95,7 @@ from pyutilib.misc.visitor import SimpleVisitor, ValueVisitor
 from pyutilib.math.util import isclose
 
 from pyomo.common.deprecation import deprecation_warning
+from pyomo.common.timing import ConstructionProfiler
 from pyomo.core.expr.symbol_map import SymbolMap
 from pyomo.core.expr.numvalue import \
     (NumericValue,
@@ -176,6 +179,9 @@ class clone_counter(object):
         """
         return clone_counter._count
 
+# Report the number of expressions cloned in construction profiles
+ConstructionProfiler.counters['clones'] = lambda: clone_counter._count
+
 
 class nonlinear_expression(object):
     """ Context manager for mutable sums.
@@ -191,6 +197,7 @@ class nonlinear_expression(object):
     def __exit__(self, *args):
         if self.e.__class__ == _MutableSumExpression:
             self.e.__class__ = SumExpression
+            self.e._args_ = tuple(self.e._args_)
 
 
 class linear_expression(object):
@@ -2478,23 +2485,33 @@ class SumExpression(SumExpressionBase):
 
         x + y
 
+    The children are stored in a tuple, or in a list that may be
+    shared with other sum expressions.  The :func:`add` method creates
+    a new sum that appends to the list of the original sum, and each
+    sum only uses the first :attr:`_nargs` items of the list.  Thus,
+    a sum can only be extended in place if it uses all of the items
+    in its list.
+
     Args:
-        args (list): Children nodes
+        args (list or tuple): Children nodes
     """
-    __slots__ = ('_nargs','_shared_args')
+    __slots__ = ('_nargs',)
     PRECEDENCE = 6
 
     def __init__(self, args):
         self._args_ = args
-        self._shared_args = False
         self._nargs = len(self._args_)
 
     def add(self, new_arg):
         if new_arg.__class__ in native_numeric_types and new_arg == 0:
             return self
         # Clone 'self', because SumExpression are immutable
-        self._shared_args = True
-        self = self.__class__(self._args_)
+        if self._args_.__class__ is not list:
+            self._args_ = list(self._args_)
+        if self._nargs == len(self._args_):
+            self = self.__class__(self._args_)
+        else:
+            self = self.__class__(self._args_[:self._nargs])
         #
         if new_arg.__class__ is SumExpression or new_arg.__class__ is _MutableSumExpression:
             self._args_.extend( islice(new_arg._args_, new_arg._nargs) )
@@ -2513,7 +2530,7 @@ class SumExpression(SumExpressionBase):
         return sum(result)
 
     def create_node_with_local_data(self, args):
-        return self.__class__(list(args))
+        return self.__class__(tuple(args))
 
     def __getstate__(self):
         state = super(SumExpression, self).__getstate__()
@@ -2572,12 +2589,13 @@ class _MutableSumExpression(SumExpression):
 
     __slots__ = ()
 
+    def create_node_with_local_data(self, args):
+        return self.__class__(list(args))
+
     def add(self, new_arg):
         if new_arg.__class__ in native_numeric_types and new_arg == 0:
             return self
         # Do not clone 'self', because _MutableSumExpression are mutable
-        #self._shared_args = True
-        #self = self.__class__(list(self.args))
         #
         if new_arg.__class__ is SumExpression or new_arg.__class__ is _MutableSumExpression:
             self._args_.extend( islice(new_arg._args_, new_arg._nargs) )
@@ -3064,6 +3082,52 @@ class _MutableLinearExpression(LinearExpression):
 #
 #-------------------------------------------------------
 
+def linear_sum(coefs, variables, constant=0):
+    """
+    A function that creates a :class:`LinearExpression` directly from
+    a list of coefficients and a list of variables.
+
+    The terms are stored in the expression without being processed
+    by the expression generation logic, so this is much faster than
+    summing the products of the coefficients and variables.  The
+    arguments are not validated: the coefficients must be constants
+    (numbers or non-variable expressions) and the variables must be
+    variable objects.
+
+    Args:
+        coefs: An iterable of coefficients, a NumPy array, or a
+            number that is used as the coefficient of every variable.
+        variables: An iterable of variables, or a NumPy array of
+            variables.
+        constant: The constant term.  Defaults to zero.
+
+    Returns:
+        A :class:`LinearExpression` object, or :attr:`constant` if
+        there are no variables.
+    """
+    if hasattr(variables, 'tolist'):
+        variables = variables.tolist()
+    else:
+        variables = list(variables)
+    if hasattr(coefs, 'tolist'):
+        coefs = coefs.tolist()
+    elif coefs.__class__ not in native_numeric_types:
+        coefs = list(coefs)
+    if coefs.__class__ in native_numeric_types:
+        coefs = [coefs]*len(variables)
+    if len(coefs) != len(variables):
+        raise ValueError(
+            "The linear_sum() function was called with %d coefficients "
+            "and %d variables" % (len(coefs), len(variables)))
+    if not variables:
+        return constant
+    ans = LinearExpression()
+    ans.constant = constant
+    ans.linear_coefs = coefs
+    ans.linear_vars = variables
+    return ans
+
+
 def decompose_term(expr):
     """
     A function that returns a tuple consisting of (1) a flag indicated
@@ -3240,10 +3304,10 @@ def _generate_sum_expression(etype, _self, _other):
         #
         # x + y
         #
-        if (_self.__class__ is SumExpression and not _self._shared_args) or \
+        if (_self.__class__ is SumExpression and _self._nargs == len(_self._args_)) or \
            _self.__class__ is _MutableSumExpression:
             return _self.add(_other)
-        elif (_other.__class__ is SumExpression and not _other._shared_args) or \
+        elif (_other.__class__ is SumExpression and _other._nargs == len(_other._args_)) or \
             _other.__class__ is _MutableSumExpression:
             return _other.add(_self)
         elif _other.__class__ in native_numeric_types:
@@ -3252,22 +3316,22 @@ def _generate_sum_expression(etype, _self, _other):
             elif _other == 0:
                 return _self
             if _self.is_potentially_variable():
-                return SumExpression([_self, _other])
+                return SumExpression((_self, _other))
             return NPV_SumExpression((_self, _other))
         elif _self.__class__ in native_numeric_types:
             if _self == 0:
                 return _other
             if _other.is_potentially_variable():
                 #return _LinearSumExpression((_self, _other))
-                return SumExpression([_self, _other])
+                return SumExpression((_self, _other))
             return NPV_SumExpression((_self, _other))
         elif _other.is_potentially_variable():
             #return _LinearSumExpression((_self, _other))
-            return SumExpression([_self, _other])
+            return SumExpression((_self, _other))
         elif _self.is_potentially_variable():
             #return _LinearSumExpression((_other, _self))
             #return SumExpression([_other, _self])
-            return SumExpression([_self, _other])
+            return SumExpression((_self, _other))
         else:
             return NPV_SumExpression((_self, _other))
 
@@ -3275,7 +3339,7 @@ def _generate_sum_expression(etype, _self, _other):
         #
         # x - y
         #
-        if (_self.__class__ is SumExpression and not _self._shared_args) or \
+        if (_self.__class__ is SumExpression and _self._nargs == len(_self._args_)) or \
            _self.__class__ is _MutableSumExpression:
             return _self.add(-_other)
         elif _other.__class__ in native_numeric_types:
@@ -3284,7 +3348,7 @@ def _generate_sum_expression(etype, _self, _other):
             elif _other == 0:
                 return _self
             if _self.is_potentially_variable():
-                return SumExpression([_self, -_other])
+                return SumExpression((_self, -_other))
             return NPV_SumExpression((_self, -_other))
         elif _self.__class__ in native_numeric_types:
             if _self == 0:
@@ -3299,20 +3363,20 @@ def _generate_sum_expression(etype, _self, _other):
                     return NegationExpression((_other,))
                 return NPV_NegationExpression((_other,))
             elif _other.__class__ is MonomialTermExpression:
-                return SumExpression([_self, MonomialTermExpression((-_other._args_[0], _other._args_[1]))])
+                return SumExpression((_self, MonomialTermExpression((-_other._args_[0], _other._args_[1]))))
             elif _other.is_variable_type():
-                return SumExpression([_self, MonomialTermExpression((-1,_other))])
+                return SumExpression((_self, MonomialTermExpression((-1,_other))))
             elif _other.is_potentially_variable():
-                return SumExpression([_self, NegationExpression((_other,))])
+                return SumExpression((_self, NegationExpression((_other,))))
             return NPV_SumExpression((_self, NPV_NegationExpression((_other,))))
         elif _other.__class__ is MonomialTermExpression:
-            return SumExpression([_self, MonomialTermExpression((-_other._args_[0], _other._args_[1]))])
+            return SumExpression((_self, MonomialTermExpression((-_other._args_[0], _other._args_[1]))))
         elif _other.is_variable_type():
-            return SumExpression([_self, MonomialTermExpression((-1,_other))])
+            return SumExpression((_self, MonomialTermExpression((-1,_other))))
         elif _other.is_potentially_variable():
-            return SumExpression([_self, NegationExpression((_other,))])
+            return SumExpression((_self, NegationExpression((_other,))))
         elif _self.is_potentially_variable():
-            return SumExpression([_self, NPV_NegationExpression((_other,))])
+            return SumExpression((_self, NPV_NegationExpression((_other,))))
         else:
             return NPV_SumExpression((_self, NPV_NegationExpression((_other,))))
 
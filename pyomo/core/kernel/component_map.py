@@ -16,8 +16,44 @@ except:                                           #pragma:nocover
     from collections import MutableMapping as _MutableMapping
     from collections import Mapping as _Mapping
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
 import six
-from six import itervalues
+from six import itervalues, iteritems
+from six.moves import zip, map
+
+if six.PY3:
+    try:
+        from collections.abc import ValuesView as _ValuesView
+        from collections.abc import ItemsView as _ItemsView
+    except:                                       #pragma:nocover
+        from collections import ValuesView as _ValuesView
+        from collections import ItemsView as _ItemsView
+
+    class _ComponentMapValuesView(_ValuesView):
+        __slots__ = ()
+        def __iter__(self):
+            return self._mapping._itervalues()
+
+    class _ComponentMapItemsView(_ItemsView):
+        __slots__ = ()
+        def __iter__(self):
+            return self._mapping._iteritems()
+
+
+def _as_list(values):
+    """Return a sequence of values (e.g., a numpy array) as a list of
+    Python objects"""
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    if values.__class__ is list:
+        return values
+    return list(values)
+
 
 class ComponentMap(_MutableMapping):
     """
@@ -34,6 +70,13 @@ class ComponentMap(_MutableMapping):
     has a corresponding entry in the container, so there is
     no need to worry about id() clashes.
 
+    The keys and values are stored in two dictionaries
+    indexed by the object id() (and not as (obj,val) tuples
+    in a single dictionary), so that setting an entry does
+    not allocate a tuple and the keys, values, and items
+    can be iterated over (and bulk updates performed)
+    without a Python-level lookup for each entry.
+
     We also override __setstate__ so that we can rebuild the
     container based on possibly updated object ids after
     a deepcopy or pickle.
@@ -43,10 +86,12 @@ class ComponentMap(_MutableMapping):
     components for which it contains map entries (e.g., as
     part of a block). ***
     """
-    __slots__ = ("_dict",)
+    __slots__ = ("_keys", "_vals")
     def __init__(self, *args, **kwds):
-        # maps id(obj) -> (obj,val)
-        self._dict = {}
+        # maps id(obj) -> obj
+        self._keys = {}
+        # maps id(obj) -> val
+        self._vals = {}
         # handle the dict-style initialization scenarios
         self.update(*args, **kwds)
 
@@ -55,6 +100,15 @@ class ComponentMap(_MutableMapping):
     # because this class relies on Python ids.
     #
     def __setstate__(self, state):
+        if '_dict' in state:
+            # The state of a ComponentMap pickled before the keys
+            # and values were stored separately: id(obj) -> (obj,val)
+            state = dict(state)
+            items = list(itervalues(state.pop('_dict')))
+            state['_keys'] = dict((i, obj) for i, (obj, val)
+                                  in enumerate(items))
+            state['_vals'] = dict((i, val) for i, (obj, val)
+                                  in enumerate(items))
         # *** Temporary hack to allow this class to be used
         # *** in inheritance chains for both the old and new
         # *** component hierarchies.
@@ -64,10 +118,14 @@ class ComponentMap(_MutableMapping):
                 break
 
         # object id() may have changed after unpickling,
-        # so we rebuild the dictionary keys
-        self._dict = \
-            dict((id(obj), (obj,val)) \
-                 for obj, val in itervalues(state['_dict']))
+        # so we rebuild the dictionary keys (the keys and
+        # values are still paired by the old ids)
+        keys = state['_keys']
+        vals = state['_vals']
+        self._keys = dict((id(obj), obj)
+                          for obj in itervalues(keys))
+        self._vals = dict((id(obj), vals[i])
+                          for i, obj in iteritems(keys))
 
     def __getstate__(self):
         # *** Temporary hack to allow this class to be used
@@ -100,28 +158,31 @@ class ComponentMap(_MutableMapping):
 
     def __getitem__(self, obj):
         try:
-            return self._dict[id(obj)][1]
+            return self._vals[id(obj)]
         except KeyError:
             raise KeyError("Component with id '%s': %s"
                            % (id(obj), str(obj)))
 
     def __setitem__(self, obj, val):
-        self._dict[id(obj)] = (obj,val)
+        i = id(obj)
+        # Note: set the value first, so that an error (e.g., from a
+        # derived class that validates the values) does not add the key
+        self._vals[i] = val
+        self._keys[i] = obj
 
     def __delitem__(self, obj):
         try:
-            del self._dict[id(obj)]
+            del self._vals[id(obj)]
         except KeyError:
             raise KeyError("Component with id '%s': %s"
                            % (id(obj), str(obj)))
+        del self._keys[id(obj)]
 
     def __iter__(self):
-        return (obj \
-                for obj, val in \
-                itervalues(self._dict))
+        return itervalues(self._keys)
 
     def __len__(self):
-        return self._dict.__len__()
+        return self._keys.__len__()
 
     #
     # Overload MutableMapping default implementations
@@ -151,24 +212,313 @@ class ComponentMap(_MutableMapping):
     #
 
     def __contains__(self, obj):
-        return id(obj) in self._dict
+        return id(obj) in self._keys
 
     def clear(self):
         'D.clear() -> None.  Remove all items from D.'
-        self._dict.clear()
+        self._keys.clear()
+        self._vals.clear()
 
     def get(self, key, default=None):
         'D.get(k[,d]) -> D[k] if k in D, else d.  d defaults to None.'
-        if key in self:
-            return self[key]
-        return default
+        return self._vals.get(id(key), default)
 
     def setdefault(self, key, default=None):
         'D.setdefault(k[,d]) -> D.get(k,d), also set D[k]=d if k not in D'
-        if key in self:
-            return self[key]
+        if id(key) in self._keys:
+            return self._vals[id(key)]
         else:
             self[key] = default
         return default
 
+    def pop(self, key, *default):
+        """D.pop(k[,d]) -> v, remove specified key and return the
+        corresponding value.  If key is not found, d is returned if
+        given, otherwise KeyError is raised."""
+        if len(default) > 1:
+            raise TypeError("pop expected at most 2 arguments, got %s"
+                            % (len(default)+1,))
+        if id(key) in self._keys:
+            del self._keys[id(key)]
+            return self._vals.pop(id(key))
+        if default:
+            return default[0]
+        raise KeyError("Component with id '%s': %s"
+                       % (id(key), str(key)))
+
+    def _itervalues(self):
+        return map(self._vals.__getitem__, self._keys)
+
+    def _iteritems(self):
+        return zip(itervalues(self._keys),
+                   map(self._vals.__getitem__, self._keys))
+
+    if six.PY3:
+        def values(self):
+            "D.values() -> a set-like object providing a view on D's values"
+            return _ComponentMapValuesView(self)
+
+        def items(self):
+            "D.items() -> a set-like object providing a view on D's items"
+            return _ComponentMapItemsView(self)
+    else:                                         #pragma:nocover
+        def values(self):
+            "D.values() -> list of D's values"
+            return list(self._itervalues())
+
+        def items(self):
+            "D.items() -> list of D's (key, value) pairs, as 2-tuples"
+            return list(self._iteritems())
+
+        def itervalues(self):
+            'D.itervalues() -> an iterator over the values of D'
+            return self._itervalues()
+
+        def iteritems(self):
+            'D.iteritems() -> an iterator over the (key, value) items of D'
+            return self._iteritems()
+
+    def update(*args, **kwds):
+        """D.update([E, ]**F) -> None.  Update D from mapping/iterable
+        E and F."""
+        # (self is not a named argument so that 'self' can be used
+        # as a keyword, as in dict.update)
+        if not args:
+            raise TypeError("descriptor 'update' of 'ComponentMap' "
+                            "object needs an argument")
+        self = args[0]
+        if len(args) > 2:
+            raise TypeError("update expected at most 1 arguments, got %s"
+                            % (len(args)-1,))
+        if len(args) == 2:
+            other = args[1]
+            if isinstance(other, ComponentMap):
+                self._keys.update(other._keys)
+                self._vals.update(other._vals)
+            else:
+                if isinstance(other, _Mapping):
+                    other = other.items()
+                elif hasattr(other, "keys"):
+                    other = [(key, other[key]) for key in other.keys()]
+                items = list(other)
+                if items:
+                    keys, vals = zip(*items)
+                    self.update_from_arrays(keys, vals)
+        if kwds:
+            self.update(kwds)
+
+    def update_from_arrays(self, keys, values):
+        """Set the values of a sequence of keys from a parallel
+        sequence of values (e.g., a list or a numpy array).
+
+        This is equivalent to ``self.update(zip(keys, values))``, but
+        the entries are added without a Python-level loop over the
+        keys.  Numpy values are stored as Python numbers.
+        """
+        keys = _as_list(keys)
+        values = _as_list(values)
+        if len(keys) != len(values):
+            raise ValueError(
+                "The keys and values passed to update_from_arrays() "
+                "have different lengths (%s != %s)"
+                % (len(keys), len(values)))
+        ids = list(map(id, keys))
+        self._keys.update(zip(ids, keys))
+        self._vals.update(zip(ids, values))
+
+
+class ComponentArrayMap(_MutableMapping):
+    """
+    A ComponentMap whose values are numbers stored in a
+    contiguous array.
+
+    Each key is assigned a dense index (the position of its
+    value in the array) when it is added to the map.  The
+    values are stored in a numpy float64 array (a list if
+    numpy is not available), so the values of all entries
+    can be read or updated at once through the :attr:`array`
+    attribute, and :meth:`update_from_arrays` sets the
+    values of many entries with a single vectorized
+    assignment.
+
+    Deleting an entry moves the last entry into its
+    position, so the index of a key (and the iteration
+    order) can change when an entry is deleted.
+
+    Like ComponentMap, the mapping is based on the Python
+    id() of the keys, and an instance of this class should
+    only be deepcopied/pickled along with its keys.
+    """
+    __slots__ = ("_index", "_objs", "_values")
+    def __init__(self, *args, **kwds):
+        # maps id(obj) -> index
+        self._index = {}
+        # maps index -> obj
+        self._objs = []
+        # maps index -> value (with numpy, the capacity of the
+        # array is larger than the number of entries)
+        if has_numpy:
+            self._values = numpy.zeros(0, dtype=numpy.float64)
+        else:
+            self._values = []
+        self.update(*args, **kwds)
+
+    def __getstate__(self):
+        return {'_objs': self._objs, '_values': self.array}
+
+    def __setstate__(self, state):
+        # object id() may have changed after unpickling,
+        # so we rebuild the index
+        self._objs = list(state['_objs'])
+        self._index = dict(zip(map(id, self._objs),
+                               range(len(self._objs))))
+        values = state['_values']
+        if has_numpy:
+            self._values = numpy.array(values, dtype=numpy.float64)
+        else:
+            self._values = _as_list(values)
+
+    def __str__(self):
+        """String representation of the mapping."""
+        tmp = dict()
+        for c,v in self.items():
+            tmp[str(c)+" (id="+str(id(c))+")"] = v
+        return "ComponentArrayMap("+str(tmp)+")"
+
+    def _reserve(self, size):
+        # Grow the values array (by at least a factor of 2, so that
+        # adding entries takes amortized constant time)
+        if has_numpy:
+            n = len(self._values)
+            if size > n:
+                values = numpy.zeros(max(size, 2*n, 16),
+                                     dtype=numpy.float64)
+                values[:n] = self._values
+                self._values = values
+        else:
+            self._values.extend([0.0]*(size - len(self._values)))
+
+    @property
+    def array(self):
+        """The values of the entries, in index order.  With numpy,
+        this is a view of the underlying array (so assigning to its
+        elements changes the values in the map); otherwise, it is a
+        list copy of the values."""
+        return self._values[:len(self._objs)]
+
+    def index(self, obj):
+        """Return the index of a key in the values array"""
+        try:
+            return self._index[id(obj)]
+        except KeyError:
+            raise KeyError("Component with id '%s': %s"
+                           % (id(obj), str(obj)))
+
+    def update_from_arrays(self, keys, values):
+        """Set the values of a sequence of keys from a parallel
+        sequence of numbers (e.g., a numpy array) or a single number.
+
+        Keys that are not in the map are added to it.  With numpy,
+        the values are assigned in a single vectorized operation.
+        """
+        keys = _as_list(keys)
+        _index = self._index
+        ids = list(map(id, keys))
+        new = [obj for i, obj in zip(ids, keys) if i not in _index]
+        if new:
+            # (duplicate keys are only added once)
+            new = dict(zip(map(id, new), new))
+            n = len(self._objs)
+            _index.update(zip(new, range(n, n+len(new))))
+            self._objs.extend(itervalues(new))
+            self._reserve(len(self._objs))
+        positions = list(map(_index.__getitem__, ids))
+        if has_numpy:
+            values = numpy.asarray(values, dtype=numpy.float64)
+            if values.ndim and len(values) != len(positions):
+                raise ValueError(
+                    "The keys and values passed to update_from_arrays() "
+                    "have different lengths (%s != %s)"
+                    % (len(positions), len(values)))
+            self._values[positions] = values
+        else:
+            if not hasattr(values, '__len__'):
+                values = [values]*len(positions)
+            if len(values) != len(positions):
+                raise ValueError(
+                    "The keys and values passed to update_from_arrays() "
+                    "have different lengths (%s != %s)"
+                    % (len(positions), len(values)))
+            _values = self._values
+            for pos, val in zip(positions, values):
+                _values[pos] = float(val)
+
+    #
+    # Implement MutableMapping abstract methods
+    #
+
+    def __getitem__(self, obj):
+        try:
+            pos = self._index[id(obj)]
+        except KeyError:
+            raise KeyError("Component with id '%s': %s"
+                           % (id(obj), str(obj)))
+        if has_numpy:
+            return self._values.item(pos)
+        return self._values[pos]
+
+    def __setitem__(self, obj, val):
+        pos = self._index.get(id(obj), None)
+        if pos is None:
+            pos = self._index[id(obj)] = len(self._objs)
+            self._objs.append(obj)
+            if pos >= len(self._values):
+                self._reserve(pos + 1)
+        if has_numpy:
+            self._values[pos] = val
+        else:
+            self._values[pos] = float(val)
+
+    def __delitem__(self, obj):
+        try:
+            pos = self._index.pop(id(obj))
+        except KeyError:
+            raise KeyError("Component with id '%s': %s"
+                           % (id(obj), str(obj)))
+        # Move the last entry into the position of the deleted entry
+        last = self._objs.pop()
+        if pos < len(self._objs):
+            self._objs[pos] = last
+            self._index[id(last)] = pos
+            self._values[pos] = self._values[len(self._objs)]
 
+    def __iter__(self):
+        return iter(self._objs)
+
+    def __len__(self):
+        return len(self._objs)
+
+    def __contains__(self, obj):
+        return id(obj) in self._index
+
+    def __eq__(self, other):
+        if not isinstance(other, _Mapping):
+            return False
+        return dict(((type(key), id(key)), val)
+                    for key, val in self.items()) == \
+               dict(((type(key), id(key)), val)
+                    for key, val in other.items())
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def clear(self):
+        'D.clear() -> None.  Remove all items from D.'
+        self._index.clear()
+        del self._objs[:]
+
+    def get(self, key, default=None):
+        'D.get(k[,d]) -> D[k] if k in D, else d.  d defaults to None.'
+        if id(key) in self._index:
+            return self[key]
+        return default
@@ -18,6 +18,7 @@ except:                                           #pragma:nocover
 
 import six
 from six import itervalues, iteritems
+from six.moves import zip, map
 
 class ComponentSet(_MutableSet):
     """
@@ -62,8 +63,12 @@ class ComponentSet(_MutableSet):
 
     def update(self, args):
         """Update a set with the union of itself and others."""
-        self._data.update((id(obj), obj)
-                          for obj in args)
+        if isinstance(args, ComponentSet):
+            self._data.update(args._data)
+            return
+        if args.__class__ not in (list, tuple):
+            args = list(args)
+        self._data.update(zip(map(id, args), args))
 
     #
     # This method must be defined for deepcopy/pickling
@@ -73,8 +78,8 @@ class ComponentSet(_MutableSet):
         # object id() may have changed after unpickling,
         # so we rebuild the dictionary keys
         assert len(state) == 1
-        self._data = dict((id(obj), obj)
-                          for obj in state['_data'])
+        objs = state['_data']
+        self._data = dict(zip(map(id, objs), objs))
 
     def __getstate__(self):
         return {'_data': tuple(self._data.values())}
@@ -98,8 +103,7 @@ class ComponentSet(_MutableSet):
 
     def discard(self, val):
         """Remove an element. Do not raise an exception if absent."""
-        if id(val) in self._data:
-            del self._data[id(val)]
+        self._data.pop(id(val), None)
 
     #
     # Overload MutableSet default implementations
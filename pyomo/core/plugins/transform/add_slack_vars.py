@@ -58,7 +58,7 @@ class AddSlackVariables(NonIsomorphicTransformation):
         instance.add_component(xblockname, Block())
         xblock = instance.component(xblockname)
 
-        obj_expr = 0
+        slack_vars = []
         for cons in constraintDatas:
             if (cons.lower is not None and cons.upper is not None) and \
                value(cons.lower) > value(cons.upper):
@@ -76,7 +76,7 @@ class AddSlackVariables(NonIsomorphicTransformation):
                 # add positive slack to body expression
                 cons._body += posSlack
                 # penalize slack in objective
-                obj_expr += posSlack
+                slack_vars.append(posSlack)
             if cons.upper is not None:
                 # we subtract a positive slack variable from the body:
                 # declare slack
@@ -86,7 +86,7 @@ class AddSlackVariables(NonIsomorphicTransformation):
                 # add negative slack to body expression
                 cons._body -= negSlack
                 # add slack to objective
-                obj_expr += negSlack
+                slack_vars.append(negSlack)
 
         # make a new objective that minimizes sum of slack variables
-        xblock._slack_objective = Objective(expr=obj_expr)
+        xblock._slack_objective = Objective(expr=linear_sum(1, slack_vars))
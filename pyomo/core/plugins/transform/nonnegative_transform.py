@@ -396,9 +396,10 @@ class NonNegativeTransformation(IsomorphicTransformation):
         and so attr='X', and 1 is a key of vars.
 
         """
+        var = model.__getattribute__(attr)
         return (lb,
-                sum(c * model.__getattribute__(attr)[v] \
-                    for (v,c) in vars.items()),
+                linear_sum(list(vars.values()),
+                           [var[v] for v in vars.keys()]),
                 ub)
 
     @staticmethod
@@ -410,7 +411,8 @@ class NonNegativeTransformation(IsomorphicTransformation):
         """
         Returns a sum expression.
         """
-        return sum(c*model.__getattribute__(attr)[v] for (v, c) in vars.items())
+        var = model.__getattribute__(attr)
+        return linear_sum(list(vars.values()), [var[v] for v in vars.keys()])
 
     @staticmethod
     def exprMapRule(ruleMap, model, ndx=None):
@@ -142,12 +142,13 @@ class TestAddSlacks(unittest.TestCase):
         self.assertIsInstance(obj, Objective)
         self.assertTrue(obj.active)
         
-        self.assertEqual(obj.expr.nargs(), 4)
+        self.assertEqual(len(obj.expr.linear_vars), 4)
+        self.assertEqual(obj.expr.linear_coefs, [1, 1, 1, 1])
 
-        self.assertIs(obj.expr.arg(0), transBlock._slack_minus_rule1)
-        self.assertIs(obj.expr.arg(1), transBlock._slack_plus_rule2)
-        self.assertIs(obj.expr.arg(2), transBlock._slack_minus_rule2)
-        self.assertIs(obj.expr.arg(3), transBlock._slack_plus_rule3)
+        self.assertIs(obj.expr.linear_vars[0], transBlock._slack_minus_rule1)
+        self.assertIs(obj.expr.linear_vars[1], transBlock._slack_plus_rule2)
+        self.assertIs(obj.expr.linear_vars[2], transBlock._slack_minus_rule2)
+        self.assertIs(obj.expr.linear_vars[3], transBlock._slack_plus_rule3)
 
     def test_badModel_err(self):
         model = ConcreteModel()
@@ -243,9 +244,10 @@ class TestAddSlacks(unittest.TestCase):
     def checkTargetsObj(self, m):
         transBlock = m._core_add_slack_variables
         obj = transBlock.component("_slack_objective")
-        self.assertEqual(obj.expr.nargs(), 2)
-        self.assertIs(obj.expr.arg(0), transBlock._slack_minus_rule1)
-        self.assertIs(obj.expr.arg(1), transBlock._slack_plus_rule3)
+        self.assertEqual(len(obj.expr.linear_vars), 2)
+        self.assertEqual(obj.expr.linear_coefs, [1, 1])
+        self.assertIs(obj.expr.linear_vars[0], transBlock._slack_minus_rule1)
+        self.assertIs(obj.expr.linear_vars[1], transBlock._slack_plus_rule3)
 
     def test_target_objective(self):
         m = self.makeModel()
@@ -385,12 +387,13 @@ class TestAddSlacks_IndexedConstraints(unittest.TestCase):
         transBlock = m._core_add_slack_variables
         obj = transBlock.component("_slack_objective")
         self.assertIsInstance(obj, Objective)
-        self.assertEqual(obj.expr.nargs(), 3)
-        self.assertIs(obj.expr.arg(0), 
+        self.assertEqual(len(obj.expr.linear_vars), 3)
+        self.assertEqual(obj.expr.linear_coefs, [1, 1, 1])
+        self.assertIs(obj.expr.linear_vars[0], 
                       transBlock.component("_slack_plus_rule1[1]"))
-        self.assertIs(obj.expr.arg(1), 
+        self.assertIs(obj.expr.linear_vars[1], 
                       transBlock.component("_slack_plus_rule1[2]"))
-        self.assertIs(obj.expr.arg(2), 
+        self.assertIs(obj.expr.linear_vars[2], 
                       transBlock.component("_slack_plus_rule1[3]"))
 
     def test_indexedtarget_objective(self):
@@ -513,7 +516,10 @@ class TestAddSlacks_IndexedConstraints(unittest.TestCase):
         transBlock = m._core_add_slack_variables
         obj = transBlock.component("_slack_objective")
         self.assertIsInstance(obj, Objective)
-        self.assertIs(obj.expr, transBlock.component("_slack_plus_rule1[2]"))
+        self.assertEqual(len(obj.expr.linear_vars), 1)
+        self.assertEqual(obj.expr.linear_coefs, [1])
+        self.assertIs(obj.expr.linear_vars[0],
+                      transBlock.component("_slack_plus_rule1[2]"))
 
     def test_ConstraintDatatarget_objective(self):
         m = self.makeModel()
@@ -12,7 +12,9 @@ import pickle
 import collections
 
 import pyutilib.th as unittest
-from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.kernel.component_map import (ComponentMap,
+                                             ComponentArrayMap,
+                                             has_numpy)
 from pyomo.core.kernel.variable import (variable,
                                         variable_dict,
                                         variable_list)
@@ -243,6 +245,142 @@ class TestComponentMap(unittest.TestCase):
         self.assertTrue(cmap1 != cmap2)
         self.assertNotEqual(cmap1, cmap2)
 
+    def test_update_mapping(self):
+        cmap = ComponentMap(self._components)
+        cmap2 = ComponentMap()
+        cmap2.update(cmap)
+        self.assertEqual(cmap2, cmap)
+        cmap3 = ComponentMap()
+        cmap3.update(cmap.items())
+        self.assertEqual(cmap3, cmap)
+        name = 'a'
+        cmap3.update({name: 1}, b=2)
+        self.assertEqual(len(cmap3), len(cmap)+2)
+        self.assertEqual(cmap3[name], 1)
+        with self.assertRaises(TypeError):
+            cmap3.update(cmap, cmap)
+
+    def test_update_from_arrays(self):
+        keys = [c for c, val in self._components]
+        vals = [val for c, val in self._components]
+        cmap = ComponentMap()
+        cmap.update_from_arrays(keys, vals)
+        self.assertEqual(cmap, ComponentMap(self._components))
+        self.assertEqual(list(cmap.keys()), keys)
+        self.assertEqual(list(cmap.values()), vals)
+        cmap.update_from_arrays(keys[:2], [1, 2])
+        self.assertEqual(len(cmap), len(self._components))
+        self.assertEqual(cmap[keys[0]], 1)
+        self.assertEqual(cmap[keys[1]], 2)
+        with self.assertRaises(ValueError):
+            cmap.update_from_arrays(keys, [1])
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_update_from_numpy_array(self):
+        import numpy
+        keys = [c for c, val in self._components]
+        cmap = ComponentMap()
+        cmap.update_from_arrays(keys, numpy.arange(len(keys)))
+        self.assertEqual(list(cmap.values()), list(range(len(keys))))
+        self.assertIs(type(cmap[keys[0]]), int)
+
+    def test_pop(self):
+        cmap = ComponentMap(self._components)
+        c, val = self._components[0]
+        self.assertEqual(cmap.pop(c), val)
+        self.assertTrue(c not in cmap)
+        self.assertEqual(cmap.pop(c, None), None)
+        with self.assertRaises(KeyError):
+            cmap.pop(c)
+        self.assertEqual(len(cmap), len(self._components)-1)
+
+    def test_setstate_tuples(self):
+        # The state of a ComponentMap that stored (obj,val) tuples
+        v = variable()
+        cmap = ComponentMap.__new__(ComponentMap)
+        cmap.__setstate__({'_dict': {0: (v, 1.0)}})
+        self.assertEqual(len(cmap), 1)
+        self.assertEqual(cmap[v], 1.0)
+
+
+class TestComponentArrayMap(unittest.TestCase):
+
+    def _keys(self, n):
+        return [variable() for i in range(n)]
+
+    def test_getsetdelitem(self):
+        keys = self._keys(4)
+        amap = ComponentArrayMap()
+        for i, v in enumerate(keys):
+            amap[v] = i
+        self.assertEqual(len(amap), 4)
+        self.assertEqual([amap[v] for v in keys], [0, 1, 2, 3])
+        self.assertIs(type(amap[keys[1]]), float)
+        self.assertEqual([amap.index(v) for v in keys], [0, 1, 2, 3])
+        self.assertEqual(list(amap.array), [0, 1, 2, 3])
+        del amap[keys[1]]
+        # The last entry is moved into the deleted position
+        self.assertEqual(len(amap), 3)
+        self.assertEqual(list(amap), [keys[0], keys[3], keys[2]])
+        self.assertEqual(list(amap.array), [0, 3, 2])
+        self.assertEqual(amap.index(keys[3]), 1)
+        self.assertTrue(keys[1] not in amap)
+        with self.assertRaises(KeyError):
+            amap[keys[1]]
+        with self.assertRaises(KeyError):
+            del amap[keys[1]]
+        with self.assertRaises(KeyError):
+            amap.index(keys[1])
+        self.assertEqual(amap.get(keys[1], 5), 5)
+        amap.clear()
+        self.assertEqual(len(amap), 0)
+        self.assertEqual(len(amap.array), 0)
+
+    def test_update_from_arrays(self):
+        keys = self._keys(40)
+        amap = ComponentArrayMap()
+        amap.update_from_arrays(keys, range(40))
+        self.assertEqual(list(amap), keys)
+        self.assertEqual(list(amap.array), list(range(40)))
+        amap.update_from_arrays(keys[::2], 1.5)
+        self.assertEqual(amap[keys[0]], 1.5)
+        self.assertEqual(amap[keys[1]], 1)
+        new = self._keys(2)
+        amap.update_from_arrays([keys[1], new[0], new[1], new[0]],
+                                [10, 20, 30, 40])
+        self.assertEqual(len(amap), 42)
+        self.assertEqual(amap[keys[1]], 10)
+        self.assertEqual(amap[new[0]], 40)
+        self.assertEqual(amap[new[1]], 30)
+        with self.assertRaises(ValueError):
+            amap.update_from_arrays(keys, [1, 2])
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_array_view(self):
+        keys = self._keys(3)
+        amap = ComponentArrayMap(zip(keys, [1, 2, 3]))
+        self.assertEqual(amap.array.sum(), 6)
+        amap.array[:] *= 2
+        self.assertEqual(dict(zip(map(id, keys), [2, 4, 6])),
+                         dict((id(k), v) for k, v in amap.items()))
+
+    def test_pickle(self):
+        keys = self._keys(3)
+        amap = ComponentArrayMap(zip(keys, [1, 2, 3]))
+        keys_up, amap_up = pickle.loads(pickle.dumps((keys, amap)))
+        self.assertEqual([amap_up[v] for v in keys_up], [1, 2, 3])
+        self.assertEqual(amap_up.index(keys_up[2]), 2)
+        amap_up[variable()] = 4
+        self.assertEqual(len(amap_up), 4)
+        self.assertEqual(len(amap), 3)
+
+    def test_eq(self):
+        keys = self._keys(3)
+        amap = ComponentArrayMap(zip(keys, [1, 2, 3]))
+        self.assertEqual(amap, ComponentMap(zip(keys, [1.0, 2.0, 3.0])))
+        self.assertNotEqual(amap, ComponentMap(zip(keys, [1, 2, 4])))
+        self.assertNotEqual(amap, [])
+
 
 if __name__ == "__main__":
     unittest.main()
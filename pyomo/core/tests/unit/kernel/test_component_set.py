@@ -174,6 +174,12 @@ class TestComponentSet(unittest.TestCase):
         self.assertEqual(len(cset), len(self._components))
         for c in self._components:
             self.assertTrue(c in cset)
+        cset2 = ComponentSet()
+        cset2.update(cset)
+        self.assertEqual(cset2, cset)
+        cset2 = ComponentSet()
+        cset2.update(c for c in self._components)
+        self.assertEqual(cset2, cset)
 
     def test_clear(self):
         cset = ComponentSet()
@@ -28,11 +28,18 @@ import pyutilib.services
 from pyomo.environ import *
 from pyomo.common.log import LoggingIntercept
 from pyomo.core.base.block import SimpleBlock, SubclassOf
+from pyomo.core.base.clone import _BlockCloner
 from pyomo.core.expr import current as EXPR
 from pyomo.opt import *
 
 from pyomo.gdp import Disjunct
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
 solvers = check_available_solvers('glpk')
 
 class DerivedBlock(SimpleBlock):
@@ -1524,6 +1531,113 @@ class TestBlock(unittest.TestCase):
                           list(m.component_map( set([Objective]), active=False,
                                                 sort=True )) )
 
+    def test_component_data_objects_cache(self):
+        def _b(b, i):
+            b.x = Var([1,2,3])
+            b.c = Constraint([1,2], rule=lambda b,i: b.x[i] >= 0)
+        m = ConcreteModel()
+        m.b = Block([1,2], rule=_b)
+
+        def names(**kwds):
+            return [x.name for x in m.component_data_objects(**kwds)]
+
+        ref = ['b[1].c[1]', 'b[1].c[2]', 'b[2].c[1]', 'b[2].c[2]']
+        self.assertEqual(names(ctype=Constraint, active=True), ref)
+        self.assertEqual(m.component_data_cache_info(),
+                         (0, 1, 1))
+        self.assertEqual(names(ctype=Constraint, active=True), ref)
+        self.assertEqual(m.component_data_cache_info(),
+                         (1, 1, 1))
+
+        # Deactivation invalidates the cache
+        m.b[1].c[2].deactivate()
+        self.assertEqual(names(ctype=Constraint, active=True),
+                         ['b[1].c[1]', 'b[2].c[1]', 'b[2].c[2]'])
+        m.b[1].c[2].activate()
+        self.assertEqual(names(ctype=Constraint, active=True), ref)
+
+        # Adding and deleting components and component data
+        m.b[2].d = Constraint(expr=m.b[2].x[3] <= 1)
+        self.assertEqual(names(ctype=Constraint, active=True),
+                         ref + ['b[2].d'])
+        m.b[2].del_component('d')
+        self.assertEqual(names(ctype=Constraint, active=True), ref)
+        del m.b[1].c[1]
+        self.assertEqual(names(ctype=Constraint, active=True), ref[1:])
+        m.b[1].c[1] = m.b[1].x[1] >= 0
+        self.assertEqual(names(ctype=Constraint, active=True), ref)
+        m.b[1].c._data.pop(1)
+        self.assertEqual(names(ctype=Constraint, active=True), ref[1:])
+
+        m.b[2].reclassify_component_type('c', Objective)
+        self.assertEqual(names(ctype=Constraint), ['b[1].c[2]'])
+
+        # Uncacheable arguments
+        self.assertEqual(names(ctype=SubclassOf(Var)),
+                         ['b[%s].x[%s]' % (i,j) for i in (1,2)
+                          for j in (1,2,3)])
+
+        # The cache is not cloned
+        i = m.clone()
+        self.assertNotIn('_component_data_cache', i.__dict__)
+        self.assertEqual(i.component_data_cache_info(), (0, 0, 0))
+
+    def test_component_data_objects_cache_scope(self):
+        def _b(b, i):
+            b.x = Var([1,2])
+            b.c = Constraint([1,2], rule=lambda b,i: b.x[i] >= 0)
+        m = ConcreteModel()
+        m.b = Block([1,2], rule=_b)
+        n = ConcreteModel()
+        n.b = Block([1,2], rule=_b)
+        for blk in (m, m.b[1], m.b[2], n):
+            list(blk.component_data_objects(Constraint, active=True))
+            list(blk.component_data_objects(Constraint, active=True))
+
+        # Changes to other models do not invalidate the cache
+        n.b[1].c[1].deactivate()
+        n.y = Var()
+        self.assertEqual(m.component_data_cache_info().entries, 1)
+        self.assertEqual(n.component_data_cache_info().entries, 0)
+
+        # Changes beneath a block only invalidate the caches of the
+        # block and its ancestors
+        m.b[2].c[1].deactivate()
+        self.assertEqual(m.component_data_cache_info().entries, 0)
+        self.assertEqual(m.b[1].component_data_cache_info().entries, 1)
+        self.assertEqual(m.b[2].component_data_cache_info().entries, 0)
+        self.assertEqual(
+            [c.name for c in m.component_data_objects(
+                Constraint, active=True)],
+            ['b[1].c[1]', 'b[1].c[2]', 'b[2].c[2]'])
+        m.b[2].deactivate()
+        self.assertEqual(m.b[2].component_data_cache_info().entries, 0)
+        self.assertEqual(
+            list(m.b[2].component_data_objects(Constraint, active=True)),
+            [])
+
+        # The number of entries is bounded
+        for ctype in (Var, Constraint, Objective, Param, Expression):
+            for active in (True, None):
+                list(m.b[1].component_data_objects(ctype, active=active))
+        self.assertEqual(m.b[1].component_data_cache_info().entries, 8)
+
+    def test_component_data_objects_cache_modify_while_iterating(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3])
+        m.c = Constraint([1,2,3], rule=lambda m,i: m.x[i] >= 0)
+        ref = list(m.component_data_objects(Constraint, active=True))
+        self.assertEqual(len(ref), 3)
+
+        ans = []
+        for c in m.component_data_objects(Constraint, active=True):
+            ans.append(c.name)
+            if c is m.c[1]:
+                m.c[2].deactivate()
+                m.d = Constraint(expr=m.x[1] <= 1)
+        self.assertEqual(m.component_data_cache_info().hits, 1)
+        self.assertEqual(ans, ['c[1]', 'c[3]', 'd'])
+
     def test_iterate_hierarchical_blocks(self):
         def def_var(b, *args):
             b.x = Var()
@@ -1918,6 +2032,8 @@ class TestBlock(unittest.TestCase):
         OUTPUT = StringIO()
         with LoggingIntercept(OUTPUT, 'pyomo.core'):
             nb = m.b.clone()
+        self.assertIn("Cloning block 'b' with the structure-aware copy "
+                      "failed (TypeError: ", OUTPUT.getvalue())
         self.assertNotIn("'unknown' contains an uncopyable field 'bad1'",
                          OUTPUT.getvalue())
         self.assertIn("'b' contains an uncopyable field 'bad2'",
@@ -2000,6 +2116,116 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (n.x, n.y[1], n.b.x, n.b.y[1])),
         )
 
+    def test_clone_fallback(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], initialize=1)
+        m.c = Constraint(expr=m.x[1] + m.x[2] <= 1)
+
+        def _raise(self):
+            raise self.exc
+        _clone = _BlockCloner.clone
+        try:
+            _BlockCloner.clone = _raise
+            # Unexpected failures of the structure-aware copy fall back
+            # on deepcopy with a warning
+            _BlockCloner.exc = RuntimeError("maximum recursion depth")
+            OUTPUT = StringIO()
+            with LoggingIntercept(OUTPUT, 'pyomo.core'):
+                n = m.clone()
+            self.assertIn("falling back on deepcopy", OUTPUT.getvalue())
+            self.assertIs(n.c.body.arg(0), n.x[1])
+            self.assertIs(n.parent_block(), None)
+
+            # ... but interrupts and other errors propagate
+            for exc in (KeyboardInterrupt(), KeyError(1)):
+                _BlockCloner.exc = exc
+                with self.assertRaises(exc.__class__):
+                    m.clone()
+                self.assertIs(m.parent_block(), None)
+        finally:
+            _BlockCloner.clone = _clone
+            del _BlockCloner.exc
+
+    def test_clone_shares_external_expressions(self):
+        m = ConcreteModel()
+        m.x = Var([1,2])
+        m.p = Param(mutable=True, initialize=2)
+        m.b = Block()
+        m.b.y = Var()
+        m.b.q = Param(mutable=True, initialize=3)
+        ext = m.p*m.x[1]**2 + m.x[2]
+        m.b.c = Constraint(expr=ext + m.b.q*m.b.y <= 1)
+        m.b.d = Constraint(expr=ext >= 0)
+        m.b.e = Expression(expr=sum(m.x[i] for i in m.x) + m.b.y)
+
+        nb = _BlockCloner(m.b).clone()
+        # The subtree that only references components outside the
+        # block is shared
+        self.assertIs(nb.d.body, m.b.d.body)
+        self.assertIs(nb.c.body.arg(0), m.b.c.body.arg(0))
+        self.assertIsNot(nb.c.body, m.b.c.body)
+        self.assertIs(nb.c.body.arg(2).arg(0), nb.q)
+        self.assertIs(nb.c.body.arg(2).arg(1), nb.y)
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(nb.e.expr)),
+            sorted(id(v) for v in (m.x[1], m.x[2], nb.y)))
+        self.assertIs(nb.c.parent_block(), nb)
+        self.assertIs(nb.e.parent_component(), nb.e)
+        self.assertEqual(str(nb.c.body), str(m.b.c.body))
+
+        # The original and the clone are independent
+        nb.q = 5
+        self.assertEqual(value(m.b.q), 3)
+        self.assertEqual(value(nb.c.body.arg(2).arg(0)), 5)
+
+    def test_clone_model_components(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[1,2,3])
+        m.p = Param(m.I, initialize={1:1, 2:2, 3:3})
+        m.q = Param(m.I, mutable=True, initialize=1)
+        m.x = Var(m.I, bounds=(0, 10), initialize=2)
+        m.x[2].fix(5)
+        with EXPR.linear_expression() as e:
+            e += 2*m.x[1]
+            e += m.x[3]
+        m.c = Constraint(m.I, rule=lambda m, i: m.q[i]*m.x[i] >= m.p[i])
+        m.lin = Constraint(expr=e <= 4)
+        m.o = Objective(expr=sum(m.x[i] for i in m.I))
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        m.dual[m.c[1]] = 7
+        m.b = Block(m.I)
+        m.b[2].z = Var(initialize=lambda b: b.index())
+        m.b[2].c = Constraint(expr=m.b[2].z >= m.x[2])
+        m.c[3].deactivate()
+
+        n = _BlockCloner(m).clone()
+        self.assertEqual(list(n.I), [1,2,3])
+        self.assertIs(n.x.index_set(), n.I)
+        self.assertEqual([n.p[i] for i in n.I], [1,2,3])
+        self.assertEqual(n.x[1].value, 2)
+        self.assertTrue(n.x[2].fixed)
+        self.assertEqual(n.x[2].value, 5)
+        self.assertEqual(n.x[3].bounds, (0, 10))
+        self.assertIs(n.x[1].parent_component(), n.x)
+        self.assertIs(n.q[1].parent_component(), n.q)
+        self.assertFalse(n.c[3].active)
+        self.assertTrue(n.c[1].active)
+        self.assertEqual(
+            [id(v) for v in n.lin.body.linear_vars],
+            [id(v) for v in (n.x[1], n.x[3])])
+        self.assertEqual(str(n.lin.body), str(m.lin.body))
+        self.assertIs(n.c[2].body.arg(0), n.q[2])
+        self.assertIs(n.c[2].body.arg(1), n.x[2])
+        self.assertEqual(n.dual[n.c[1]], 7)
+        self.assertNotIn(m.c[1], n.dual)
+        self.assertIs(n.b[2].parent_component(), n.b)
+        self.assertIs(n.b[2].parent_block(), n)
+        self.assertEqual(n.b[2].z.value, 2)
+        self.assertEqual(
+            sorted(id(v) for v in EXPR.identify_variables(n.b[2].c.body)),
+            sorted(id(v) for v in (n.b[2].z, n.x[2])))
+        self.assertIs(n.o.expr.arg(0), n.x[1])
+
     def test_pprint(self):
         m = HierarchicalModel().model
         buf = StringIO()
@@ -2261,6 +2487,65 @@ class TestBlock(unittest.TestCase):
                 ValueError, ".*Cannot write model in format"):
             m.write(format="bogus")
 
+    def test_fix_unfix_all_vars(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=1)
+        m.y = Var(initialize=2)
+        m.b = Block([1, 2])
+        m.b[2].z = Var([1, 2], initialize=3)
+        vars_ = list(m.component_data_objects(Var))
+        m.fix_all_vars()
+        self.assertEqual([v.fixed for v in vars_], [True]*5)
+        self.assertEqual([v.value for v in vars_], [1, 1, 2, 3, 3])
+        m.unfix_all_vars(mask=[True, False, True, False, True])
+        self.assertEqual([v.fixed for v in vars_],
+                         [False, True, False, True, False])
+        m.unfix_all_vars()
+        m.fix_all_vars([5, 6, 7, 8, 9], mask=[0, 1, 1, 0, 1])
+        self.assertEqual([v.fixed for v in vars_],
+                         [False, True, True, False, True])
+        self.assertEqual([v.value for v in vars_], [1, 6, 7, 3, 9])
+        m.b[2].unfix_all_vars()
+        self.assertEqual([v.fixed for v in vars_],
+                         [False, True, True, False, False])
+        self.assertRaisesRegexp(
+            ValueError, "4 values were given for 5 variables",
+            m.fix_all_vars, [1, 2, 3, 4])
+        m.fix_all_vars([1, 2, None, 4, float('nan')])
+        self.assertEqual([v.value for v in vars_], [1, 2, None, 4, None])
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_fix_all_vars_numpy(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.y = Var()
+        m.z = Var()
+        vars_ = list(m.component_data_objects(Var))
+        m.fix_all_vars(numpy.array([1., 2., 3., numpy.nan]))
+        self.assertEqual([v.value for v in vars_], [1, 2, 3, None])
+        # numpy scalars are not stored in the variables
+        self.assertEqual([type(v.value) for v in vars_[:3]], [float]*3)
+        self.assertTrue(all(v.fixed for v in vars_))
+
+    def test_set_var_values_and_bounds(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2], initialize=1)
+        m.y = Var(initialize=2)
+        m.b = Block()
+        m.b.z = Var([1, 2], storage='array')
+        vars_ = list(m.component_data_objects(Var))
+        m.set_var_values([5, None, 7, 8, float('nan')])
+        self.assertEqual([v.value for v in vars_], [5, None, 7, 8, None])
+        m.set_var_values([0, 0, 0, 0, 0], mask=[1, 0, 0, 1, 0])
+        self.assertEqual([v.value for v in vars_], [0, None, 7, 0, None])
+        self.assertRaises(ValueError, m.set_var_values, 1)
+
+        m.set_var_bounds(0, [1, 2, None, 4, 5])
+        self.assertEqual([(v.lb, v.ub) for v in vars_],
+                         [(0, 1), (0, 2), (0, None), (0, 4), (0, 5)])
+        m.set_var_bounds(None, None, mask=[0, 0, 1, 1, 0])
+        self.assertEqual([(v.lb, v.ub) for v in vars_],
+                         [(0, 1), (0, 2), (None, None), (None, None), (0, 5)])
 
 
 if __name__ == "__main__":
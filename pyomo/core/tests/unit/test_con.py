@@ -911,6 +911,83 @@ class TestArrayCon(unittest.TestCase):
         m.c[2] = Constraint.Skip
         self.assertEqual(len(m.c), 0)
 
+    def test_lazy_rule(self):
+        model = self.create_model()
+        calls = []
+        def f(model, i):
+            calls.append(i)
+            if i == 2:
+                return Constraint.Skip
+            return model.x[i] >= i
+        model.x = Var(model.A)
+        model.c = Constraint(model.A, rule=f, lazy=True)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(model.c[3].lower, 3)
+        self.assertEqual(calls, [3])
+        self.assertIn(1, model.c)
+        self.assertNotIn(2, model.c)
+        self.assertNotIn(5, model.c)
+        self.assertEqual(calls, [3, 1, 2])
+        self.assertRaises(KeyError, model.c.__getitem__, 2)
+        self.assertEqual(calls, [3, 1, 2])
+
+        # Explicitly setting an index replaces the rule
+        model.c[4] = model.x[4] <= 0
+        self.assertEqual(len(model.c), 3)
+        self.assertEqual(calls, [3, 1, 2])
+        self.assertEqual(model.c[4].upper, 0)
+        self.assertEqual(list(model.c), [1, 3, 4])
+
+    def test_lazy_iteration(self):
+        model = self.create_model()
+        model.x = Var(model.A)
+        model.c = Constraint(model.A, rule=lambda m, i: m.x[i] >= 0,
+                             lazy=True)
+        self.assertEqual(len(model.c._data), 0)
+        self.assertEqual(
+            [c.name for c in model.component_data_objects(Constraint)],
+            ['c[1]', 'c[2]', 'c[3]', 'c[4]'])
+        self.assertIsNone(model.c._lazy_done)
+
+    def test_lazy_abstract(self):
+        model = AbstractModel()
+        model.A = Set(initialize=[1,2,3])
+        model.x = Var(model.A)
+        model.c = Constraint(model.A, rule=lambda m, i: m.x[i] >= i,
+                             lazy=True)
+        instance = model.create_instance()
+        self.assertEqual(len(instance.c._data), 0)
+        self.assertEqual(instance.c[2].lower, 2)
+        self.assertEqual(len(instance.c._data), 1)
+        clone = instance.clone()
+        self.assertIs(clone.c[3].body, clone.x[3])
+        self.assertEqual(len(clone.c), 3)
+        self.assertEqual(len(instance.c._data), 1)
+
+    def test_lazy_timing(self):
+        from pyomo.common.timing import report_timing
+        model = self.create_model()
+        model.x = Var(model.A)
+        buf = StringIO()
+        report_timing(buf)
+        try:
+            model.c = Constraint(model.A, rule=lambda m, i: m.x[i] >= 0,
+                                 lazy=True)
+            model.c[1]
+            model.c[3]
+            self.assertEqual(model.c._lazy_realized, 2)
+            len(model.c)
+        finally:
+            report_timing(False)
+        lines = [l.strip() for l in buf.getvalue().splitlines()
+                 if 'Constraint c' in l]
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith(
+            "4 indicies total (4 deferred, 0 realized)"))
+        self.assertTrue(lines[1].endswith(
+            "4 indicies total (4 deferred, 4 realized)"))
+
 class TestConList(unittest.TestCase):
 
     def create_model(self):
@@ -4120,6 +4120,34 @@ class TestSumExpression(unittest.TestCase):
         self.assertEqual( e(), 15 )
         self.assertIs(type(e), EXPR.SumExpression)
 
+    def test_args_storage(self):
+        m = self.m
+        e1 = m.a[1] + m.a[2]
+        self.assertIs(type(e1._args_), tuple)
+        # Extending a sum appends to its (shared) list of arguments
+        e2 = e1 + m.a[3]
+        self.assertIs(type(e2), EXPR.SumExpression)
+        self.assertIs(e1._args_, e2._args_)
+        self.assertEqual(e1.nargs(), 2)
+        self.assertEqual(e2.nargs(), 3)
+        self.assertEqual(e1(), 10)
+        self.assertEqual(e2(), 15)
+        # ... so the next sum with e1 is nested
+        e3 = e1 + m.a[4]
+        self.assertEqual(e3.nargs(), 2)
+        self.assertIs(e3.arg(0), e1)
+        self.assertEqual(e3(), 15)
+        e4 = e2 + m.a[5]
+        self.assertIs(e4._args_, e2._args_)
+        self.assertEqual(e4.nargs(), 4)
+        self.assertEqual(e2(), 15)
+        self.assertEqual(e4(), 20)
+
+        e = quicksum((m.a[i] for i in m.I), linear=False)
+        self.assertIs(type(e._args_), tuple)
+        self.assertEqual(e.nargs(), 5)
+        self.assertIs(type(e.clone()._args_), tuple)
+
 
 class TestCloneExpression(unittest.TestCase):
 
@@ -4163,7 +4191,7 @@ class TestCloneExpression(unittest.TestCase):
             self.assertEqual( expr1(), 11 )
             self.assertEqual( expr2(), 11 )
             self.assertNotEqual( id(expr1),       id(expr2) )
-            self.assertNotEqual( id(expr1._args_), id(expr2._args_) )
+            self.assertEqual( id(expr1._args_), id(expr2._args_) )
             self.assertEqual( id(expr1.arg(0)), id(expr2.arg(0)) )
             self.assertEqual( id(expr1.arg(1)), id(expr2.arg(1)) )
             #
@@ -4202,7 +4230,7 @@ class TestCloneExpression(unittest.TestCase):
             self.assertEqual( expr1(), 15 )
             self.assertEqual( expr2(), 15 )
             self.assertNotEqual( id(expr1),       id(expr2) )
-            self.assertNotEqual( id(expr1._args_), id(expr2._args_) )
+            self.assertEqual( id(expr1._args_), id(expr2._args_) )
             self.assertEqual( id(expr1.arg(0)), id(expr2.arg(0)) )
             self.assertEqual( id(expr1.arg(1)), id(expr2.arg(1)) )
             expr1 += self.m.b
@@ -5462,6 +5490,71 @@ class TestLinearExpression(unittest.TestCase):
             self.assertIs(e.__class__, EXPR.PowExpression)
 
 
+class TestLinearSum(unittest.TestCase):
+
+    def test_lists(self):
+        m = ConcreteModel()
+        m.v = Var(range(3))
+        m.p = Param(mutable=True, initialize=2)
+
+        coefs = [1, m.p, 3]
+        vars_ = [m.v[0], m.v[1], m.v[2]]
+        e = linear_sum(coefs, vars_, 4)
+        self.assertIs(e.__class__, EXPR.LinearExpression)
+        self.assertEqual(e.constant, 4)
+        self.assertEqual(e.linear_coefs, coefs)
+        self.assertIsNot(e.linear_coefs, coefs)
+        self.assertEqual([id(v) for v in e.linear_vars],
+                         [id(v) for v in vars_])
+        self.assertIsNot(e.linear_vars, vars_)
+        self.assertEqual(str(e), "4 + v[0] + p*v[1] + 3*v[2]")
+
+        e = linear_sum(2, m.v.values())
+        self.assertEqual(e.constant, 0)
+        self.assertEqual(e.linear_coefs, [2, 2, 2])
+        self.assertEqual(str(e), "2*v[0] + 2*v[1] + 2*v[2]")
+
+    def test_empty(self):
+        self.assertEqual(linear_sum([], []), 0)
+        self.assertEqual(linear_sum(1, [], 5), 5)
+
+    def test_length_mismatch(self):
+        m = ConcreteModel()
+        m.v = Var(range(3))
+        with self.assertRaisesRegexp(
+                ValueError, "called with 2 coefficients and 3 variables"):
+            linear_sum([1, 2], m.v.values())
+
+    def test_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("This test requires NumPy")
+        m = ConcreteModel()
+        m.v = Var(range(3))
+        vars_ = numpy.array(list(m.v.values()), dtype=object)
+        e = linear_sum(numpy.array([1., 2., 3.]), vars_)
+        self.assertEqual(e.linear_coefs, [1., 2., 3.])
+        self.assertIs(e.linear_coefs[0].__class__, float)
+        self.assertIs(e.linear_vars.__class__, list)
+        self.assertIs(e.linear_vars[2], m.v[2])
+        e = linear_sum(numpy.float64(2), vars_)
+        self.assertEqual(e.linear_coefs, [2., 2., 2.])
+
+    def test_quicksum_terms(self):
+        m = ConcreteModel()
+        m.v = Var(range(3))
+        m.p = Param(mutable=True, initialize=2)
+
+        e = quicksum([m.v[0], 1, m.p*m.v[1], 3*m.v[2], m.p], linear=True)
+        self.assertIs(e.__class__, EXPR.LinearExpression)
+        self.assertEqual(str(e), "1 + p + v[0] + p*v[1] + 3*v[2]")
+
+        e = quicksum([m.v[0], m.v[1]*m.v[2], 2*m.v[1]], linear=True)
+        self.assertIs(e.__class__, EXPR.SumExpression)
+        self.assertEqual(str(e), "v[0] + v[1]*v[2] + 2*v[1]")
+
+
 class TestNonlinearExpression(unittest.TestCase):
 
     def test_sum_other(self):
@@ -291,6 +291,23 @@ class TestExpression(unittest.TestCase):
     def tearDown(self):
         expr_common.TO_STRING_VERBOSE = TestExpression._save
 
+    def test_lazy_rule(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3], initialize=1)
+        calls = []
+        def rule(m, i):
+            calls.append(i)
+            if i > 1:
+                return m.e[i-1] + m.x[i]
+            return m.x[i]
+        model.e = Expression([1,2,3], rule=rule, lazy=True)
+        self.assertEqual(calls, [])
+        self.assertEqual(value(model.e[2]), 2)
+        self.assertEqual(calls, [2, 1])
+        model.e.add(3, 5*model.x[3])
+        self.assertEqual([value(e) for e in model.e.values()], [1, 2, 5])
+        self.assertEqual(calls, [2, 1])
+
     def test_unconstructed_singleton(self):
         a = Expression()
         self.assertEqual(a._constructed, False)
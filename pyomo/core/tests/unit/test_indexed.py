@@ -136,6 +136,41 @@ class TestIndexedComponent(unittest.TestCase):
             TypeError, '.*',
             m.x.__getitem__, {})
 
+    def test_normalize_index(self):
+        from pyomo.core.base.indexed_component import normalize_index
+        self.assertEqual(normalize_index(1), 1)
+        self.assertEqual(normalize_index('a'), 'a')
+        self.assertEqual(normalize_index((1,'a')), (1,'a'))
+        self.assertEqual(normalize_index((1,)), 1)
+        self.assertEqual(normalize_index(((1,2),3)), (1,2,3))
+        self.assertEqual(normalize_index((1,(2,(3,'a')))), (1,2,3,'a'))
+        self.assertEqual(normalize_index(((1,),)), 1)
+        self.assertEqual(normalize_index([1,[2,3]]), (1,2,3))
+        self.assertEqual(normalize_index((None,1)), (None,1))
+        self.assertEqual(normalize_index(()), ())
+
+    def test_index_by_nested_tuple(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], [1,2,3], initialize=lambda m,x,y: 2*x*y)
+        self.assertEqual(m.x[(2,),3], 12)
+        self.assertEqual(m.x[((2,3),)], 12)
+        self.assertRaises(KeyError, m.x.__getitem__, ((2,4),))
+
+    def test_get_many(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], [1,2], dense=False)
+        m.p = Param([1,2,3], default=5, initialize={2: 1})
+        m.x[1,1]
+        m.x[3,2]
+        ans = m.x.get_many([(1,1), (2,2), (3,2)])
+        self.assertEqual([v.name for v in ans],
+                         ['x[1,1]', 'x[2,2]', 'x[3,2]'])
+        self.assertEqual(len(m.x), 3)
+        self.assertEqual(m.p.get_many(i for i in (1,2,3)), [5,1,5])
+        self.assertRaises(KeyError, m.p.get_many, [1,4])
+        self.assertEqual([v.name for v in m.x.get_many([(2, slice(None))])[0]],
+                         ['x[2,2]'])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,7 +20,8 @@ from six import itervalues
 
 from pyomo.environ import *
 from pyomo.core.base.block import _BlockData
-from pyomo.core.base.indexed_component import _IndexedComponent_slice
+from pyomo.core.base.indexed_component import (
+    IndexedComponent, _IndexedComponent_slice)
 
 
 class TestComponentSlices(unittest.TestCase):
@@ -400,6 +401,81 @@ class TestComponentSlices(unittest.TestCase):
         _slicer.call_errors_generate_exceptions = True
         self.assertRaises( TypeError, _slicer.next )
 
+    def test_fixed_index_slices(self):
+        m = self.m
+        self.assertEqual([x.value for x in m.y[2,:]], [24, 25, 26])
+        self.assertEqual([x.value for x in m.y[:,5]], [15, 25, 35])
+        self.assertEqual(list(m.y[4,:]), [])
+        self.assertEqual([b.name for b in m.bb[:,5,:]],
+                         ['bb[%s,5,%s]' % (i,k) for i in m.I for k in m.K])
+
+        # Sparse components only iterate over the defined indices
+        m.z = Var(m.I, m.J, dense=False)
+        m.z[3,5].value = 1
+        m.z[1,5].value = 2
+        self.assertEqual([x.value for x in m.z[:,5]], [2, 1])
+        self.assertEqual(len(m.z), 2)
+
+    def test_slice_index(self):
+        m = self.m
+        m.z = Var(m.I, m.J, dense=False)
+        m.z[3,5].value = 1
+        m.z[1,5].value = 2
+        m.z[2,4].value = 3
+        # The secondary index is built by the second slice
+        self.assertEqual([x.value for x in m.z[:,5]], [2, 1])
+        self.assertNotIn((2, (1,)), m.z._slice_index.indexes)
+        self.assertEqual([x.value for x in m.z[:,5]], [2, 1])
+        self.assertIn((2, (1,)), m.z._slice_index.indexes)
+        self.assertEqual([x.value for x in m.z[:,4]], [3])
+        self.assertEqual([x.value for x in m.z[2,:]], [3])
+        self.assertEqual(list(m.z[:,6]), [])
+
+        # The index is updated when data are added or removed
+        m.z[2,5].value = 4
+        self.assertEqual([x.value for x in m.z[:,5]], [2, 4, 1])
+        self.assertEqual([x.value for x in m.z[:,5]], [2, 4, 1])
+        del m.z[1,5]
+        self.assertEqual([x.value for x in m.z[:,5]], [4, 1])
+        self.assertEqual([x.value for x in m.z[:,5]], [4, 1])
+        m.z.clear()
+        self.assertEqual(list(m.z[:,5]), [])
+        self.assertEqual(list(m.z[:,5]), [])
+
+        # Non-product index sets
+        m.T = Set(dimen=2, initialize=[(1,'a'), (2,'b'), (3,'a')],
+                  ordered=True)
+        m.w = Var(m.T, initialize=lambda m,i,j: i)
+        for i in range(2):
+            self.assertEqual([x.value for x in m.w[:,'a']], [1, 3])
+            self.assertEqual([x.value for x in m.w[2,:]], [2])
+
+        # Dense components are checked once for every member of the
+        # index set (and not just the number of data)
+        self.assertEqual([x.value for x in m.y[:,5]], [15, 25, 35])
+        self.assertTrue(m.y._slice_index.dense)
+        m.v = Var(m.I, m.J, dense=False)
+        for i in m.I:
+            for j in m.J:
+                if (i, j) != (1, 4):
+                    m.v[i,j].value = i*10+j
+        _checking = IndexedComponent._DEFAULT_INDEX_CHECKING_ENABLED
+        IndexedComponent._DEFAULT_INDEX_CHECKING_ENABLED = False
+        try:
+            m.v[4,4].value = 44
+        finally:
+            IndexedComponent._DEFAULT_INDEX_CHECKING_ENABLED = _checking
+        self.assertEqual(len(m.v), len(m.I*m.J))
+        self.assertEqual([x.value for x in m.v[:,5]], [15, 25, 35])
+        self.assertFalse(m.v._slice_index.dense)
+
+        # The index is not copied
+        m.y[:,5]
+        m.y[:,5]
+        i = m.clone()
+        self.assertNotIn('_slice_index', i.w.__dict__)
+        self.assertEqual([x.value for x in i.w[:,'a']], [1, 3])
+
     def test_iterators(self):
         m = self.m
 
@@ -20,13 +20,25 @@
 
 import math
 import os
+import pickle
 import sys
 
 import pyutilib.services
 import pyutilib.th as unittest
 
 from pyomo.environ import *
-from pyomo.core.base.param import _NotValid
+from pyomo.core.base.param import _NotValid, _ArrayParamData
+
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+try:
+    import pandas
+    has_pandas = True
+except:     #pragma:nocover
+    has_pandas = False
 
 from six import iteritems, itervalues, StringIO
 
@@ -667,6 +679,40 @@ class ArrayParam_immutable_dense_intDefault_ruleInit\
         self.data = self.sparse_data
 
 
+
+class ArrayParam_mutable_sparse_intDefault_sparseStorage\
+          (ArrayParam_mutable_sparse_intDefault):
+
+    def setUp(self, **kwds):
+        ArrayParam_mutable_sparse_intDefault.setUp(
+            self, storage='sparse', **kwds)
+        # Array storage only holds numeric values
+        self.expectTextDomainError = True
+        if has_numpy:
+            # ... of a single type: the int default is stored as a float
+            self.data = {1:1.3, 3:0.0}
+
+
+class ArrayParam_mutable_dense_intDefault_dictInit_sparseStorage\
+          (ArrayParam_mutable_dense_intDefault_dictInit):
+
+    def setUp(self, **kwds):
+        ArrayParam_mutable_dense_intDefault_dictInit.setUp(
+            self, storage='sparse', **kwds)
+        # Array storage only holds numeric values
+        self.expectTextDomainError = True
+
+
+class ArrayParam_immutable_sparse_intDefault_sparseStorage\
+          (ArrayParam_immutable_sparse_intDefault):
+
+    def setUp(self, **kwds):
+        ArrayParam_immutable_sparse_intDefault.setUp(
+            self, storage='sparse', **kwds)
+        # Array storage only holds numeric values
+        self.expectTextDomainError = True
+
+
 class ArrayParam6(unittest.TestCase):
 
     def setUp(self, **kwds):
@@ -1938,5 +1984,142 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests,instrinsic_test_list)
 
 
+class TestParamArrayStorage(unittest.TestCase):
+
+    def _model(self, **kwds):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.J = Set(initialize=['a', 'b'], ordered=True)
+        m.p = Param(m.I, m.J, **kwds)
+        return m
+
+    def test_storage_errors(self):
+        self.assertRaises(ValueError, Param, storage='dense')
+        self.assertRaises(ValueError, Param, [1, 2], storage='columns')
+        m = AbstractModel()
+        m.I = Set(initialize=[1, 2])
+        m.p = Param(m.I, storage='dense')
+        # Dense storage requires an ordered index set
+        self.assertRaises(ValueError, m.create_instance)
+
+    def test_dense(self):
+        m = self._model(initialize={(1, 'a'): 1, (3, 'b'): 3},
+                        storage='dense')
+        self.assertEqual(len(m.p), 2)
+        self.assertEqual(m.p[1, 'a'], 1)
+        self.assertIs(type(m.p[1, 'a']), int)
+        self.assertIn((3, 'b'), m.p)
+        self.assertNotIn((2, 'b'), m.p)
+        self.assertNotIn((4, 'b'), m.p)
+        self.assertEqual(list(m.p.keys()), [(1, 'a'), (3, 'b')])
+        self.assertRaises(ValueError, m.p.__getitem__, (2, 'a'))
+        self.assertRaises(KeyError, m.p.__getitem__, (4, 'a'))
+        self.assertRaises(TypeError, m.p.__setitem__, (1, 'a'), 5)
+
+    def test_sparse(self):
+        m = ConcreteModel()
+        m.p = Param(Any, mutable=True, storage='sparse')
+        m.p['x'] = 1
+        m.p[1, 2] = 2.5
+        self.assertEqual(m.p.extract_values(), {'x': 1, (1, 2): 2.5})
+        self.assertRaises(ValueError, m.p.__setitem__, 'x', 'text')
+        del m.p['x']
+        self.assertEqual(list(m.p.keys()), [(1, 2)])
+        m.p.clear()
+        self.assertEqual(len(m.p), 0)
+
+    def test_mutable_views(self):
+        m = self._model(mutable=True, initialize={(1, 'a'): 0, (2, 'b'): 0},
+                        storage='dense')
+        self.assertEqual(len(m.p._data._views), 0)
+        self.assertEqual(m.p[2, 'b'].value, 0)
+        # Data objects are only created when they are referenced...
+        self.assertEqual(len(m.p._data._views), 1)
+        self.assertEqual(m.p.extract_values()[(1, 'a')], 0)
+        self.assertEqual(len(m.p._data._views), 1)
+        # ... and are the same objects on every reference
+        p = m.p[2, 'b']
+        self.assertIs(type(p), _ArrayParamData)
+        self.assertIs(p, m.p[2, 'b'])
+        e = 2*p
+        m.p[2, 'b'] = 1.5
+        self.assertEqual(value(e), 3)
+        p.value = 4
+        self.assertEqual(m.p.extract_values()[(2, 'b')], 4)
+
+    def test_slice_update(self):
+        m = self._model(mutable=True, default=0, storage='dense')
+        m.p[:, 'b'] = 5
+        self.assertEqual(m.p.extract_values_sparse(),
+                         {(1, 'b'): 5, (2, 'b'): 5, (3, 'b'): 5})
+        self.assertEqual(len(m.p._data._views), 0)
+        m.q = Param(m.I, within=NonNegativeReals, mutable=True,
+                    initialize=0, storage='sparse')
+        self.assertRaises(ValueError, m.q.__setitem__, slice(None), -1)
+        self.assertEqual(m.q.extract_values(), {1: 0, 2: 0, 3: 0})
+        m.p[2, :] = 1.5
+        self.assertEqual(m.p.extract_values_sparse(),
+                         {(1, 'b'): 5, (2, 'a'): 1.5, (2, 'b'): 1.5,
+                          (3, 'b'): 5})
+        self.assertEqual(len(m.p._data._views), 0)
+
+    def test_store_values_validation(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.p = Param(m.I, within=NonNegativeReals, mutable=True,
+                    initialize=0, storage='dense')
+        for check in (True, False):
+            self.assertRaises(ValueError, m.p.store_values, {1: -1}, check)
+            self.assertRaises(KeyError, m.p.store_values, {4: 1}, check)
+        m.p.store_values({1: 1, 3: 2}, check=False)
+        self.assertEqual(m.p.extract_values(), {1: 1, 2: 0, 3: 2})
+        m.q = Param(m.I, validate=lambda m, v, i: v < 3, mutable=True,
+                    storage='sparse')
+        self.assertRaises(ValueError, m.q.store_values, {1: 3}, False)
+        with self.assertRaises(ValueError):
+            m.r = Param(m.I, within=NonNegativeReals, initialize={1: -1},
+                        storage='dense')
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_numpy_init(self):
+        data = numpy.arange(6).reshape(3, 2)
+        m = self._model(initialize=data, storage='dense')
+        self.assertEqual(m.p[2, 'a'], 2)
+        self.assertEqual(m.p[3, 'b'], 5)
+        # numpy arrays are also accepted with the default storage
+        m.q = Param(m.I, m.J, initialize=data*0.5)
+        self.assertEqual(m.q[3, 'b'], 2.5)
+        with self.assertRaises(ValueError):
+            m.r = Param(m.I, initialize=numpy.arange(4))
+        m.s = Param(m.I, mutable=True, storage='dense')
+        m.s.store_values(numpy.array([1., 2., 3.]))
+        self.assertEqual(m.s.extract_values(), {1: 1, 2: 2, 3: 3})
+
+    @unittest.skipIf(not has_pandas, "Pandas is not available")
+    def test_pandas_init(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        series = pandas.Series([1.5, 2.5], index=[2, 4])
+        m.p = Param(m.I, initialize=series, storage='dense')
+        self.assertEqual(m.p.extract_values(), {2: 1.5, 4: 2.5})
+        m.q = Param(m.I, initialize=series)
+        self.assertEqual(m.q.extract_values(), {2: 1.5, 4: 2.5})
+        with self.assertRaises(KeyError):
+            m.r = Param(m.I, initialize=pandas.Series([1], index=[5]),
+                        storage='sparse')
+
+    def test_clone_and_pickle(self):
+        m = self._model(mutable=True, initialize={(1, 'a'): 1},
+                        storage='dense')
+        m.x = Var()
+        m.c = Constraint(expr=m.x >= m.p[1, 'a'])
+        for n in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIs(n.p._data._component, n.p)
+            self.assertIs(n.p[1, 'a']._store, n.p._data)
+            n.p[1, 'a'] = 10
+            self.assertEqual(value(n.c.lower), 10)
+            self.assertEqual(value(m.c.lower), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
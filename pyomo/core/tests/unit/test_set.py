@@ -671,6 +671,92 @@ class TestRangeSetMisc(unittest.TestCase):
         self.assertEqual(tmp, list(range(1,11,2)))
         self.assertEqual( instance.d.bounds(), (1,9))
 
+    def test_ord(self):
+        a=RangeSet(2,20,3)
+        a.construct()
+        self.assertEqual([a.ord(i) for i in a], list(range(1,8)))
+        self.assertEqual(a[3], 8)
+        self.assertEqual(a[-1], 20)
+        self.assertEqual(a.next(8), 11)
+        self.assertEqual(a.prev(8), 5)
+        self.assertEqual(a.nextw(20), 2)
+        self.assertEqual(a.prevw(2), 20)
+        self.assertRaises(IndexError, a.ord, 3)
+        self.assertRaises(IndexError, a.ord, 23)
+        self.assertRaises(KeyError, a.next, 3)
+
+    def test_ord_filter(self):
+        model=ConcreteModel()
+        model.a=RangeSet(1,10,filter=lambda m,i: i % 3 == 0)
+        self.assertEqual(list(model.a), [3,6,9])
+        self.assertEqual(model.a[2], 6)
+        self.assertEqual(model.a.ord(9), 3)
+        self.assertEqual(model.a.next(3), 6)
+        self.assertRaises(IndexError, model.a.ord, 4)
+
+class TestSetProductOrdered(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ConcreteModel()
+        self.model.A = Set(initialize=['a','b','c'], ordered=True)
+        self.model.B = Set(initialize=[(1,2),(3,4)], dimen=2, ordered=True)
+        self.model.R = RangeSet(2,20,3)
+        self.model.U = Set(initialize=[1,2])
+
+    def test_ord_getitem(self):
+        P = self.model.A * self.model.R
+        self.assertEqual(len(P), 21)
+        self.assertEqual(P[1], ('a',2))
+        self.assertEqual(P[8], ('b',2))
+        self.assertEqual(P[-1], ('c',20))
+        self.assertEqual(P.ord(('b',8)), 10)
+        self.assertEqual([P[i] for i in range(1,len(P)+1)], list(P))
+        self.assertEqual([P.ord(i) for i in P], list(range(1,len(P)+1)))
+        self.assertRaises(IndexError, P.__getitem__, 22)
+        self.assertRaises(IndexError, P.__getitem__, 0)
+        self.assertRaises(IndexError, P.ord, ('z',2))
+        self.assertRaises(IndexError, P.ord, ('a',3))
+        self.assertRaises(IndexError, P.ord, 'a')
+
+    def test_ord_getitem_multidimensional(self):
+        P = self.model.A * self.model.B * self.model.R
+        self.assertEqual(P.dimen, 4)
+        self.assertEqual(P[2], ('a',1,2,5))
+        self.assertEqual([P[i] for i in range(1,len(P)+1)], list(P))
+        self.assertEqual([P.ord(i) for i in P], list(range(1,len(P)+1)))
+        self.assertRaises(IndexError, P.ord, ('a',1,4,5))
+
+    def test_next_prev(self):
+        P = self.model.A * self.model.R
+        self.assertEqual(P.first(), ('a',2))
+        self.assertEqual(P.last(), ('c',20))
+        self.assertEqual(P.next(('a',20)), ('b',2))
+        self.assertEqual(P.prev(('b',2)), ('a',20))
+        self.assertEqual(P.nextw(('c',20)), ('a',2))
+        self.assertEqual(P.prevw(('a',2)), ('c',20))
+        self.assertRaises(KeyError, P.next, ('z',2))
+
+    def test_unordered(self):
+        P = self.model.U * self.model.R
+        self.assertRaises(ValueError, P.__getitem__, 1)
+        self.assertRaises(ValueError, P.ord, (1,2))
+
+    def test_iter_slice(self):
+        P = self.model.A * self.model.B * self.model.R
+        self.assertEqual(
+            list(P.iter_slice(('b',slice(None),slice(None),5))),
+            [('b',1,2,5), ('b',3,4,5)])
+        self.assertEqual(
+            list(P.iter_slice((slice(None),3,slice(None),20))),
+            [('a',3,4,20), ('b',3,4,20), ('c',3,4,20)])
+        self.assertEqual(
+            list(P.iter_slice(('c',1,2,slice(None)))),
+            [('c',1,2,i) for i in self.model.R])
+        self.assertEqual(list(P.iter_slice(('z',1,2,slice(None)))), [])
+        self.assertEqual(
+            list(P.iter_slice((slice(None),)*4)), list(P))
+        self.assertRaises(ValueError, list, P.iter_slice(('a',5)))
+
 class SimpleSetB(SimpleSetA):
 
     def setUp(self):
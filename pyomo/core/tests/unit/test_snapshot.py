@@ -0,0 +1,168 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for model snapshots (Block.save_snapshot / load_snapshot)
+#
+
+from six import StringIO
+
+import pyutilib.th as unittest
+import pyutilib.services
+
+from pyomo.environ import *
+from pyomo.core.expr.current import identify_variables
+from pyomo.core.base.snapshot import save_snapshot
+
+
+def p_init(m, i):
+    return i/2.0
+def c_rule(m, i):
+    return m.x[i] + m.p[i]*m.y[i] <= 5
+def e_rule(m, i):
+    return 2*m.x[i]**2
+def obj_rule(m):
+    return sum(m.x[i] for i in m.I)
+def b_rule(b, i):
+    b.z = Var(initialize=i)
+    b.c = Constraint(expr=b.z >= b.model().x[i])
+
+
+def _pprint(model):
+    buf = StringIO()
+    model.pprint(ostream=buf)
+    return buf.getvalue()
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def tearDown(self):
+        pyutilib.services.TempfileManager.clear_tempfiles()
+
+    def _roundtrip(self, block):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.snapshot')
+        block.save_snapshot(fname)
+        return load_snapshot(fname)
+
+    def _make_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(5)
+        m.J = Set(initialize=['a', 'b'])
+        m.x = Var(m.I, bounds=(0, 10), initialize=1.5)
+        m.y = Var(m.I, within=Binary)
+        m.w = Var(m.I, m.J, initialize=0)
+        m.p = Param(m.I, initialize=p_init, mutable=True)
+        m.q = Param(m.J, initialize={'a': 1, 'b': 2})
+        m.c = Constraint(m.I, rule=c_rule)
+        m.e = Expression(m.I, rule=e_rule)
+        m.o = Objective(rule=obj_rule, sense=maximize)
+        m.b = Block(m.I, rule=b_rule)
+        m.s = Block()
+        m.s.v = Var(m.J, initialize={'a': 1, 'b': 2})
+        m.s.c = Constraint(expr=m.s.v['a'] <= m.x[1])
+        m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+        m.dual[m.c[2]] = 3.5
+        m.x[3].fix(4)
+        m.c[4].deactivate()
+        return m
+
+    def test_roundtrip(self):
+        m = self._make_model()
+        n = self._roundtrip(m)
+        self.assertIsNot(m, n)
+        self.assertEqual(_pprint(m), _pprint(n))
+
+        self.assertIs(n.x[1].parent_component(), n.x)
+        self.assertIs(n.b[2].z.parent_block(), n.b[2])
+        self.assertIs(n.b[2].parent_block(), n)
+        self.assertIs(n.c[1].body.arg(0), n.x[1])
+        self.assertIs(n.c[1].body.arg(1).arg(1), n.y[1])
+        self.assertEqual(
+            sorted(v.name for v in identify_variables(n.b[3].c.body)),
+            ['b[3].z', 'x[3]'])
+        self.assertIn(id(n.x[3]),
+                      set(id(v) for v in identify_variables(n.b[3].c.body)))
+        self.assertEqual(n.x[2].value, 1.5)
+        self.assertEqual(n.x[2].bounds, (0, 10))
+        self.assertTrue(n.x[3].fixed)
+        self.assertEqual(n.y[1].bounds, (0, 1))
+        self.assertTrue(n.y[1].is_binary())
+        self.assertFalse(n.c[4].active)
+        self.assertEqual(n.dual[n.c[2]], 3.5)
+        self.assertEqual(value(n.e[2]), 4.5)
+        self.assertIs(n.o.sense, maximize)
+
+        # The restored model is fully functional
+        n.y[1].value = 0
+        n.p[1] = 10
+        self.assertEqual(value(n.c[1].body), 1.5)
+        n.y[1].value = 1
+        self.assertEqual(value(n.c[1].body), 11.5)
+        n.x[1].setlb(-1)
+        self.assertEqual(n.x[1].lb, -1)
+        self.assertEqual(m.x[1].lb, 0)
+        n.add_component('d', Constraint(expr=n.x[1] == n.x[2]))
+        self.assertEqual(len(list(n.component_data_objects(Constraint))),
+                         len(list(m.component_data_objects(Constraint))) + 1)
+
+    def test_sub_block(self):
+        m = self._make_model()
+        n = self._roundtrip(m.s)
+        self.assertIs(m.s.parent_block(), m)
+        self.assertIsNone(n.parent_block())
+        self.assertEqual(n.v['b'].value, 2)
+        self.assertIs(n.v['a'].parent_block(), n)
+        # Variables outside the block are stored with the snapshot (as
+        # with pickle)
+        vars_ = list(identify_variables(n.c.body))
+        self.assertEqual(len(vars_), 2)
+        self.assertIn(id(n.v['a']), set(id(v) for v in vars_))
+        self.assertNotIn(id(m.x[1]), set(id(v) for v in vars_))
+
+        n = self._roundtrip(m.b[2])
+        self.assertIs(m.b[2].parent_block(), m)
+        self.assertEqual(n.z.value, 2)
+        self.assertIs(n.z.parent_block(), n)
+        self.assertIsNot(n.parent_component(), m.b)
+
+    def test_abstract_model(self):
+        m = AbstractModel()
+        m.I = Set()
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=c_rule)
+        n = self._roundtrip(m)
+        self.assertFalse(n.is_constructed())
+        self.assertEqual(_pprint(m), _pprint(n))
+
+    def test_module_function(self):
+        m = self._make_model()
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.snapshot')
+        save_snapshot(m, fname)
+        self.assertEqual(_pprint(m), _pprint(load_snapshot(fname)))
+
+    def test_not_a_snapshot(self):
+        fname = pyutilib.services.TempfileManager.create_tempfile(
+            suffix='.snapshot')
+        with open(fname, 'w') as OUTPUT:
+            OUTPUT.write("not a snapshot")
+        self.assertRaisesRegexp(
+            ValueError, "is not a Pyomo model snapshot",
+            load_snapshot, fname)
+
+        with open(fname, 'w') as OUTPUT:
+            pass
+        self.assertRaisesRegexp(
+            ValueError, "is not a Pyomo model snapshot",
+            load_snapshot, fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for SolutionPool and ModelSolutions.load_from(solution_pool=True)
+#
+
+import pickle
+
+import pyutilib.th as unittest
+
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint
+from pyomo.core.base.solution_pool import SolutionPool, has_numpy
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.opt import SolverResults, SolverStatus, SolutionStatus
+
+
+def _make_model():
+    m = ConcreteModel()
+    m.x = Var([1, 2, 3])
+    m.y = Var()
+    m.o = Objective(expr=m.y)
+    m.c = Constraint(expr=m.x[1] + m.y >= 1)
+    return m
+
+
+class TestSolutionPool(unittest.TestCase):
+
+    def test_add_and_load(self):
+        m = _make_model()
+        pool = SolutionPool([m.x[1], m.x[2], m.y])
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.add([1, 2, 3], objective=10), 0)
+        self.assertEqual(pool.add([4, None, 6], objective=5), 1)
+        for i in range(5):
+            pool.add([i, i, i])
+        self.assertEqual(len(pool), 7)
+        self.assertEqual(pool.objectives[:2], [10, 5])
+        self.assertEqual(pool.value(1, m.y), 6)
+        self.assertIsNone(pool.value(1, m.x[2]))
+        self.assertEqual(list(pool.values(-1)), [4, 4, 4])
+        self.assertEqual(pool.best(), 1)
+        self.assertEqual(pool.best(minimize=False), 0)
+
+        m.x[2].value = 20
+        m.x[3].value = 30
+        m.y.fix(60)
+        pool.load(1)
+        self.assertEqual(m.x[1].value, 4)
+        self.assertFalse(m.x[1].stale)
+        self.assertEqual(m.x[2].value, 20)
+        self.assertTrue(m.x[2].stale)
+        self.assertEqual(m.x[3].value, 30)
+        self.assertEqual(m.y.value, 60)
+        pool.load(1, ignore_fixed_vars=False)
+        self.assertEqual(m.y.value, 6)
+
+        with self.assertRaisesRegexp(ValueError, "has 2 values"):
+            pool.add([1, 2])
+        with self.assertRaises(IndexError):
+            pool.values(7)
+
+    def test_pickle(self):
+        m = _make_model()
+        pool = SolutionPool([m.x[1], m.y])
+        pool.add([1, 2], objective=1)
+        pool.add([3, 4], objective=2)
+        self.assertEqual(pool.value(1, m.y), 4)
+        pool2 = pickle.loads(pickle.dumps(pool))
+        self.assertEqual(list(pool2.values(0)), [1, 2])
+        self.assertEqual(pool2.objectives, [1, 2])
+
+    @unittest.skipIf(not has_numpy, "numpy is not available")
+    def test_matrix(self):
+        m = _make_model()
+        pool = SolutionPool([m.x[1], m.y])
+        pool.add([1, 2])
+        pool.add([3, 4])
+        self.assertEqual(pool.matrix().tolist(), [[1, 2], [3, 4]])
+
+
+class TestLoadSolutionPool(unittest.TestCase):
+
+    def _results(self, m, with_smap):
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        for vals, obj in (((1, 2), 3), ((4, 5), 6), ((7, 8), 9)):
+            soln = results.solution.add()
+            soln.status = SolutionStatus.feasible
+            soln._cuid = False
+            if with_smap:
+                soln.variable['x1'] = {'Value': vals[0]}
+                soln.variable['y'] = {'Value': vals[1]}
+                soln.objective['o'] = {'Value': obj}
+            else:
+                soln.variable['x[1]'] = {'Value': vals[0]}
+                soln.variable['y'] = {'Value': vals[1]}
+                soln.objective['o'] = {'Value': obj}
+        if with_smap:
+            smap = SymbolMap()
+            smap.addSymbols([(m.x[1], 'x1'), (m.y, 'y'), (m.o, 'o')])
+            m.solutions.add_symbol_map(smap)
+            results._smap_id = id(smap)
+        return results
+
+    def test_load_with_symbol_map(self):
+        m = _make_model()
+        m.solutions.load_from(self._results(m, True), select=1,
+                              solution_pool=True)
+        self.assertEqual(len(m.solutions), 1)
+        self.assertEqual(m.x[1].value, 4)
+        self.assertEqual(m.y.value, 5)
+        pool = m.solutions.pool
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.objectives, [3, 6, 9])
+        pool.load(2)
+        self.assertEqual(m.x[1].value, 7)
+        self.assertEqual(m.y.value, 8)
+        self.assertEqual(m.solutions.symbol_map, {})
+
+    def test_load_by_name(self):
+        m = _make_model()
+        m.solutions.load_from(self._results(m, False), solution_pool=True)
+        self.assertEqual(m.x[1].value, 1)
+        pool = m.solutions.pool
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(pool.value(1, m.x[1]), 4)
+        self.assertIsNone(pool.value(1, m.x[2]))
+
+    def test_pool_from_results(self):
+        m = _make_model()
+        results = self._results(m, False)
+        pool = SolutionPool([m.x[1], m.y])
+        pool.add([10, 20])
+        results._solution_pool = pool
+        m.solutions.load_from(results)
+        self.assertIs(m.solutions.pool, pool)
+        self.assertEqual(len(m.solutions), 1)
+        m.solutions.clear()
+        self.assertIsNone(m.solutions.pool)
+
+    def test_no_pool(self):
+        m = _make_model()
+        m.solutions.load_from(self._results(m, False))
+        self.assertIsNone(m.solutions.pool)
+        self.assertEqual(len(m.solutions), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,7 +27,9 @@ from pyomo.core.base.suffix import \
      local_suffix_generator,
      active_suffix_generator,
      suffix_generator)
+from pyomo.core.base.suffix import has_numpy
 from pyomo.environ import *
+from pyomo.opt import SolverResults, SolverStatus, SolutionStatus
 
 from six import StringIO
 
@@ -1543,5 +1545,178 @@ class TestSuffixPickleUsage(unittest.TestCase):
         self.assertEqual(inst.junk.get(model),None)
         self.assertEqual(inst.junk.get(inst),1.0)
 
+class TestSuffixArrayStorage(unittest.TestCase):
+
+    def _model(self, storage='array'):
+        model = ConcreteModel()
+        model.x = Var([1,2,3], initialize=1)
+        model.c = ConstraintList()
+        for i in model.x:
+            model.c.add(model.x[i] >= i)
+        model.o = Objective(expr=sum_product(model.x))
+        model.dual = Suffix(direction=Suffix.IMPORT_EXPORT, storage=storage)
+        return model
+
+    def test_init(self):
+        model = ConcreteModel()
+        model.junk = Suffix()
+        self.assertEqual(model.junk.get_storage(), 'map')
+        model.del_component('junk')
+        model.junk = Suffix(storage='array')
+        self.assertEqual(model.junk.get_storage(), 'array')
+        model.del_component('junk')
+        with self.assertRaises(ValueError):
+            model.junk = Suffix(storage='list')
+        with self.assertRaises(ValueError):
+            model.junk = Suffix(storage='array', datatype=None)
+        model.junk = Suffix(storage='array')
+        with self.assertRaises(ValueError):
+            model.junk.set_datatype(None)
+
+    def test_getsetdelitem(self):
+        model = self._model()
+        c = model.c
+        model.dual[c[1]] = 1
+        model.dual[c[2]] = 2
+        model.dual[c[3]] = 3
+        self.assertEqual(len(model.dual), 3)
+        self.assertEqual(model.dual[c[2]], 2.0)
+        self.assertIs(type(model.dual[c[2]]), float)
+        self.assertEqual(model.dual.get(model.x[1], 5), 5)
+        with self.assertRaises(KeyError):
+            model.dual[model.x[1]]
+        del model.dual[c[2]]
+        self.assertEqual(len(model.dual), 2)
+        self.assertTrue(c[2] not in model.dual)
+        model.dual[c[2]] = 4
+        # Iteration is in the order of the array (insertion order)
+        self.assertEqual(list(model.dual), [c[1], c[3], c[2]])
+        self.assertEqual(list(model.dual.values()), [1, 3, 4])
+        self.assertEqual(list(model.dual.items()),
+                         [(c[1], 1), (c[3], 3), (c[2], 4)])
+        self.assertEqual(model.dual.pop(c[3]), 3)
+        self.assertEqual(list(model.dual.get_values_array()), [1, 4])
+        with self.assertRaisesRegexp(ValueError, "numeric values"):
+            model.dual[c[1]] = 'a'
+        # An invalid value does not add the component
+        with self.assertRaisesRegexp(ValueError, "numeric values"):
+            model.dual[c[3]] = 'a'
+        self.assertEqual(len(model.dual), 2)
+        self.assertTrue(c[3] not in model.dual)
+        self.assertIsNone(model.dual.get(c[3]))
+        model.dual.set_all_values(2)
+        self.assertEqual(list(model.dual.values()), [2, 2])
+        model.dual.clear_all_values()
+        self.assertEqual(len(model.dual), 0)
+        self.assertEqual(list(model.dual.items()), [])
+
+    def test_int_datatype(self):
+        model = self._model()
+        model.junk = Suffix(datatype=Suffix.INT, storage='array')
+        model.junk[model.x[1]] = 2
+        self.assertIs(type(model.junk[model.x[1]]), int)
+        # Non-integral values are rejected (not truncated)
+        with self.assertRaisesRegexp(ValueError, "integer values"):
+            model.junk[model.x[1]] = 3.7
+        with self.assertRaisesRegexp(ValueError, "integer values"):
+            model.junk.update_from_arrays([model.x[2], model.x[3]],
+                                          [1, 2.5])
+        self.assertEqual(len(model.junk), 1)
+        self.assertEqual(model.junk[model.x[1]], 2)
+        model.junk[model.x[3]] = 3.0
+        self.assertIs(type(model.junk[model.x[3]]), int)
+        model.junk.set_datatype(Suffix.FLOAT)
+        model.junk[model.x[2]] = 2.5
+        self.assertEqual(model.junk[model.x[2]], 2.5)
+        self.assertIs(type(model.junk[model.x[1]]), float)
+        with self.assertRaisesRegexp(ValueError, "integer values"):
+            model.junk.set_datatype(Suffix.INT)
+        self.assertEqual(model.junk[model.x[2]], 2.5)
+        del model.junk[model.x[2]]
+        model.junk.set_datatype(Suffix.INT)
+        self.assertIs(type(model.junk[model.x[1]]), int)
+
+    def test_update_from_arrays(self):
+        for storage in Suffix.SuffixStorages:
+            model = self._model(storage)
+            cons = list(model.c.values())
+            model.dual.update_from_arrays(cons, [1, 2, 3])
+            self.assertEqual([model.dual[c] for c in cons], [1, 2, 3])
+            model.dual.update_from_arrays(cons[:1], [4])
+            self.assertEqual([model.dual[c] for c in cons], [4, 2, 3])
+            with self.assertRaises(ValueError):
+                model.dual.update_from_arrays(cons, [1, 2])
+        self.assertEqual(
+            list(model.dual.get_values_array([cons[2], cons[0]])), [3, 4])
+        with self.assertRaises(KeyError):
+            model.dual.get_values_array([model.x[1]])
+        model = self._model('map')
+        with self.assertRaises(ValueError):
+            model.dual.get_values_array()
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_update_from_numpy_array(self):
+        import numpy
+        model = self._model()
+        cons = list(model.c.values())
+        model.dual.update_from_arrays(cons, numpy.array([1.5, 2.5, 3.5]))
+        self.assertEqual(model.dual.get_values_array().tolist(),
+                         [1.5, 2.5, 3.5])
+        self.assertIs(type(model.dual[cons[0]]), float)
+
+    def test_clone_pickle(self):
+        model = self._model()
+        model.dual.update_from_arrays(list(model.c.values()), [1, 2, 3])
+        del model.dual[model.c[1]]
+        for inst in (model.clone(), pickle.loads(pickle.dumps(model))):
+            self.assertEqual(inst.dual.get_storage(), 'array')
+            self.assertEqual(len(inst.dual), 2)
+            self.assertEqual(inst.dual[inst.c[2]], 2)
+            self.assertEqual(inst.dual[inst.c[3]], 3)
+            self.assertTrue(inst.c[1] not in inst.dual)
+            self.assertTrue(model.c[2] not in inst.dual)
+            inst.dual[inst.c[1]] = 5
+            self.assertEqual(len(inst.dual), 3)
+        self.assertEqual(len(model.dual), 2)
+
+    def test_load_solution(self):
+        model = self._model()
+        model.rc = Suffix(direction=Suffix.IMPORT, storage='array')
+        model.dual[model.c[3]] = 10
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        soln = results.solution.add()
+        soln.status = SolutionStatus.optimal
+        soln._cuid = False
+        soln.variable['x[1]'] = {'Value': 2, 'Rc': 0.5}
+        soln.variable['x[2]'] = {'Value': 3}
+        soln.constraint['c[1]'] = {'Dual': 1}
+        soln.constraint['c[2]'] = {'Dual': 2}
+        model.solutions.load_from(results)
+        self.assertEqual(model.x[1].value, 2)
+        self.assertEqual(list(model.rc.items()), [(model.x[1], 0.5)])
+        # The suffix values are replaced by the solution values
+        self.assertEqual(list(model.dual.items()),
+                         [(model.c[1], 1), (model.c[2], 2)])
+
+    def test_write_nl(self):
+        output = {}
+        for storage in Suffix.SuffixStorages:
+            model = self._model(storage)
+            model.junk = Suffix(direction=Suffix.EXPORT, storage=storage)
+            model.dual.update_from_arrays(list(model.c.values()),
+                                          [1.0, 2.0, 3.0])
+            model.junk[model.x[2]] = 5.0
+            model.junk[model.c[1]] = 6.0
+            fname = currdir+'suffix_storage_%s.nl' % (storage,)
+            model.write(fname, format='nl')
+            with open(fname) as INPUT:
+                output[storage] = INPUT.read()
+            os.remove(fname)
+        self.assertIn("\nd3\n", output['array'])
+        self.assertIn("S4 1 junk\n1 5.0\n", output['array'])
+        self.assertEqual(output['array'], output['map'])
+
+
 if __name__ == "__main__":
     unittest.main()
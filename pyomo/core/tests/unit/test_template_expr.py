@@ -11,7 +11,8 @@
 
 import pyutilib.th as unittest
 
-from pyomo.environ import ConcreteModel, RangeSet, Param, Var, Set, value
+from pyomo.environ import (ConcreteModel, RangeSet, Param, Var, Set,
+                           Constraint, value, exp, inequality)
 import pyomo.core.expr.current as EXPR
 from pyomo.core.base.template_expr import (
     IndexTemplate, 
@@ -19,9 +20,12 @@ from pyomo.core.base.template_expr import (
     substitute_template_expression, 
     substitute_getitem_with_param,
     substitute_template_with_value,
+    templatize_rule,
+    compile_template,
 )
 
 import six
+from pyomo.common.log import LoggingIntercept
 
 class ExpressionObjectTester(object):
     def setUp(self):
@@ -359,5 +363,149 @@ class TestTemplateSubstitution(unittest.TestCase):
             str(E),
             'dxdt[5,2]  ==  5.0*x[5,2]**2 + y**2' )
 
+
+class TestTemplateCompilation(unittest.TestCase):
+
+    def setUp(self):
+        self.m = m = ConcreteModel()
+        m.I = RangeSet(1,4)
+        m.T = Set(initialize=range(4), ordered=True)
+        m.x = Var(m.I, m.T)
+        m.u = Var(m.I, m.T)
+        m.k = Param(m.I, initialize=lambda m,i: i+1)
+        m.q = Param(m.I, initialize=2, mutable=True)
+        m.dt = Param(initialize=0.5)
+
+    def _structure(self, e):
+        if e is None or e.__class__ in (int, float, bool):
+            return e
+        if not e.is_expression_type():
+            return id(e)
+        return (e.__class__, tuple(self._structure(x) for x in e.args))
+
+    def _check(self, rule, *sets):
+        # The template constraints are identical to the constraints
+        # generated by calling the rule
+        m = self.m
+        m.a = Constraint(*sets, rule=rule)
+        m.b = Constraint(*sets, rule=rule, template=True)
+        self.assertEqual(list(m.a), list(m.b))
+        for i in m.a:
+            for attr in ('body', 'lower', 'upper'):
+                self.assertEqual(
+                    self._structure(getattr(m.a[i], attr)),
+                    self._structure(getattr(m.b[i], attr)))
+        return templatize_rule(m, rule, m.b.index_set()) is not None
+
+    def test_templatize_rule(self):
+        m = self.m
+        rule = lambda m, i, t: m.x[i,t] >= m.k[i]*t
+        template, templates = templatize_rule(m, rule, m.x.index_set())
+        self.assertEqual(len(templates), 2)
+        self.assertIs(templates[0]._set, m.I)
+        self.assertIs(templates[1]._set, m.T)
+        self.assertEqual(str(template), 'k{I}*{T}  <=  x{I}')
+
+        f = compile_template(template, templates)
+        e = f(2, 3)
+        self.assertEqual(str(e), str(rule(m, 2, 3)))
+        self.assertIs(e.arg(1), m.x[2,3])
+
+        # Rules that evaluate the indices cannot be templatized
+        self.assertIsNone(templatize_rule(
+            m, lambda m, i: m.x[i,0] >= 0 if i <= 2 else Constraint.Skip,
+            m.I))
+        self.assertIsNone(templatize_rule(
+            m, lambda m, i: m.x[i,0] >= 0 if m.k[i] > 2 else m.x[i,1] >= 0,
+            m.I))
+        self.assertIsNone(templatize_rule(
+            m, lambda m, i: m.x[i, list(m.T)[i-1]] >= 0, m.I))
+
+    def test_template_constraints(self):
+        self.assertTrue(self._check(
+            lambda m, i, t: m.x[i,t] == m.x[i,t-1]
+                + m.dt*(m.k[i]*m.u[i,t] - m.x[i,t]**2),
+            self.m.I, Set(initialize=range(1,4))))
+
+    def test_template_monomials(self):
+        self.assertTrue(self._check(
+            lambda m, i: -m.x[i,0] + m.q[i]*m.u[i,0] - m.x[i,1]/m.k[i]
+                - m.k[i]*m.u[i,1] <= m.q[i]*2,
+            self.m.I))
+
+    def test_template_sum(self):
+        self.assertTrue(self._check(
+            lambda m, i: sum(m.k[i]*m.x[i,t] for t in m.T) >= m.k[i],
+            self.m.I))
+
+    def test_template_tuple(self):
+        self.assertTrue(self._check(
+            lambda m, i, t: (-m.k[i], m.x[i,t]*m.u[i,t], None),
+            self.m.I, self.m.T))
+
+    def test_template_nonlinear(self):
+        self.assertTrue(self._check(
+            lambda m, i: inequality(0, exp(m.x[i,1]) + abs(m.u[i,0]), m.q[i]),
+            self.m.I))
+
+    def test_template_fallback(self):
+        self.assertFalse(self._check(
+            lambda m, i, t: Constraint.Skip if t == 0 else m.x[i,t] >= 0,
+            self.m.I, self.m.T))
+        self.assertEqual(len(self.m.b), 12)
+
+    def test_template_inspects_index(self):
+        m = self.m
+        # Converting the index to a string raises during the capture
+        rule = lambda m, i: m.x[i,0] >= 0 if str(i) == '2' else m.u[i,0] >= 0
+        self.assertIsNone(templatize_rule(m, rule, m.I))
+        self.assertFalse(self._check(rule, m.I))
+        self.assertEqual(str(m.b[2].body), 'x[2,0]')
+        self.assertEqual(str(m.b[3].body), 'u[3,0]')
+
+    def test_template_check(self):
+        m = self.m
+        # isinstance() silently takes the wrong branch during the
+        # capture: the template is discarded after comparing it with
+        # the rule for the first index
+        rule = lambda m, i: \
+            m.x[i,0] >= 0 if isinstance(i, int) else m.u[i,0] >= 0
+        self.assertIsNotNone(templatize_rule(m, rule, m.I))
+        self._check(rule, m.I)
+        self.assertIsNone(m.b._rule_template)
+        self.assertEqual(str(m.b[3].body), 'x[3,0]')
+
+        m.c = Constraint(m.I, rule=rule, template=True, lazy=True)
+        self.assertEqual(str(m.c[2].body), 'x[2,0]')
+        self.assertIsNone(m.c._rule_template)
+        self.assertEqual(str(m.c[4].body), 'x[4,0]')
+
+        m.d = Constraint(m.I, rule=lambda m, i: m.x[i,0] >= m.k[i],
+                         template=True, lazy=True)
+        self.assertEqual(str(m.d[2].body), 'x[2,0]')
+        self.assertIsNotNone(m.d._rule_template)
+
+    def test_template_errors(self):
+        m = self.m
+        # Errors raised while instantiating the template propagate
+        m.T2 = Set(initialize=range(1,5))
+        output = six.StringIO()
+        with LoggingIntercept(output, 'pyomo.core'):
+            with self.assertRaises(KeyError):
+                m.c = Constraint(m.I, m.T2, template=True,
+                                 rule=lambda m, i, t: m.x[i,t] >= 0)
+        self.assertIn("Rule failed when generating expression for "
+                      "constraint c with index (1, 4)", output.getvalue())
+
+    def test_template_lazy(self):
+        m = self.m
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i,0] >= m.k[i],
+                         template=True, lazy=True)
+        self.assertEqual(str(m.c[2].expr), '3.0  <=  x[2,0]')
+        n = m.clone()
+        self.assertEqual(str(n.c[3].expr), '4.0  <=  x[3,0]')
+        self.assertEqual(len(n.c), 4)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -15,14 +15,22 @@
 #
 
 import os
+import pickle
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
 import pyutilib.th as unittest
 
 from pyomo.core.base import IntegerSet
+from pyomo.core.base.var import _ArrayVarData
 from pyomo.environ import *
 
+try:
+    import numpy
+    has_numpy = True
+except:     #pragma:nocover
+    has_numpy = False
+
 class PyomoModel(unittest.TestCase):
 
     def setUp(self):
@@ -1337,5 +1345,208 @@ class MiscVarTests(unittest.TestCase):
         model.x = Var(model.C)
 
 
+class TestArrayStorageVar(unittest.TestCase):
+
+    def _model(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=5)
+        m.x = Var([1, 2, 3, 4], storage='array', bounds=(0, m.p),
+                  initialize={1: 1, 3: 3})
+        return m
+
+    def test_data(self):
+        m = self._model()
+        self.assertIs(type(m.x[1]), _ArrayVarData)
+        self.assertEqual(m.x[1].value, 1)
+        self.assertIsNone(m.x[2].value)
+        self.assertEqual(m.x[1].lb, 0)
+        self.assertEqual(m.x[1].ub, 5)
+        m.p = 7
+        self.assertEqual(m.x[1].ub, 7)
+        m.x[2].setub(2)
+        self.assertEqual(m.x[2].ub, 2)
+        m.x[2].setlb(None)
+        self.assertIsNone(m.x[2].lb)
+        self.assertFalse(m.x[1].stale)
+        self.assertTrue(m.x[2].stale)
+        m.x[2].fix(4)
+        self.assertTrue(m.x[2].fixed)
+        self.assertEqual(m.x[2].value, 4)
+        self.assertRaises(ValueError, m.x[2].setlb, m.x[1])
+        m.x[4].domain = Binary
+        self.assertRaises(ValueError, m.x[4].set_value, 2)
+        self.assertEqual(m.x[4].ub, 1)
+
+    def test_value_type(self):
+        # Unlike the object storage, the array storage does not keep
+        # the type of the values: they are stored as floats
+        m = self._model()
+        m.x[2] = 3
+        self.assertEqual(m.x[2].value, 3)
+        self.assertIs(type(m.x[2].value), float)
+        self.assertIs(type(m.x[1].value), float)
+        m.y = Var([1], initialize=3)
+        self.assertIs(type(m.y[1].value), int)
+
+    def test_storage_errors(self):
+        self.assertRaises(ValueError, Var, storage='array')
+        self.assertRaises(ValueError, Var, [1, 2], storage='columns')
+
+    def test_sparse(self):
+        m = ConcreteModel()
+        m.x = Var(Any, dense=False, storage='array')
+        m.x['a'] = 1
+        m.x[2] = 2
+        self.assertEqual(list(m.x.get_values(as_array=True)), [1, 2])
+        m.x.set_values([3, None])
+        self.assertEqual(m.x['a'].value, 3)
+        self.assertIsNone(m.x[2].value)
+
+    def test_get_values_as_array(self):
+        m = self._model()
+        m.x[4].fix(4)
+        ans = m.x.get_values(as_array=True)
+        self.assertEqual(len(ans), 4)
+        self.assertEqual(list(ans)[0::2], [1, 3])
+        self.assertNotEqual(ans[1], ans[1])
+        self.assertEqual(ans[3], 4)
+        ans = m.x.get_values(include_fixed_values=False, as_array=True)
+        self.assertNotEqual(ans[3], ans[3])
+        # Object storage returns the same array
+        m.y = Var([1, 2, 3, 4], initialize={1: 1, 3: 3})
+        self.assertEqual(list(m.y.get_values(as_array=True))[0::2], [1, 3])
+
+    def test_set_values(self):
+        m = self._model()
+        m.x.flag_as_stale()
+        self.assertTrue(m.x[1].stale)
+        m.x.set_values([4, 3, None, 1])
+        self.assertEqual(m.x.get_values(), {1: 4, 2: 3, 3: None, 4: 1})
+        self.assertFalse(m.x[1].stale)
+        self.assertRaises(ValueError, m.x.set_values, [1, 2])
+        m.x[1].domain = Integers
+        self.assertRaises(ValueError, m.x.set_values, [0.5, 1, 2, 3])
+        m.x.set_values([0.5, 1, 2, 3], valid=True)
+        self.assertEqual(m.x[1].value, 0.5)
+        # Dictionaries are still supported
+        m.x.set_values({2: 5})
+        self.assertEqual(m.x[2].value, 5)
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_set_values_numpy(self):
+        m = self._model()
+        m.x.set_values(numpy.array([1., 2., numpy.nan, 4.]))
+        self.assertEqual(m.x.get_values(), {1: 1, 2: 2, 3: None, 4: 4})
+        m.y = Var([1, 2], initialize=0)
+        m.y.set_values(numpy.array([numpy.nan, 2.]))
+        self.assertEqual(m.y.get_values(), {1: None, 2: 2})
+
+    def test_fix_unfix(self):
+        m = self._model()
+        m.x.fix()
+        self.assertTrue(all(v.fixed for v in m.x.values()))
+        self.assertEqual(m.x[1].value, 1)
+        m.x.unfix()
+        self.assertFalse(any(v.fixed for v in m.x.values()))
+        m.x.fix(2)
+        self.assertEqual(m.x.get_values(), {1: 2, 2: 2, 3: 2, 4: 2})
+
+    def test_clone_and_pickle(self):
+        m = self._model()
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+        for n in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertIsNot(n.x._arrays, m.x._arrays)
+            self.assertIs(n.x[1]._arrays, n.x._arrays)
+            n.x[1].value = 10
+            self.assertEqual(m.x[1].value, 1)
+            self.assertEqual(n.x[3].value, 3)
+            self.assertEqual(n.x[1].ub, 5)
+
+
+class TestBulkVarObjectStorage(unittest.TestCase):
+
+    storage = 'object'
+
+    def _model(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=5)
+        m.x = Var([1, 2, 3, 4], storage=self.storage, bounds=(0, m.p),
+                  initialize=1)
+        return m
+
+    def test_set_values_mask(self):
+        m = self._model()
+        m.x.set_values([5, 6, None, 8], mask=[True, False, True, False])
+        self.assertEqual(m.x.get_values(), {1: 5, 2: 1, 3: None, 4: 1})
+        self.assertRaises(ValueError, m.x.set_values, [1, 2, 3, 4],
+                          mask=[True, False])
+        self.assertRaises(ValueError, m.x.set_values, {1: 2},
+                          mask=[True, False, True, False])
+
+    def test_fix_values_mask(self):
+        m = self._model()
+        m.x.fix([5, 6, 7, 8], mask=[True, False, True, False])
+        self.assertEqual(m.x.get_values(), {1: 5, 2: 1, 3: 7, 4: 1})
+        self.assertEqual([m.x[i].fixed for i in m.x],
+                         [True, False, True, False])
+        m.x.unfix(mask=[True, True, False, False])
+        self.assertEqual([m.x[i].fixed for i in m.x],
+                         [False, False, True, False])
+        m.x.fix(2, mask=[False, True, False, False])
+        self.assertEqual(m.x.get_values(), {1: 5, 2: 2, 3: 7, 4: 1})
+        self.assertEqual([m.x[i].fixed for i in m.x],
+                         [False, True, True, False])
+        m.x.unfix()
+        m.x.fix({4: 3})
+        self.assertEqual(m.x[4].value, 3)
+        self.assertEqual([m.x[i].fixed for i in m.x],
+                         [False, False, False, True])
+        # Like _VarData.fix(), sequences and dictionaries of values are
+        # not validated
+        m.x.domain = Integers
+        m.x.fix([0.5, 1, 2, 3])
+        m.x.fix({2: 1.5})
+        self.assertEqual(m.x.get_values(), {1: 0.5, 2: 1.5, 3: 2, 4: 3})
+        self.assertRaises(ValueError, m.x.fix, [1, 2])
+        self.assertRaises(ValueError, m.x.fix, 1, bogus=True)
+
+    def test_set_bounds(self):
+        m = self._model()
+        m.x.set_bounds([-1, None, float('nan'), -4], 10)
+        self.assertEqual([(m.x[i].lb, m.x[i].ub) for i in m.x],
+                         [(-1, 10), (None, 10), (None, 10), (-4, 10)])
+        m.x.set_bounds(0, m.p, mask=[True, True, False, False])
+        self.assertEqual([(m.x[i].lb, m.x[i].ub) for i in m.x],
+                         [(0, 5), (0, 5), (None, 10), (-4, 10)])
+        m.p = 7
+        self.assertEqual(m.x[1].ub, 7)
+        m.x.set_bounds(None, None)
+        self.assertEqual([(m.x[i].lb, m.x[i].ub) for i in m.x],
+                         [(None, None)]*4)
+        self.assertRaises(ValueError, m.x.set_bounds, [1, 2], None)
+        m.y = Var()
+        self.assertRaises(ValueError, m.x.set_bounds, m.y, None)
+
+    @unittest.skipIf(not has_numpy, "Numpy is not available")
+    def test_numpy(self):
+        m = self._model()
+        mask = numpy.array([True, False, True, False])
+        m.x.fix(numpy.array([5., 6., 7., 8.]), mask=mask)
+        self.assertEqual(m.x.get_values(), {1: 5, 2: 1, 3: 7, 4: 1})
+        self.assertEqual([m.x[i].fixed for i in m.x],
+                         [True, False, True, False])
+        m.x.unfix(mask=mask)
+        self.assertFalse(any(m.x[i].fixed for i in m.x))
+        m.x.set_bounds(numpy.array([-1., numpy.nan, -3., -4.]),
+                       numpy.array([1., 2., 3., 4.]), mask=~mask)
+        self.assertEqual([(m.x[i].lb, m.x[i].ub) for i in m.x],
+                         [(0, 5), (None, 2), (0, 5), (-4, 4)])
+
+
+class TestBulkVarArrayStorage(TestBulkVarObjectStorage):
+
+    storage = 'array'
+
+
 if __name__ == "__main__":
     unittest.main()
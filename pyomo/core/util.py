@@ -17,7 +17,7 @@ __all__ = ['sum_product', 'summation', 'dot_product', 'sequence', 'prod', 'quick
 from six.moves import xrange
 from functools import reduce
 import operator
-from pyomo.core.expr.numvalue import native_numeric_types
+from pyomo.core.expr.numvalue import native_numeric_types, NumericValue
 from pyomo.core.expr.expr_pyomo5 import decompose_term
 from pyomo.core.expr import current as EXPR
 import pyomo.core.base.var
@@ -113,8 +113,7 @@ def quicksum(args, start=0, linear=None):
         if linear:
             with EXPR.linear_expression() as e:
                 e += start
-                for arg in args:
-                    e += arg
+                e = _add_linear_terms(e, args)
             # Return the constant term if the linear expression does not contains variables
             if e.is_constant():
                 return e.constant
@@ -138,6 +137,39 @@ def quicksum(args, start=0, linear=None):
     return e
 
 
+def _add_linear_terms(e, args):
+    """
+    Add the terms in :attr:`args` to the mutable linear expression
+    :attr:`e`.
+
+    Variables, monomials and numeric constants are appended to the
+    expression directly.  Other terms are added with the += operator,
+    and if the expression cannot represent a term then the remaining
+    terms are also added with +=.
+    """
+    args = iter(args)
+    coefs = e.linear_coefs
+    vars_ = e.linear_vars
+    for arg in args:
+        if arg.__class__ is EXPR.MonomialTermExpression:
+            coefs.append(arg._args_[0])
+            vars_.append(arg._args_[1])
+        elif arg.__class__ in native_numeric_types:
+            e.constant += arg
+        elif isinstance(arg, NumericValue) and arg.is_variable_type():
+            coefs.append(1)
+            vars_.append(arg)
+        else:
+            e += arg
+            if e.__class__ is not EXPR._MutableLinearExpression:
+                for arg in args:
+                    e += arg
+                return e
+            coefs = e.linear_coefs
+            vars_ = e.linear_vars
+    return e
+
+
 def sum_product(*args, **kwds):
     """
     A utility function to compute a generalized dot product.  
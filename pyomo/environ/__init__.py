@@ -9,6 +9,7 @@
 #  ___________________________________________________________________________
 
 import sys as _sys
+from six import iteritems as _iteritems
 if _sys.version_info[0] >= 3:
     import importlib
 
@@ -54,41 +55,146 @@ _optional_packages = set([
 ])
 
 
-def _import_packages():
+#
+# The plugins in these packages are only registered with the plugin
+# factories (or are only used by the pyomo command).  They are not
+# imported with pyomo.environ: each package is imported the first time
+# that one of its plugins is requested from a factory.  The plugins
+# registered by each package are recorded in
+# pyomo.environ.plugin_manifest (generated by running "python -m
+# pyomo.environ.manifest").
+#
+_deferred_packages = set([
+    'pyomo.dataportal',
+    'pyomo.duality',
+    'pyomo.repn',
+    'pyomo.pysp',
+    'pyomo.neos',
+    'pyomo.gdp',
+    'pyomo.mpec',
+    'pyomo.dae',
+    'pyomo.bilevel',
+    'pyomo.network',
+]) | _optional_packages
+
+_loaded_packages = set()
+# The {plugin name: package} maps of the deferred plugin registries
+_deferred_plugins = []
+
+
+def _import_package(name):
+    if name in _loaded_packages:
+        return
+    _loaded_packages.add(name)
+    pname = name+'.plugins'
+    try:
+        _do_import(pname)
+    except ImportError:
+        if name in _optional_packages:
+            return
+        exctype, err, tb = _sys.exc_info()  # BUG?
+        import traceback
+        msg = "pyomo.environ failed to import %s:\nOriginal %s: %s\n"\
+              "Traceback:\n%s" \
+              % (pname, exctype.__name__, err,
+                 ''.join(traceback.format_tb(tb)),)
+        # clear local variables to remove circular references
+        exctype = err = tb = None
+        # TODO: Should this just log an error and re-raise the
+        # original exception?
+        raise ImportError(msg)
+    finally:
+        # The package plugins are either registered or unavailable
+        for deferred in _deferred_plugins:
+            for plugin in [key for key, val in _iteritems(deferred)
+                           if val == name]:
+                del deferred[plugin]
+
+    pkg = _sys.modules[pname]
+    pkg.load()
+
+
+def _import_packages(deferred=False):
+    """Import the plugin packages
+
+    The deferred packages are only imported if deferred is True (e.g.,
+    by the pyomo command, which uses the plugins that are registered
+    as pyutilib plugins and not with the plugin factories).
+    """
     #
     # Import required packages
     #
     for name in _packages:
-        pname = name+'.plugins'
-        try:
-            _do_import(pname)
-        except ImportError:
-            exctype, err, tb = _sys.exc_info()  # BUG?
-            import traceback
-            msg = "pyomo.environ failed to import %s:\nOriginal %s: %s\n"\
-                  "Traceback:\n%s" \
-                  % (pname, exctype.__name__, err,
-                     ''.join(traceback.format_tb(tb)),)
-            # clear local variables to remove circular references
-            exctype = err = tb = None
-            # TODO: Should this just log an error and re-raise the
-            # original exception?
-            raise ImportError(msg)
-
-        pkg = _sys.modules[pname]
-        pkg.load()
+        if deferred or name not in _deferred_packages:
+            _import_package(name)
     #
     # Import optional packages
     #
     for name in _optional_packages:
-        pname = name+'.plugins'
-        try:
-            _do_import(pname)
-        except ImportError:
-            continue
-        pkg = _sys.modules[pname]
-        pkg.load()
+        if deferred or name not in _deferred_packages:
+            _import_package(name)
+
+
+class _DeferredPluginRegistry(dict):
+    """A plugin factory registry (Factory._cls or Factory._doc) that
+    also contains the plugins of the deferred packages that have not
+    been imported.  Requesting one of these plugins imports its
+    package."""
+
+    def __init__(self, registry, deferred):
+        super(_DeferredPluginRegistry, self).__init__(registry)
+        self.deferred = deferred
+
+    def __missing__(self, name):
+        package = self.deferred.get(name, None)
+        if package is None:
+            raise KeyError(name)
+        _import_package(package)
+        return dict.__getitem__(self, name)
+
+    def __contains__(self, name):
+        return dict.__contains__(self, name) or name in self.deferred
+
+    def __iter__(self):
+        # Note: iterate over a copy, as the caller may request (and
+        # import) plugins while iterating
+        names = list(dict.__iter__(self))
+        names.extend(name for name in self.deferred
+                     if not dict.__contains__(self, name))
+        return iter(names)
+
+    def __delitem__(self, name):
+        if not dict.__contains__(self, name):
+            self[name]
+        dict.__delitem__(self, name)
+
+
+def _plugin_factories():
+    from pyomo.opt import SolverFactory, SolverManagerFactory, WriterFactory
+    from pyomo.core import TransformationFactory
+    from pyomo.dataportal import DataManagerFactory
+    return {
+        'SolverFactory': SolverFactory,
+        'SolverManagerFactory': SolverManagerFactory,
+        'TransformationFactory': TransformationFactory,
+        'WriterFactory': WriterFactory,
+        'DataManagerFactory': DataManagerFactory,
+    }
+
+
+def _defer_plugins():
+    from pyomo.environ.plugin_manifest import plugins
+    factories = _plugin_factories()
+    for factory_name, names in _iteritems(plugins):
+        factory = factories[factory_name]
+        deferred = dict((name, package)
+                        for name, package in _iteritems(names)
+                        if package not in _loaded_packages)
+        _deferred_plugins.append(deferred)
+        factory._cls = _DeferredPluginRegistry(factory._cls, deferred)
+        factory._doc = _DeferredPluginRegistry(factory._doc, deferred)
 
+_defer_plugins()
 _import_packages()
 
 #
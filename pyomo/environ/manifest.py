@@ -0,0 +1,97 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Generate the manifest of the plugins registered by the deferred
+plugin packages (pyomo/environ/plugin_manifest.py).
+
+The manifest must be regenerated when a plugin is added to (or removed
+from) one of the packages in pyomo.environ._deferred_packages:
+
+    python -m pyomo.environ.manifest
+"""
+
+import os
+import sys
+
+from six import iteritems
+
+import pyomo.environ as environ
+
+_header = '''\
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# This file was generated by "python -m pyomo.environ.manifest".
+# DO NOT EDIT.
+#
+# The plugins registered by the deferred plugin packages (see
+# pyomo.environ), by factory.
+#
+'''
+
+
+def build_manifest():
+    """Return the {factory: {plugin: package}} manifest of the plugins
+    registered by the deferred packages
+
+    The deferred packages are imported (in the order that
+    pyomo.environ imports them) and the new plugins in each factory are
+    recorded.  This must be called before any deferred package has
+    been imported.
+    """
+    loaded = environ._loaded_packages & environ._deferred_packages
+    if loaded:
+        raise RuntimeError(
+            "Cannot build the plugin manifest: the deferred packages %s "
+            "have already been imported" % (sorted(loaded),))
+    factories = environ._plugin_factories()
+
+    def _registered():
+        return dict((key, set(dict.keys(factory._cls)))
+                    for key, factory in iteritems(factories))
+
+    manifest = dict((key, {}) for key in factories)
+    packages = list(environ._packages)
+    packages.extend(sorted(environ._optional_packages))
+    for name in packages:
+        if name not in environ._deferred_packages:
+            continue
+        before = _registered()
+        environ._import_package(name)
+        for key, names in iteritems(_registered()):
+            for plugin in names - before[key]:
+                manifest[key][plugin] = name
+    return manifest
+
+
+def write_manifest(ostream, manifest):
+    ostream.write(_header)
+    ostream.write("plugins = {\n")
+    for key in sorted(manifest):
+        ostream.write("    %r: {\n" % (key,))
+        for plugin, package in sorted(iteritems(manifest[key])):
+            ostream.write("        %r: %r,\n" % (plugin, package))
+        ostream.write("    },\n")
+    ostream.write("}\n")
+
+
+if __name__ == '__main__':
+    fname = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'plugin_manifest.py')
+    manifest = build_manifest()
+    with open(fname, 'w') as OUTPUT:
+        write_manifest(OUTPUT, manifest)
+    sys.stdout.write("Wrote %s\n" % (fname,))
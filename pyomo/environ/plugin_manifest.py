@@ -0,0 +1,87 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# This file was generated by "python -m pyomo.environ.manifest".
+# DO NOT EDIT.
+#
+# The plugins registered by the deferred plugin packages (see
+# pyomo.environ), by factory.
+#
+plugins = {
+    'DataManagerFactory': {
+        'csv': 'pyomo.dataportal',
+        'dat': 'pyomo.dataportal',
+        'json': 'pyomo.dataportal',
+        'pymysql': 'pyomo.dataportal',
+        'pyodbc': 'pyomo.dataportal',
+        'pypyodbc': 'pyomo.dataportal',
+        'sqlite3': 'pyomo.dataportal',
+        'tab': 'pyomo.dataportal',
+        'xml': 'pyomo.dataportal',
+        'yaml': 'pyomo.dataportal',
+    },
+    'SolverFactory': {
+        '_neos': 'pyomo.neos',
+        'bilevel_blp_global': 'pyomo.bilevel',
+        'bilevel_blp_local': 'pyomo.bilevel',
+        'bilevel_bqp': 'pyomo.bilevel',
+        'bilevel_ld': 'pyomo.bilevel',
+        'contrib.gjh': 'pyomo.contrib.trustregion',
+        'gdpopt': 'pyomo.contrib.gdpopt',
+        'mpec_minlp': 'pyomo.mpec',
+        'mpec_nlp': 'pyomo.mpec',
+        'multistart': 'pyomo.contrib.multistart',
+        'path': 'pyomo.mpec',
+        'trustregion': 'pyomo.contrib.trustregion',
+    },
+    'SolverManagerFactory': {
+        'neos': 'pyomo.neos',
+    },
+    'TransformationFactory': {
+        'bilevel.linear_dual': 'pyomo.bilevel',
+        'bilevel.linear_mpec': 'pyomo.bilevel',
+        'contrib.aggregate_vars': 'pyomo.contrib.preprocessing',
+        'contrib.compute_disj_var_bounds': 'pyomo.contrib.gdp_bounds',
+        'contrib.constraints_to_var_bounds': 'pyomo.contrib.preprocessing',
+        'contrib.deactivate_trivial_constraints': 'pyomo.contrib.preprocessing',
+        'contrib.detect_fixed_vars': 'pyomo.contrib.preprocessing',
+        'contrib.example.xfrm': 'pyomo.contrib.example',
+        'contrib.induced_linearity': 'pyomo.contrib.preprocessing',
+        'contrib.init_vars_midpoint': 'pyomo.contrib.preprocessing',
+        'contrib.init_vars_zero': 'pyomo.contrib.preprocessing',
+        'contrib.propagate_eq_var_bounds': 'pyomo.contrib.preprocessing',
+        'contrib.propagate_fixed_vars': 'pyomo.contrib.preprocessing',
+        'contrib.propagate_zero_sum': 'pyomo.contrib.preprocessing',
+        'contrib.remove_zero_terms': 'pyomo.contrib.preprocessing',
+        'contrib.strip_var_bounds': 'pyomo.contrib.preprocessing',
+        'core.tighten_constraints_from_vars': 'pyomo.contrib.preprocessing',
+        'dae.collocation': 'pyomo.dae',
+        'dae.finite_difference': 'pyomo.dae',
+        'duality.linear_dual': 'pyomo.duality',
+        'gdp.bigm': 'pyomo.gdp',
+        'gdp.bilinear': 'pyomo.gdp',
+        'gdp.chull': 'pyomo.gdp',
+        'gdp.cuttingplane': 'pyomo.gdp',
+        'gdp.fix_disjuncts': 'pyomo.gdp',
+        'gdp.reclassify': 'pyomo.gdp',
+        'gdp.varmover': 'pyomo.gdp',
+        'mpec.nl': 'pyomo.mpec',
+        'mpec.simple_disjunction': 'pyomo.mpec',
+        'mpec.simple_nonlinear': 'pyomo.mpec',
+        'mpec.standard_form': 'pyomo.mpec',
+        'network.expand_arcs': 'pyomo.network',
+    },
+    'WriterFactory': {
+        'cpxlp': 'pyomo.repn',
+        'gams': 'pyomo.repn',
+        'lp': 'pyomo.repn',
+        'mps': 'pyomo.repn',
+    },
+}
@@ -26,6 +26,45 @@ class TestPyomoEnviron(unittest.TestCase):
             self.fail("Importing pyomo.core automatically imports "
                       "pyomo.environ and it should not.")
 
+    def test_deferred_packages_not_imported(self):
+        rc, output = run_command([
+                sys.executable, '-c',
+                'import pyomo.environ, sys; '
+                'sys.exit( sum(1 for pkg in ("pysp", "neos", "gdp", "mpec", '
+                '"dae", "bilevel", "network") '
+                'if "pyomo.%s.plugins" % pkg in sys.modules) )'])
+        if rc:
+            self.fail("Importing pyomo.environ automatically imports "
+                      "the deferred plugin packages and it should not.")
+
+    def test_deferred_plugins(self):
+        rc, output = run_command([
+                sys.executable, '-c',
+                'import sys; '
+                'from pyomo.environ import TransformationFactory as T; '
+                'assert "dae.collocation" in T; '
+                'assert "dae.collocation" in list(T); '
+                'assert "pyomo.dae.plugins" not in sys.modules; '
+                'assert T("dae.collocation") is not None; '
+                'assert "pyomo.dae.plugins" in sys.modules; '
+                'assert T("dae.unknown") is None; '
+                'assert "dae.unknown" not in T'])
+        self.assertEqual(rc, 0, msg=output)
+
+    def test_plugin_manifest(self):
+        # The plugin manifest must be regenerated (by running "python
+        # -m pyomo.environ.manifest") when the plugins in the deferred
+        # packages change
+        rc, output = run_command([
+                sys.executable, '-c',
+                'import sys; '
+                'from pyomo.environ.manifest import build_manifest; '
+                'from pyomo.environ.plugin_manifest import plugins; '
+                'sys.exit( build_manifest() != plugins )'])
+        if rc:
+            self.fail("The plugin manifest (pyomo/environ/plugin_manifest.py) "
+                      "is out of date.")
+
 if __name__ == "__main__":
     unittest.main()
 
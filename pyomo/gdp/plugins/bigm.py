@@ -15,7 +15,7 @@ import textwrap
 
 from pyomo.core import (
     Block, Connector, Constraint, Param, Set, Suffix, Var,
-    Expression, SortComponents, TraversalStrategy, Any, value
+    Expression, SortComponents, TraversalStrategy, Any, value, linear_sum
 )
 from pyomo.core.base import Transformation, TransformationFactory
 from pyomo.core.base.component import ComponentUID, ActiveComponent
@@ -320,9 +320,9 @@ class BigM_Transformation(Transformation):
         orConstraint = self._getXorConstraint(parent_component)
 
         xor = obj.xor
-        or_expr = 0
+        indicator_vars = []
         for disjunct in obj.disjuncts:
-            or_expr += disjunct.indicator_var
+            indicator_vars.append(disjunct.indicator_var)
             # make suffix list. (We don't need it until we are
             # transforming constraints, but it gets created at the
             # disjunct level, so more efficient to make it here and
@@ -331,6 +331,7 @@ class BigM_Transformation(Transformation):
             # relax the disjunct
             self._bigM_relax_disjunct(disjunct, transBlock, bigM, suffix_list)
         # add or (or xor) constraint
+        or_expr = linear_sum(1, indicator_vars)
         if xor:
             orConstraint.add(index, (or_expr, 1))
         else:
@@ -430,12 +430,12 @@ class ConvexHull_Transformation(Transformation):
 
         # Now that we know who we need to disaggregate, we will do it
         # while we also transform the disjuncts.
-        or_expr = 0
+        indicator_vars = []
         for disjunct in obj.disjuncts:
-            or_expr += disjunct.indicator_var
+            indicator_vars.append(disjunct.indicator_var)
             self._transform_disjunct(disjunct, transBlock, varSet,
                                      localVars[disjunct])
-        orConstraint.add(index, (or_expr, 1))
+        orConstraint.add(index, (linear_sum(1, indicator_vars), 1))
 
         for i, var in enumerate(varSet):
             disaggregatedExpr = 0
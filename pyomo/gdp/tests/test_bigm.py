@@ -233,8 +233,8 @@ class TwoTermDisj(unittest.TestCase, CommonTests):
         # block of the disjunction--in this case the model.
         xor = m.component("_gdp_bigm_relaxation_disjunction_xor")
         self.assertIsInstance(xor, Constraint)
-        self.assertIs(m.d[0].indicator_var, xor.body.arg(0))
-        self.assertIs(m.d[1].indicator_var, xor.body.arg(1))
+        self.assertIs(m.d[0].indicator_var, xor.body.linear_vars[0])
+        self.assertIs(m.d[1].indicator_var, xor.body.linear_vars[1])
         repn = generate_standard_repn(xor.body)
         check_linear_coef(self, repn, m.d[0].indicator_var, 1)
         check_linear_coef(self, repn, m.d[1].indicator_var, 1)
@@ -249,8 +249,8 @@ class TwoTermDisj(unittest.TestCase, CommonTests):
         # check or constraint is an or (upper bound is None)
         orcons = m.component("_gdp_bigm_relaxation_disjunction_xor")
         self.assertIsInstance(orcons, Constraint)
-        self.assertIs(m.d[0].indicator_var, orcons.body.arg(0))
-        self.assertIs(m.d[1].indicator_var, orcons.body.arg(1))
+        self.assertIs(m.d[0].indicator_var, orcons.body.linear_vars[0])
+        self.assertIs(m.d[1].indicator_var, orcons.body.linear_vars[1])
         repn = generate_standard_repn(orcons.body)
         check_linear_coef(self, repn, m.d[0].indicator_var, 1)
         check_linear_coef(self, repn, m.d[1].indicator_var, 1)
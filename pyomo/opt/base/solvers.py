@@ -354,6 +354,7 @@ class OptSolver(object):
         # the call to solve, but will be reset to defaults if not given
         self._load_solutions = True
         self._select_index = 0
+        self._solution_pool = False
         self._report_timing = False
         self._suffixes = []
         self._log_file = None
@@ -626,7 +627,8 @@ class OptSolver(object):
                         _model.solutions.load_from(
                             result,
                             select=self._select_index,
-                            default_variable_value=self._default_variable_value)
+                            default_variable_value=self._default_variable_value,
+                            solution_pool=self._solution_pool)
                         result._smap_id = None
                         result.solution.clear()
                     else:
@@ -657,6 +659,7 @@ class OptSolver(object):
         self._tee                     = kwds.pop("tee", False)
         self._assert_available        = kwds.pop("available", True)
         self._suffixes                = kwds.pop("suffixes", [])
+        self._solution_pool           = kwds.pop("solution_pool", False)
 
         self.available()
 
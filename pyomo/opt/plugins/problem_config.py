@@ -156,6 +156,11 @@ def minlp_config_block(init=False):
                 bool,
                 'Keep temporary files',
                 None) ).declare_as_argument('-k', '--keepfiles', dest='keepfiles')
+    runtime.declare('memory report', ConfigValue(
+                0, 
+                int,
+                'Report the memory used by the model components (separated into component data, expressions, repn caches and suffixes) after the model instance is created. The value of this option is the number of components that are listed (largest first). A value of 0 indicates disabled.',
+                None) ).declare_as_argument(dest='memory_report', metavar='COUNT')
     runtime.declare('paths', ConfigList(
                 [], 
                 ConfigValue(None, str, 'Path', None),
@@ -171,6 +176,11 @@ def minlp_config_block(init=False):
                 int,
                 "Report memory usage statistics for the generated instance and any associated processing steps. A value of 0 indicates disabled. A value of 1 forces the print of the total memory after major stages of the pyomo script. A value of 2 forces summary memory statistics after major stages of the pyomo script. A value of 3 forces detailed memory statistics during instance creation and various steps of preprocessing. Values equal to 4 and higher currently provide no additional information. Higher values automatically enable all functionality associated with lower values, e.g., 3 turns on detailed and summary statistics.",
                 None) )
+    runtime.declare('profile construction', ConfigValue(
+                None, 
+                str,
+                "Record the time spent constructing each model component and applying each transformation (and the memory allocated, if 'profile memory' is enabled), and write the profile tree to this file. Files ending in '.json' are written in JSON format; other files are written as folded stacks for flame graph tools.",
+                None) ).declare_as_argument(dest='profile_construction', metavar='FILE')
     runtime.declare('report timing', ConfigValue(
                 False, 
                 bool,
@@ -0,0 +1,225 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Incremental parsing of solver logs while the solver is running
+#
+
+__all__ = ['SolverProgress', 'LogProgressParser', 'ProgressMonitor']
+
+import logging
+import os
+import signal
+import threading
+import time
+
+from six import StringIO
+
+import pyutilib.subprocess
+
+logger = logging.getLogger('pyomo.opt')
+
+
+class SolverProgress(object):
+    """A single progress event extracted from a solver log.
+
+    Any of the fields may be None if the solver did not report that
+    information on the corresponding log line.
+
+    Attributes:
+        incumbent: the objective value of the best known solution
+        bound: the best known bound on the optimal objective value
+        gap: the relative gap between the incumbent and the bound
+        iteration: the iteration (or node) count reported by the solver
+        time: the elapsed time (in seconds) since the solver started
+        objective: the objective value of the current (possibly
+            infeasible) iterate, for solvers without an incumbent
+        infeasibility: the primal infeasibility of the current iterate
+        line: the raw log line that generated this event
+    """
+
+    __slots__ = ('incumbent', 'bound', 'gap', 'iteration', 'time',
+                 'objective', 'infeasibility', 'line')
+
+    def __init__(self, incumbent=None, bound=None, gap=None,
+                 iteration=None, time=None, objective=None,
+                 infeasibility=None, line=None):
+        self.incumbent = incumbent
+        self.bound = bound
+        self.gap = gap
+        self.iteration = iteration
+        self.time = time
+        self.objective = objective
+        self.infeasibility = infeasibility
+        self.line = line
+
+    def __str__(self):
+        return "SolverProgress(%s)" % (
+            ", ".join("%s=%s" % (k, getattr(self, k))
+                      for k in self.__slots__[:-1]
+                      if getattr(self, k) is not None),)
+
+    __repr__ = __str__
+
+
+class LogProgressParser(object):
+    """Base class for incremental solver log parsers.
+
+    Solver plugins derive from this class and implement
+    :py:meth:`parse_line`, which is called once for every complete
+    line written by the solver.  The parser may keep state between
+    lines (e.g., the most recent incumbent).
+    """
+
+    # Values larger than this are treated as "no value" (e.g., CBC
+    # reports 1e+50 as the incumbent before a solution is found)
+    infinity = 1e20
+
+    def __init__(self):
+        self.incumbent = None
+        self.bound = None
+
+    def parse_line(self, line):
+        """Parse a single log line.
+
+        Returns a :py:class:`SolverProgress` event, or None if the line
+        does not contain progress information.
+        """
+        raise NotImplementedError       #pragma:nocover
+
+    def _to_float(self, val):
+        try:
+            val = float(val)
+        except (TypeError, ValueError):
+            return None
+        if abs(val) >= self.infinity:
+            return None
+        return val
+
+    def _event(self, incumbent=None, bound=None, gap=None,
+               iteration=None, time=None, line=None):
+        """Create an event, remembering the last incumbent and bound
+        and computing the relative gap if the solver did not report it"""
+        if incumbent is not None:
+            self.incumbent = incumbent
+        if bound is not None:
+            self.bound = bound
+        if gap is None and self.incumbent is not None \
+           and self.bound is not None:
+            gap = abs(self.incumbent - self.bound) \
+                  / max(1e-10, abs(self.incumbent))
+        return SolverProgress(incumbent=self.incumbent,
+                              bound=self.bound,
+                              gap=gap,
+                              iteration=iteration,
+                              time=time,
+                              line=line)
+
+
+class ProgressMonitor(object):
+    """A file-like object that receives the solver output stream.
+
+    The monitor accumulates the complete solver log (so it can be
+    processed after the solve just as before), splits it into lines,
+    and passes each line to a :py:class:`LogProgressParser`.  Events
+    are forwarded to the user callback, and termination criteria are
+    checked against them.  When a criterion is met (or the callback
+    returns True), the running solver process is interrupted.
+
+    Note that this object is written to from the subprocess reader
+    thread, so the callback is also called from that thread.
+    """
+
+    def __init__(self, parser=None, callback=None, solver=None,
+                 stop_gap=None, stop_time=None):
+        self.parser = parser
+        self.callback = callback
+        self.solver = solver
+        self.stop_gap = stop_gap
+        self.stop_time = stop_time
+        self.stop_reason = None
+        self.last_event = None
+        self._log = StringIO()
+        self._buf = ''
+        self._start_time = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Record the start time and arm the stop_time timer"""
+        self._start_time = time.time()
+        if self.stop_time is not None:
+            self._timer = threading.Timer(
+                self.stop_time, self.request_stop,
+                ('time limit of %s seconds reached' % (self.stop_time,),))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def finish(self):
+        """Disarm the timer and process any partial final line"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buf:
+            self._process_line(self._buf)
+            self._buf = ''
+
+    def getvalue(self):
+        return self._log.getvalue()
+
+    def write(self, data):
+        self._log.write(data)
+        if self.parser is None:
+            return
+        lines = (self._buf + data).split('\n')
+        self._buf = lines.pop()
+        for line in lines:
+            self._process_line(line)
+
+    def flush(self):
+        pass
+
+    def _process_line(self, line):
+        try:
+            event = self.parser.parse_line(line.rstrip('\r'))
+        except Exception:
+            logger.debug("Error parsing solver log line: %s", line,
+                         exc_info=True)
+            return
+        if event is None:
+            return
+        if event.time is None and self._start_time is not None:
+            event.time = time.time() - self._start_time
+        self.last_event = event
+        if self.callback is not None and self.callback(self.solver, event):
+            self.request_stop('termination requested by progress callback')
+        if self.stop_gap is not None and event.gap is not None \
+           and event.gap <= self.stop_gap:
+            self.request_stop('relative gap %s <= %s'
+                              % (event.gap, self.stop_gap))
+
+    def request_stop(self, reason):
+        """Interrupt the running solver process (only the first request
+        has any effect)"""
+        with self._lock:
+            if self.stop_reason is not None:
+                return
+            self.stop_reason = reason
+        logger.info("Interrupting solver: %s", reason)
+        process = pyutilib.subprocess.GlobalData.current_process
+        if process is None:
+            return
+        try:
+            if os.name == 'nt':
+                process.terminate()
+            else:
+                process.send_signal(signal.SIGINT)
+        except OSError:
+            # The process may have already exited
+            pass
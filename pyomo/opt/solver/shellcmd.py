@@ -24,6 +24,7 @@ from pyutilib.subprocess import run
 from pyomo.opt.base import *
 from pyomo.opt.base.solvers import *
 from pyomo.opt.results import SolverStatus, SolverResults
+from pyomo.opt.solver.progress import ProgressMonitor
 
 logger = logging.getLogger('pyomo.opt')
 
@@ -45,6 +46,11 @@ class SystemCallSolver(OptSolver):
         # broadly useful for reporting, and in cases where
         # a solver plugin may not report execution time.
         self._last_solve_time = None
+        # progress monitoring (see _progress_parser)
+        self._progress_callback = None
+        self._stop_gap = None
+        self._stop_time = None
+        self._progress_stop_reason = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -146,6 +152,14 @@ class SystemCallSolver(OptSolver):
         """
         return results
 
+    def _progress_parser(self):
+        """
+        Returns a LogProgressParser that extracts progress events from
+        the solver output while the solver is running, or None if this
+        solver does not support progress monitoring.
+        """
+        return None
+
     #
     # NOTE: As JDS has suggested, there could be some value
     #       to allowing the user to change the search path
@@ -196,6 +210,10 @@ class SystemCallSolver(OptSolver):
         TempfileManager.push()
 
         self._keepfiles = kwds.pop("keepfiles", False)
+        self._progress_callback = kwds.pop("progress_callback", None)
+        self._stop_gap = kwds.pop("stop_gap", None)
+        self._stop_time = kwds.pop("stop_time", None)
+        self._progress_stop_reason = None
 
         OptSolver._presolve(self, *args, **kwds)
 
@@ -245,6 +263,11 @@ class SystemCallSolver(OptSolver):
         sys.stdout.flush()
         self._rc, self._log = self._execute_command(self._command)
         sys.stdout.flush()
+        if self._progress_stop_reason is not None and self._rc:
+            logger.warning(
+                "Solver (%s) was interrupted (%s) but did not "
+                "terminate gracefully (return code %s)"
+                % (self.name, self._progress_stop_reason, self._rc))
         return Bunch(rc=self._rc, log=self._log)
 
     def _postsolve(self):
@@ -294,6 +317,8 @@ class SystemCallSolver(OptSolver):
         Execute the command
         """
 
+        monitor = self._create_progress_monitor()
+
         start_time = time.time()
 
         try:
@@ -301,23 +326,58 @@ class SystemCallSolver(OptSolver):
                 _input = command.script
             else:
                 _input = None
+            if monitor is not None:
+                monitor.start()
             [rc, log] = run(
                 command.cmd,
                 stdin = _input,
                 timelimit = self._timelimit if self._timelimit is None else self._timelimit + max(1, 0.01*self._timelimit),
                 env   = command.env,
-                tee   = self._tee
+                tee   = self._tee,
+                ostream = monitor
              )
         except WindowsError:
             err = sys.exc_info()[1]
             msg = 'Could not execute the command: %s\tError message: %s'
             raise ApplicationError(msg % (command.cmd, err))
+        finally:
+            if monitor is not None:
+                monitor.finish()
         sys.stdout.flush()
 
+        if monitor is not None:
+            log = monitor.getvalue()
+            self._progress_stop_reason = monitor.stop_reason
+
         self._last_solve_time = time.time() - start_time
 
         return [rc,log]
 
+    def _create_progress_monitor(self):
+        """
+        Create the ProgressMonitor that receives the solver output, or
+        None if no progress monitoring was requested.
+        """
+        if self._progress_callback is None and self._stop_gap is None \
+           and self._stop_time is None:
+            return None
+        parser = self._progress_parser()
+        if parser is None:
+            if self._stop_gap is not None:
+                raise ValueError(
+                    "Solver (%s) does not support progress monitoring: "
+                    "the 'stop_gap' option is not available" % (self.name,))
+            if self._progress_callback is not None:
+                logger.warning(
+                    "Solver (%s) does not support progress monitoring: "
+                    "the progress callback will not be called"
+                    % (self.name,))
+        return ProgressMonitor(parser=parser,
+                               callback=self._progress_callback,
+                               solver=self,
+                               stop_gap=self._stop_gap,
+                               stop_time=self._stop_time)
+
     def process_output(self, rc):
         """
         Process the output files.
@@ -360,6 +420,11 @@ class SystemCallSolver(OptSolver):
         if self._last_solve_time != None:
             results.solver.time=self._last_solve_time
 
+        if self._progress_stop_reason is not None \
+           and results.solver.message is None:
+            results.solver.message = \
+                "Solver interrupted by Pyomo: %s" % (self._progress_stop_reason,)
+
         return results
 
     def _default_results_format(self, prob_format):
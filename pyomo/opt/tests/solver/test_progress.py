@@ -0,0 +1,239 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for pyomo.opt.solver.progress
+#
+
+import os
+import sys
+import time
+
+import pyutilib.th as unittest
+from pyutilib.misc import Bunch
+
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.progress import (SolverProgress, LogProgressParser,
+                                       ProgressMonitor)
+from pyomo.solvers.plugins.solvers.CBCplugin import CBCLogParser
+from pyomo.solvers.plugins.solvers.GLPK import GLPKLogParser
+from pyomo.solvers.plugins.solvers.CPLEX import CPLEXLogParser
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPTLogParser
+
+is_windows = os.name == 'nt'
+
+# A fake solver that prints CBC-style node log lines with a closing
+# gap and exits cleanly when interrupted
+_fake_cbc = """
+import signal, sys, time
+def handler(signum, frame):
+    print('Cbc0027I Exiting on user event')
+    sys.stdout.flush()
+    sys.exit(0)
+signal.signal(signal.SIGINT, handler)
+for i, inc in enumerate((100, 80, 60, 55, 52, 51, 50.5)):
+    print('Cbc0010I After %d nodes, 3 on tree, %s best solution, '
+          'best possible 50 (%d.00 seconds)' % (i*100, inc, i))
+    sys.stdout.flush()
+    time.sleep(0.2)
+time.sleep(30)
+"""
+
+
+class _FakeCBC(SystemCallSolver):
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'fake_cbc'
+        SystemCallSolver.__init__(self, **kwds)
+        self._timelimit = None
+        self._tee = False
+        self._progress_callback = None
+        self._stop_gap = None
+        self._stop_time = None
+
+    def _progress_parser(self):
+        return CBCLogParser()
+
+
+class TestLogParsers(unittest.TestCase):
+
+    def test_cbc(self):
+        parser = CBCLogParser()
+        self.assertIsNone(parser.parse_line("Coin0506I Presolve 2 rows"))
+        event = parser.parse_line(
+            "Cbc0010I After 0 nodes, 1 on tree, 1e+50 best solution, "
+            "best possible -5 (0.02 seconds)")
+        self.assertIsNone(event.incumbent)
+        self.assertEqual(event.bound, -5)
+        self.assertIsNone(event.gap)
+        self.assertEqual(event.iteration, 0)
+        self.assertEqual(event.time, 0.02)
+        event = parser.parse_line(
+            "Cbc0012I Integer solution of -4 found by DiveCoefficient "
+            "after 12 iterations and 3 nodes (0.05 seconds)")
+        self.assertEqual(event.incumbent, -4)
+        self.assertEqual(event.bound, -5)
+        self.assertAlmostEqual(event.gap, 0.25)
+        self.assertEqual(event.iteration, 3)
+        event = parser.parse_line(
+            "Cbc0001I Search completed - best objective -4.5, took 20 "
+            "iterations and 7 nodes (0.07 seconds)")
+        self.assertEqual(event.incumbent, -4.5)
+        self.assertEqual(event.time, 0.07)
+
+    def test_glpk(self):
+        parser = GLPKLogParser()
+        event = parser.parse_line(
+            "*     2: obj =   1.000000000e+01 inf =   0.000e+00 (0)")
+        self.assertEqual(event.objective, 10)
+        self.assertEqual(event.infeasibility, 0)
+        self.assertIsNone(event.incumbent)
+        event = parser.parse_line(
+            "+     2: mip =     not found yet >=              -inf        "
+            "(1; 0)")
+        self.assertIsNone(event.incumbent)
+        self.assertIsNone(event.bound)
+        event = parser.parse_line(
+            "+    14: >>>>>   1.000000000e+01 >=   8.000000000e+00  20.0% "
+            "(5; 0)")
+        self.assertEqual(event.incumbent, 10)
+        self.assertEqual(event.bound, 8)
+        self.assertAlmostEqual(event.gap, 0.2)
+        self.assertEqual(event.iteration, 14)
+        self.assertIsNone(parser.parse_line("INTEGER OPTIMAL SOLUTION FOUND"))
+
+    def test_cplex(self):
+        parser = CPLEXLogParser()
+        self.assertIsNone(parser.parse_line(
+            "   Node  Left     Objective  IInf  Best Integer    "
+            "Best Bound    ItCnt     Gap"))
+        event = parser.parse_line(
+            "      0     0       10.0000     5                     "
+            "10.0000        8         ")
+        self.assertIsNone(event.incumbent)
+        self.assertEqual(event.bound, 10)
+        event = parser.parse_line(
+            "*     0+    0                           12.0000       "
+            "10.0000            16.67%")
+        self.assertEqual(event.incumbent, 12)
+        self.assertEqual(event.bound, 10)
+        self.assertAlmostEqual(event.gap, 0.1667)
+        event = parser.parse_line(
+            "    100    50    infeasible             11.0000       "
+            "10.5000      234    4.55%")
+        self.assertEqual(event.incumbent, 11)
+        self.assertEqual(event.bound, 10.5)
+        self.assertEqual(event.iteration, 100)
+
+    def test_ipopt(self):
+        parser = IPOPTLogParser()
+        self.assertIsNone(parser.parse_line(
+            "iter    objective    inf_pr   inf_du lg(mu)  ||d||  lg(rg) "
+            "alpha_du alpha_pr  ls"))
+        event = parser.parse_line(
+            "  12r 1.2345678e+00 1.00e-08 2.00e-06  -5.7 1.00e-02    -  "
+            "1.00e+00 1.00e+00h  1")
+        self.assertEqual(event.iteration, 12)
+        self.assertEqual(event.objective, 1.2345678)
+        self.assertEqual(event.infeasibility, 1e-8)
+        self.assertIsNone(event.incumbent)
+
+
+class TestProgressMonitor(unittest.TestCase):
+
+    def test_write(self):
+        events = []
+        monitor = ProgressMonitor(parser=CBCLogParser(),
+                                  callback=lambda s, e: events.append(e))
+        monitor.start()
+        monitor.write("Cbc0010I After 0 nodes, 1 on tree, 3 best ")
+        self.assertEqual(events, [])
+        monitor.write("solution, best possible 2 (0.01 seconds)\nCbc0012I")
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].incumbent, 3)
+        monitor.write(" Integer solution of 2.5 found after 5 iterations "
+                      "and 2 nodes (0.5 seconds)")
+        self.assertEqual(len(events), 1)
+        monitor.finish()
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1].incumbent, 2.5)
+        self.assertIs(monitor.last_event, events[1])
+        self.assertIsNone(monitor.stop_reason)
+        self.assertTrue(monitor.getvalue().startswith("Cbc0010I"))
+
+    def test_no_parser(self):
+        monitor = ProgressMonitor()
+        monitor.write("Cbc0010I After 0 nodes, 1 on tree, 3 best solution, "
+                      "best possible 2 (0.01 seconds)\n")
+        monitor.finish()
+        self.assertIsNone(monitor.last_event)
+        self.assertEqual(monitor.getvalue()[:8], "Cbc0010I")
+
+    def test_callback_stop(self):
+        monitor = ProgressMonitor(parser=CBCLogParser(),
+                                  callback=lambda s, e: e.iteration >= 5)
+        monitor.write("Cbc0010I After 2 nodes, 1 on tree, 3 best solution, "
+                      "best possible 2 (0.01 seconds)\n")
+        self.assertIsNone(monitor.stop_reason)
+        monitor.write("Cbc0010I After 5 nodes, 1 on tree, 3 best solution, "
+                      "best possible 2 (0.01 seconds)\n")
+        self.assertIn('callback', monitor.stop_reason)
+
+    def test_gap_stop(self):
+        monitor = ProgressMonitor(parser=CBCLogParser(), stop_gap=0.1)
+        monitor.write("Cbc0010I After 2 nodes, 1 on tree, 3 best solution, "
+                      "best possible 2 (0.01 seconds)\n")
+        self.assertIsNone(monitor.stop_reason)
+        monitor.write("Cbc0010I After 5 nodes, 1 on tree, 2.1 best solution, "
+                      "best possible 2 (0.01 seconds)\n")
+        self.assertIn('gap', monitor.stop_reason)
+
+
+@unittest.skipIf(is_windows, "Interrupting the solver requires SIGINT")
+class TestSystemCallSolverProgress(unittest.TestCase):
+
+    def _run(self, opt):
+        cmd = Bunch(cmd=[sys.executable, '-c', _fake_cbc],
+                    log_file=None, env=None)
+        start = time.time()
+        rc, log = opt._execute_command(cmd)
+        return rc, log, time.time() - start
+
+    def test_stop_gap(self):
+        events = []
+        with _FakeCBC() as opt:
+            opt._progress_callback = lambda s, e: events.append(e)
+            opt._stop_gap = 0.05
+            rc, log, elapsed = self._run(opt)
+        self.assertEqual(rc, 0)
+        self.assertLess(elapsed, 20)
+        self.assertIn('gap', opt._progress_stop_reason)
+        self.assertIn('Cbc0027I Exiting on user event', log)
+        self.assertLessEqual(events[-1].gap, 0.05)
+        self.assertTrue(all(e.gap > 0.05 for e in events[:-1]))
+
+    def test_stop_time(self):
+        with _FakeCBC() as opt:
+            opt._stop_time = 0.5
+            rc, log, elapsed = self._run(opt)
+        self.assertEqual(rc, 0)
+        self.assertLess(elapsed, 20)
+        self.assertIn('time limit', opt._progress_stop_reason)
+
+    def test_stop_gap_unsupported(self):
+        with SystemCallSolver(type='test') as opt:
+            opt._progress_callback = None
+            opt._stop_gap = 0.01
+            opt._stop_time = None
+            with self.assertRaisesRegexp(ValueError, "stop_gap"):
+                opt._create_progress_monitor()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -48,7 +48,7 @@ from pyomo.core.kernel.block import IBlock
 from pyomo.core.kernel.expression import IIdentityExpression
 from pyomo.core.kernel.variable import IVariable
 
-from six import itervalues, iteritems
+from six import itervalues, iteritems, StringIO
 from six.moves import xrange, zip
 
 logger = logging.getLogger('pyomo.core')
@@ -146,6 +146,79 @@ def _get_bound(exp):
         return value(exp)
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
+def _get_constraint_bounds_line(constraint_data, offset):
+    """Return the "r" segment line for a constraint (that is not a
+    complementarity condition), where offset is the constant term of
+    the constraint body"""
+    L = None
+    U = None
+    if constraint_data.has_lb():
+        L = _get_bound(constraint_data.lower)
+    else:
+        assert constraint_data.has_ub()
+    if constraint_data.has_ub():
+        U = _get_bound(constraint_data.upper)
+    else:
+        assert constraint_data.has_lb()
+    if constraint_data.equality:
+        assert L == U
+
+    if L == U:
+        if L is None:
+            # No constraint on body
+            return "3\n"
+        else:
+            return "4 %r\n" % (L-offset)
+    elif L is None:
+        return "1 %r\n" % (U-offset)
+    elif U is None:
+        return "2 %r\n" % (L-offset)
+    elif (L > U):
+        msg = 'Constraint {0}: lower bound greater than upper' \
+            ' bound ({1} > {2})'
+        raise ValueError(msg.format(constraint_data.name,
+                                    str(L), str(U)))
+    else:
+        # double sided inequality
+        # both are not none and they are valid
+        return "0 %r %r\n" % (L-offset, U-offset)
+
+def _label_filename(nl_filename, ext):
+    """Return the name of the .row or .col file that accompanies an NL
+    file when symbolic_solver_labels is True"""
+    if nl_filename.endswith('.nl'):
+        return nl_filename.replace('.nl', ext)
+    return nl_filename + ext
+
+class _NamedStringIO(StringIO):
+    """An in-memory stand-in for the NL file (the writer uses the name
+    of the output stream to locate the .row and .col files)"""
+
+    def __init__(self, name):
+        StringIO.__init__(self)
+        self.name = name
+
+class _NLSegments(object):
+    """The pieces of an NL file recorded by ProblemWriter_nl when
+    _record_segments is True.
+
+    The text of the header and "F" segments (head), the "C" and "O"
+    segments (body), and the "k", "J", and "G" segments (tail) depend
+    only on the model structure and are kept verbatim.  The "S", "d",
+    "x", "r", and "b" segments are regenerated from the model by
+    ProblemWriter_nl._write_segments.
+    """
+
+    __slots__ = ('model', 'symbol_map', 'all_blocks_list', 'modelSOS',
+                 'var_list', 'rows', 'head', 'body', 'tail',
+                 'symbolic_solver_labels', 'output_fixed_variable_bounds',
+                 'rowcol')
+
+    def __init__(self, **kwds):
+        self.rowcol = None
+        for key, val in iteritems(kwds):
+            setattr(self, key, val)
+
 class StopWatch(object):
 
     def __init__(self):
@@ -272,6 +345,11 @@ class ProblemWriter_nl(AbstractProblemWriter):
         self._ampl_obj_id = {}
         self._OUTPUT = None
         self._varID_map = None
+        # If True, the writer keeps the pieces of the NL file that
+        # are needed to regenerate the file after bound, initial
+        # point, or suffix changes (see _write_segments)
+        self._record_segments = False
+        self.segments = None
 
     def __call__(self,
                  model,
@@ -368,7 +446,10 @@ class ProblemWriter_nl(AbstractProblemWriter):
         # Pause the GC for the duration of this method
         with PauseGC() as pgc:
             with open(filename,"w") as f:
-                self._OUTPUT = f
+                if self._record_segments:
+                    self._OUTPUT = _NamedStringIO(filename)
+                else:
+                    self._OUTPUT = f
                 symbol_map = self._print_model_NL(
                     model,
                     solver_capability,
@@ -376,6 +457,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     skip_trivial_constraints=skip_trivial_constraints,
                     file_determinism=file_determinism,
                     include_all_variable_bounds=include_all_variable_bounds)
+                if self._record_segments:
+                    f.write(self._OUTPUT.getvalue())
+            if self._record_segments and symbolic_solver_labels:
+                self.segments.rowcol = {}
+                for ext in ('.row', '.col'):
+                    with open(_label_filename(filename, ext)) as f:
+                        self.segments.rowcol[ext] = f.read()
 
         self._symbolic_solver_labels = False
         self._output_fixed_variable_bounds = False
@@ -1013,19 +1101,6 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     len(set(wrapped_repn.linear_vars).union(
                         wrapped_repn.nonlinear_vars))
 
-                L = None
-                U = None
-                if constraint_data.has_lb():
-                    L = _get_bound(constraint_data.lower)
-                else:
-                    assert constraint_data.has_ub()
-                if constraint_data.has_ub():
-                    U = _get_bound(constraint_data.upper)
-                else:
-                    assert constraint_data.has_lb()
-                if constraint_data.equality:
-                    assert L == U
-
                 offset = repn.constant
                 _type = getattr(constraint_data, '_complementarity', None)
                 _vid = getattr(constraint_data, '_vid', None)
@@ -1044,32 +1119,17 @@ class ProblemWriter_nl(AbstractProblemWriter):
                     else:
                         ccons_lin += 1
                 else:
-                    if L == U:
-                        if L is None:
-                            # No constraint on body
-                            constraint_bounds_dict[con_ID] = "3\n"
-                            n_unbounded += 1
-                        else:
-                            constraint_bounds_dict[con_ID] = \
-                                "4 %r\n" % (L-offset)
-                            n_equals += 1
-                    elif L is None:
-                        constraint_bounds_dict[con_ID] = "1 %r\n" % (U-offset)
-                        n_single_sided_ineq += 1
-                    elif U is None:
-                        constraint_bounds_dict[con_ID] = "2 %r\n" % (L-offset)
-                        n_single_sided_ineq += 1
-                    elif (L > U):
-                        msg = 'Constraint {0}: lower bound greater than upper' \
-                            ' bound ({1} > {2})'
-                        raise ValueError(msg.format(constraint_data.name,
-                                                    str(L), str(U)))
-                    else:
-                        constraint_bounds_dict[con_ID] = \
-                            "0 %r %r\n" % (L-offset, U-offset)
-                        # double sided inequality
-                        # both are not none and they are valid
+                    bounds_line = _get_constraint_bounds_line(
+                        constraint_data, offset)
+                    constraint_bounds_dict[con_ID] = bounds_line
+                    if bounds_line[0] == '0':
                         n_ranges += 1
+                    elif bounds_line[0] == '3':
+                        n_unbounded += 1
+                    elif bounds_line[0] == '4':
+                        n_equals += 1
+                    else:
+                        n_single_sided_ineq += 1
 
         sos1 = solver_capability("sos1")
         sos2 = solver_capability("sos2")
@@ -1208,11 +1268,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
 #        end_time = time.clock()
 #        print (end_time - start_time)
 
-        colfilename = None
-        if OUTPUT.name.endswith('.nl'):
-            colfilename = OUTPUT.name.replace('.nl','.col')
-        else:
-            colfilename = OUTPUT.name+'.col'
+        colfilename = _label_filename(OUTPUT.name, '.col')
         if symbolic_solver_labels:
             colf = open(colfilename,'w')
             colfile_line_template = "%s\n"
@@ -1338,6 +1394,368 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
         symbol_map_byObject = symbol_map.byObject
 
+        if self._record_segments:
+            head_end = OUTPUT.tell()
+        suffix_dict = self._print_suffix_lines(model,
+                                               all_blocks_list,
+                                               symbol_map_byObject,
+                                               modelSOS)
+        if self._record_segments:
+            body_start = OUTPUT.tell()
+            self.segments = _NLSegments(
+                model=model,
+                symbol_map=symbol_map,
+                all_blocks_list=all_blocks_list,
+                modelSOS=modelSOS,
+                symbolic_solver_labels=symbolic_solver_labels,
+                output_fixed_variable_bounds=output_fixed_variable_bounds)
+
+        del modelSOS
+
+        #
+        # "C" lines
+        #
+        rowfilename = _label_filename(OUTPUT.name, '.row')
+        if symbolic_solver_labels:
+            rowf = open(rowfilename,'w')
+
+        cu = [0 for i in xrange(len(full_var_list))]
+        for con_ID in nonlin_con_order_list:
+            con_data, wrapped_repn = Constraints_dict[con_ID]
+            row_id = self_ampl_con_id[con_ID]
+            OUTPUT.write("C%d" % (row_id))
+            if symbolic_solver_labels:
+                lbl = name_labeler(con_data)
+                OUTPUT.write("\t#%s" % (lbl))
+                rowf.write(lbl+"\n")
+            OUTPUT.write("\n")
+
+            if wrapped_repn.repn.nonlinear_expr is not None:
+                assert not wrapped_repn.repn.is_quadratic()
+                self._print_nonlinear_terms_NL(
+                    wrapped_repn.repn.nonlinear_expr)
+            else:
+                assert wrapped_repn.repn.is_quadratic()
+                self._print_standard_quadratic_NL(
+                    wrapped_repn.repn.quadratic_vars,
+                    wrapped_repn.repn.quadratic_coefs)
+
+            for var_ID in set(wrapped_repn.linear_vars).union(
+                    wrapped_repn.nonlinear_vars):
+                cu[self_ampl_var_id[var_ID]] += 1
+
+        for con_ID in lin_con_order_list:
+            con_data, wrapped_repn = Constraints_dict[con_ID]
+            row_id = self_ampl_con_id[con_ID]
+            con_vars = set(wrapped_repn.linear_vars)
+            for var_ID in con_vars:
+                cu[self_ampl_var_id[var_ID]] += 1
+            OUTPUT.write("C%d" % (row_id))
+            if symbolic_solver_labels:
+                lbl = name_labeler(con_data)
+                OUTPUT.write("\t#%s" % (lbl))
+                rowf.write(lbl+"\n")
+            OUTPUT.write("\n")
+            OUTPUT.write("n0\n")
+
+        if show_section_timing:
+            subsection_timer.report("Write NL header and suffix lines")
+            subsection_timer.reset()
+
+        #
+        # "O" lines
+        #
+        for obj_ID, (obj, wrapped_repn) in iteritems(Objectives_dict):
+
+            k = 0
+            if not obj.is_minimizing():
+                k = 1
+
+            OUTPUT.write("O%d %d" % (self_ampl_obj_id[obj_ID], k))
+            if symbolic_solver_labels:
+                lbl = name_labeler(obj)
+                OUTPUT.write("\t#%s" % (lbl))
+                rowf.write(lbl+"\n")
+            OUTPUT.write("\n")
+
+            if wrapped_repn.repn.is_linear():
+                OUTPUT.write(self._op_string[NumericConstant]
+                             % (wrapped_repn.repn.constant))
+            else:
+                if wrapped_repn.repn.constant != 0:
+                    _, binary_sum_str, _ = self._op_string[EXPR.SumExpressionBase]
+                    OUTPUT.write(binary_sum_str)
+                    OUTPUT.write(self._op_string[NumericConstant]
+                                 % (wrapped_repn.repn.constant))
+                if wrapped_repn.repn.nonlinear_expr is not None:
+                    assert not wrapped_repn.repn.is_quadratic()
+                    self._print_nonlinear_terms_NL(
+                        wrapped_repn.repn.nonlinear_expr)
+                else:
+                    assert wrapped_repn.repn.is_quadratic()
+                    self._print_standard_quadratic_NL(
+                        wrapped_repn.repn.quadratic_vars,
+                        wrapped_repn.repn.quadratic_coefs)
+
+        if symbolic_solver_labels:
+            rowf.close()
+        del name_labeler
+
+        if show_section_timing:
+            subsection_timer.report("Write objective expression")
+            subsection_timer.reset()
+
+        if self._record_segments:
+            body_end = OUTPUT.tell()
+
+        #
+        # "d" lines
+        #
+        self._print_dual_lines(suffix_dict, symbol_map_byObject)
+
+        #
+        # "x", "r", and "b" lines
+        #
+        # variable initialization and bounds
+        var_list = [Vars_dict[var_ID] for var_ID in full_var_list]
+        x_init_list, var_bound_list = self._get_initial_point_and_bounds(
+            model, var_list)
+        # *NOTE: This iteration follows the assignment of the ampl_con_id
+        constraint_bounds_list = [
+            constraint_bounds_dict[con_ID]
+            for con_ID in itertools.chain(nonlin_con_order_list,
+                                          lin_con_order_list)]
+        self._print_initial_point_and_bounds(x_init_list,
+                                             constraint_bounds_list,
+                                             var_bound_list)
+        del x_init_list
+        del var_bound_list
+
+        if show_section_timing:
+            subsection_timer.report("Write initializations and bounds")
+            subsection_timer.reset()
+
+        if self._record_segments:
+            tail_start = OUTPUT.tell()
+            self.segments.var_list = var_list
+            self.segments.rows = [
+                [Constraints_dict[con_ID][0],
+                 Constraints_dict[con_ID][1].repn,
+                 constraint_bounds_list[i]]
+                for i, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
+                                                           lin_con_order_list))]
+        del var_list
+        del constraint_bounds_list
+
+        #
+        # "k" lines
+        #
+        ktot = 0
+        n1 = len(full_var_list) - 1
+        OUTPUT.write("k%d" % (n1))
+        if symbolic_solver_labels:
+            OUTPUT.write("\t#intermediate Jacobian column lengths")
+        OUTPUT.write("\n")
+        ktot = 0
+        for i in xrange(n1):
+            ktot += cu[i]
+            OUTPUT.write("%d\n"%(ktot))
+        del cu
+
+        if show_section_timing:
+            subsection_timer.report("Write k lines")
+            subsection_timer.reset()
+
+        #
+        # "J" lines
+        #
+        for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
+                                                    lin_con_order_list)):
+            con_data, wrapped_repn = Constraints_dict[con_ID]
+            numnonlinear_vars = len(wrapped_repn.nonlinear_vars)
+            numlinear_vars = len(wrapped_repn.linear_vars)
+            if numnonlinear_vars == 0:
+                if numlinear_vars > 0:
+                    linear_dict = dict((var_ID, coef)
+                                       for var_ID, coef in
+                                       zip(wrapped_repn.linear_vars,
+                                           wrapped_repn.repn.linear_coefs))
+                    OUTPUT.write("J%d %d\n"%(nc, numlinear_vars))
+                    OUTPUT.writelines(
+                        "%d %r\n" % (self_ampl_var_id[con_var],
+                                     linear_dict[con_var])
+                        for con_var in sorted(linear_dict.keys()))
+            elif numlinear_vars == 0:
+                nl_con_vars = \
+                    sorted(wrapped_repn.nonlinear_vars)
+                OUTPUT.write("J%d %d\n"%(nc, numnonlinear_vars))
+                OUTPUT.writelines(
+                    "%d 0\n"%(self_ampl_var_id[con_var])
+                    for con_var in nl_con_vars)
+            else:
+                con_vars = set(wrapped_repn.nonlinear_vars)
+                nl_con_vars = sorted(
+                    con_vars.difference(
+                        wrapped_repn.linear_vars))
+                con_vars.update(wrapped_repn.linear_vars)
+                linear_dict = dict(
+                    (var_ID, coef) for var_ID, coef in
+                    zip(wrapped_repn.linear_vars,
+                        wrapped_repn.repn.linear_coefs))
+                OUTPUT.write("J%d %d\n"%(nc, len(con_vars)))
+                OUTPUT.writelines(
+                    "%d %r\n" % (self_ampl_var_id[con_var],
+                                 linear_dict[con_var])
+                    for con_var in sorted(linear_dict.keys()))
+                OUTPUT.writelines(
+                    "%d 0\n"%(self_ampl_var_id[con_var])
+                    for con_var in nl_con_vars)
+
+
+        if show_section_timing:
+            subsection_timer.report("Write J lines")
+            subsection_timer.reset()
+
+        #
+        # "G" lines
+        #
+        for obj_ID, (obj, wrapped_repn) in \
+               iteritems(Objectives_dict):
+
+            grad_entries = {}
+            for idx, obj_var in enumerate(
+                    wrapped_repn.linear_vars):
+                grad_entries[self_ampl_var_id[obj_var]] = \
+                    wrapped_repn.repn.linear_coefs[idx]
+            for obj_var in wrapped_repn.nonlinear_vars:
+                if obj_var not in wrapped_repn.linear_vars:
+                    grad_entries[self_ampl_var_id[obj_var]] = 0
+            len_ge = len(grad_entries)
+            if len_ge > 0:
+                OUTPUT.write("G%d %d\n" % (self_ampl_obj_id[obj_ID],
+                                           len_ge))
+                for var_ID in sorted(grad_entries.keys()):
+                    OUTPUT.write("%d %r\n" % (var_ID,
+                                              grad_entries[var_ID]))
+
+        if show_section_timing:
+            subsection_timer.report("Write G lines")
+            subsection_timer.reset()
+            overall_timer.report("Total time")
+
+        if self._record_segments:
+            nl_text = OUTPUT.getvalue()
+            self.segments.head = nl_text[:head_end]
+            self.segments.body = nl_text[body_start:body_end]
+            self.segments.tail = nl_text[tail_start:]
+
+        return symbol_map
+
+    def _print_initial_point_and_bounds(self,
+                                        x_init_list,
+                                        constraint_bounds_list,
+                                        var_bound_list):
+        """Write the "x", "r", and "b" segments"""
+        OUTPUT = self._OUTPUT
+        symbolic_solver_labels = self._symbolic_solver_labels
+
+        #
+        # "x" lines
+        #
+        OUTPUT.write("x%d" % (len(x_init_list)))
+        if symbolic_solver_labels:
+            OUTPUT.write("\t# initial guess")
+        OUTPUT.write("\n")
+        OUTPUT.writelines(x_init_list)
+
+        #
+        # "r" lines
+        #
+        OUTPUT.write("r")
+        if symbolic_solver_labels:
+            OUTPUT.write("\t#%d ranges (rhs's)"
+                         % (len(constraint_bounds_list)))
+        OUTPUT.write("\n")
+        OUTPUT.writelines(constraint_bounds_list)
+
+        #
+        # "b" lines
+        #
+        OUTPUT.write("b")
+        if symbolic_solver_labels:
+            OUTPUT.write("\t#%d bounds (on variables)"
+                         % (len(var_bound_list)))
+        OUTPUT.write("\n")
+        OUTPUT.writelines(var_bound_list)
+
+    def _write_segments(self, filename):
+        """Regenerate an NL file from the segments recorded by a
+        previous call to this writer (with _record_segments=True).
+
+        The "S", "d", "x", "r", and "b" segments are written using the
+        current suffix values, initial point, variable bounds, and
+        constraint bounds (using the constant term stored with each
+        row, which the caller is responsible for updating).  Returns
+        False (and writes nothing) if a constraint changed the type
+        of its bounds, as that changes the NL header; the caller must
+        then write the file from scratch.
+        """
+        segments = self.segments
+        constraint_bounds_list = []
+        for row in segments.rows:
+            constraint_data, repn, bounds_line = row
+            if bounds_line[0] != '5':
+                # complementarity conditions are left unchanged
+                bounds_line = _get_constraint_bounds_line(constraint_data,
+                                                          repn.constant)
+                if bounds_line[0] != row[2][0]:
+                    return False
+                row[2] = bounds_line
+            constraint_bounds_list.append(bounds_line)
+
+        self._symbolic_solver_labels = segments.symbolic_solver_labels
+        self._output_fixed_variable_bounds = \
+            segments.output_fixed_variable_bounds
+        try:
+            x_init_list, var_bound_list = \
+                self._get_initial_point_and_bounds(segments.model,
+                                                   segments.var_list)
+            symbol_map_byObject = segments.symbol_map.byObject
+            with open(filename, "w") as f:
+                self._OUTPUT = f
+                f.write(segments.head)
+                suffix_dict = self._print_suffix_lines(
+                    segments.model,
+                    segments.all_blocks_list,
+                    symbol_map_byObject,
+                    segments.modelSOS)
+                f.write(segments.body)
+                self._print_dual_lines(suffix_dict, symbol_map_byObject)
+                self._print_initial_point_and_bounds(x_init_list,
+                                                     constraint_bounds_list,
+                                                     var_bound_list)
+                f.write(segments.tail)
+            if segments.rowcol is not None:
+                for ext, text in iteritems(segments.rowcol):
+                    with open(_label_filename(filename, ext), "w") as f:
+                        f.write(text)
+        finally:
+            self._symbolic_solver_labels = False
+            self._output_fixed_variable_bounds = False
+            self._OUTPUT = None
+        return True
+
+    def _print_suffix_lines(self,
+                            model,
+                            all_blocks_list,
+                            symbol_map_byObject,
+                            modelSOS):
+        """Write the "S" segments for the SOSConstraint components and
+        the active export suffixes.  Returns the dict mapping suffix
+        names to the active export suffixes (so the "dual" suffixes
+        can be written to the "d" segment)."""
+        OUTPUT = self._OUTPUT
+
         var_sosno_suffix = modelSOS.sosno
         var_ref_suffix = modelSOS.ref
         sosconstraint_sosno_vals = set(var_sosno_suffix.vals)
@@ -1498,108 +1916,13 @@ class ProblemWriter_nl(AbstractProblemWriter):
                                   for _l in sorted(mod_s_lines,
                                                    key=operator.itemgetter(0)))
 
-        del modelSOS
-
-        #
-        # "C" lines
-        #
-        rowfilename = None
-        if OUTPUT.name.endswith('.nl'):
-            rowfilename = OUTPUT.name.replace('.nl','.row')
-        else:
-            rowfilename = OUTPUT.name+'.row'
-        if symbolic_solver_labels:
-            rowf = open(rowfilename,'w')
-
-        cu = [0 for i in xrange(len(full_var_list))]
-        for con_ID in nonlin_con_order_list:
-            con_data, wrapped_repn = Constraints_dict[con_ID]
-            row_id = self_ampl_con_id[con_ID]
-            OUTPUT.write("C%d" % (row_id))
-            if symbolic_solver_labels:
-                lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
-                rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
+        return suffix_dict
 
-            if wrapped_repn.repn.nonlinear_expr is not None:
-                assert not wrapped_repn.repn.is_quadratic()
-                self._print_nonlinear_terms_NL(
-                    wrapped_repn.repn.nonlinear_expr)
-            else:
-                assert wrapped_repn.repn.is_quadratic()
-                self._print_standard_quadratic_NL(
-                    wrapped_repn.repn.quadratic_vars,
-                    wrapped_repn.repn.quadratic_coefs)
-
-            for var_ID in set(wrapped_repn.linear_vars).union(
-                    wrapped_repn.nonlinear_vars):
-                cu[self_ampl_var_id[var_ID]] += 1
-
-        for con_ID in lin_con_order_list:
-            con_data, wrapped_repn = Constraints_dict[con_ID]
-            row_id = self_ampl_con_id[con_ID]
-            con_vars = set(wrapped_repn.linear_vars)
-            for var_ID in con_vars:
-                cu[self_ampl_var_id[var_ID]] += 1
-            OUTPUT.write("C%d" % (row_id))
-            if symbolic_solver_labels:
-                lbl = name_labeler(con_data)
-                OUTPUT.write("\t#%s" % (lbl))
-                rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-            OUTPUT.write("n0\n")
-
-        if show_section_timing:
-            subsection_timer.report("Write NL header and suffix lines")
-            subsection_timer.reset()
-
-        #
-        # "O" lines
-        #
-        for obj_ID, (obj, wrapped_repn) in iteritems(Objectives_dict):
-
-            k = 0
-            if not obj.is_minimizing():
-                k = 1
-
-            OUTPUT.write("O%d %d" % (self_ampl_obj_id[obj_ID], k))
-            if symbolic_solver_labels:
-                lbl = name_labeler(obj)
-                OUTPUT.write("\t#%s" % (lbl))
-                rowf.write(lbl+"\n")
-            OUTPUT.write("\n")
-
-            if wrapped_repn.repn.is_linear():
-                OUTPUT.write(self._op_string[NumericConstant]
-                             % (wrapped_repn.repn.constant))
-            else:
-                if wrapped_repn.repn.constant != 0:
-                    _, binary_sum_str, _ = self._op_string[EXPR.SumExpressionBase]
-                    OUTPUT.write(binary_sum_str)
-                    OUTPUT.write(self._op_string[NumericConstant]
-                                 % (wrapped_repn.repn.constant))
-                if wrapped_repn.repn.nonlinear_expr is not None:
-                    assert not wrapped_repn.repn.is_quadratic()
-                    self._print_nonlinear_terms_NL(
-                        wrapped_repn.repn.nonlinear_expr)
-                else:
-                    assert wrapped_repn.repn.is_quadratic()
-                    self._print_standard_quadratic_NL(
-                        wrapped_repn.repn.quadratic_vars,
-                        wrapped_repn.repn.quadratic_coefs)
-
-        if symbolic_solver_labels:
-            rowf.close()
-        del name_labeler
-
-        if show_section_timing:
-            subsection_timer.report("Write objective expression")
-            subsection_timer.reset()
+    def _print_dual_lines(self, suffix_dict, symbol_map_byObject):
+        """Write the "d" segment (dual initialization)"""
+        OUTPUT = self._OUTPUT
+        suffix_line = "{0} {1!r}\n"
 
-        #
-        # "d" lines
-        #
         # dual initialization
         if 'dual' in suffix_dict:
             s_lines = []
@@ -1619,21 +1942,20 @@ class ProblemWriter_nl(AbstractProblemWriter):
 
             if len(s_lines) > 0:
                 OUTPUT.write("d%d" % (len(s_lines)))
-                if symbolic_solver_labels:
+                if self._symbolic_solver_labels:
                     OUTPUT.write("\t# dual initial guess")
                 OUTPUT.write("\n")
                 OUTPUT.writelines(suffix_line.format(*_l)
                                   for _l in sorted(s_lines,
                                                    key=operator.itemgetter(0)))
 
-        #
-        # "x" lines
-        #
-        # variable initialization
+    def _get_initial_point_and_bounds(self, model, var_list):
+        """Return the lists of "x" (initial point) and "b" (variable
+        bounds) segment lines for the variables in NL column order"""
+        output_fixed_variable_bounds = self._output_fixed_variable_bounds
         var_bound_list = []
         x_init_list = []
-        for ampl_var_id, var_ID in enumerate(full_var_list):
-            var = Vars_dict[var_ID]
+        for ampl_var_id, var in enumerate(var_list):
             if var.value is not None:
                 x_init_list.append("%d %r\n" % (ampl_var_id, var.value))
             if var.fixed:
@@ -1667,147 +1989,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 var_bound_list.append("1 %r\n" % (U))
             else:
                 var_bound_list.append("3\n")
-
-        OUTPUT.write("x%d" % (len(x_init_list)))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t# initial guess")
-        OUTPUT.write("\n")
-        OUTPUT.writelines(x_init_list)
-        del x_init_list
-
-        if show_section_timing:
-            subsection_timer.report("Write initializations")
-            subsection_timer.reset()
-
-        #
-        # "r" lines
-        #
-        OUTPUT.write("r")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d ranges (rhs's)"
-                         % (len(nonlin_con_order_list) + len(lin_con_order_list)))
-        OUTPUT.write("\n")
-        # *NOTE: This iteration follows the assignment of the ampl_con_id
-        OUTPUT.writelines(constraint_bounds_dict[con_ID]
-                          for con_ID in itertools.chain(nonlin_con_order_list,
-                                                        lin_con_order_list))
-
-        if show_section_timing:
-            subsection_timer.report("Write constraint bounds")
-            subsection_timer.reset()
-
-        #
-        # "b" lines
-        #
-        OUTPUT.write("b")
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#%d bounds (on variables)"
-                         % (len(var_bound_list)))
-        OUTPUT.write("\n")
-        OUTPUT.writelines(var_bound_list)
-        del var_bound_list
-
-        if show_section_timing:
-            subsection_timer.report("Write variable bounds")
-            subsection_timer.reset()
-
-        #
-        # "k" lines
-        #
-        ktot = 0
-        n1 = len(full_var_list) - 1
-        OUTPUT.write("k%d" % (n1))
-        if symbolic_solver_labels:
-            OUTPUT.write("\t#intermediate Jacobian column lengths")
-        OUTPUT.write("\n")
-        ktot = 0
-        for i in xrange(n1):
-            ktot += cu[i]
-            OUTPUT.write("%d\n"%(ktot))
-        del cu
-
-        if show_section_timing:
-            subsection_timer.report("Write k lines")
-            subsection_timer.reset()
-
-        #
-        # "J" lines
-        #
-        for nc, con_ID in enumerate(itertools.chain(nonlin_con_order_list,
-                                                    lin_con_order_list)):
-            con_data, wrapped_repn = Constraints_dict[con_ID]
-            numnonlinear_vars = len(wrapped_repn.nonlinear_vars)
-            numlinear_vars = len(wrapped_repn.linear_vars)
-            if numnonlinear_vars == 0:
-                if numlinear_vars > 0:
-                    linear_dict = dict((var_ID, coef)
-                                       for var_ID, coef in
-                                       zip(wrapped_repn.linear_vars,
-                                           wrapped_repn.repn.linear_coefs))
-                    OUTPUT.write("J%d %d\n"%(nc, numlinear_vars))
-                    OUTPUT.writelines(
-                        "%d %r\n" % (self_ampl_var_id[con_var],
-                                     linear_dict[con_var])
-                        for con_var in sorted(linear_dict.keys()))
-            elif numlinear_vars == 0:
-                nl_con_vars = \
-                    sorted(wrapped_repn.nonlinear_vars)
-                OUTPUT.write("J%d %d\n"%(nc, numnonlinear_vars))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
-            else:
-                con_vars = set(wrapped_repn.nonlinear_vars)
-                nl_con_vars = sorted(
-                    con_vars.difference(
-                        wrapped_repn.linear_vars))
-                con_vars.update(wrapped_repn.linear_vars)
-                linear_dict = dict(
-                    (var_ID, coef) for var_ID, coef in
-                    zip(wrapped_repn.linear_vars,
-                        wrapped_repn.repn.linear_coefs))
-                OUTPUT.write("J%d %d\n"%(nc, len(con_vars)))
-                OUTPUT.writelines(
-                    "%d %r\n" % (self_ampl_var_id[con_var],
-                                 linear_dict[con_var])
-                    for con_var in sorted(linear_dict.keys()))
-                OUTPUT.writelines(
-                    "%d 0\n"%(self_ampl_var_id[con_var])
-                    for con_var in nl_con_vars)
-
-
-        if show_section_timing:
-            subsection_timer.report("Write J lines")
-            subsection_timer.reset()
-
-        #
-        # "G" lines
-        #
-        for obj_ID, (obj, wrapped_repn) in \
-               iteritems(Objectives_dict):
-
-            grad_entries = {}
-            for idx, obj_var in enumerate(
-                    wrapped_repn.linear_vars):
-                grad_entries[self_ampl_var_id[obj_var]] = \
-                    wrapped_repn.repn.linear_coefs[idx]
-            for obj_var in wrapped_repn.nonlinear_vars:
-                if obj_var not in wrapped_repn.linear_vars:
-                    grad_entries[self_ampl_var_id[obj_var]] = 0
-            len_ge = len(grad_entries)
-            if len_ge > 0:
-                OUTPUT.write("G%d %d\n" % (self_ampl_obj_id[obj_ID],
-                                           len_ge))
-                for var_ID in sorted(grad_entries.keys()):
-                    OUTPUT.write("%d %r\n" % (var_ID,
-                                              grad_entries[var_ID]))
-
-        if show_section_timing:
-            subsection_timer.report("Write G lines")
-            subsection_timer.reset()
-            overall_timer.report("Total time")
-
-        return symbol_map
+        return x_init_list, var_bound_list
 
     def _symbolMapKeyError(self, err, model, map, vars):
         _errors = []
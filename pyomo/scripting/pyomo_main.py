@@ -43,6 +43,8 @@ def main(args=None, get_return=False):
     #
     from pyomo.scripting import pyomo_parser
     import pyomo.environ
+    # The pyomo subcommands (and help) use the plugins in all packages
+    pyomo.environ._import_packages(deferred=True)
     #
     # Parse the arguments
     #
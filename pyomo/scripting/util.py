@@ -59,6 +59,7 @@ memory_data = Options()
 
 import pyutilib.misc
 from pyomo.common.plugin import ExtensionPoint, Plugin, implements
+from pyomo.common.timing import ConstructionProfiler, tracemalloc
 from pyutilib.misc import Container
 from pyutilib.services import TempfileManager
 
@@ -68,6 +69,7 @@ from pyomo.opt.parallel import SolverManagerFactory
 from pyomo.dataportal import DataPortal
 from pyomo.core import *
 from pyomo.core.base import TextLabeler
+from pyomo.util.model_memory import build_memory_report, format_memory_report
 import pyomo.core.base
 
 
@@ -510,6 +512,13 @@ def create_model(data):
             data.local.max_memory = mem_used
         print("   Total memory = %d bytes following Pyomo instance creation" % mem_used)
 
+    if data.options.runtime.memory_report:
+        print("")
+        print("      Memory used by the model components (bytes)")
+        print(format_memory_report(build_memory_report(instance),
+                                   data.options.runtime.memory_report))
+        print("")
+
     return pyutilib.misc.Options(
                     model=model, instance=instance,
                     smap_id=smap_id, filename=fname, local=data.local )
@@ -933,6 +942,15 @@ def run_command(command=None, parser=None, args=None, name='unknown', data=None,
     #
     configure_loggers(options=options)
     #
+    # Record the construction and transformation timers
+    #
+    profiler = None
+    if options.runtime.profile_construction:
+        profiler = ConstructionProfiler(
+            memory=bool(options.runtime.profile_memory)
+            and tracemalloc is not None)
+        profiler.start()
+    #
     # Call the main Pyomo runner with profiling
     #
     TempfileManager.push()
@@ -1015,6 +1033,10 @@ def run_command(command=None, parser=None, args=None, name='unknown', data=None,
             logger.error(msg+errStr)
             errorcode = 1
 
+    if profiler is not None:
+        profiler.stop()
+        profiler.write(options.runtime.profile_construction)
+
     configure_loggers(shutdown=True)
 
     if options.runtime.disable_gc:
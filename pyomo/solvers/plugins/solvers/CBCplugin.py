@@ -25,6 +25,7 @@ from pyomo.opt.base import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
+from pyomo.opt.solver.progress import LogProgressParser
 from pyomo.solvers.mockmip import MockMIP
 
 logger = logging.getLogger('pyomo.solvers')
@@ -57,6 +58,46 @@ def configure_cbc():
         _cbc_old_version = _cbc_version < (2,7,0,0)
 
 
+class CBCLogParser(LogProgressParser):
+    """Extract progress events from the CBC branch-and-bound log"""
+
+    # Cbc0010I After 100 nodes, 12 on tree, 56 best solution,
+    #     best possible 50 (2.35 seconds)
+    _node_re = re.compile(
+        r'Cbc0010I After (\d+) nodes, \d+ on tree, (\S+) best solution, '
+        r'best possible (\S+) \(([\d.]+) seconds\)')
+    # Cbc0012I Integer solution of 56 found by DiveCoefficient after
+    #     123 iterations and 0 nodes (0.12 seconds)
+    _solution_re = re.compile(
+        r'Cbc00(?:04|12|16)I Integer solution of (\S+) found.* after '
+        r'\d+ iterations and (\d+) nodes \(([\d.]+) seconds\)')
+    # Cbc0001I Search completed - best objective 56, took 2300
+    #     iterations and 120 nodes (3.21 seconds)
+    _completed_re = re.compile(
+        r'Cbc0001I Search completed - best objective (\S+), took '
+        r'\d+ iterations and (\d+) nodes \(([\d.]+) seconds\)')
+
+    def parse_line(self, line):
+        if not line.startswith('Cbc00'):
+            return None
+        m = self._node_re.match(line)
+        if m is not None:
+            return self._event(incumbent=self._to_float(m.group(2)),
+                               bound=self._to_float(m.group(3)),
+                               iteration=int(m.group(1)),
+                               time=float(m.group(4)),
+                               line=line)
+        m = self._solution_re.match(line)
+        if m is None:
+            m = self._completed_re.match(line)
+        if m is not None:
+            return self._event(incumbent=self._to_float(m.group(1)),
+                               iteration=int(m.group(2)),
+                               time=float(m.group(3)),
+                               line=line)
+        return None
+
+
 @SolverFactory.register('cbc', doc='The CBC LP/MIP solver')
 class CBC(OptSolver):
     """The CBC LP/MIP solver
@@ -198,6 +239,9 @@ class CBCSHELL(SystemCallSolver):
             return _extract_version('')
         return _cbc_version
 
+    def _progress_parser(self):
+        return CBCLogParser()
+
     def create_command_line(self, executable, problem_files):
         #
         # Define the log file
@@ -510,6 +554,12 @@ class CBCSHELL(SystemCallSolver):
                     else:
                         print("***WARNING: CBC plugin currently not processing this solution status correctly. Full status line is: "+line.strip())
 
+                elif len(tokens) > 2 and tokens[0:3] == ['Stopped','on','ctrl-c']:
+                    # CBC was interrupted (e.g., by the progress monitor)
+                    results.solver.termination_condition = TerminationCondition.userInterrupt
+                    solution.gap = None
+                    optim_value = float(tokens[-1])
+
                 elif tokens[0] in ("Optimal", "Infeasible", "Unbounded", "Stopped", "Integer", "Status"):
                     print("***WARNING: CBC plugin currently not processing solution status="+tokens[0]+" correctly. Full status line is: "+line.strip())
 
@@ -22,7 +22,10 @@ from pyomo.opt.base import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
+from pyomo.opt.solver.progress import LogProgressParser
 from pyomo.solvers.mockmip import MockMIP
+from pyomo.solvers.plugins.solvers.warmstart import (collect_mip_start,
+                                                     write_cplex_mst)
 from pyomo.core.kernel.block import IBlock
 
 logger = logging.getLogger('pyomo.solvers')
@@ -67,6 +70,41 @@ _validate_file_name.illegal_characters = re.compile(
     '[^%s]' % (_validate_file_name.allowed_characters,))
 
 
+class CPLEXLogParser(LogProgressParser):
+    """Extract progress events from the CPLEX MIP node log.
+
+    Node log lines have the columns
+      Node  Left  Objective  IInf  Best Integer  Best Bound  ItCnt  Gap
+    where columns may be empty (e.g., before an incumbent is found) or
+    hold a keyword (e.g., 'infeasible').  The incumbent and bound are
+    the last two decimal numbers on a line that reports a gap, and
+    the bound is the last decimal number on a line without a gap.
+    """
+
+    _node_re = re.compile(r'\*?\s*(\d+)\+?\s+(\d+)\+?\s')
+
+    def parse_line(self, line):
+        m = self._node_re.match(line)
+        if m is None:
+            return None
+        tokens = line[m.end():].split()
+        gap = None
+        if tokens and tokens[-1].endswith('%'):
+            gap = float(tokens.pop()[:-1])/100.0
+        values = [self._to_float(tok) for tok in tokens if '.' in tok]
+        if gap is not None and len(values) >= 2:
+            incumbent, bound = values[-2:]
+        elif gap is None and values:
+            incumbent, bound = None, values[-1]
+        else:
+            return None
+        return self._event(incumbent=incumbent,
+                           bound=bound,
+                           gap=gap,
+                           iteration=int(m.group(1)),
+                           line=line)
+
+
 @SolverFactory.register('cplex', doc='The CPLEX LP/MIP solver')
 class CPLEX(OptSolver):
     """The CPLEX LP/MIP solver
@@ -161,44 +199,17 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
     # write a warm-start file in the CPLEX MST format.
     #
     def _warm_start(self, instance):
-
-        from pyomo.core.base import Var
-
-        # for each variable in the symbol_map, add a child to the
-        # variables element.  Both continuous and discrete are accepted
-        # (and required, depending on other options), according to the
-        # CPLEX manual.
+        # write the values of the discrete variables in the
+        # symbol_map, in the order they are declared on the instance.
         # **Note**: This assumes that the symbol_map is "clean", i.e.,
         # contains only references to the variables encountered in constraints
-        output_index = 0
         if isinstance(instance, IBlock):
             smap = getattr(instance,"._symbol_maps")\
                    [self._smap_id]
         else:
             smap = instance.solutions.symbol_map[self._smap_id]
-        byObject = smap.byObject
-
-        # in principle, one could use a Python XML writer library like
-        # xml.dom.minidom.  it works, but it is slow. hence, the
-        # explicit direct-write of XML below.
-
-        with open(self._warm_start_file_name, "w") as mst_file:
-            mst_file.write("<?xml version=\"1.0\" ?>\n")
-            mst_file.write("<CPLEXSolution version=\"1.0\">\n")
-            mst_file.write("<header/>\n")
-            mst_file.write("<quality/>\n")
-            mst_file.write("<variables>\n")
-            for var in instance.component_data_objects(Var):
-                if (var.value is not None) and \
-                   (id(var) in byObject):
-                    name = byObject[id(var)]
-                    mst_file.write("<variable index=\"%d\" "
-                                   "name=\"%s\" value=\"%f\" />\n"
-                                   % (output_index, name, var.value))
-                    output_index = output_index + 1
-
-            mst_file.write("</variables>\n")
-            mst_file.write("</CPLEXSolution>\n")
+        symbols, values = collect_mip_start(smap, instance)
+        write_cplex_mst(self._warm_start_file_name, symbols, values)
 
     # over-ride presolve to extract the warm-start keyword, if specified.
     def _presolve(self, *args, **kwds):
@@ -278,6 +289,9 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
         results = pyutilib.subprocess.run( [solver_exec,'-c','quit'], timelimit=1 )
         return _extract_version(results[1])
 
+    def _progress_parser(self):
+        return CPLEXLogParser()
+
     def create_command_line(self, executable, problem_files):
 
         #
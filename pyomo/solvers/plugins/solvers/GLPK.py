@@ -21,6 +21,7 @@ from pyutilib.services import TempfileManager
 from pyomo.opt import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.progress import LogProgressParser, SolverProgress
 
 from six import iteritems, string_types
 
@@ -57,6 +58,37 @@ GLP_NOFEAS = 'n'  # no feasible solution exists
 GLP_OPT    = 'o'  # solution is optimal
 
 
+class GLPKLogParser(LogProgressParser):
+    """Extract progress events from the glpsol simplex and
+    branch-and-bound logs"""
+
+    # +   123: mip =   1.000000000e+01 >=   8.000000000e+00  20.0% (5; 0)
+    # +   456: >>>>>   9.000000000e+00 >=   8.000000000e+00  11.1% (7; 2)
+    # +     0: mip =     not found yet >=              -inf        (1; 0)
+    _mip_re = re.compile(
+        r'\+\s*(\d+): (?:mip =|>>>>>)\s+(not found yet|\S+)\s+[<>]=\s+(\S+)'
+        r'(?:\s+([\d.]+)%)?')
+    # *    12: obj =   1.000000000e+01 inf =   0.000e+00 (0)
+    _lp_re = re.compile(r'[ *]\s*(\d+): obj =\s+(\S+)\s+infe?a?s? =\s+(\S+)')
+
+    def parse_line(self, line):
+        m = self._mip_re.match(line)
+        if m is not None:
+            gap = m.group(4)
+            return self._event(incumbent=self._to_float(m.group(2)),
+                               bound=self._to_float(m.group(3)),
+                               gap=None if gap is None else float(gap)/100.0,
+                               iteration=int(m.group(1)),
+                               line=line)
+        m = self._lp_re.match(line)
+        if m is not None:
+            return SolverProgress(objective=self._to_float(m.group(2)),
+                                  infeasibility=self._to_float(m.group(3)),
+                                  iteration=int(m.group(1)),
+                                  line=line)
+        return None
+
+
 @SolverFactory.register('glpk', doc='The GLPK LP/MIP solver')
 class GLPK(OptSolver):
     """The GLPK LP/MIP solver"""
@@ -160,6 +192,9 @@ class GLPKSHELL(SystemCallSolver):
             return _extract_version('')
         return _glpk_version
 
+    def _progress_parser(self):
+        return GLPKLogParser()
+
     def create_command_line(self, executable, problem_files):
         #
         # Define log file
@@ -23,6 +23,8 @@ from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
 from pyomo.core.kernel.block import IBlock
+from pyomo.solvers.plugins.solvers.warmstart import (collect_mip_start,
+                                                     write_gurobi_mst)
 
 logger = logging.getLogger('pyomo.solvers')
 
@@ -161,29 +163,17 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
     # write a warm-start file in the GUROBI MST format, which is *not* the same as the CPLEX MST format.
     #
     def _warm_start(self, instance):
-
-        from pyomo.core.base import Var
-
-        # for each variable in the symbol_map, add a child to the
-        # variables element.  Both continuous and discrete are accepted
-        # (and required, depending on other options), according to the
-        # CPLEX manual.
+        # write the values of the discrete variables in the
+        # symbol_map, in the order they are declared on the instance.
         # **Note**: This assumes that the symbol_map is "clean", i.e.,
         # contains only references to the variables encountered in constraints
-        output_index = 0
         if isinstance(instance, IBlock):
             smap = getattr(instance,"._symbol_maps")\
                    [self._smap_id]
         else:
             smap = instance.solutions.symbol_map[self._smap_id]
-        byObject = smap.byObject
-        with open(self._warm_start_file_name, 'w') as mst_file:
-            for vdata in instance.component_data_objects(Var):
-                if (vdata.value is not None) and \
-                   (id(vdata) in byObject):
-                    name = byObject[id(vdata)]
-                    mst_file.write("%s %s\n"
-                                   % (name, vdata.value))
+        symbols, values = collect_mip_start(smap, instance)
+        write_gurobi_mst(self._warm_start_file_name, symbols, values)
 
     # over-ride presolve to extract the warm-start keyword, if specified.
     def _presolve(self, *args, **kwds):
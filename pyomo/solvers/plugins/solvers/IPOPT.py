@@ -9,6 +9,7 @@
 #  ___________________________________________________________________________
 
 import os
+import re
 
 import pyomo.common
 import pyutilib.misc
@@ -17,6 +18,7 @@ from pyomo.opt.base import *
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
+from pyomo.opt.solver.progress import LogProgressParser, SolverProgress
 
 import logging
 logger = logging.getLogger('pyomo.solvers')
@@ -27,6 +29,27 @@ except:
     basestring = str
 
 
+class IPOPTLogParser(LogProgressParser):
+    """Extract progress events from the Ipopt iteration log"""
+
+    # iter    objective    inf_pr   inf_du lg(mu)  ||d||  lg(rg) ...
+    #   10  1.2345678e+00 1.00e-08 2.00e-06  -5.7 1.00e-02    - ...
+    #   11r 1.2345678e+00 1.00e-08 2.00e-06  -5.7 1.00e-02    - ...
+    _iter_re = re.compile(r'\s*(\d+)r?\s+(\S+)\s+(\S+)\s+\S+\s+\S+\s+\S+')
+
+    def parse_line(self, line):
+        m = self._iter_re.match(line)
+        if m is None:
+            return None
+        objective = self._to_float(m.group(2))
+        if objective is None:
+            return None
+        return SolverProgress(objective=objective,
+                              infeasibility=self._to_float(m.group(3)),
+                              iteration=int(m.group(1)),
+                              line=line)
+
+
 @SolverFactory.register('ipopt', doc='The Ipopt NLP solver')
 class IPOPT(SystemCallSolver):
     """
@@ -79,6 +102,9 @@ class IPOPT(SystemCallSolver):
         results = pyutilib.subprocess.run( [solver_exec,"-v"], timelimit=1 )
         return _extract_version(results[1])
 
+    def _progress_parser(self):
+        return IPOPTLogParser()
+
     def create_command_line(self, executable, problem_files):
 
         assert(self._problem_format == ProblemFormat.nl)
@@ -24,6 +24,7 @@ import pyomo.solvers.plugins.solvers.SCIPAMPL
 import pyomo.solvers.plugins.solvers.CONOPT
 import pyomo.solvers.plugins.solvers.XPRESS
 import pyomo.solvers.plugins.solvers.IPOPT
+import pyomo.solvers.plugins.solvers.asl_persistent
 import pyomo.solvers.plugins.solvers.gurobi_direct
 import pyomo.solvers.plugins.solvers.gurobi_persistent
 import pyomo.solvers.plugins.solvers.cplex_direct
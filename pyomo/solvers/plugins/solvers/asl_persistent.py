@@ -0,0 +1,337 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import logging
+
+import pyutilib.services
+
+from pyomo.core.base.block import _BlockData
+from pyomo.core.base.constraint import Constraint
+from pyomo.core.base.objective import Objective
+from pyomo.core.base.sos import SOSConstraint
+from pyomo.core.base.suffix import Suffix
+from pyomo.core.expr.current import (identify_variables,
+                                     identify_mutable_parameters)
+from pyomo.core.expr.numvalue import native_types, value
+from pyomo.opt.base import ProblemFormat, SolverFactory
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.repn.plugins.ampl.ampl_ import ProblemWriter_nl
+from pyomo.repn.standard_repn import generate_standard_repn
+from pyomo.solvers.plugins.solvers.ASL import ASL
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPT
+
+logger = logging.getLogger('pyomo.solvers')
+
+
+class _NLModelState(object):
+    """The state of a model when its NL file was last written from
+    scratch.  This is compared against the current model to decide if
+    the cached NL segments can be reused."""
+
+    __slots__ = ('model', 'writer', 'io_options', 'constraints',
+                 'objectives', 'sos', 'named_expressions', 'variables',
+                 'row_params', 'objective_params')
+
+    def __init__(self, model, writer, io_options):
+        self.model = model
+        self.writer = writer
+        self.io_options = io_options
+        self.constraints = _constraint_state(model)
+        self.objectives = _objective_state(model)
+        self.sos = _sos_state(model)
+        self.named_expressions = _named_expression_state(
+            [con.body for con, body, has_lb, has_ub in self.constraints] +
+            [expr for obj, expr, sense in self.objectives])
+
+        variables = {}
+        self.objective_params = []
+        for obj, expr, sense in self.objectives:
+            self.objective_params.extend(
+                (p, p.value) for p in identify_mutable_parameters(expr))
+            for v in identify_variables(expr, include_fixed=True):
+                variables[id(v)] = v
+        self.row_params = []
+        for row in writer.segments.rows:
+            body = row[0].body
+            params = list(identify_mutable_parameters(body))
+            if params:
+                self.row_params.append(
+                    (row, [(p, p.value) for p in params]))
+            for v in identify_variables(body, include_fixed=True):
+                variables[id(v)] = v
+        for v in writer.segments.var_list:
+            variables[id(v)] = v
+        self.variables = [(v, v.fixed, v.value if v.fixed else None,
+                           v.domain)
+                          for v in variables.values()]
+
+
+def _constraint_state(model):
+    return [(con, con.body, con.has_lb(), con.has_ub())
+            for con in model.component_data_objects(Constraint,
+                                                    active=True,
+                                                    descend_into=True)]
+
+def _objective_state(model):
+    return [(obj, obj.expr, obj.sense)
+            for obj in model.component_data_objects(Objective,
+                                                    active=True,
+                                                    descend_into=True)]
+
+def _sos_state(model):
+    return [(sos, sos.level,
+             tuple((id(v), w) for v, w in sos.get_items()))
+            for sos in model.component_data_objects(SOSConstraint,
+                                                    active=True,
+                                                    descend_into=True)]
+
+def _named_expression_state(exprs):
+    """Return the named expressions (e.g., Expression components)
+    that appear in the expressions, together with their current
+    expressions.  The bodies of the constraints and objectives are
+    compared by identity, so the named expressions in them must be
+    checked separately."""
+    ans = {}
+    stack = list(exprs)
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types or not node.is_expression_type():
+            continue
+        if node.is_named_expression_type():
+            if id(node) in ans:
+                continue
+            ans[id(node)] = (node, node.expr)
+        stack.extend(node.args)
+    return list(ans.values())
+
+def _same_state(old, new, n_components):
+    """Compare two lists of state tuples: the first n_components
+    entries of each tuple are compared by identity (comparing Pyomo
+    components or expressions with == would generate an expression),
+    the rest by value"""
+    if len(old) != len(new):
+        return False
+    for old_item, new_item in zip(old, new):
+        for a, b in zip(old_item[:n_components], new_item[:n_components]):
+            if a is not b:
+                return False
+        if old_item[n_components:] != new_item[n_components:]:
+            return False
+    return True
+
+def _linear_repn(constraint_data):
+    if constraint_data._linear_canonical_form:
+        return constraint_data.canonical_form()
+    return generate_standard_repn(constraint_data.body, quadratic=False)
+
+
+class ASLPersistentMixin(object):
+    """Reuse the NL file structure across solves of the same model.
+
+    The first solve writes the NL file from scratch and keeps the
+    pieces of the file that depend only on the model structure (the
+    expression graphs in the "C" and "O" segments and the Jacobian and
+    gradient sparsity in the "k", "J", and "G" segments).  Subsequent
+    solves of the same model only regenerate the suffixes ("S" and
+    "d"), initial point ("x"), constraint bounds ("r"), and variable
+    bounds ("b").  Changes to mutable parameters that only appear in
+    the constant term of a linear constraint are handled by updating
+    that constant.
+
+    The NL file is written from scratch whenever the model structure
+    changes: constraints or objectives are added, removed,
+    (de)activated, or given new expressions, variables are fixed,
+    unfixed, or change domain, the value of a fixed variable changes,
+    the expression of a named Expression used in a constraint or
+    objective is replaced, a mutable parameter used in an objective or
+    nonlinear constraint (or in the coefficients of a linear
+    constraint) changes, or a constraint changes the type of its
+    bounds (e.g., from an inequality to an equality).
+
+    The model must not have complementarity conditions (these are
+    transformed by the 'asl' interface before every solve).
+
+    Keyword arguments to solve():
+        warmstart: if True, prepare the solver to start from the
+            current point (see _set_warm_start()).  The initial point
+            is always written to the NL file.
+    """
+
+    def _init_persistent(self):
+        self._nl_state = None
+        self._warmstart = False
+        # The number of times the NL file was written from scratch and
+        # regenerated from the cached segments
+        self.nl_full_writes = 0
+        self.nl_segment_writes = 0
+
+    def reset(self):
+        """Discard the cached NL file structure"""
+        self._nl_state = None
+        super(ASLPersistentMixin, self).reset()
+
+    def warm_start_capable(self):
+        return True
+
+    def _presolve(self, *args, **kwds):
+        self._warmstart = kwds.pop("warmstart", False)
+        if self._warmstart and len(args) and isinstance(args[0], _BlockData):
+            self._set_warm_start(args[0])
+        # Skip the 'mpec.nl' transformation applied by the ASL
+        # interface: it would change the model structure on every
+        # solve
+        SystemCallSolver._presolve(self, *args, **kwds)
+
+    def _postsolve(self):
+        return SystemCallSolver._postsolve(self)
+
+    def _set_warm_start(self, model):
+        """Set the solver-specific options and suffixes to warm start
+        the next solve of the model."""
+        pass
+
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
+        if (len(args) != 1) or (not isinstance(args[0], _BlockData)) or \
+           (problem_format != ProblemFormat.nl):
+            self._nl_state = None
+            return super(ASLPersistentMixin, self)._convert_problem(
+                args, problem_format, valid_problem_formats, **kwds)
+
+        model = args[0]
+        io_options = dict(kwds)
+        filename = pyutilib.services.TempfileManager.\
+                   create_tempfile(suffix='.pyomo.nl')
+        state = self._nl_state
+        if (state is None) or (not self._update_segments(model, io_options)) \
+           or (not state.writer._write_segments(filename)):
+            self._nl_state = None
+            state = self._write_nl(model, filename, io_options)
+        else:
+            self.nl_segment_writes += 1
+
+        if not hasattr(model, 'solutions'):
+            # See the comment in _BlockData.write
+            from pyomo.core.base.PyomoModel import ModelSolutions
+            model.solutions = ModelSolutions(model)
+        symbol_map = state.writer.segments.symbol_map
+        model.solutions.add_symbol_map(symbol_map)
+        return (filename,), ProblemFormat.nl, id(symbol_map)
+
+    def _write_nl(self, model, filename, io_options):
+        writer = ProblemWriter_nl()
+        writer._record_segments = True
+        writer(model, filename, self.has_capability, io_options)
+        self._nl_state = _NLModelState(model, writer, io_options)
+        self.nl_full_writes += 1
+        return self._nl_state
+
+    def _update_segments(self, model, io_options):
+        """Check if the cached NL segments are still valid for the
+        model, updating the constant terms of linear constraints
+        that depend on mutable parameters.  Returns False if the NL
+        file must be written from scratch."""
+        state = self._nl_state
+        if (model is not state.model) or (io_options != state.io_options):
+            return False
+        if not _same_state(state.constraints, _constraint_state(model), 2):
+            return False
+        if not _same_state(state.objectives, _objective_state(model), 2):
+            return False
+        if not _same_state(state.sos, _sos_state(model), 1):
+            return False
+        for named_expr, expr in state.named_expressions:
+            if named_expr.expr is not expr:
+                return False
+        for v, fixed, val, domain in state.variables:
+            if (v.fixed != fixed) or (v.domain is not domain):
+                return False
+            if fixed and v.value != val:
+                return False
+        for p, val in state.objective_params:
+            if p.value != val:
+                return False
+
+        for row, params in state.row_params:
+            if all(p.value == val for p, val in params):
+                continue
+            constraint_data, repn, bounds_line = row
+            if not repn.is_linear():
+                return False
+            new_repn = _linear_repn(constraint_data)
+            if (not new_repn.is_linear()) or \
+               (len(new_repn.linear_vars) != len(repn.linear_vars)):
+                return False
+            for v1, v2 in zip(new_repn.linear_vars, repn.linear_vars):
+                if v1 is not v2:
+                    return False
+            for c1, c2 in zip(new_repn.linear_coefs, repn.linear_coefs):
+                if value(c1) != value(c2):
+                    return False
+            row[1] = new_repn
+            params[:] = [(p, p.value) for p, val in params]
+        return True
+
+
+@SolverFactory.register('ipopt_persistent',
+                        doc='The Ipopt NLP solver, reusing the NL file '
+                            'structure across solves')
+class IPOPTPersistent(ASLPersistentMixin, IPOPT):
+    """
+    An interface to the Ipopt optimizer that only regenerates the
+    bounds, initial point, and suffixes in the NL file when the same
+    model is solved repeatedly.
+    """
+
+    def __init__(self, **kwds):
+        super(IPOPTPersistent, self).__init__(**kwds)
+        self._init_persistent()
+
+    def _set_warm_start(self, model):
+        """Set the Ipopt warm_start_init_point option and copy the
+        values of the 'ipopt_zL_out' and 'ipopt_zU_out' import
+        suffixes (the bound multipliers from the last solve) to the
+        'ipopt_zL_in' and 'ipopt_zU_in' export suffixes, if those are
+        declared on the model.
+
+        This is called by solve() (through _presolve()), where
+        self.options holds the options of the current solve only, so
+        the option does not carry over to later solves.
+        """
+        self.options['warm_start_init_point'] = 'yes'
+        for name in ('zL', 'zU'):
+            suffix_in = model.component('ipopt_%s_in' % (name,))
+            suffix_out = model.component('ipopt_%s_out' % (name,))
+            if (suffix_in is None) or (suffix_out is None) or \
+               (suffix_in.type() is not Suffix) or \
+               (suffix_out.type() is not Suffix):
+                continue
+            suffix_in.update_values(suffix_out.items())
+
+
+@SolverFactory.register('asl_persistent',
+                        doc='Interface for solvers using the AMPL Solver '
+                            'Library, reusing the NL file structure '
+                            'across solves')
+class ASLPersistent(ASLPersistentMixin, ASL):
+    """
+    A generic interface to solvers using the AMPL Solver Library that
+    only regenerates the bounds, initial point, and suffixes in the NL
+    file when the same model is solved repeatedly.
+    """
+
+    def __init__(self, **kwds):
+        if not 'type' in kwds:
+            kwds["type"] = "asl_persistent"
+        super(ASLPersistent, self).__init__(**kwds)
+        self._init_persistent()
@@ -22,6 +22,7 @@ from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPe
 from pyomo.core.kernel.objective import minimize, maximize
 from pyomo.core.kernel.component_set import ComponentSet
 from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.core.base.solution_pool import SolutionPool
 from pyomo.opt.results.results_ import SolverResults
 from pyomo.opt.results.solution import Solution, SolutionStatus
 from pyomo.opt.results.solver import TerminationCondition, SolverStatus
@@ -678,18 +679,35 @@ class CPLEXDirect(DirectSolver):
         if cpxprob.get_problem_type() in [cpxprob.problem_type.MILP,
                                           cpxprob.problem_type.MIQP,
                                           cpxprob.problem_type.MIQCP]:
+            # pass the values of the discrete variables to CPLEX in a
+            # single call
             var_names = []
             var_values = []
             for pyomo_var, cplex_var in self._pyomo_var_to_solver_var_map.items():
-                if pyomo_var.value is not None:
+                val = pyomo_var.value
+                if (val is not None) and (not pyomo_var.is_continuous()):
                     var_names.append(cplex_var)
-                    var_values.append(value(pyomo_var))
+                    var_values.append(val)
 
             if len(var_names):
                 self._solver_model.MIP_starts.add(
                     [var_names, var_values],
                     self._solver_model.MIP_starts.effort_level.auto)
 
+    def _create_solution_pool(self):
+        cpx_pool = self._solver_model.solution.pool
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        pyomo_vars = [var for var in var_map.keys() if ref_vars[var] > 0]
+        cplex_vars = [var_map[var] for var in pyomo_vars]
+        pool = SolutionPool(pyomo_vars)
+        # The pool is loaded eagerly: the solver model changes with the
+        # next solve
+        for i in range(cpx_pool.get_num()):
+            pool.add(cpx_pool.get_values(i, cplex_vars),
+                     objective=cpx_pool.get_objective_value(i))
+        return pool
+
     def _load_vars(self, vars_to_load=None):
         var_map = self._pyomo_var_to_solver_var_map
         ref_vars = self._referenced_variables
@@ -716,9 +734,9 @@ class CPLEXDirect(DirectSolver):
         cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
 
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                rc[pyomo_var] = vals[i]
+        rc.update_from_arrays(
+            [var for var in vars_to_load if ref_vars[var] > 0],
+            [val for var, val in zip(vars_to_load, vals) if ref_vars[var] > 0])
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -735,9 +753,9 @@ class CPLEXDirect(DirectSolver):
             linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
             vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
 
-        for i, cplex_con in enumerate(linear_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            dual[pyomo_con] = vals[i]
+        dual.update_from_arrays(
+            [reverse_con_map[cplex_con] for cplex_con in linear_cons_to_load],
+            vals)
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -97,20 +97,51 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
             raise ValueError('The Var provided to compile_var needs to be added first: {0}'.format(var))
         cplex_var = self._pyomo_var_to_solver_var_map[var]
         vtype = self._cplex_vtype_from_var(var)
-        if var.is_fixed():
-            lb = var.value
-            ub = var.value
-        else:
-            lb = -self._cplex.infinity
-            ub = self._cplex.infinity
-            if var.has_lb():
-                lb = value(var.lb)
-            if var.has_ub():
-                ub = value(var.ub)
+        lb, ub = self._cplex_bounds_from_var(var)
         self._solver_model.variables.set_lower_bounds(cplex_var, lb)
         self._solver_model.variables.set_upper_bounds(cplex_var, ub)
         self._solver_model.variables.set_types(cplex_var, vtype)
 
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This will update bounds, fix/unfix the variables as needed, and
+        update the variable types, with one call to cplex for each
+        attribute.
+
+        Parameters
+        ----------
+        variables: iterable of Var (scalar Vars, single _VarData, or indexed Vars)
+
+        """
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in self._expand_vars(variables):
+            if var not in self._pyomo_var_to_solver_var_map:
+                raise ValueError('The Var provided to update_vars needs to be added first: {0}'.format(var))
+            cplex_var = self._pyomo_var_to_solver_var_map[var]
+            lb, ub = self._cplex_bounds_from_var(var)
+            lbs.append((cplex_var, lb))
+            ubs.append((cplex_var, ub))
+            vtypes.append((cplex_var, self._cplex_vtype_from_var(var)))
+        if not lbs:
+            return
+        self._solver_model.variables.set_lower_bounds(lbs)
+        self._solver_model.variables.set_upper_bounds(ubs)
+        self._solver_model.variables.set_types(vtypes)
+
+    def _cplex_bounds_from_var(self, var):
+        if var.is_fixed():
+            return var.value, var.value
+        lb = -self._cplex.infinity
+        ub = self._cplex.infinity
+        if var.has_lb():
+            lb = value(var.lb)
+        if var.has_ub():
+            ub = value(var.ub)
+        return lb, ub
+
     def write(self, filename, filetype=''):
         """
         Write the model to a file (e.g., and lp file).
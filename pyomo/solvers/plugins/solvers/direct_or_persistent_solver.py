@@ -22,6 +22,9 @@ from pyomo.opt.base.formats import ResultsFormat
 from pyutilib.misc import Options
 from collections import MutableMapping
 
+import logging
+logger = logging.getLogger('pyomo.solvers')
+
 
 class DirectOrPersistentSolver(OptSolver):
     """
@@ -169,8 +172,30 @@ class DirectOrPersistentSolver(OptSolver):
 
     """ This method should be implemented by subclasses."""
     def _postsolve(self):
+        if self._solution_pool:
+            # The pool travels with the results object (and is picked
+            # up by ModelSolutions.load_from); it is attached to the
+            # model directly when the solution is loaded without
+            # saving the results
+            pool = self._create_solution_pool()
+            if self.results is not None:
+                self.results._solution_pool = pool
+            if (pool is not None) and self._load_solutions and \
+               (not self._save_results) and \
+               (getattr(self._pyomo_model, 'solutions', None) is not None):
+                self._pyomo_model.solutions.pool = pool
         return OptSolver._postsolve(self)
 
+    def _create_solution_pool(self):
+        """
+        Return a SolutionPool holding all solutions found by the
+        solver (subclasses that support solution pools override this).
+        """
+        logger.warning("The %s solver plugin does not support solution "
+                       "pools; ignoring the 'solution_pool' keyword"
+                       % (type(self).__name__,))
+        return None
+
     """ This method should be implemented by subclasses."""
     def _set_instance(self, model, kwds={}):
         if not isinstance(model, (Model, IBlock, Block, _BlockData)):
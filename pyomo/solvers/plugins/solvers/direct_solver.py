@@ -179,7 +179,8 @@ class DirectSolver(DirectOrPersistentSolver):
                             _model.solutions.load_from(
                                 result,
                                 select=self._select_index,
-                                default_variable_value=self._default_variable_value)
+                                default_variable_value=self._default_variable_value,
+                                solution_pool=self._solution_pool)
                             result._smap_id = None
                             result.solution.clear()
                         else:
@@ -38,6 +38,8 @@ def configure_glpk_direct():
         print("Import of glpk failed - glpk message="+str(e)+"\n")
         glpk_python_api_exists = False
 
+from six.moves import xrange, zip
+
 from pyutilib.misc import Bunch, Options
 
 from pyomo.opt.base import *
@@ -45,11 +47,122 @@ from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.results import *
 from pyomo.opt.solver import *
 from pyomo.core.base.numvalue import value
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn import generate_standard_repn
 
 import logging
 logger = logging.getLogger('pyomo.solvers')
 
 
+def _glpk_bound_type(lb, ub):
+    """Return the GLPK bound type for a column or row"""
+    if lb is None:
+        if ub is None:
+            return GLP_FR    # Free
+        return GLP_UP        # Upper bounded only
+    if ub is None:
+        return GLP_LO        # Lower bounded only
+    if lb == ub:
+        return GLP_FX        # Fixed
+    return GLP_DB            # Double bounded
+
+
+def _collect_glpk_problem(model):
+    """Collect the GLPK problem data for a linear model.
+
+    The columns are the variables that appear in the active objective
+    and constraints (fixed variables are folded into the constant
+    terms).  The constraint matrix is returned in coordinate form
+    (Ai, Aj, Ar) using GLPK's 1-based row and column indices, so it
+    can be loaded with a single call to glp_load_matrix.
+    """
+    from pyomo.core.base import Var, Objective, Constraint, SOSConstraint
+
+    for soscondata in model.component_data_objects(SOSConstraint, active=True):
+        raise Exception("Solver: glpk_direct does not support SOSConstraint declarations")
+
+    objectives = list(model.component_data_objects(Objective, active=True))
+    if len(objectives) != 1:
+        raise ValueError("Solver: glpk_direct requires exactly one active "
+                         "objective (found %d)" % (len(objectives),))
+    objective = objectives[0]
+
+    data = Bunch(objective_name=objective.name,
+                 minimize=objective.is_minimizing(),
+                 col_names=[], col_lbs=[], col_ubs=[], col_kinds=[],
+                 row_names=[], row_lbs=[], row_ubs=[],
+                 Ai=[], Aj=[], Ar=[],
+                 obj_coefs=[], obj_constant=0.0)
+
+    col_names = data.col_names
+    col_lbs = data.col_lbs
+    col_ubs = data.col_ubs
+    col_kinds = data.col_kinds
+    colvar_map = ComponentMap()
+    def _columns(variables):
+        cols = []
+        for var in variables:
+            col = colvar_map.get(var)
+            if col is None:
+                col_names.append(var.name)
+                col_lbs.append(value(var.lb) if var.has_lb() else None)
+                col_ubs.append(value(var.ub) if var.has_ub() else None)
+                if var.is_binary():
+                    col_kinds.append('B')
+                elif var.is_integer():
+                    col_kinds.append('I')
+                elif var.is_continuous():
+                    col_kinds.append('C')
+                else:
+                    raise TypeError(
+                        "Invalid domain type for variable with name '%s'. "
+                        "Variable is not continuous, integer, or binary."
+                        % (var.name,))
+                col = colvar_map[var] = len(col_names)
+            cols.append(col)
+        return cols
+
+    repn = generate_standard_repn(objective.expr, quadratic=False)
+    if not repn.is_linear():
+        msg = "Nonlinear objective to GLPK.  GLPK can only handle "       \
+              "linear problems."
+        raise RuntimeError( msg )
+    if repn.is_constant():
+        logger.warning( "Ignoring objective '%s' which is constant"
+                        % (objective.name,) )
+    data.obj_constant = value(repn.constant)
+    data.obj_coefs.extend(zip(_columns(repn.linear_vars),
+                              map(value, repn.linear_coefs)))
+
+    Ai = data.Ai
+    Aj = data.Aj
+    Ar = data.Ar
+    row_names = data.row_names
+    row_lbs = data.row_lbs
+    row_ubs = data.row_ubs
+    for constraint in model.component_data_objects(Constraint, active=True):
+        if (not constraint.has_lb()) and (not constraint.has_ub()):
+            continue
+        repn = generate_standard_repn(constraint.body, quadratic=False)
+        if not repn.is_linear():
+            raise RuntimeError(
+                "Nonlinear constraint '%s' to GLPK.  GLPK can only handle "
+                "linear problems." % (constraint.name,))
+        offset = value(repn.constant)
+        row_names.append(constraint.name)
+        row_lbs.append(value(constraint.lower) - offset
+                       if constraint.has_lb() else None)
+        row_ubs.append(value(constraint.upper) - offset
+                       if constraint.has_ub() else None)
+        row = len(row_names)
+        cols = _columns(repn.linear_vars)
+        Ai.extend([row]*len(cols))
+        Aj.extend(cols)
+        Ar.extend(map(value, repn.linear_coefs))
+
+    return data
+
+
 
 @SolverFactory.register('_glpk_direct', doc='Direct Python interface to the GLPK LP/MIP solver.')
 class GLPKDirect ( OptSolver ):
@@ -119,8 +232,6 @@ class GLPKDirect ( OptSolver ):
 
     def _populate_glpk_instance ( self, model ):
 
-        from pyomo.core.base import Var, Objective, Constraint, SOSConstraint
-
         try:
             lp = glp_create_prob()
         except Exception:
@@ -129,181 +240,68 @@ class GLPKDirect ( OptSolver ):
             '\n       the Python bindings for GLPK?\n\n\tError message: %s'
             raise Exception(msg % e)
 
-        objective = sorted( model.component_map(Objective, active=True).values() )[0]
-        # so we can correctly map the solution to the correct objective label in _postsolve
-        lp.objective_name = sorted( model.component_map(Objective, active=True).keys() )[0]
-        sense = GLP_MAX
-        if objective.is_minimizing(): sense = GLP_MIN
-
-        constraint_list = model.component_map(Constraint, active=True)
-        variable_list   = model.component_map(Var)
-        num_constraints = model.statistics.number_of_constraints
-        num_variables   = model.statistics.number_of_variables
+        data = _collect_glpk_problem(model)
 
-        sosn = self._capabilities.sosn
-        sos1 = self._capabilities.sos1
-        sos2 = self._capabilities.sos2
-
-        for soscondata in model.component_data_objects(SOSConstraint, active=True):
-            raise Exception("Solver: glpk_direct does not support SOSConstraint declarations")
+        # so we can correctly map the solution to the correct objective label in _postsolve
+        lp.objective_name = data.objective_name
 
         glp_set_prob_name(lp, model.name)
-
-        glp_set_obj_dir( lp, sense )
-        glp_add_rows( lp, num_constraints )
-        glp_add_cols( lp, num_variables )
-
-        # 1 extra because GLPK's arrays in this context are 1-based, not 0-based
-        coef_count = num_constraints * num_variables + 1
-        Ai = intArray( coef_count )
-        Aj = intArray( coef_count )
-        Ar = doubleArray( coef_count )
-
-        row = col = coef_count = 0
-        colvar_map = dict()
-        rowvar_map = dict()
-
-        # In matrix parlance, variables are columns
-        for name in variable_list:
-            var_set = variable_list[ name ]
-            for ii in var_set:
-                var = var_set[ ii ]
-                if var.fixed is True:
-                    continue
-
-                lb = ub = 0.0
-                if (not var.has_lb()) and \
-                   (not var.has_ub()):
-                    var_type = GLP_FR
-                elif not var.has_lb():
-                    var_type = GLP_UB
-                    ub = value(var.ub)
-                elif not var.has_ub():
-                    var_type = GLP_LO
-                    lb = value(var.lb)
-                else:
-                    var_type = GLP_DB
-                    lb = value(var.lb)
-                    ub = value(var.ub)
-
-                col += 1
-                colvar_map[ var.label ] = col
-
-                # the name is perhaps not necessary, but for completeness ...
-                glp_set_col_name( lp, col, var.label )
-                glp_set_col_bnds( lp, col, var_type, lb, ub )
-
-                # Be sure to impart the integer and binary nature of any variables
-                if var.is_integer():
-                    glp_set_col_kind( lp, col, GLP_IV )
-                elif var.is_binary():
-                    glp_set_col_kind( lp, col, GLP_BV )
-                elif var.is_continuous():
-                    glp_set_col_kind( lp, col, GLP_CV )   # continuous
-                else:
-                    raise TypeError("Invalid domain type for variable with name '%s'. "
-                                    "Variable is not continuous, integer, or binary.")
-
-        model_canonical_repn = getattr(model, "_canonical_repn", None)
-        if model_canonical_repn is None:
-            raise ValueError("No _canonical_repn ComponentMap was found on "
-                             "block with name %s. Did you forget to preprocess?"
-                             % (model.name))
-
-        for name in constraint_list:
-            constraint_set = constraint_list[ name ]
-
-            for ii in constraint_set:
-                constraint = constraint_set[ ii ]
-                if not constraint.active: continue
-                elif (not constraint.has_lb()) and \
-                     (not constraint.has_ub()):
-                    continue
-
-                expression = model_canonical_repn.get(constraint)
-                if constraint is None:
-                    raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                     "block %s for active constraint with name %s. "
-                                     "Did you forget to preprocess?"
-                                     % (model.name, constraint.name))
-
-                offset = 0.0
-                if 0 in expression:
-                    offset = expression[0][None]
-
-                lbound = ubound = -offset
-
-                if constraint.equality:
-                    var_type = GLP_FX    # Fixed
-                    lbound = ubound = constraint.lower() - offset
-                elif not constraint.has_lb():
-                    var_type = GLP_UP    # Upper bounded only
-                    ubound += constraint.upper()
-                elif not constraint.has_ub():
-                    var_type = GLP_LO    # Lower bounded only
-                    lbound += constraint.lower()
-                else:
-                    var_type = GLP_DB    # Double bounded
-                    lbound += constraint.lower()
-                    ubound += constraint.upper()
-
-                row += 1
-                rowvar_map[ constraint.label ] = row
-
-                # just as with variables, set the name just for completeness ...
-                glp_set_row_name( lp, row, constraint.label )
-                glp_set_row_bnds( lp, row, var_type, lbound, ubound )
-
-                if 1 in expression: # first-order terms
-                    keys = sorted( expression[1].keys() )
-                    for var_key in keys:
-                        index = var_key.keys()[0]
-                        var = expression[-1][ index ]
-                        coef  = expression[ 1][ var_key ]
-                        col = colvar_map[ var.label ]
-
-                        coef_count += 1
-                        Ai[ coef_count ] = row
-                        Aj[ coef_count ] = col
-                        Ar[ coef_count ] = coef
-
-        # with the rows and columns named and bounded, load the coefficients
-        glp_load_matrix( lp, coef_count, Ai, Aj, Ar )
-
-        for key in objective:
-
-            expression = model_canonical_repn.get(objective[key])
-            if expression is None:
-                raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                 "block %s for active objective with name %s. "
-                                 "Did you forget to preprocess?"
-                                 % (model.name, objective[key].name))
-
-            if expression.is_constant():
-                msg = "Ignoring objective '%s[%s]' which is constant"
-                logger.warning( msg % (str(objective), str(key)) )
-                continue
-
-            if 1 in expression: # first-order terms
-                keys = sorted( expression[1].keys() )
-                for var_key in keys:
-                    index = var_key.keys()[0]
-                    label = expression[-1][ index ].label
-                    coef  = expression[ 1][ var_key ]
-                    col = colvar_map[ label ]
-                    glp_set_obj_coef( lp, col, coef )
-
-            elif -1 in expression:
-                pass
-            else:
-                msg = "Nonlinear objective to GLPK.  GLPK can only handle "       \
-                      "linear problems."
-                raise RuntimeError( msg )
-
+        glp_set_obj_dir( lp, GLP_MIN if data.minimize else GLP_MAX )
+
+        # In matrix parlance, variables are columns.  GLPK has no array
+        # API for bounds and names, so these are set column by column
+        # (and row by row) using GLPK's 1-based indices.
+        num_cols = len(data.col_names)
+        if num_cols:
+            glp_add_cols( lp, num_cols )
+        set_col_name = glp_set_col_name
+        set_col_bnds = glp_set_col_bnds
+        set_col_kind = glp_set_col_kind
+        col_kinds = {'C': GLP_CV, 'I': GLP_IV, 'B': GLP_BV}
+        for col, name, lb, ub, kind in zip(
+                xrange(1, num_cols+1), data.col_names,
+                data.col_lbs, data.col_ubs, data.col_kinds):
+            # the name is perhaps not necessary, but for completeness ...
+            set_col_name( lp, col, name )
+            set_col_bnds( lp, col, _glpk_bound_type(lb, ub),
+                          0.0 if lb is None else lb,
+                          0.0 if ub is None else ub )
+            # Be sure to impart the integer and binary nature of any variables
+            set_col_kind( lp, col, col_kinds[kind] )
+
+        num_rows = len(data.row_names)
+        if num_rows:
+            glp_add_rows( lp, num_rows )
+        set_row_name = glp_set_row_name
+        set_row_bnds = glp_set_row_bnds
+        for row, name, lb, ub in zip(
+                xrange(1, num_rows+1), data.row_names,
+                data.row_lbs, data.row_ubs):
+            set_row_name( lp, row, name )
+            set_row_bnds( lp, row, _glpk_bound_type(lb, ub),
+                          0.0 if lb is None else lb,
+                          0.0 if ub is None else ub )
+
+        # Load all of the coefficients with a single call (GLPK's arrays
+        # in this context are 1-based, so element 0 is unused)
+        nnz = len(data.Ar)
+        Ai = intArray( nnz + 1 )
+        Aj = intArray( nnz + 1 )
+        Ar = doubleArray( nnz + 1 )
+        for k, i, j, a in zip(xrange(1, nnz+1), data.Ai, data.Aj, data.Ar):
+            Ai[k] = i
+            Aj[k] = j
+            Ar[k] = a
+        glp_load_matrix( lp, nnz, Ai, Aj, Ar )
+
+        set_obj_coef = glp_set_obj_coef
+        set_obj_coef( lp, 0, data.obj_constant )
+        for col, coef in data.obj_coefs:
+            set_obj_coef( lp, col, coef )
 
         self._glpk_instance = lp
-        self._glpk_rowvar_map = rowvar_map
-        self._glpk_colvar_map = colvar_map
+        self._glpk_col_names = data.col_names
+        self._glpk_row_names = data.row_names
 
 
     def warm_start_capable(self):
@@ -579,16 +577,21 @@ class GLPKDirect ( OptSolver ):
             objective_name = lp.objective_name
             soln.objective[objective_name] = {'Value': obj_val}
 
-            colvar_map = self._glpk_colvar_map
-            rowvar_map = self._glpk_rowvar_map
-
-            for var_label in colvar_map:
-                col = colvar_map[ var_label ]
-                soln.variable[ var_label ] = {"Value" : get_col_prim( lp, col )}
-
-            for row_label in rowvar_map:
-                row = rowvar_map[ row_label ]
-                soln.constraint[ row_label ] = {"Value" : get_row_prim( lp, row )}
+            # Extract the primal values for all columns and rows before
+            # building the (much slower) solution dictionaries
+            col_names = self._glpk_col_names
+            row_names = self._glpk_row_names
+            col_vals = [ get_col_prim( lp, col )
+                         for col in xrange(1, len(col_names)+1) ]
+            row_vals = [ get_row_prim( lp, row )
+                         for row in xrange(1, len(row_names)+1) ]
+
+            soln.variable.update(
+                (name, {"Value": val})
+                for name, val in zip(col_names, col_vals) )
+            soln.constraint.update(
+                (name, {"Value": val})
+                for name, val in zip(row_names, row_vals) )
 
         results.solution.insert(soln)
 
@@ -597,6 +600,7 @@ class GLPKDirect ( OptSolver ):
         # All done with the GLPK object, so free up some memory.
         glp_free( lp )
         del self._glpk_instance, lp
+        self._glpk_col_names = self._glpk_row_names = None
 
         # let the base class deal with returning results.
         return OptSolver._postsolve(self)
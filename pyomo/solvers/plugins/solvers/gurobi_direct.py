@@ -27,6 +27,7 @@ from pyomo.opt.results.solution import Solution, SolutionStatus
 from pyomo.opt.results.solver import TerminationCondition, SolverStatus
 from pyomo.opt.base import SolverFactory
 from pyomo.core.base.suffix import Suffix
+from pyomo.core.base.solution_pool import SolutionPool
 import pyomo.core.base.var
 
 
@@ -688,9 +689,37 @@ class GurobiDirect(DirectSolver):
         return True
 
     def _warm_start(self):
+        # set the start values of the discrete variables in a single call
+        gurobipy_vars = []
+        var_values = []
         for pyomo_var, gurobipy_var in self._pyomo_var_to_solver_var_map.items():
-            if pyomo_var.value is not None:
-                gurobipy_var.setAttr(self._gurobipy.GRB.Attr.Start, value(pyomo_var))
+            val = pyomo_var.value
+            if (val is not None) and (not pyomo_var.is_continuous()):
+                gurobipy_vars.append(gurobipy_var)
+                var_values.append(val)
+        if len(gurobipy_vars):
+            self._solver_model.setAttr(self._gurobipy.GRB.Attr.Start,
+                                       gurobipy_vars, var_values)
+
+    def _create_solution_pool(self):
+        gprob = self._solver_model
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        pyomo_vars = [var for var in var_map.keys() if ref_vars[var] > 0]
+        gurobi_vars = [var_map[var] for var in pyomo_vars]
+        pool = SolutionPool(pyomo_vars)
+        # The pool is loaded eagerly: the solver model changes with the
+        # next solve.  SolutionNumber is restored so that later queries
+        # of Xn/PoolObjVal are not affected.
+        solution_number = gprob.Params.SolutionNumber
+        try:
+            for i in range(gprob.SolCount):
+                gprob.setParam('SolutionNumber', i)
+                pool.add(gprob.getAttr("Xn", gurobi_vars),
+                         objective=gprob.PoolObjVal)
+        finally:
+            gprob.setParam('SolutionNumber', solution_number)
+        return pool
 
     def _load_vars(self, vars_to_load=None):
         var_map = self._pyomo_var_to_solver_var_map
@@ -718,9 +747,9 @@ class GurobiDirect(DirectSolver):
         gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        rc.update_from_arrays(
+            [var for var in vars_to_load if ref_vars[var] > 0],
+            [val for var, val in zip(vars_to_load, vals) if ref_vars[var] > 0])
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -742,13 +771,14 @@ class GurobiDirect(DirectSolver):
         if self._version_major >= 5:
             quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
 
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            dual[pyomo_con] = val
+        dual.update_from_arrays(
+            [reverse_con_map[gurobi_con] for gurobi_con in linear_cons_to_load],
+            linear_vals)
         if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                dual[pyomo_con] = val
+            dual.update_from_arrays(
+                [reverse_con_map[gurobi_con]
+                 for gurobi_con in quadratic_cons_to_load],
+                quadratic_vals)
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -114,20 +114,51 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
         if var not in self._pyomo_var_to_solver_var_map:
             raise ValueError('The Var provided to update_var needs to be added first: {0}'.format(var))
         gurobipy_var = self._pyomo_var_to_solver_var_map[var]
-        vtype = self._gurobi_vtype_from_var(var)
-        if var.is_fixed():
-            lb = var.value
-            ub = var.value
-        else:
-            lb = -self._gurobipy.GRB.INFINITY
-            ub = self._gurobipy.GRB.INFINITY
-            if var.has_lb():
-                lb = value(var.lb)
-            if var.has_ub():
-                ub = value(var.ub)
+        lb, ub = self._gurobi_bounds_from_var(var)
         gurobipy_var.setAttr('lb', lb)
         gurobipy_var.setAttr('ub', ub)
-        gurobipy_var.setAttr('vtype', vtype)
+        gurobipy_var.setAttr('vtype', self._gurobi_vtype_from_var(var))
+
+    def update_vars(self, variables):
+        """Update several variables in the solver's model.
+
+        This will update bounds, fix/unfix the variables as needed, and
+        update the variable types, with one call to gurobi for each
+        attribute.
+
+        Parameters
+        ----------
+        variables: iterable of Var (scalar Vars, single _VarData, or indexed Vars)
+
+        """
+        gurobipy_vars = []
+        lbs = []
+        ubs = []
+        vtypes = []
+        for var in self._expand_vars(variables):
+            if var not in self._pyomo_var_to_solver_var_map:
+                raise ValueError('The Var provided to update_vars needs to be added first: {0}'.format(var))
+            gurobipy_vars.append(self._pyomo_var_to_solver_var_map[var])
+            lb, ub = self._gurobi_bounds_from_var(var)
+            lbs.append(lb)
+            ubs.append(ub)
+            vtypes.append(self._gurobi_vtype_from_var(var))
+        if not gurobipy_vars:
+            return
+        self._solver_model.setAttr('lb', gurobipy_vars, lbs)
+        self._solver_model.setAttr('ub', gurobipy_vars, ubs)
+        self._solver_model.setAttr('vtype', gurobipy_vars, vtypes)
+
+    def _gurobi_bounds_from_var(self, var):
+        if var.is_fixed():
+            return var.value, var.value
+        lb = -self._gurobipy.GRB.INFINITY
+        ub = self._gurobipy.GRB.INFINITY
+        if var.has_lb():
+            lb = value(var.lb)
+        if var.has_ub():
+            ub = value(var.ub)
+        return lb, ub
 
     def write(self, filename):
         """
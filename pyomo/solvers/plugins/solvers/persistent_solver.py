@@ -311,6 +311,31 @@ class PersistentSolver(DirectOrPersistentSolver):
         """
         raise NotImplementedError('This method should be implemented by subclasses.')
 
+    def update_vars(self, variables):
+        """
+        Update several variables in the solver's model. This will update bounds, fix/unfix the variables as needed,
+        and update the variable types. Subclasses may override this method to update all of the variables with a
+        single call to the solver.
+
+        Parameters
+        ----------
+        variables: iterable of Var (scalar Vars, single _VarData, or indexed Vars)
+        """
+        for var in self._expand_vars(variables):
+            self.update_var(var)
+
+    @staticmethod
+    def _expand_vars(variables):
+        ans = []
+        for var in variables:
+            # pyomo.kernel variables do not define is_indexed()
+            if getattr(var, 'is_indexed', None) is not None \
+               and var.is_indexed():
+                ans.extend(var.values())
+            else:
+                ans.append(var)
+        return ans
+
     def solve(self, *args, **kwds):
         """
         Solve the model.
@@ -446,7 +471,8 @@ class PersistentSolver(DirectOrPersistentSolver):
                             _model.solutions.load_from(
                                 result,
                                 select=self._select_index,
-                                default_variable_value=self._default_variable_value)
+                                default_variable_value=self._default_variable_value,
+                                solution_pool=self._solution_pool)
                             result._smap_id = None
                             result.solution.clear()
                         else:
@@ -0,0 +1,69 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from six.moves import zip
+
+from pyomo.core.base.var import Var
+from pyomo.core.kernel.block import IBlock
+from pyomo.core.kernel.variable import IVariable
+
+
+def collect_mip_start(symbol_map, instance):
+    """
+    Collect the MIP start stored in the current values of the
+    discrete variables of an instance that are in a symbol map.
+
+    Returns two lists: the symbols and the values of the discrete
+    variables that have a value, in the order in which the variables
+    are declared on the instance (so that the MIP start does not
+    depend on the iteration order of the symbol map).
+    """
+    if isinstance(instance, IBlock):
+        variables = instance.components(ctype=IVariable)
+    else:
+        variables = instance.component_data_objects(Var)
+    byObject = symbol_map.byObject
+    symbols = []
+    values = []
+    for var in variables:
+        symbol = byObject.get(id(var), None)
+        if (symbol is None) or var.is_continuous():
+            continue
+        val = var.value
+        if val is not None:
+            symbols.append(symbol)
+            values.append(val)
+    return symbols, values
+
+
+def write_cplex_mst(filename, symbols, values):
+    """Write a MIP start in the CPLEX MST (XML) format"""
+    # in principle, one could use a Python XML writer library like
+    # xml.dom.minidom.  it works, but it is slow. hence, the explicit
+    # direct-write of XML below.
+    template = "<variable index=\"%d\" name=\"%s\" value=\"%f\" />\n"
+    with open(filename, "w") as mst_file:
+        mst_file.write("<?xml version=\"1.0\" ?>\n"
+                       "<CPLEXSolution version=\"1.0\">\n"
+                       "<header/>\n"
+                       "<quality/>\n"
+                       "<variables>\n")
+        mst_file.write("".join(
+            [template % (i, name, val)
+             for i, (name, val) in enumerate(zip(symbols, values))]))
+        mst_file.write("</variables>\n"
+                       "</CPLEXSolution>\n")
+
+
+def write_gurobi_mst(filename, symbols, values):
+    """Write a MIP start in the GUROBI MST format"""
+    with open(filename, "w") as mst_file:
+        mst_file.write("".join(["%s %s\n" % (name, val)
+                                for name, val in zip(symbols, values)]))
@@ -0,0 +1,215 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (ConcreteModel, Var, Param, Constraint,
+                           Expression, Objective, Suffix, Integers, exp,
+                           SolverFactory)
+from pyomo.opt import ProblemFormat
+from pyomo.solvers.plugins.solvers.asl_persistent import (IPOPTPersistent,
+                                                          ASLPersistent)
+
+
+def _make_model():
+    m = ConcreteModel()
+    m.x = Var(bounds=(0, 4), initialize=1)
+    m.y = Var(bounds=(None, 10))
+    m.z = Var([1, 2, 3], initialize=0.5)
+    m.p = Param(initialize=2, mutable=True)
+    m.q = Param(initialize=3, mutable=True)
+    m.o = Objective(expr=(m.x - 1)**2 + exp(m.y) + sum(m.z.values()))
+    m.c1 = Constraint(expr=m.x + 2*m.y + m.p >= 1)
+    m.c2 = Constraint(expr=m.x * m.y <= m.q)
+    m.c3 = Constraint(expr=(m.p, m.z[1] + m.z[2] - m.z[3], 5))
+    m.c4 = Constraint(expr=m.z[1] == 2*m.z[2])
+    m.dual = Suffix(direction=Suffix.IMPORT_EXPORT)
+    m.dual[m.c1] = 0.5
+    m.ipopt_zL_in = Suffix(direction=Suffix.EXPORT)
+    m.ipopt_zL_out = Suffix(direction=Suffix.IMPORT)
+    return m
+
+
+class TestASLPersistent(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _write(self, opt, m, **io_options):
+        fnames, fmt, smap_id = opt._convert_problem(
+            (m,), ProblemFormat.nl, [ProblemFormat.nl], **io_options)
+        self.assertEqual(fmt, ProblemFormat.nl)
+        self.assertIn(smap_id, m.solutions.symbol_map)
+        m.solutions.delete_symbol_map(smap_id)
+        with open(fnames[0]) as f:
+            return f.read()
+
+    def _reference(self, m, **io_options):
+        fname = TempfileManager.create_tempfile(suffix='.ref.nl')
+        fname, smap_id = m.write(fname, format=ProblemFormat.nl,
+                                 io_options=io_options)
+        m.solutions.delete_symbol_map(smap_id)
+        with open(fname) as f:
+            return f.read()
+
+    def test_registered(self):
+        self.assertIs(type(SolverFactory('ipopt_persistent')),
+                      IPOPTPersistent)
+        self.assertIs(type(SolverFactory('asl_persistent')),
+                      ASLPersistent)
+
+    def test_bounds_and_initial_point(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 1)
+
+        m.x.setlb(1)
+        m.y.setub(None)
+        m.z[2].setlb(-1)
+        m.x.value = 3
+        m.y.value = 0.25
+        m.dual[m.c2] = 1.5
+        m.ipopt_zL_in[m.x] = 0.1
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 1)
+        self.assertEqual(opt.nl_segment_writes, 1)
+
+    def test_symbolic_labels(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        self._write(opt, m, symbolic_solver_labels=True)
+        m.x.setub(2)
+        nl = self._write(opt, m, symbolic_solver_labels=True)
+        self.assertEqual(opt.nl_segment_writes, 1)
+        self.assertEqual(nl, self._reference(m, symbolic_solver_labels=True))
+        # changing the io_options requires a new file
+        self._write(opt, m)
+        self.assertEqual(opt.nl_full_writes, 2)
+
+    def test_linear_constant_params(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        self._write(opt, m)
+        # p appears in the constant of c1 and in the bounds of c3
+        m.p = 1.5
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 1)
+        self.assertEqual(opt.nl_segment_writes, 1)
+        # q appears in the bound of a nonlinear constraint
+        m.q = 4
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 1)
+
+    def test_full_rewrite(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        self._write(opt, m)
+
+        # params in a linear coefficient
+        m.r = Param(initialize=1, mutable=True)
+        m.c5 = Constraint(expr=m.r*m.x + m.y <= 8)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 2)
+        m.r = 2
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 3)
+
+        # deactivating a constraint
+        m.c5.deactivate()
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 4)
+
+        # changing the type of the constraint bounds
+        m.c3.set_value((m.p, m.z[1] + m.z[2] - m.z[3], m.p))
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 5)
+
+        # changing a variable domain
+        m.z[3].domain = Integers
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 6)
+
+        # fixing a variable
+        m.z[3].fix(1)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 7)
+        m.z[3].value = 2
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 8)
+
+        opt.reset()
+        self._write(opt, m)
+        self.assertEqual(opt.nl_full_writes, 9)
+        self.assertEqual(opt.nl_segment_writes, 0)
+
+    def test_named_expressions(self):
+        m = _make_model()
+        m.e = Expression(expr=m.x**2)
+        m.f = Expression(expr=m.e + m.y)
+        m.c5 = Constraint(expr=m.f <= 3)
+        opt = IPOPTPersistent()
+        self._write(opt, m)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 1)
+        # Replacing the expression of an Expression nested in a
+        # constraint body changes the expression graph
+        m.e.set_value(m.x**3 + 7*m.x)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 2)
+        m.f.set_value(m.e - m.y)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 3)
+        self.assertEqual(self._write(opt, m), self._reference(m))
+        self.assertEqual(opt.nl_full_writes, 3)
+
+    def test_warm_start(self):
+        m = _make_model()
+        m.ipopt_zL_out[m.x] = 0.25
+        opt = IPOPTPersistent()
+        opt._set_warm_start(m)
+        self.assertEqual(opt.options['warm_start_init_point'], 'yes')
+        self.assertEqual(m.ipopt_zL_in[m.x], 0.25)
+        self.assertTrue(opt.warm_start_capable())
+        # The generic ASL interface does not set Ipopt options
+        opt = ASLPersistent()
+        opt._set_warm_start(m)
+        self.assertNotIn('warm_start_init_point', opt.options)
+
+    def test_warm_start_single_solve(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.options['tol'] = 1e-6
+        solve_options = []
+        class _Stop(Exception):
+            pass
+        def _apply_solver():
+            solve_options.append(dict(opt.options))
+            raise _Stop()
+        opt.available = lambda exception_flag=False: True
+        opt.executable = lambda: 'ipopt'
+        opt._apply_solver = _apply_solver
+        with self.assertRaises(_Stop):
+            opt.solve(m, warmstart=True)
+        with self.assertRaises(_Stop):
+            opt.solve(m)
+        self.assertEqual(solve_options[0]['warm_start_init_point'], 'yes')
+        self.assertNotIn('warm_start_init_point', solve_options[1])
+        self.assertEqual(dict(opt.options), {'tol': 1e-6})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.environ import (ConcreteModel, Var, Param, Constraint,
+                           Objective, Binary, Integers, maximize)
+from pyomo.solvers.plugins.solvers.glpk_direct import _collect_glpk_problem
+
+
+class TestGLPKDirectProblemData(unittest.TestCase):
+
+    def test_collect(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 4))
+        m.y = Var(within=Binary)
+        m.z = Var(within=Integers, bounds=(None, 7))
+        m.w = Var()
+        m.unused = Var()
+        m.f = Var(initialize=2)
+        m.f.fix()
+        m.p = Param(initialize=3, mutable=True)
+        m.o = Objective(expr=2*m.x + m.y + 5, sense=maximize)
+        m.c1 = Constraint(expr=m.x + m.p*m.z + m.f <= 10)
+        m.c2 = Constraint(expr=m.w - m.y == 1)
+        m.c3 = Constraint(expr=(-1, m.z + m.w, 1))
+        m.c4 = Constraint(expr=m.x >= m.f)
+        m.c4.deactivate()
+
+        data = _collect_glpk_problem(m)
+        self.assertEqual(data.objective_name, 'o')
+        self.assertFalse(data.minimize)
+        self.assertEqual(data.obj_constant, 5)
+        self.assertEqual(data.obj_coefs, [(1, 2), (2, 1)])
+
+        self.assertEqual(data.col_names, ['x', 'y', 'z', 'w'])
+        self.assertEqual(data.col_lbs, [0, 0, None, None])
+        self.assertEqual(data.col_ubs, [4, 1, 7, None])
+        self.assertEqual(data.col_kinds, ['C', 'B', 'I', 'C'])
+
+        self.assertEqual(data.row_names, ['c1', 'c2', 'c3'])
+        self.assertEqual(data.row_lbs, [None, 1, -1])
+        self.assertEqual(data.row_ubs, [8, 1, 1])
+        self.assertEqual(
+            sorted(zip(data.Ai, data.Aj, data.Ar)),
+            [(1, 1, 1), (1, 3, 3), (2, 2, -1), (2, 4, 1),
+             (3, 3, 1), (3, 4, 1)])
+
+    def test_nonlinear(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.o = Objective(expr=m.x)
+        m.c = Constraint(expr=m.x**2 <= 1)
+        with self.assertRaisesRegexp(RuntimeError, "Nonlinear constraint"):
+            _collect_glpk_problem(m)
+
+
+if __name__ == "__main__":
+    unittest.main()
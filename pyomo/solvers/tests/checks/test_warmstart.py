@@ -0,0 +1,85 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyutilib.services import TempfileManager
+
+from pyomo.environ import (ConcreteModel, Var, Constraint, Objective,
+                           Binary, Integers)
+from pyomo.opt import ProblemFormat
+from pyomo.solvers.plugins.solvers.CPLEX import CPLEXSHELL
+from pyomo.solvers.plugins.solvers.GUROBI import GUROBISHELL
+from pyomo.solvers.plugins.solvers.warmstart import collect_mip_start
+
+
+def _make_model():
+    m = ConcreteModel()
+    m.x = Var(initialize=1.5)
+    m.y = Var([1, 2, 3], domain=Binary)
+    m.z = Var(domain=Integers, initialize=4)
+    m.unused = Var(domain=Binary, initialize=1)
+    m.y[3].value = 1
+    m.y[1].value = 0
+    m.o = Objective(expr=m.z + m.y[2] + m.x)
+    m.c = Constraint(expr=m.y[3] + m.y[1] + m.y[2] + m.z >= m.x)
+    return m
+
+
+class TestWarmStart(unittest.TestCase):
+
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _write(self, opt, m):
+        fname = TempfileManager.create_tempfile(suffix='.lp')
+        fname, smap_id = m.write(fname, format=ProblemFormat.cpxlp,
+                                 io_options={'symbolic_solver_labels': True})
+        opt._smap_id = smap_id
+        opt._warm_start_file_name = \
+            TempfileManager.create_tempfile(suffix='.mst')
+        opt._warm_start(m)
+        with open(opt._warm_start_file_name) as f:
+            return f.read()
+
+    def test_collect(self):
+        m = _make_model()
+        fname = TempfileManager.create_tempfile(suffix='.lp')
+        fname, smap_id = m.write(fname, format=ProblemFormat.cpxlp,
+                                 io_options={'symbolic_solver_labels': True})
+        smap = m.solutions.symbol_map[smap_id]
+        symbols, values = collect_mip_start(smap, m)
+        # only discrete variables in the problem that have a value, in
+        # declaration order
+        self.assertEqual(list(zip(symbols, values)),
+                         [('y(1)', 0), ('y(3)', 1), ('z', 4)])
+
+    def test_cplex_mst(self):
+        m = _make_model()
+        mst = self._write(CPLEXSHELL(), m)
+        self.assertTrue(mst.startswith(
+            '<?xml version="1.0" ?>\n<CPLEXSolution version="1.0">\n'))
+        self.assertTrue(mst.endswith('</variables>\n</CPLEXSolution>\n'))
+        self.assertIn(
+            '<variable index="0" name="y(1)" value="0.000000" />\n'
+            '<variable index="1" name="y(3)" value="1.000000" />\n'
+            '<variable index="2" name="z" value="4.000000" />\n', mst)
+        self.assertEqual(mst.count('<variable '), 3)
+
+    def test_gurobi_mst(self):
+        m = _make_model()
+        mst = self._write(GUROBISHELL(), m)
+        self.assertEqual(mst.splitlines(), ['y(1) 0', 'y(3) 1', 'z 4'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,292 @@
+"""This module contains functions to compute fingerprints of Pyomo models.
+
+A fingerprint is a pair of stable hashes: a hash of the structure of a
+model (the active components and their indices, the shapes of the
+expressions, the variables that appear in them, the variable domains
+and which variables are fixed) and a hash of its numeric data (the
+constants in the expressions, the constraint bounds, the variable
+bounds and values, and the values of mutable parameters).  The hashes
+do not depend on the order of the components, and they are the same
+across Python processes, so they can be used as keys of persistent
+caches (e.g., of the output of a writer).  The components are
+identified by their names relative to the fingerprinted block, so
+identical blocks have the same fingerprint wherever they are in a
+model.
+
+The fingerprints of the component data are cached on their components
+and are recomputed when the component data change (e.g., when the
+expression of a constraint is replaced or a variable is fixed).
+"""
+import hashlib
+from collections import namedtuple
+
+from six import iteritems
+
+from pyomo.core import (Constraint, Expression, Objective, Param, Var,
+                        minimize)
+from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import native_types, value
+
+_MASK = (1 << 64) - 1
+
+
+class Fingerprint(namedtuple('Fingerprint', ('structure', 'values'))):
+    """The fingerprint of a model, component data or expression.
+
+    structure: a 64-bit hash of the structure of the model
+    values: a 64-bit hash of the numeric data of the model
+
+    Use :meth:`changes` to check what changed between two fingerprints.
+    """
+    __slots__ = ()
+
+    STRUCTURE = 'structure'
+    VALUES = 'values'
+
+    def changes(self, other):
+        """Compare this fingerprint with another fingerprint.
+
+        Returns:
+            None if the fingerprints are equal, Fingerprint.VALUES
+            if only the numeric data differ, and
+            Fingerprint.STRUCTURE if the structure differs.
+        """
+        if self.structure != other.structure:
+            return Fingerprint.STRUCTURE
+        if self.values != other.values:
+            return Fingerprint.VALUES
+        return None
+
+    def __str__(self):
+        return "%016x:%016x" % self
+
+
+def _hash(tokens):
+    digest = hashlib.md5('\x1f'.join(tokens).encode('utf-8')).hexdigest()
+    return int(digest[:16], 16)
+
+
+class _Names(object):
+    """The names of the components and component data, relative to a
+    block (fully qualified if block is None).
+
+    Objects that are not on the block (e.g., variables of a parent
+    block that appear in the constraints of the block) are identified
+    by their fully qualified names, prefixed with '/' so that they can
+    not be confused with the objects on the block.
+    """
+    __slots__ = ('block', 'relative', 'full', 'names')
+
+    def __init__(self, block=None):
+        self.block = block
+        # name buffers for getname()
+        self.relative = {}
+        self.full = {}
+        # id -> name
+        self.names = {}
+
+    def __call__(self, obj):
+        ans = self.names.get(id(obj))
+        if ans is None:
+            try:
+                ans = obj.getname(fully_qualified=True,
+                                  name_buffer=self.relative,
+                                  relative_to=self.block)
+            except RuntimeError:
+                # The object is not on the block
+                ans = '/' + obj.getname(fully_qualified=True,
+                                        name_buffer=self.full)
+            self.names[id(obj)] = ans
+        return ans
+
+
+def _expression_tokens(expr, structure, values, names):
+    """Append the structure and value tokens of an expression."""
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        if node.__class__ in native_types:
+            structure.append('#')
+            values.append(repr(node))
+        elif node.is_expression_type():
+            if node.is_named_expression_type():
+                structure.append('e:' + names(node))
+            elif node.__class__ is EXPR.LinearExpression:
+                structure.append('linear/%d' % len(node.linear_vars))
+                stack.extend(reversed(node.linear_vars))
+                stack.extend(reversed(node.linear_coefs))
+                stack.append(node.constant)
+            else:
+                structure.append('%s:%s:%s/%d' % (
+                    node.__class__.__name__, node.getname(),
+                    getattr(node, '_strict', ''), node.nargs()))
+                stack.extend(reversed(node.args))
+        elif node.is_variable_type():
+            structure.append('v:' + names(node))
+        elif node.is_parameter_type() and not node.is_constant():
+            structure.append('p:' + names(node))
+        elif node.is_constant():
+            structure.append('#')
+            values.append(repr(value(node)))
+        else:
+            structure.append(node.__class__.__name__)
+
+
+def expression_fingerprint(expr):
+    """Compute the fingerprint of an expression.
+
+    Variables, mutable parameters and named expressions are identified
+    by their (fully qualified) names.  The values of the variables and
+    parameters and the expressions of the named expressions are not
+    part of the fingerprint of the expression.
+
+    Returns:
+        A :class:`Fingerprint`.
+    """
+    structure = []
+    values = []
+    _expression_tokens(expr, structure, values, _Names())
+    return Fingerprint(_hash(structure), _hash(values))
+
+
+#
+# Each of the functions below computes the fingerprint of a component
+# data and returns a tuple (key, structure, values).  The fingerprint
+# is cached until the matching _*_valid() function reports that the
+# key is out of date (e.g., because an expression was replaced), or
+# the component is fingerprinted as part of a different block.
+#
+
+def _var_fingerprint(data, name, names):
+    key = (data.domain, data.fixed, data.lb, data.ub, data.value)
+    structure = ['v', name, key[0].name, repr(key[1]),
+                 repr(key[2] is None), repr(key[3] is None)]
+    values = [name, repr(key[2]), repr(key[3]), repr(key[4])]
+    return key, _hash(structure), _hash(values)
+
+
+def _var_valid(data, key):
+    return data.domain is key[0] and data.fixed == key[1] \
+        and data.lb == key[2] and data.ub == key[3] \
+        and data.value == key[4]
+
+
+def _param_fingerprint(data, name, names):
+    key = data.value
+    return key, _hash(['p', name]), _hash([name, repr(key)])
+
+
+def _param_valid(data, key):
+    return data.value == key
+
+
+def _constraint_fingerprint(data, name, names):
+    key = (data.body, data.lower, data.upper)
+    body, lower, upper = key
+    structure = ['c', name, repr(data.equality),
+                 repr(lower is None), repr(upper is None)]
+    values = [name]
+    _expression_tokens(body, structure, values, names)
+    for bound in (lower, upper):
+        if bound is not None:
+            _expression_tokens(bound, structure, values, names)
+    return key, _hash(structure), _hash(values)
+
+
+def _constraint_valid(data, key):
+    return data.body is key[0] and data.lower is key[1] \
+        and data.upper is key[2]
+
+
+def _objective_fingerprint(data, name, names):
+    key = (data.expr, data.sense)
+    structure = ['o', name, repr(key[1] == minimize)]
+    values = [name]
+    _expression_tokens(key[0], structure, values, names)
+    return key, _hash(structure), _hash(values)
+
+
+def _objective_valid(data, key):
+    return data.expr is key[0] and data.sense == key[1]
+
+
+def _named_expression_fingerprint(data, name, names):
+    key = data.expr
+    structure = ['e', name]
+    values = [name]
+    if key is not None:
+        _expression_tokens(key, structure, values, names)
+    return key, _hash(structure), _hash(values)
+
+
+def _named_expression_valid(data, key):
+    return data.expr is key
+
+
+_fingerprint_functions = (
+    (Var, _var_fingerprint, _var_valid),
+    (Param, _param_fingerprint, _param_valid),
+    (Expression, _named_expression_fingerprint, _named_expression_valid),
+    (Constraint, _constraint_fingerprint, _constraint_valid),
+    (Objective, _objective_fingerprint, _objective_valid),
+)
+
+
+def _component_fingerprints(component, fingerprint, valid, names):
+    """Generate the fingerprints of the active data of a component.
+
+    The fingerprints are cached in the component (as the name of the
+    component and a dictionary mapping each index to the tuple (data,
+    key, structure, values)) and reused while the cached key is valid
+    and the component has the same (relative) name.
+    """
+    prefix = names(component)
+    cached = component.__dict__.get('_fingerprints')
+    if cached is None or cached[0] != prefix:
+        cached = component.__dict__['_fingerprints'] = (prefix, {})
+    cache = cached[1]
+    for index, data in iteritems(component):
+        if not data.active:
+            continue
+        entry = cache.get(index)
+        if entry is not None and entry[0] is data and valid(data, entry[1]):
+            yield entry[2], entry[3]
+            continue
+        key, structure, values = fingerprint(
+            data, prefix + repr(index), names)
+        cache[index] = (data, key, structure, values)
+        yield structure, values
+
+
+def model_fingerprint(block, active=True):
+    """Compute the fingerprint of a block.
+
+    The fingerprint covers the variables, mutable parameters, named
+    expressions and active constraints and objectives on the block and
+    on its (active) sub-blocks.  The fingerprint of the block is the
+    sum (modulo 2**64) of the fingerprints of the component data, so
+    it does not depend on the order of the components.  Components
+    are identified by their names relative to the block, so the
+    fingerprint does not depend on where the block is in the model.
+
+    Args:
+        block: The block (or model) to fingerprint.
+        active (bool): If True (the default), only descend into active
+            sub-blocks.  If None, descend into all sub-blocks.
+
+    Returns:
+        A :class:`Fingerprint`.
+    """
+    structure = 0
+    values = 0
+    names = _Names(block)
+    for ctype, fingerprint, valid in _fingerprint_functions:
+        for component in block.component_objects(
+                ctype, active=active, descend_into=True):
+            if ctype is Param and not component._mutable:
+                continue
+            for s, v in _component_fingerprints(
+                    component, fingerprint, valid, names):
+                structure += s
+                values += v
+    return Fingerprint(structure & _MASK, values & _MASK)
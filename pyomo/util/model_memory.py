@@ -0,0 +1,299 @@
+"""This module contains functions to report the memory used by a Pyomo model."""
+import logging
+import platform
+import sys
+import types
+from gc import get_referents
+from itertools import compress, repeat
+from operator import eq, is_, is_not
+from sys import getsizeof
+from weakref import ref as weakref_ref
+
+from six import iteritems, itervalues
+
+from pyomo.core import Suffix
+from pyomo.core.base.component import _ComponentBase
+from pyomo.core.expr.expr_pyomo5 import ExpressionBase
+from pyutilib.misc import Container, PauseGC
+
+
+default_logger = logging.getLogger('pyomo.util.model_memory')
+default_logger.setLevel(logging.INFO)
+
+_categories = ('data', 'expressions', 'repn', 'suffix')
+
+# Object kinds (cached by class)
+_LEAF = 0        # has no referents: count, but do not walk
+_SKIP = 1        # shared program objects (classes, functions, modules)
+_COMPONENT = 2   # component or component data: count only if owned
+_EXPRESSION = 3  # expression node
+_OTHER = 4       # containers and other objects: count and walk
+
+_kinds = {
+    weakref_ref: _LEAF,
+}
+for _t in (int, float, bool, complex, str, bytes, type(None)):
+    _kinds[_t] = _LEAF
+if sys.version_info[0] < 3:
+    _kinds[long] = _LEAF
+    _kinds[unicode] = _LEAF
+_skip_types = (type, types.ModuleType, types.FunctionType,
+               types.BuiltinFunctionType, types.MethodType,
+               types.CodeType, types.FrameType, logging.Logger)
+
+
+def _kind(cls):
+    if issubclass(cls, _skip_types):
+        ans = _SKIP
+    elif issubclass(cls, _ComponentBase):
+        ans = _COMPONENT
+    elif issubclass(cls, ExpressionBase):
+        ans = _EXPRESSION
+    else:
+        ans = _OTHER
+    _kinds[cls] = ans
+    return ans
+
+
+class MemoryReport(Container):
+    """Stores model memory information.
+
+    components: a list of the components in the model, sorted by
+    decreasing total memory.  Each entry records the component name,
+    type, number of component data ('size'), number of indices of a
+    lazily constructed component that have not been constructed yet
+    ('deferred'), and the bytes used in each category:
+
+        data            the component, its component data and the
+                        containers and values that they own
+        expressions     the expression nodes reachable from the
+                        component data (e.g., constraint bodies), and
+                        the constants that they own
+        repn            the repn objects cached by the writers for the
+                        component data (Block._repn)
+        suffix          the values stored by a Suffix
+
+    total: the bytes used in each category (and overall) by the model.
+
+    Objects referenced by more than one component (e.g., shared
+    expression subtrees) are attributed to the first component that
+    references them and are never counted twice.  Variables and
+    parameters that appear in expressions are attributed to the
+    components that own them.  Module-level objects (classes,
+    functions, etc.) are not counted.
+    """
+    pass
+
+
+class _MemoryWalker(object):
+    """Walk the objects reachable from a set of roots, one level at a
+    time.  Each level is de-duplicated and filtered against the objects
+    already counted using set operations, and the referents of all of
+    the objects in a level are collected with a single call to
+    gc.get_referents(), so that the Python-level work is proportional
+    to the number of objects (and not the number of references)."""
+
+    def __init__(self):
+        self.seen = set()
+
+    def walk(self, roots, owner, expression=False):
+        """Return the (data, expression) bytes used by the objects
+        reachable from roots that were not previously counted,
+        stopping at components and component data not owned by
+        owner."""
+        seen = self.seen
+        # Components and component data (owned by other components)
+        # found during this walk
+        foreign = set()
+        # Note: weakref.ref() returns the existing (canonical) reference
+        owner_ref = weakref_ref(owner)
+        totals = [0, 0]
+        frontier = [[], []]
+        frontier[bool(expression)] = list(roots)
+        while frontier[0] or frontier[1]:
+            next_frontier = [[], []]
+            for expr in (0, 1):
+                objs = frontier[expr]
+                if not objs:
+                    continue
+                objs = dict(zip(map(id, objs), objs))
+                # Note: set.difference() iterates over the (smaller)
+                # level, and not over all of the objects already seen
+                ids = set(objs).difference(seen)
+                if foreign:
+                    ids = ids.difference(foreign)
+                objs = list(map(objs.__getitem__, ids))
+                classes = list(map(type, objs))
+                for cls in set(classes).difference(_kinds):
+                    _kind(cls)
+                kinds = list(map(_kinds.__getitem__, classes))
+                counted = _select(objs, kinds, _OTHER)
+                counted.extend(_select(objs, kinds, _LEAF))
+                comps = _select(objs, kinds, _COMPONENT)
+                if comps:
+                    refs = list(map(getattr, comps, repeat('_component'),
+                                    repeat(None)))
+                    counted.extend(compress(
+                        comps, map(is_, refs, repeat(owner_ref))))
+                    for obj in compress(
+                            comps, map(is_not, refs, repeat(owner_ref))):
+                        if obj.parent_component() is owner:
+                            counted.append(obj)
+                        else:
+                            foreign.add(id(obj))
+                nodes = _select(objs, kinds, _EXPRESSION)
+                if expr:
+                    counted.extend(nodes)
+                else:
+                    # Expression nodes found while walking the data
+                    # are counted (and walked) as expressions
+                    frontier[1].extend(nodes)
+                seen.update(map(id, counted))
+                totals[expr] += sum(map(getsizeof, counted))
+                next_frontier[expr].extend(get_referents(*counted))
+            frontier = next_frontier
+        return totals[0], totals[1]
+
+
+def _select(objs, kinds, kind):
+    return list(compress(objs, map(eq, kinds, repeat(kind))))
+
+
+def build_memory_report(model):
+    """Build a model memory report object.
+
+    Raises RuntimeError if the interpreter does not support
+    sys.getsizeof() (e.g., PyPy)."""
+    try:
+        getsizeof(model)
+    except TypeError:
+        raise RuntimeError(
+            "The model memory report is unsupported on this interpreter "
+            "(%s does not implement sys.getsizeof())"
+            % (platform.python_implementation(),))
+    # The walk creates many (short-lived) lists and no garbage
+    with PauseGC():
+        return _build_memory_report(model)
+
+
+def _build_memory_report(model):
+    walker = _MemoryWalker()
+    entries = []
+    by_component = {}
+
+    def _entry(comp):
+        ans = by_component.get(id(comp), None)
+        if ans is None:
+            ans = Container()
+            ans.name = comp.name
+            ans.type = comp.type().__name__
+            # Note: len(comp) would construct the deferred indices of
+            # lazily constructed components
+            if comp.is_indexed():
+                ans.size = len(comp._data)
+                done = getattr(comp, '_lazy_done', None)
+                ans.deferred = 0 if done is None \
+                    else len(comp._index) - len(done)
+            else:
+                ans.size = 1
+                ans.deferred = 0
+            for cat in _categories:
+                ans[cat] = 0
+            entries.append(ans)
+            by_component[id(comp)] = ans
+        return ans
+
+    # The repn caches are counted after the components (so that any
+    # expressions shared with the components are attributed to the
+    # components)
+    repn_caches = []
+    for blk in model.block_data_objects(descend_into=True):
+        cache = blk.__dict__.get('_repn', None)
+        if cache is not None:
+            repn_caches.append((blk, cache))
+            walker.seen.add(id(cache))
+
+    components = [model.parent_component()]
+    components.extend(model.component_objects(descend_into=True))
+    for comp in components:
+        entry = _entry(comp)
+        if comp.is_indexed():
+            roots = [comp]
+            roots.extend(itervalues(comp._data))
+        else:
+            roots = (comp,)
+        data_bytes, expr_bytes = walker.walk(roots, comp)
+        if comp.type() is Suffix:
+            entry.suffix += data_bytes + expr_bytes
+        else:
+            entry.data += data_bytes
+            entry.expressions += expr_bytes
+
+    for blk, cache in repn_caches:
+        # Walk the repns of each component together
+        repns = {}
+        for obj, repn in iteritems(cache):
+            comp = obj.parent_component()
+            if id(comp) in repns:
+                repns[id(comp)][1].append(repn)
+            else:
+                repns[id(comp)] = (comp, [repn])
+        for comp, roots in itervalues(repns):
+            entry = _entry(comp)
+            entry.repn += sum(walker.walk(roots, comp, True))
+        walker.seen.discard(id(cache))
+        entry = _entry(blk.parent_component())
+        entry.repn += sum(walker.walk((cache,), blk.parent_component()))
+
+    report = MemoryReport()
+    report.total = Container()
+    for cat in _categories:
+        report.total[cat] = 0
+    for entry in entries:
+        entry.total = sum(entry[cat] for cat in _categories)
+        for cat in _categories:
+            report.total[cat] += entry[cat]
+    report.total.total = sum(report.total[cat] for cat in _categories)
+    report.components = sorted(
+        entries, key=lambda x: x.total, reverse=True)
+    report.objects = len(walker.seen)
+    return report
+
+
+def format_memory_report(report, limit=None):
+    """Return the memory report as a table (of the limit largest
+    components)."""
+    header = ('Component', 'Type', 'Size', 'Data', 'Expressions',
+              'Repn', 'Suffix', 'Total')
+    rows = [header]
+    components = report.components
+    if limit:
+        components = components[:limit]
+    for entry in components:
+        size = str(entry.size)
+        if entry.deferred:
+            size += ' (+%s deferred)' % (entry.deferred,)
+        rows.append((entry.name, entry.type, size)
+                    + tuple(str(entry[cat]) for cat in _categories)
+                    + (str(entry.total),))
+    rows.append(('(model total)', '', '')
+                + tuple(str(report.total[cat]) for cat in _categories)
+                + (str(report.total.total),))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = []
+    for row in rows:
+        lines.append('  '.join(
+            val.ljust(w) if i < 2 else val.rjust(w)
+            for i, (val, w) in enumerate(zip(row, widths))).rstrip())
+    return '\n'.join(lines)
+
+
+def log_memory_report(model, logger=default_logger, limit=None):
+    """Generate a report logging the memory used by the model
+    components (in bytes)."""
+    try:
+        report = build_memory_report(model)
+    except RuntimeError as e:
+        logger.warning(str(e))
+        return
+    logger.info(format_memory_report(report, limit))
@@ -0,0 +1,200 @@
+"""Tests for the model fingerprint utility."""
+import os
+import pickle
+import subprocess
+import sys
+
+import pyutilib.th as unittest
+from pyomo.core import (Binary, Block, ConcreteModel, Constraint,
+                        Expression, Objective, Param, RangeSet, Var,
+                        maximize)
+from pyomo.util.fingerprint import (Fingerprint, expression_fingerprint,
+                                    model_fingerprint)
+
+
+def _p_init(m, i):
+    return i
+
+
+def _c_rule(m, i):
+    return m.p[i]*m.x[i] + m.y[i]**2 <= 4
+
+
+def _build_model(reverse=False):
+    m = ConcreteModel()
+    m.I = RangeSet(5)
+    m.p = Param(m.I, initialize=_p_init, mutable=True)
+    m.q = Param(initialize=3)
+    names = ('x', 'y') if not reverse else ('y', 'x')
+    for name in names:
+        m.add_component(name, Var(m.I, bounds=(0, 10), initialize=1))
+    m.e = Expression(expr=m.x[1] + 2*m.y[1])
+    m.c = Constraint(m.I, rule=_c_rule)
+    m.d = Constraint(expr=m.e >= 1)
+    m.o = Objective(expr=sum(m.x[i] for i in m.I) + m.q)
+    return m
+
+
+class TestFingerprint(unittest.TestCase):
+    """Tests for model fingerprint utility."""
+
+    def test_unchanged(self):
+        """Test that the fingerprint of an unchanged model is stable."""
+        m = _build_model()
+        fp = model_fingerprint(m)
+        self.assertIsInstance(fp, Fingerprint)
+        self.assertEqual(model_fingerprint(m), fp)
+        self.assertIsNone(model_fingerprint(m).changes(fp))
+        self.assertEqual(model_fingerprint(_build_model()), fp)
+        self.assertEqual(len(str(fp)), 33)
+
+    def test_order_independent(self):
+        """Test that the fingerprint ignores the order of components."""
+        self.assertEqual(model_fingerprint(_build_model()),
+                         model_fingerprint(_build_model(reverse=True)))
+
+    def test_stable_across_processes(self):
+        """Test that the fingerprint does not depend on the hash seed."""
+        script = ("from pyomo.util.tests.test_fingerprint import "
+                  "_build_model; from pyomo.util.fingerprint import "
+                  "model_fingerprint; print(model_fingerprint(_build_model()))")
+        env = dict(os.environ)
+        env['PYTHONHASHSEED'] = '12345'
+        output = subprocess.check_output(
+            [sys.executable, '-c', script], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), str(model_fingerprint(_build_model())))
+
+    def test_value_changes(self):
+        """Test changes that only affect the numeric data."""
+        m = _build_model()
+        fp = model_fingerprint(m)
+        m.p[2] = 7
+        fp_p = model_fingerprint(m)
+        self.assertEqual(fp_p.changes(fp), Fingerprint.VALUES)
+        m.p[2] = 2
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.x[3].value = 5
+        self.assertEqual(model_fingerprint(m).changes(fp), Fingerprint.VALUES)
+        m.x[3].value = 1
+        m.y[1].setub(20)
+        self.assertEqual(model_fingerprint(m).changes(fp), Fingerprint.VALUES)
+        m.y[1].setub(10)
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.c[1] = m.p[1]*m.x[1] + m.y[1]**2 <= 5
+        self.assertEqual(model_fingerprint(m).changes(fp), Fingerprint.VALUES)
+        m.c[1] = m.p[1]*m.x[1] + m.y[1]**2 <= 4
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.e = m.x[1] + 3*m.y[1]
+        self.assertEqual(model_fingerprint(m).changes(fp), Fingerprint.VALUES)
+
+    def test_structure_changes(self):
+        """Test changes that affect the structure."""
+        m = _build_model()
+        fp = model_fingerprint(m)
+
+        m.x[1].fix(1)
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+        m.x[1].unfix()
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.y[2].domain = Binary
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+        m.y[2].domain = m.x[2].domain
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.c[2].deactivate()
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+        m.c[2].activate()
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.c[3] = m.p[3]*m.x[3] + m.y[3]*m.x[3] <= 4
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+        m.c[3] = m.p[3]*m.x[3] + m.y[3]**2 <= 4
+        self.assertEqual(model_fingerprint(m), fp)
+
+        m.o.sense = maximize
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+        m.o.sense = 1
+
+        m.z = Var()
+        self.assertEqual(model_fingerprint(m).changes(fp),
+                         Fingerprint.STRUCTURE)
+
+    def test_sub_blocks(self):
+        """Test that active sub-blocks are part of the fingerprint."""
+        m = _build_model()
+        fp = model_fingerprint(m)
+        m.b = Block()
+        m.b.c = Constraint(expr=m.x[1] >= 0)
+        fp_b = model_fingerprint(m)
+        self.assertEqual(fp_b.changes(fp), Fingerprint.STRUCTURE)
+        m.b.deactivate()
+        self.assertEqual(model_fingerprint(m), fp)
+        self.assertEqual(model_fingerprint(m, active=None), fp_b)
+
+    def test_relative_names(self):
+        """Test that identical blocks have the same fingerprint."""
+        def _b(b):
+            b.x = Var([1, 2], initialize=1)
+            b.c = Constraint(expr=b.x[1] + 2*b.x[2] >= 1)
+        m = ConcreteModel()
+        m.a = Block(rule=_b)
+        m.b = Block([1, 2], rule=lambda b, i: _b(b))
+        m.b[2].sub = Block(rule=_b)
+        fp = model_fingerprint(m.a)
+        self.assertEqual(model_fingerprint(m.b[1]), fp)
+        self.assertEqual(model_fingerprint(m.b[2].sub), fp)
+        # The cached fingerprints are not reused for a different block
+        model_fingerprint(m)
+        self.assertEqual(model_fingerprint(m.a), fp)
+        self.assertNotEqual(model_fingerprint(m.b[2]), fp)
+        # Variables that are not on the block are identified by their
+        # fully qualified names
+        m.x = Var([1, 2])
+        m.a.d = Constraint(expr=m.x[1] >= 0)
+        m.b[1].d = Constraint(expr=m.x[1] >= 0)
+        self.assertEqual(model_fingerprint(m.a), model_fingerprint(m.b[1]))
+        m.a.d.set_value(m.a.x[1] >= 0)
+        self.assertEqual(model_fingerprint(m.a).changes(
+            model_fingerprint(m.b[1])), Fingerprint.STRUCTURE)
+
+    def test_expression_fingerprint(self):
+        """Test the fingerprint of an expression."""
+        m = ConcreteModel()
+        m.x = Var()
+        m.y = Var()
+        m.p = Param(mutable=True, initialize=1)
+        fp = expression_fingerprint(2*m.x + m.p*m.y**2)
+        self.assertEqual(expression_fingerprint(2*m.x + m.p*m.y**2), fp)
+        self.assertEqual(
+            expression_fingerprint(3*m.x + m.p*m.y**2).changes(fp),
+            Fingerprint.VALUES)
+        self.assertEqual(
+            expression_fingerprint(2*m.y + m.p*m.x**2).changes(fp),
+            Fingerprint.STRUCTURE)
+        # The value of a mutable parameter is not part of the
+        # fingerprint of an expression
+        m.p = 5
+        self.assertEqual(expression_fingerprint(2*m.x + m.p*m.y**2), fp)
+
+    def test_pickle(self):
+        """Test that the cached fingerprints are not pickled."""
+        m = _build_model()
+        fp = model_fingerprint(m)
+        self.assertIn('_fingerprints', m.c.__dict__)
+        i = pickle.loads(pickle.dumps(m))
+        self.assertNotIn('_fingerprints', i.c.__dict__)
+        self.assertEqual(model_fingerprint(i), fp)
+        self.assertEqual(model_fingerprint(m.clone()), fp)
+
+
+if __name__ == "__main__":
+    unittest.main()
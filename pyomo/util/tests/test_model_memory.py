@@ -0,0 +1,177 @@
+"""Tests for the model memory report utility."""
+import logging
+import platform
+
+from six import StringIO
+
+import pyutilib.th as unittest
+from pyomo.common.log import LoggingIntercept
+from pyomo.core import (Block, ConcreteModel, Constraint, Expression,
+                        Objective, RangeSet, Suffix, Var)
+from pyomo.repn.standard_repn import preprocess_block_constraints
+import pyomo.util.model_memory as model_memory
+from pyomo.util.model_memory import (build_memory_report,
+                                     format_memory_report,
+                                     log_memory_report)
+
+
+def _entries(report):
+    return dict((entry.name, entry) for entry in report.components)
+
+
+@unittest.skipIf(platform.python_implementation() == 'PyPy',
+                 "sys.getsizeof() is not supported by PyPy")
+class TestModelMemoryReport(unittest.TestCase):
+    """Tests for model memory report utility."""
+
+    def test_empty_model(self):
+        """Test with an empty model."""
+        report = build_memory_report(ConcreteModel())
+        self.assertEqual(len(report.components), 1)
+        self.assertGreater(report.total.data, 0)
+        self.assertEqual(report.total.expressions, 0)
+        self.assertEqual(report.total.repn, 0)
+        self.assertEqual(report.total.suffix, 0)
+        self.assertEqual(report.total.total, report.total.data)
+
+    def test_categories(self):
+        """Test the attribution of memory to each category."""
+        m = ConcreteModel()
+        m.I = RangeSet(10)
+        m.x = Var(m.I, initialize=1)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i]**2 + m.x[i] <= i)
+        m.o = Objective(expr=sum(m.x[i] for i in m.I))
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        for i in m.I:
+            m.dual[m.c[i]] = i
+        preprocess_block_constraints(m)
+
+        report = build_memory_report(m)
+        entries = _entries(report)
+        self.assertEqual(entries['x'].size, 10)
+        self.assertEqual(entries['x'].type, 'Var')
+        self.assertGreater(entries['x'].data, 0)
+        self.assertEqual(entries['x'].expressions, 0)
+        self.assertGreater(entries['c'].data, 0)
+        self.assertGreater(entries['c'].expressions, 0)
+        self.assertGreater(entries['c'].repn, 0)
+        self.assertGreater(entries['o'].expressions, 0)
+        self.assertEqual(entries['o'].repn, 0)
+        self.assertGreater(entries['dual'].suffix, 0)
+        self.assertEqual(entries['dual'].data, 0)
+
+        for cat in ('data', 'expressions', 'repn', 'suffix', 'total'):
+            self.assertEqual(
+                report.total[cat],
+                sum(entry[cat] for entry in report.components))
+        totals = [entry.total for entry in report.components]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+
+    def test_shared_objects(self):
+        """Test that shared objects are only counted once."""
+        m = ConcreteModel()
+        m.x = Var(range(50))
+        m.y = Var()
+        m.c1 = Constraint(expr=m.y <= 1)
+        report = build_memory_report(m)
+        x_bytes = _entries(report)['x'].data
+
+        shared = sum(m.x[i] for i in range(50))
+        m.c2 = Constraint(expr=shared + m.y <= 1)
+        m.c3 = Constraint(expr=shared + m.y <= 2)
+        m.e = Expression(expr=shared)
+        report = build_memory_report(m)
+        entries = _entries(report)
+        # Variables are attributed to the Var component (and not to the
+        # expressions that use them)
+        self.assertEqual(entries['x'].data, x_bytes)
+        # The shared sum is attributed to the first constraint
+        self.assertGreater(entries['c2'].expressions,
+                           entries['c3'].expressions)
+        self.assertGreater(entries['c2'].expressions,
+                           entries['e'].expressions)
+
+    def test_lazy_components(self):
+        """Test that the report does not construct deferred indices."""
+        m = ConcreteModel()
+        m.I = RangeSet(10)
+        m.x = Var(m.I)
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= i, lazy=True)
+        m.c[2]
+        m.c[5]
+        report = build_memory_report(m)
+        entries = _entries(report)
+        self.assertEqual(entries['c'].size, 2)
+        self.assertEqual(entries['c'].deferred, 8)
+        self.assertEqual(entries['x'].deferred, 0)
+        self.assertEqual(len(m.c._data), 2)
+        self.assertIn('2 (+8 deferred)', format_memory_report(report))
+
+        len(m.c)
+        entries = _entries(build_memory_report(m))
+        self.assertEqual(entries['c'].size, 10)
+        self.assertEqual(entries['c'].deferred, 0)
+
+    def test_blocks(self):
+        """Test that components are reported for each block."""
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var()
+        m.b[2].x = Var()
+        entries = _entries(build_memory_report(m))
+        self.assertIn('b', entries)
+        self.assertIn('b[1].x', entries)
+        self.assertIn('b[2].x', entries)
+        self.assertGreater(entries['b[2].x'].data, 0)
+
+    def test_log_memory_report(self):
+        """Test logging functionality."""
+        m = ConcreteModel()
+        m.x = Var(range(3))
+        m.y = Var()
+        m.c = Constraint(expr=m.x[0] + m.y <= 1)
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.util.model_memory',
+                              logging.INFO):
+            log_memory_report(m, limit=2)
+        lines = output.getvalue().strip().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(
+            lines[0].split(),
+            ['Component', 'Type', 'Size', 'Data', 'Expressions',
+             'Repn', 'Suffix', 'Total'])
+        self.assertTrue(lines[-1].startswith('(model total)'))
+
+        report = build_memory_report(m)
+        lines = format_memory_report(report).splitlines()
+        self.assertEqual(len(lines), len(report.components) + 2)
+        self.assertEqual(lines[-1].split()[-1], str(report.total.total))
+
+
+class TestModelMemoryReportUnsupported(unittest.TestCase):
+    """Tests for interpreters that do not support sys.getsizeof()."""
+
+    def setUp(self):
+        def getsizeof(obj):
+            raise TypeError("getsizeof(...) is not implemented")
+        self.getsizeof = model_memory.getsizeof
+        model_memory.getsizeof = getsizeof
+
+    def tearDown(self):
+        model_memory.getsizeof = self.getsizeof
+
+    def test_unsupported(self):
+        m = ConcreteModel()
+        m.x = Var()
+        with self.assertRaisesRegexp(RuntimeError,
+                                     "unsupported on this interpreter"):
+            build_memory_report(m)
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.util.model_memory',
+                              logging.INFO):
+            log_memory_report(m)
+        self.assertIn("unsupported on this interpreter", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()